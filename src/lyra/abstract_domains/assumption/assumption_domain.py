@@ -581,6 +581,11 @@ class AssumptionState(State):
         def _assign_slicing(self, left: Slicing, right: Expression) -> 'AssumptionState.InputStack':
             return self._assign_any(left, right)
 
+        @copy_docstring(State._assign_tuple)
+        def _assign_tuple(self, left: TupleDisplay,
+                          right: Expression) -> 'AssumptionState.InputStack':
+            return self._assign_any(left, right)
+
         def _assume_any(self):
             if not self.is_bottom() and self.scope == AssumptionState.InputStack.Scope.Loop:  # current scope is a loop
                 if not self.lattice.is_empty():
@@ -959,6 +964,10 @@ class AssumptionState(State):
     def _assign_slicing(self, left: Slicing, right: Expression) -> 'AssumptionState':
         return self._assign_any(left, right)
 
+    @copy_docstring(State._assign_tuple)
+    def _assign_tuple(self, left: TupleDisplay, right: Expression) -> 'AssumptionState':
+        return self._assign_any(left, right)
+
     @copy_docstring(State._assume_variable)
     def _assume_variable(self, condition: VariableIdentifier, neg: bool = False) -> 'AssumptionState':
         raise RuntimeError("Unexpected call to AssumptionState._assume_variable!")
@@ -529,6 +529,40 @@ class TypeState(Store, StateWithSummarization, InputMixin):
         # perform a weak update on the current state
         return self.join(current)
 
+    @copy_docstring(State._assign_tuple)
+    def _assign_tuple(self, left: TupleDisplay, right: Expression) -> 'TypeState':
+        """The items of the tuple are assigned simultaneously. When the assigned expression is
+        a tuple or list display of the same length, each item is assigned the corresponding item
+        (evaluated before any assignment);
+        otherwise, each item is assigned any value of its type."""
+        if isinstance(right, (TupleDisplay, ListDisplay)) and len(right.items) == len(left.items):
+            pairs = list(zip(left.items, right.items))
+            values = [self._evaluation.visit(item, self, dict())[item] for item in right.items]
+        else:
+            pairs = [(item, None) for item in left.items]
+            values = [TypeLattice() for _ in left.items]
+        # the containers are updated first, with the values before the assignment
+        for target, item in pairs:
+            if isinstance(target, VariableIdentifier):
+                continue
+            if item is not None:
+                self._assign(target, item)
+            elif isinstance(target, TupleDisplay):
+                self._assign_tuple(target, right)
+            else:   # the container may now hold any value of its type
+                while isinstance(target, (Subscription, Slicing)):
+                    target = target.target
+                if isinstance(target, VariableIdentifier):
+                    self.store[target] = TypeLattice.from_lyra_type(target.typ)
+        for (target, _), value in zip(pairs, values):
+            if isinstance(target, VariableIdentifier):
+                typ = TypeLattice.from_lyra_type(target.typ)
+                self.store[target] = value.meet(typ)
+                if target.is_dictionary:
+                    self.keys[target.keys] = TypeLattice.from_lyra_type(target.typ.key_typ)
+                    self.values[target.values] = TypeLattice.from_lyra_type(target.typ.val_typ)
+        return self
+
     @copy_docstring(StateWithSummarization._weak_update)
     def _weak_update(self, variables: Set[VariableIdentifier], previous: 'TypeState'):
         for var in variables:
@@ -22,10 +22,10 @@ from lyra.abstract_domains.store import Store
 from lyra.core.expressions import VariableIdentifier, Expression, Subscription, DictDisplay, \
     BinaryComparisonOperation, Keys, Items, Values, TupleDisplay, ExpressionVisitor, \
     NegationFreeNormalExpression, Input, ListDisplay, Literal, Slicing, KeysIdentifier, \
-    ValuesIdentifier
+    ValuesIdentifier, rebuild
 from lyra.core.types import DictLyraType, BooleanLyraType, IntegerLyraType, \
     FloatLyraType, StringLyraType, ListLyraType
-from lyra.core.utils import copy_docstring
+from lyra.core.utils import copy_docstring, fields
 
 # special variable names:
 k_name = "0v_k"
@@ -1476,14 +1476,13 @@ class FularaState(State):
         def default_visit(self, expr: Expression, state: 'FularaState' = None,
                           evaluation=None):
             """default: visit & replace children (adapted from expressions._iter_child_exprs)"""
-            new_expr = copy(expr)
-            for name, field in new_expr.__dict__.items():
+            changes = dict()
+            for name, field in fields(expr).items():
                 if isinstance(field, Expression):
-                    new_expr.__dict__[name] = self.visit(field, state, evaluation)  # replace
+                    changes[name] = self.visit(field, state, evaluation)  # replace
                 elif isinstance(field, list):
-                    for idx, item in enumerate(field):
-                        if isinstance(item, Expression):
-                            field[idx] = self.visit(item, state, evaluation)
-            return new_expr
+                    changes[name] = [self.visit(item, state, evaluation)
+                                     if isinstance(item, Expression) else item for item in field]
+            return rebuild(expr, **changes)
 
     read_eval = DictReadEvaluation()  # static class member shared between all instances
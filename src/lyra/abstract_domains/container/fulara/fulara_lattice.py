@@ -11,6 +11,7 @@ from copy import deepcopy, copy
 from typing import Tuple, Set, Type, Dict, Any
 
 from lyra.abstract_domains.container.fulara.key_wrapper import KeyWrapper
+from lyra.abstract_domains.container.fulara.segment_index import SegmentIndex
 from lyra.abstract_domains.lattice import Lattice, BottomMixin
 from lyra.core.expressions import VariableIdentifier
 from lyra.core.utils import copy_docstring
@@ -145,15 +146,15 @@ class FularaLattice(BottomMixin):
         else:
             # all segments of self need to be contained in some segment of other
             # & their value must be less_equal
+            index = SegmentIndex(other.segments)
             for (k1, v1) in self.segments:
-                for (k2, v2) in other.segments:
-                    k_meet = deepcopy(k1).meet(k2)
-                    if not k_meet.is_bottom():      # segments overlap
-                        if k1.less_equal(k2) and v1.less_equal(v2):
-                            break   # self segment can only be contained in one other segment
-                        return False  # (k1, v1) not fully contained in (k2, v2)
-                else:   # (k1, v1) does not overlap with any segment of other
+                overlapping = index.overlapping(k1)
+                if not overlapping:     # (k1, v1) does not overlap with any segment of other
                     return False
+                # self segment can only be contained in one other segment
+                (k2, v2) = overlapping[0]
+                if not (k1.less_equal(k2) and v1.less_equal(v2)):
+                    return False  # (k1, v1) not fully contained in (k2, v2)
 
             return True
 
@@ -161,19 +162,18 @@ class FularaLattice(BottomMixin):
     def _meet(self, other: 'FularaLattice') -> 'FularaLattice':
         """Point-wise meet of overlapping segments"""
         new_segments = set()
-        other_segments = copy(other.segments)
+        index = SegmentIndex(other.segments)
         for (k1, v1) in self.segments:
-            for (k2, v2) in other_segments:
+            for (k2, v2) in index.overlapping(k1):
                 if (k1, v1) == (k2, v2):
                     new_segments.add((k1, v1))
-                    other_segments.remove((k2, v2))     # cannot overlap again
+                    index.remove((k2, v2))     # cannot overlap again
                     break   # there cannot be more segments in other that overlap with (k1, v1)
 
                 k_meet = deepcopy(k1).meet(deepcopy(k2))
-                if not k_meet.is_bottom():
-                    v_meet = deepcopy(v1).meet(deepcopy(v2))
-                    if not v_meet.is_bottom():
-                        new_segments.add((k_meet, v_meet))
+                v_meet = deepcopy(v1).meet(deepcopy(v2))
+                if not v_meet.is_bottom():
+                    new_segments.add((k_meet, v_meet))
 
         self._replace(FularaLattice(self.k_domain, self.v_domain,
                                     self.k_d_args, self.v_d_args, new_segments))
@@ -199,20 +199,18 @@ class FularaLattice(BottomMixin):
     def _widening(self, other: 'FularaLattice') -> 'FularaLattice':
         # imprecise version
         segment_set = copy(self.segments)     # cond. 2
+        index = SegmentIndex(self.segments)
         o_add_segment = False   # other has a segment, which does not overlap with any of self
         for o in other.segments:
-            o_overlaps = False
-            for s in self.segments:
-                s_meet_o = deepcopy(s[0]).meet(o[0])
-                if not s_meet_o.is_bottom():    # segments overlap (cond. 1)
-                    o_overlaps = True
-                    # overlaps with some o (not cond. 2) -> needs to be widened
-                    segment_set.discard(s)
-                    # point-wise widening
-                    r = (deepcopy(s[0]).widening(deepcopy(o[0])),
-                         deepcopy(s[1]).widening(deepcopy(o[1])))
-                    segment_set.add(r)
-            if not o_overlaps:
+            overlapping = index.overlapping(o[0])
+            for s in overlapping:   # segments overlap (cond. 1)
+                # overlaps with some o (not cond. 2) -> needs to be widened
+                segment_set.discard(s)
+                # point-wise widening
+                r = (deepcopy(s[0]).widening(deepcopy(o[0])),
+                     deepcopy(s[1]).widening(deepcopy(o[1])))
+                segment_set.add(r)
+            if not overlapping:
                 segment_set.add(o)      # cond. 3 (key will be set to top later)
                 o_add_segment = True
 
@@ -362,20 +360,16 @@ def d_norm(segment_set: Set[Tuple[KeyWrapper, Lattice]],
     """disjoint normalization function:
     Computes a partition such that no two abstract keys overlap (i.e. their meet is bottom)
     (and the keys are minimal)"""
-    # TODO: make faster? (sorted segments?)
-    if known_disjoint:      # not empty & not None
-        result_set = copy(known_disjoint)
-    else:
-        result_set = set()
+    result = SegmentIndex(known_disjoint or ())
 
     for s in segment_set:
-        remove_set = set()
-        for r in result_set:
-            s_meet_r = deepcopy(s[0]).meet(r[0])
-            if not s_meet_r.is_bottom():  # not disjoint -> join segments
+        overlapping = result.overlapping(s[0])
+        while overlapping:     # not disjoint -> join segments
+            for r in overlapping:
                 s = (deepcopy(s[0]).join(deepcopy(r[0])), deepcopy(s[1]).join(deepcopy(r[1])))
-                remove_set.add(r)
-        result_set.difference_update(remove_set)
-        result_set.add(s)
+                result.remove(r)
+            # the joined segment may overlap further segments
+            overlapping = result.overlapping(s[0])
+        result.add(s)
 
-    return result_set
+    return set(result)
@@ -102,6 +102,20 @@ class IntervalKWrapper(KeyWrapper, IntervalSWrapper):
         key_interval = self.store[self.k_var]
         return (not key_interval.is_bottom()) and (key_interval.lower == key_interval.upper)
 
+    @copy_docstring(KeyWrapper.bounds)
+    def bounds(self):
+        key_interval = self.store[self.k_var]
+        if key_interval.is_bottom():
+            return None
+        return key_interval.lower, key_interval.upper
+
+    @copy_docstring(KeyWrapper.overlaps)
+    def overlaps(self, other: 'IntervalKWrapper') -> bool:
+        k_self, k_other = self.store[self.k_var], other.store[other.k_var]
+        if k_self.is_bottom() or k_other.is_bottom():
+            return False
+        return k_self.lower <= k_other.upper and k_other.lower <= k_self.upper
+
     @copy_docstring(KeyWrapper.__lt__)
     def __lt__(self, other):
         if isinstance(other, IntervalKWrapper):
@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod
+from copy import deepcopy
 
-from typing import Set, Optional
+from typing import Set, Optional, Tuple, Any
 
 # (Class) Adapter pattern
 from lyra.abstract_domains.lattice import EnvironmentMixin
@@ -55,6 +56,22 @@ class KeyWrapper(metaclass=ABCMeta):
         :return: decomposition/partition of 'state' avoiding 'exclude'
         """
 
+    def bounds(self) -> Optional[Tuple[Any, Any]]:
+        """
+        Returns the (totally ordered) lower and upper bounds of the key values
+        in the current state, used to index segments by their keys (cf. SegmentIndex).
+        Two abstractions must not overlap if their bounds do not intersect.
+        The default implementation returns None, i.e., the key values cannot be bounded.
+        """
+        return None
+
+    def overlaps(self, other: 'KeyWrapper') -> bool:
+        """
+        Returns true if self and 'other' overlap (i.e. their meet is not bottom).
+        Concrete wrappers may override this to avoid computing the meet.
+        """
+        return not deepcopy(self).meet(other).is_bottom()
+
     @abstractmethod
     def __lt__(self, other):
         """Used to order disjoint segements for their unique representation.
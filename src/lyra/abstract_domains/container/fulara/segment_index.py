@@ -0,0 +1,93 @@
+"""
+Segment Index
+=============
+
+Index of the disjoint segments of a Fulara lattice element by the bounds of their keys,
+to find the segments overlapping a key without comparing it with every segment.
+
+:Author: Caterina Urban
+"""
+from bisect import bisect_left, bisect_right
+from typing import Tuple, Iterable, List, Iterator
+
+from lyra.abstract_domains.container.fulara.key_wrapper import KeyWrapper
+from lyra.abstract_domains.lattice import Lattice
+
+Segment = Tuple[KeyWrapper, Lattice]
+
+
+class SegmentIndex:
+    """Index of disjoint segments, ordered by the bounds of their keys (cf. ``KeyWrapper.bounds``).
+
+    Since the segments are disjoint, ordering them by the lower bounds of their keys
+    also orders them by the upper bounds of their keys. Thus, the segments whose bounds intersect
+    the bounds of a key are found by binary search. Segments whose keys cannot be bounded
+    are kept aside and are always compared with the key.
+    """
+
+    def __init__(self, segments: Iterable[Segment] = ()):
+        """Index of disjoint segments.
+
+        :param segments: disjoint segments to index
+        """
+        bounded, self._unbounded = list(), list()
+        for segment in segments:
+            bounds = segment[0].bounds()
+            if bounds is None:
+                self._unbounded.append(segment)
+            else:
+                bounded.append((bounds, segment))
+        bounded.sort(key=lambda item: item[0][0])
+        self._lowers = [bounds[0] for bounds, _ in bounded]
+        self._uppers = [bounds[1] for bounds, _ in bounded]
+        self._segments = [segment for _, segment in bounded]
+
+    def __iter__(self) -> Iterator[Segment]:
+        yield from self._segments
+        yield from self._unbounded
+
+    def __len__(self):
+        return len(self._segments) + len(self._unbounded)
+
+    def add(self, segment: Segment):
+        """Add a segment, disjoint from the indexed segments.
+
+        :param segment: segment to add
+        """
+        bounds = segment[0].bounds()
+        if bounds is None:
+            self._unbounded.append(segment)
+        else:
+            i = bisect_right(self._lowers, bounds[0])
+            self._lowers.insert(i, bounds[0])
+            self._uppers.insert(i, bounds[1])
+            self._segments.insert(i, segment)
+
+    def remove(self, segment: Segment):
+        """Remove an indexed segment.
+
+        :param segment: segment to remove
+        """
+        bounds = segment[0].bounds()
+        if bounds is None:
+            self._unbounded.remove(segment)
+        else:
+            i = bisect_left(self._lowers, bounds[0])
+            while self._segments[i] is not segment and self._segments[i] != segment:
+                i += 1
+            del self._lowers[i], self._uppers[i], self._segments[i]
+
+    def overlapping(self, key: KeyWrapper) -> List[Segment]:
+        """Indexed segments whose keys overlap the given key (cf. ``KeyWrapper.overlaps``).
+
+        :param key: key to look up
+        :return: segments overlapping the key (ordered by the bounds of their keys)
+        """
+        bounds = key.bounds()
+        if bounds is None:
+            candidates = list(self)
+        else:
+            first = bisect_left(self._uppers, bounds[0])
+            last = bisect_right(self._lowers, bounds[1])
+            candidates = self._segments[first:last] + self._unbounded
+        return [segment for segment in candidates if key.overlaps(segment[0])]
@@ -27,13 +27,26 @@ class Lattice(metaclass=ABCMeta):
     """
 
     def __eq__(self, other: 'Lattice'):
-        return isinstance(other, self.__class__) and repr(self) == repr(other)
+        if self is other:
+            return True
+        return isinstance(other, self.__class__) and self._hash_key() == other._hash_key()
 
     def __ne__(self, other: 'Lattice'):
         return not (self == other)
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash(self._hash_key())
+
+    def _hash_key(self):
+        """Structural key of the current lattice element, which determines its equality and hash.
+
+        .. note::
+            Defaults to the string representation of the current lattice element.
+            Subclasses should override it with a cheaper (hashable and immutable) key.
+
+        :return: key uniquely identifying the current lattice element
+        """
+        return repr(self)
 
     @abstractmethod
     def __repr__(self):
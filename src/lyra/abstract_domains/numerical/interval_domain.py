@@ -165,6 +165,7 @@ class IntervalStateWithSummarization(IntervalStateMixin, BasisWithSummarization)
     .. automethod:: IntervalState._substitute
 
     """
+    copy_on_write = True
 
     def __init__(self, variables: Set[VariableIdentifier], precursory: State = None):
         """Map each program variable to the interval representing its value.
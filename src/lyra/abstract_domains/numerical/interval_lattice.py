@@ -8,7 +8,8 @@ Interval Lattice
 from math import inf
 from typing import List
 
-from lyra.abstract_domains.lattice import BottomMixin, ArithmeticMixin, BooleanMixin, SequenceMixin
+from lyra.abstract_domains.lattice import Lattice, BottomMixin, ArithmeticMixin, BooleanMixin, \
+    SequenceMixin
 from lyra.core.expressions import Literal
 from lyra.core.types import BooleanLyraType, IntegerLyraType, FloatLyraType
 from lyra.core.utils import copy_docstring
@@ -108,6 +109,10 @@ class IntervalLattice(BottomMixin, ArithmeticMixin, BooleanMixin, SequenceMixin)
             return "⊥"
         return f"[{self.lower}, {self.upper}]"
 
+    @copy_docstring(Lattice._hash_key)
+    def _hash_key(self):
+        return self.lower, self.upper
+
     @copy_docstring(BottomMixin.top)
     def top(self) -> 'IntervalLattice':
         """The top lattice element is ``[-oo,+oo]``."""
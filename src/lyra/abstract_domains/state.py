@@ -395,6 +395,34 @@ class State(Lattice, metaclass=ABCMeta):
         self.precursory = precursory
         return self
 
+    def delta(self, previous: 'State') -> Optional[Any]:
+        """Changes of the current state with respect to a previous state (cf. ``patch``).
+
+        :param previous: previous state
+        :return: changes of the current state,
+            or None if the current state should be kept as a whole
+        """
+        return None
+
+    def patch(self, delta: Any) -> 'State':
+        """Copy of the current state with the given changes (cf. ``delta``) applied.
+
+        :param delta: changes to apply
+        :return: copy of the current state with the changes applied
+        """
+        raise NotImplementedError(f"Patch of {self.__class__.__name__} states is not supported!")
+
+    def collect(self, variables: Set[VariableIdentifier]) -> 'State':
+        """Forget the information about some variables that are never accessed again
+        (cf. ``Collector``).
+
+        Nothing is forgotten by default.
+
+        :param variables: variables whose information can be forgotten
+        :return: current state modified to have forgotten the information about the given variables
+        """
+        return self
+
     @abstractmethod
     def enter_if(self) -> 'State':
         """Enter a conditional if statement.
@@ -689,6 +717,12 @@ class ProductState(State):
             self.states[i] = state._assign_slicing(left, right)
         return self
 
+    @copy_docstring(State._assign_tuple)
+    def _assign_tuple(self, left: TupleDisplay, right: Expression) -> 'ProductState':
+        for i, state in enumerate(self.states):
+            self.states[i] = state._assign_tuple(left, right)
+        return self
+
     @copy_docstring(State._assume_variable)
     def _assume_variable(self, condition: VariableIdentifier, neg: bool = False):
         for i, state in enumerate(self.states):
@@ -798,6 +832,12 @@ class ProductState(State):
             self.states[i] = state.forget_variable(variable)
         return self
 
+    @copy_docstring(State.collect)
+    def collect(self, variables: Set[VariableIdentifier]) -> 'ProductState':
+        for i, state in enumerate(self.states):
+            self.states[i] = state.collect(variables)
+        return self
+
     @copy_docstring(State._output)
     def _output(self, output: Expression) -> 'ProductState':
         for i, state in enumerate(self.states):
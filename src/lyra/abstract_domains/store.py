@@ -8,7 +8,9 @@ Lifting of a lattice to a set of program variables.
 """
 import itertools
 from collections import defaultdict
-from typing import Dict, Any, Type, Set
+from collections.abc import MutableMapping
+from types import MappingProxyType
+from typing import Dict, Any, Type, Set, Mapping, Iterator, Tuple, List, Optional
 
 from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
 from lyra.core.expressions import VariableIdentifier, LengthIdentifier, KeysIdentifier, \
@@ -16,10 +18,221 @@ from lyra.core.expressions import VariableIdentifier, LengthIdentifier, KeysIden
 from lyra.abstract_domains.lattice import Lattice, EnvironmentMixin
 from lyra.core.types import LyraType, SequenceLyraType, ContainerLyraType, DictLyraType, \
     IntegerLyraType, DataFrameLyraType
+from lyra.core.statements import VariableAccess
 from lyra.core.utils import copy_docstring
 
 import copy
 
+_versions = itertools.count()
+
+
+class CopyOnWriteDict(MutableMapping):
+    """Dictionary from program variables to lattice elements with constant-time (deep) copies.
+
+    A copy shares the underlying dictionary and the lattice elements with the original.
+    The underlying dictionary is duplicated upon the first update of either of them,
+    and a shared lattice element is deep copied the first time it is retrieved,
+    since the caller might modify it.
+
+    Every update stamps the dictionary with a new version, unique across all dictionaries.
+    Once a lattice element has been retrieved (or stored), the caller might modify it at any time:
+    the dictionary is then stamped with a new version every time its version is read,
+    and the lattice element is deep copied (rather than shared) when the dictionary is copied.
+    Dictionaries with the same version thus have the same content.
+
+    .. note::
+        ``items()`` and ``values()`` retrieve the lattice elements as well.
+        Use ``shared`` for read-only accesses that should not copy them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._data = dict(*args, **kwargs)
+        self._owned = set(self._data)   # keys mapped to lattice elements that are not shared
+        self._shared = False            # whether the underlying dictionary is shared
+        self._lent = set()              # keys mapped to lattice elements handed out to callers
+        self._version = next(_versions)
+
+    @property
+    def shared(self) -> Mapping:
+        """Read-only view of the current dictionary, whose elements must not be modified."""
+        return MappingProxyType(self._data)
+
+    @property
+    def version(self) -> int:
+        """Version of the current dictionary."""
+        if self._lent:
+            self._version = next(_versions)
+        return self._version
+
+    def _detach(self):
+        if self._shared:
+            self._data = dict(self._data)
+            self._shared = False
+
+    def __getitem__(self, key):
+        self._version = next(_versions)
+        self._lent.add(key)
+        element = self._data[key]
+        if key not in self._owned:
+            element = copy.deepcopy(element)
+            self._detach()
+            self._data[key] = element
+            self._owned.add(key)
+        return element
+
+    def __setitem__(self, key, value):
+        self._version = next(_versions)
+        self._lent.add(key)
+        self._detach()
+        self._data[key] = value
+        self._owned.add(key)
+
+    def __delitem__(self, key):
+        self._version = next(_versions)
+        self._detach()
+        del self._data[key]
+        self._owned.discard(key)
+        self._lent.discard(key)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lent = set()
+        self._version = next(_versions)     # versions are only unique within a process
+
+    def __deepcopy__(self, memo):
+        result = CopyOnWriteDict.__new__(CopyOnWriteDict)
+        memo[id(self)] = result
+        result._lent, result._version = set(), self.version
+        if self._lent:    # the lattice elements handed out to callers might still be modified
+            result._data = dict(self._data)
+            for key in self._lent:
+                result._data[key] = copy.deepcopy(self._data[key], memo)
+            result._owned, result._shared = set(self._lent), False
+            self._owned = set(self._lent)
+        else:
+            result._data, result._owned, result._shared = self._data, set(), True
+            self._owned, self._shared = set(), True
+        return result
+
+    def share(self, key, other: 'CopyOnWriteDict'):
+        """Map a key to the lattice element it is mapped to in another dictionary.
+
+        :param key: key to be mapped
+        :param other: dictionary the lattice element is shared with
+        """
+        self._version = next(_versions)
+        self._detach()
+        if key in other._lent:      # the lattice element might still be modified by a caller
+            self._data[key] = copy.deepcopy(other._data[key])
+            self._owned.add(key)
+        else:
+            other._owned.discard(key)
+            self._data[key] = other._data[key]
+            self._owned.discard(key)
+        self._lent.discard(key)
+
+    def diff(self, other: 'CopyOnWriteDict') -> Tuple[Dict, Set]:
+        """Entries of the current dictionary that differ from those of another dictionary.
+
+        :param other: other dictionary
+        :return: entries mapped to other lattice elements than in the other dictionary
+            and keys missing from the current dictionary
+        """
+        if self._data is other._data:
+            return dict(), set()
+        updated = {key: element for key, element in self._data.items()
+                   if key not in other._data or other._data[key] is not element}
+        deleted = {key for key in other._data if key not in self._data}
+        return updated, deleted
+
+    def patch(self, updated: Dict, deleted: Set):
+        """Apply the differences between two dictionaries (cf. ``diff``).
+
+        The lattice elements of the updated entries are shared with the caller.
+
+        :param updated: entries to update
+        :param deleted: keys to delete
+        """
+        self._version = next(_versions)
+        self._detach()
+        self._data.update(updated)
+        for key in deleted:
+            del self._data[key]
+        self._owned.difference_update(updated)
+        self._owned.difference_update(deleted)
+        self._lent.difference_update(updated)
+        self._lent.difference_update(deleted)
+
+
+class _Constant:
+    """Picklable default factory returning (a shallow copy of) a constant default value."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def __call__(self):
+        return copy.copy(self._value)
+
+
+def _shared(mapping: Mapping) -> Mapping:
+    """Read-only access to a mapping of a store, without copying shared lattice elements."""
+    return mapping.shared if isinstance(mapping, CopyOnWriteDict) else mapping
+
+
+def _pairs(mapping: Mapping, other: Mapping,
+           update: bool = True) -> Iterator[Tuple[Lattice, Lattice]]:
+    """Pairs of corresponding lattice elements of two mappings of stores
+    for a point-wise (reflexive or idempotent) lattice operation.
+
+    Lattice elements shared between copy-on-write mappings are skipped.
+
+    :param mapping: mapping of the current store
+    :param other: mapping of the other store
+    :param update: whether the lattice elements of the current store are going to be modified
+    :return: iterator over the pairs of lattice elements
+    """
+    _mapping, _other = _shared(mapping), _shared(other)
+    copy_on_write = isinstance(mapping, CopyOnWriteDict)
+    for var, element in _mapping.items():
+        if copy_on_write and element is _other[var]:
+            continue
+        yield (mapping[var] if update else element), _other[var]
+
+
+def _copy_entry(mapping: Mapping, other: Mapping, var: VariableIdentifier):
+    """Copy the lattice element of a variable from a mapping of a store to another."""
+    if isinstance(mapping, CopyOnWriteDict) and isinstance(other, CopyOnWriteDict):
+        mapping.share(var, other)
+    else:
+        mapping[var] = copy.deepcopy(other[var])
+
+
+def _owner(key) -> Optional[VariableIdentifier]:
+    """Program variable an entry of a store is about (``None`` if it is not about one)."""
+    while not isinstance(key, VariableIdentifier):
+        if isinstance(key, (LengthIdentifier, KeysIdentifier, ValuesIdentifier)):
+            key = key.expression
+        elif isinstance(key, Subscription):
+            key = key.target
+        elif isinstance(key, VariableAccess):
+            key = key.variable
+        else:
+            return None
+    return key
+
+
 class Store(EnvironmentMixin):
     """Mutable element of a store ``Var -> L``,
     lifting a lattice ``L`` to a set of program variables ``Var``.
@@ -27,11 +240,20 @@ class Store(EnvironmentMixin):
     .. warning::
         Lattice operations modify the current store.
 
+    .. note::
+        When ``copy_on_write`` is set, the lattice elements of the store are kept in
+        copy-on-write dictionaries (cf. ``CopyOnWriteDict``) and deep copies of the store
+        share them until they are modified. The structural key of the store is also cached
+        as long as the versions of the dictionaries do not change.
+
+        Consecutive copy-on-write stores can be kept as their differences (cf. ``delta``).
+
     .. document private methods
     .. automethod:: Store._less_equal
     .. automethod:: Store._meet
     .. automethod:: Store._join
     """
+    copy_on_write = False
 
     def __init__(self, variables: Set[VariableIdentifier],
                  lattices: Dict[LyraType, Type[Lattice]],
@@ -45,7 +267,7 @@ class Store(EnvironmentMixin):
         super().__init__()
         self._variables = variables
         self._lattices = lattices
-        self._arguments = defaultdict(lambda: dict()) if arguments is None else arguments
+        self._arguments = defaultdict(dict) if arguments is None else arguments
         try:
             self._store = {v: lattices[v.typ](**self._arguments[v.typ]) for v in variables}
             self._lengths, self._keys, self._values = dict(), dict(), dict()
@@ -60,6 +282,24 @@ class Store(EnvironmentMixin):
         except KeyError as key:
             error = f"Missing lattice for variable type {repr(key.args[0])}!"
             raise ValueError(error)
+        if self.copy_on_write:
+            self._store = CopyOnWriteDict(self._store)
+            self._lengths = CopyOnWriteDict(self._lengths)
+            self._keys = CopyOnWriteDict(self._keys)
+            self._values = CopyOnWriteDict(self._values)
+        self._cached = None     # versions of the dictionaries and corresponding cached key
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_cached'] = None     # versions are only unique within a process
+        for name in ('_lattices', '_arguments'):
+            mapping = state[name]
+            factory = getattr(mapping, 'default_factory', None)
+            anonymous = getattr(factory, '__name__', None) == '<lambda>'
+            if isinstance(mapping, defaultdict) and anonymous:
+                # the default factories of the lattices (and their arguments) are constant lambdas
+                state[name] = defaultdict(_Constant(mapping.default_factory()), mapping)
+        return state
 
     @property
     def variables(self):
@@ -97,12 +337,75 @@ class Store(EnvironmentMixin):
         return self._values
 
     def __repr__(self):
-        _store = self.store.items()
-        _lengths, _keys, _values = self.lengths.items(), self.keys.items(), self.values.items()
+        _store = _shared(self.store).items()
+        _lengths, _keys = _shared(self.lengths).items(), _shared(self.keys).items()
+        _values = _shared(self.values).items()
         chain = itertools.chain(_store, _lengths, _keys, _values)
         items = sorted(chain, key=lambda x: x[0].name)
         return "; ".join("{} -> {}".format(variable, value) for variable, value in items if not isinstance(variable, LengthIdentifier))
 
+    @copy_docstring(Lattice._hash_key)
+    def _hash_key(self):
+        """The key maps the name of each variable (and of its keys and values) to its
+        lattice element, consistently with the string representation of the current store."""
+        if self.copy_on_write:
+            versions = (self.store.version, self.keys.version, self.values.version)
+            if self._cached is None or self._cached[0] != versions:
+                self._cached = (versions, self._structural_key())
+            return self._cached[1]
+        return self._structural_key()
+
+    def _structural_key(self):
+        _store, _keys, _values = _shared(self.store), _shared(self.keys), _shared(self.values)
+        chain = itertools.chain(_store.items(), _keys.items(), _values.items())
+        return frozenset((var.name, element._hash_key()) for var, element in chain
+                         if not isinstance(var, LengthIdentifier))
+
+    def delta(self,
+              previous: 'Store') -> Optional[Tuple[Dict[str, Tuple[Dict, Set]], Dict[str, Any]]]:
+        """Changes of the current store with respect to a previous store (cf. ``patch``).
+
+        Only copy-on-write stores support it: the changes consist of the entries
+        of the dictionaries that have been updated (or retrieved) since the previous store,
+        and of the other attributes that differ from those of the previous store.
+
+        :param previous: previous store
+        :return: changed entries and attributes,
+            or None if the current store should be kept as a whole
+        """
+        if not self.copy_on_write or type(previous) is not type(self):
+            return None
+        current, old = vars(self), vars(previous)
+        if current.keys() != old.keys():
+            return None
+        entries, attributes = dict(), dict()
+        for name, value in current.items():
+            if name == '_cached':
+                continue
+            if isinstance(value, CopyOnWriteDict) and isinstance(old[name], CopyOnWriteDict):
+                updated, deleted = value.diff(old[name])
+                if updated or deleted:
+                    entries[name] = (updated, deleted)
+            elif value is not old[name]:
+                if type(value) is not type(old[name]) or value != old[name]:
+                    attributes[name] = value
+        return entries, attributes
+
+    def patch(self, delta: Tuple[Dict[str, Tuple[Dict, Set]], Dict[str, Any]]) -> 'Store':
+        """Copy of the current store with the given changes (cf. ``delta``) applied.
+
+        :param delta: changed entries and attributes
+        :return: copy of the current store with the changes applied
+        """
+        entries, attributes = delta
+        result = copy.deepcopy(self)
+        for name, (updated, deleted) in entries.items():
+            getattr(result, name).patch(updated, deleted)
+        for name, value in attributes.items():
+            setattr(result, name, copy.deepcopy(value))
+        result._cached = None
+        return result
+
     @copy_docstring(Lattice.bottom)
     def bottom(self) -> 'Store':
         for var in self.store:
@@ -130,21 +433,21 @@ class Store(EnvironmentMixin):
     @copy_docstring(Lattice.is_bottom)
     def is_bottom(self) -> bool:
         """The current store is bottom if `any` of its variables map to a bottom element."""
-        for variable, element in self.store.items():
+        for variable, element in _shared(self.store).items():
             # GD: TEMPORARY FIX
             if not isinstance(variable, Subscription):  # This could happen if lhs is a subscription of a DataFrame
                 if hasattr(variable, "has_lenght") and not variable.has_length and element.is_bottom():
                     return True
                 elif element.is_bottom():
                     return True
-        return any(element.is_bottom() for element in self.lengths.values())
+        return any(element.is_bottom() for element in _shared(self.lengths).values())
 
     @copy_docstring(Lattice.is_top)
     def is_top(self) -> bool:
         """The current store is top if `all` of its variables map to a top element."""
-        _store = all(element.is_top() for element in self.store.values())
+        _store = all(element.is_top() for element in _shared(self.store).values())
         _top = IntervalLattice(lower=0)
-        _lengths = all(_top.less_equal(element) for element in self.lengths.values())
+        _lengths = all(_top.less_equal(element) for element in _shared(self.lengths).values())
         return _store and _lengths
 
     @copy_docstring(EnvironmentMixin.unify)
@@ -157,23 +460,23 @@ class Store(EnvironmentMixin):
     @copy_docstring(Lattice._less_equal)
     def _less_equal(self, other: 'Store') -> bool:
         """The comparison is performed point-wise for each variable."""
-        _store = all(self.store[var].less_equal(other.store[var]) for var in self.store)
-        _lengths = all(self.lengths[var].less_equal(other.lengths[var]) for var in self.lengths)
-        _keys = all(self.keys[var].less_equal(other.keys[var]) for var in self.keys)
-        _values = all(self.values[var].less_equal(other.values[var]) for var in self.values)
+        _store = all(x.less_equal(y) for x, y in _pairs(self.store, other.store, False))
+        _lengths = all(x.less_equal(y) for x, y in _pairs(self.lengths, other.lengths, False))
+        _keys = all(x.less_equal(y) for x, y in _pairs(self.keys, other.keys, False))
+        _values = all(x.less_equal(y) for x, y in _pairs(self.values, other.values, False))
         return _store and _lengths and _keys and _values
 
     @copy_docstring(Lattice._meet)
     def _meet(self, other: 'Store'):
         """The meet is performed point-wise for each variable."""
-        for var in self.store:
-            self.store[var].meet(other.store[var])
-        for var in self.lengths:
-            self.lengths[var].meet(other.lengths[var])
-        for var in self.keys:
-            self.keys[var].meet(other.keys[var])
-        for var in self.values:
-            self.values[var].meet(other.values[var])
+        for element, other_element in _pairs(self.store, other.store):
+            element.meet(other_element)
+        for element, other_element in _pairs(self.lengths, other.lengths):
+            element.meet(other_element)
+        for element, other_element in _pairs(self.keys, other.keys):
+            element.meet(other_element)
+        for element, other_element in _pairs(self.values, other.values):
+            element.meet(other_element)
         return self
 
     @copy_docstring(Lattice._join)
@@ -194,44 +497,112 @@ class Store(EnvironmentMixin):
 
         # Add relative missing variables to both self and other
         for var in other_vars - store_vars:
-            self.store[var] = copy.deepcopy(other.store[var])
+            _copy_entry(self.store, other.store, var)
         for var in other_length_vars - length_vars:
-            self.lengths[var] = copy.deepcopy(other.lengths[var])
+            _copy_entry(self.lengths, other.lengths, var)
         for var in other_key_vars - key_vars:
-            self.keys[var] = copy.deepcopy(other.keys[var])
+            _copy_entry(self.keys, other.keys, var)
         for var in other_value_vars - value_vars:
-            self.values[var] = copy.deepcopy(other.values[var])
+            _copy_entry(self.values, other.values, var)
 
         for var in store_vars - other_vars:
-            other.store[var] = copy.deepcopy(self.store[var])
+            _copy_entry(other.store, self.store, var)
         for var in length_vars - other_length_vars:
-            other.lengths[var] = copy.deepcopy(self.lengths[var])
+            _copy_entry(other.lengths, self.lengths, var)
         for var in key_vars - other_key_vars:
-            other.keys[var] = copy.deepcopy(self.keys[var])
+            _copy_entry(other.keys, self.keys, var)
         for var in value_vars - other_value_vars:
-            other.values[var] = copy.deepcopy(self.values[var])
-
-        for var in self.store:
-            self.store[var].join(other.store[var])
-        for var in self.lengths:
-            self.lengths[var].join(other.lengths[var])
-        for var in self.keys:
-            self.keys[var].join(other.keys[var])
-        for var in self.values:
-            self.values[var].join(other.values[var])
+            _copy_entry(other.values, self.values, var)
+
+        for element, other_element in _pairs(self.store, other.store):
+            element.join(other_element)
+        for element, other_element in _pairs(self.lengths, other.lengths):
+            element.join(other_element)
+        for element, other_element in _pairs(self.keys, other.keys):
+            element.join(other_element)
+        for element, other_element in _pairs(self.values, other.values):
+            element.join(other_element)
         return self
 
     @copy_docstring(Lattice._widening)
     def _widening(self, other: 'Store'):
         """The widening is performed point-wise for each variable."""
-        for var in self.store:
-            self.store[var].widening(other.store[var])
-        for var in self.lengths:
-            self.lengths[var].widening(other.lengths[var])
-        for var in self.keys:
-            self.keys[var].widening(other.keys[var])
-        for var in self.values:
-            self.values[var].widening(other.values[var])
+        for element, other_element in _pairs(self.store, other.store):
+            element.widening(other_element)
+        for element, other_element in _pairs(self.lengths, other.lengths):
+            element.widening(other_element)
+        for element, other_element in _pairs(self.keys, other.keys):
+            element.widening(other_element)
+        for element, other_element in _pairs(self.values, other.values):
+            element.widening(other_element)
+        return self
+
+    def _mappings(self) -> List[MutableMapping]:
+        """Mappings of the current store,
+        with entries about (expressions over) program variables."""
+        return [self._store, self._lengths, self._keys, self._values]
+
+    def comparable(self, other: 'Store') -> bool:
+        """Whether the current store and another store have the same entries
+        (and can thus be compared point-wise).
+
+        :param other: other store
+        :return: whether the stores have the same variables and the same entries
+        """
+        if self.variables != other.variables:
+            return False
+        return all(mapping.keys() == other_mapping.keys()
+                   for mapping, other_mapping in zip(self._mappings(), other._mappings()))
+
+    def project(self, variables: Set[VariableIdentifier]) -> 'Store':
+        """Restrict the current store to some program variables.
+
+        The entries about (expressions over) other program variables are removed.
+        The entries that are not about a program variable are kept.
+
+        :param variables: program variables to restrict the current store to
+        :return: current store modified to be restricted to the given program variables
+        """
+        self.variables.intersection_update(variables)
+        for mapping in self._mappings():
+            for key in list(mapping):
+                owner = _owner(key)
+                if owner is not None and owner not in variables:
+                    del mapping[key]
+        return self
+
+    def collect(self, variables: Set[VariableIdentifier]) -> 'Store':
+        """Remove the entries about (expressions over) some program variables
+        that are never accessed again.
+
+        Unlike ``project``, the program variables of the current store are left unchanged.
+
+        :param variables: program variables whose entries are removed
+        :return: current store modified to be without the entries about the given program variables
+        """
+        for mapping in self._mappings():
+            for key in [key for key in mapping if _owner(key) in variables]:
+                del mapping[key]
+        return self
+
+    def embed(self, context: 'Store', other: 'Store') -> 'Store':
+        """Replace the entries of the current store that are described by a projection of it
+        (cf. ``project``) with the entries of another store
+        (e.g., the projection once modified by the analysis of a function).
+
+        :param context: projection of the current store
+        :param other: store replacing the projection
+        :return: current store modified to embed the other store in place of the projection
+        """
+        self.variables.difference_update(context.variables)
+        self.variables.update(other.variables)
+        mappings = zip(self._mappings(), context._mappings(), other._mappings())
+        for mapping, projected, replacement in mappings:
+            for key in projected:
+                if key in mapping:
+                    del mapping[key]
+            for key in replacement:
+                _copy_entry(mapping, replacement, key)
         return self
 
     @copy_docstring(EnvironmentMixin.add_variable)
@@ -57,6 +57,7 @@ class DataFrameColumnKind(Enum):
 class DataFrameColumnIdentifier(VariableIdentifier):
     """Fake "variable" identifier for the sole purpose of embedding column
     names into VariableIdentifier and to reuse Store."""
+    __slots__ = ('_kind',)
 
     ColumnName = Union[str, None, "DataFrameColumnIdentifier"]
 
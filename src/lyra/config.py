@@ -1 +1,2 @@
-args = None
\ No newline at end of file
+args = None
+profiler = None
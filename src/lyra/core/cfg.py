@@ -9,8 +9,10 @@ Lyra's internal representation of a Python program.
 
 from abc import ABCMeta, abstractmethod
 from enum import Enum
+from math import inf
 from queue import Queue
-from typing import Dict, List, Set, Tuple, Optional
+from types import MappingProxyType
+from typing import Dict, List, Set, Tuple, Optional, FrozenSet, Mapping
 
 from lyra.core.expressions import VariableIdentifier, LengthIdentifier, KeysIdentifier, \
     ValuesIdentifier
@@ -190,7 +192,15 @@ class ControlFlowGraph:
         self._nodes = {node.identifier: node for node in nodes}
         self._in_node = in_node
         self._out_node = out_node
-        self._edges = {(edge.source, edge.target): edge for edge in edges}
+        self._edges: Dict[Tuple[Node, Node], Edge] = dict()
+        # adjacency maps, kept consistent with the edges by add_edge and remove_edge
+        self._in_edges: Dict[Node, Set[Edge]] = dict()
+        self._out_edges: Dict[Node, Set[Edge]] = dict()
+        self._views: Dict[Tuple[str, Node], FrozenSet] = dict()     # cached frozen views
+        # cached variables (and the entry node they were computed from)
+        self._variables: Optional[Tuple[Node, FrozenSet[VariableIdentifier]]] = None
+        for edge in edges:
+            self.add_edge(edge)
 
     @property
     def nodes(self) -> Dict[int, Node]:
@@ -205,11 +215,52 @@ class ControlFlowGraph:
         return self._out_node
 
     @property
-    def edges(self) -> Dict[Tuple[Node, Node], Edge]:
-        return self._edges
+    def edges(self) -> Mapping[Tuple[Node, Node], Edge]:
+        """Read-only view of the edges of the control flow graph
+        (cf. ``add_edge`` and ``remove_edge``)."""
+        return MappingProxyType(self._edges)
+
+    def add_edge(self, edge: Edge):
+        """Add an edge to the control flow graph, replacing any edge between the same nodes.
+
+        :param edge: edge to be added
+        """
+        previous = self._edges.get((edge.source, edge.target))
+        if previous is not None:
+            self.remove_edge(previous)
+        self._edges[(edge.source, edge.target)] = edge
+        self._in_edges.setdefault(edge.target, set()).add(edge)
+        self._out_edges.setdefault(edge.source, set()).add(edge)
+        self._invalidate(edge)
+
+    def remove_edge(self, edge: Edge):
+        """Remove an edge from the control flow graph.
+
+        :param edge: edge to be removed
+        """
+        del self._edges[(edge.source, edge.target)]
+        self._in_edges[edge.target].discard(edge)
+        self._out_edges[edge.source].discard(edge)
+        self._invalidate(edge)
+
+    def _invalidate(self, edge: Edge):
+        self._variables = None
+        for view in (('in', edge.target), ('predecessors', edge.target),
+                     ('out', edge.source), ('successors', edge.source)):
+            self._views.pop(view, None)
 
     @property
     def variables(self) -> Set[VariableIdentifier]:
+        """Variables assigned in the control flow graph (or iterated over by its loops).
+
+        The variables are only collected once, but a new set is returned every time
+        since analysis states modify the set of variables they are created with.
+        """
+        if self._variables is None or self._variables[0] is not self.in_node:
+            self._variables = (self.in_node, frozenset(self._collect_variables()))
+        return set(self._variables[1])
+
+    def _collect_variables(self) -> Set[VariableIdentifier]:
         variables = set()
         visited, worklist = set(), Queue()
         worklist.put(self.in_node)
@@ -233,12 +284,10 @@ class ControlFlowGraph:
                     #         variables.add(KeysIdentifier(variable))
                     #         variables.add(ValuesIdentifier(variable))
                 if isinstance(current, Loop):
-                    edges = self.edges.items()
                     conds = list()
-                    for nodes, edge in edges:
-                        if nodes[0] == current:
-                            assert isinstance(edge, Conditional)
-                            conds.append(edge.condition)
+                    for edge in self.out_edges(current):
+                        assert isinstance(edge, Conditional)
+                        conds.append(edge.condition)
                     for cond in [c for c in conds if isinstance(c, Call)]:
                         for arg in cond.arguments:
                             if isinstance(arg, VariableAccess):
@@ -256,34 +305,137 @@ class ControlFlowGraph:
                     worklist.put(node)
         return variables
 
-    def in_edges(self, node: Node) -> Set[Edge]:
+    def in_edges(self, node: Node) -> FrozenSet[Edge]:
         """Ingoing edges of a given node.
 
         :param node: given node
         :return: set of ingoing edges of the node
         """
-        return {self.edges[(source, target)] for (source, target) in self.edges if target == node}
+        view = self._views.get(('in', node))
+        if view is None:
+            view = self._views[('in', node)] = frozenset(self._in_edges.get(node, ()))
+        return view
 
-    def predecessors(self, node: Node) -> Set[Node]:
+    def predecessors(self, node: Node) -> FrozenSet[Node]:
         """Predecessors of a given node.
 
         :param node: given node
         :return: set of predecessors of the node
         """
-        return {edge.source for edge in self.in_edges(node)}
+        view = self._views.get(('predecessors', node))
+        if view is None:
+            view = frozenset(edge.source for edge in self.in_edges(node))
+            self._views[('predecessors', node)] = view
+        return view
 
-    def out_edges(self, node: Node) -> Set[Edge]:
+    def out_edges(self, node: Node) -> FrozenSet[Edge]:
         """Outgoing edges of a given node.
 
         :param node: given node
         :return: set of outgoing edges of the node
         """
-        return {self.edges[(source, target)] for (source, target) in self.edges if source == node}
+        view = self._views.get(('out', node))
+        if view is None:
+            view = self._views[('out', node)] = frozenset(self._out_edges.get(node, ()))
+        return view
 
-    def successors(self, node: Node) -> Set[Node]:
+    def successors(self, node: Node) -> FrozenSet[Node]:
         """Successors of a given node.
 
         :param node: given node
         :return: set of successors of the node
         """
-        return {edge.target for edge in self.out_edges(node)}
+        view = self._views.get(('successors', node))
+        if view is None:
+            view = frozenset(edge.target for edge in self.out_edges(node))
+            self._views[('successors', node)] = view
+        return view
+
+    def weak_topological_order(self, backward: bool = False) -> List[Node]:
+        """Weak topological ordering of the nodes of the control flow graph.
+
+        The ordering is computed with Bourdoncle's algorithm [Bourdoncle93]_ and
+        linearized: the head of each (nested) strongly connected component
+        precedes all other nodes of the component, and each component precedes
+        the nodes that follow it in the control flow graph.
+
+        .. [Bourdoncle93] F. Bourdoncle.
+            Efficient Chaotic Iteration Strategies with Widenings. FMPA 1993.
+
+        :param backward: whether to order the nodes of the reversed control flow graph
+        :return: list of nodes (reachable from the entry node) in weak topological order
+        """
+        successors = self.predecessors if backward else self.successors
+        root = self.out_node if backward else self.in_node
+        dfn: Dict[Node, float] = dict()     # depth-first numbering of the visited nodes
+        stack: List[Node] = list()
+        number = 0
+
+        def flatten(partition):
+            return [node for chunk in reversed(partition) for node in chunk]
+
+        def order(node):
+            return sorted(successors(node), key=lambda n: n.identifier)
+
+        # the recursive formulation of the algorithm is unrolled on an explicit call stack
+        # visit frames: [kind, node, successors, head, loop, partition]
+        # component frames: [kind, node, successors, head, component partition, partition]
+        calls = list()
+
+        def visit(node, partition):
+            nonlocal number
+            number += 1
+            dfn[node] = number
+            stack.append(node)
+            calls.append(['visit', node, iter(order(node)), number, False, partition])
+
+        def returned(head):
+            if calls and calls[-1][0] == 'visit' and head <= calls[-1][3]:
+                calls[-1][3] = head
+                calls[-1][4] = True
+
+        result: List[List[Node]] = list()
+        visit(root, result)
+        while calls:
+            frame = calls[-1]
+            if frame[0] == 'visit':
+                _, current, pending, head, loop, partition = frame
+                called = False
+                for successor in pending:
+                    if dfn.get(successor, 0) == 0:
+                        visit(successor, partition)
+                        called = True
+                        break
+                    elif dfn[successor] <= frame[3]:
+                        frame[3] = dfn[successor]
+                        frame[4] = True
+                if called:
+                    continue
+                head, loop = frame[3], frame[4]
+                if head == dfn[current]:
+                    dfn[current] = inf
+                    element = stack.pop()
+                    if loop:
+                        while element != current:
+                            dfn[element] = 0
+                            element = stack.pop()
+                        calls[-1] = ['component', current, iter(order(current)),
+                                     head, [], partition]
+                        continue
+                    partition.append([current])
+                calls.pop()
+                returned(head)
+            else:
+                _, current, pending, head, component, partition = frame
+                called = False
+                for successor in pending:
+                    if dfn.get(successor, 0) == 0:
+                        visit(successor, component)
+                        called = True
+                        break
+                if called:
+                    continue
+                partition.append([current] + flatten(component))
+                calls.pop()
+                returned(head)
+        return flatten(result)
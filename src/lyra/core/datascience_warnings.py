@@ -1,50 +1,67 @@
+class DatascienceWarning(UserWarning):
+    """Data science warning, identified by a stable rule identifier."""
+    rule = None
 
-class InconsistentTypeWarning(UserWarning):
-    pass
 
-class GmeanWarning(UserWarning):
-    pass
+class InconsistentTypeWarning(DatascienceWarning):
+    rule = 'DS001'
 
 
-class NoneRetAssignmentWarning(UserWarning):
-    pass
+class GmeanWarning(DatascienceWarning):
+    rule = 'DS002'
 
-class CategoricalConversionMeanWarning(UserWarning):
-    pass
 
-class ScaledMeanWarning(UserWarning):
-    pass
+class NoneRetAssignmentWarning(DatascienceWarning):
+    rule = 'DS003'
 
 
-class CategoricalPlotWarning(UserWarning):
-    pass
+class CategoricalConversionMeanWarning(DatascienceWarning):
+    rule = 'DS004'
 
-class InappropriateMissingValuesWarning(UserWarning):
-    pass
 
-class HighDimensionalityWarning(UserWarning):
-    pass
+class ScaledMeanWarning(DatascienceWarning):
+    rule = 'DS005'
 
-class FixedNComponentsPCAWarning(UserWarning):
-    pass
 
-class ReproducibilityWarning(UserWarning):
-    pass
+class CategoricalPlotWarning(DatascienceWarning):
+    rule = 'DS006'
 
-class PCAOnCategoricalWarning(UserWarning):
-    pass
 
-class PCAVisualizationWarning(UserWarning):
-    pass
+class InappropriateMissingValuesWarning(DatascienceWarning):
+    rule = 'DS007'
 
-class DuplicatesNotDroppedWarning(UserWarning):
-    pass
 
-class NotShuffledWarning(UserWarning):
-    pass
+class HighDimensionalityWarning(DatascienceWarning):
+    rule = 'DS008'
 
-class DataLeakageWarning(UserWarning):
-    pass
 
-class MissingDataWarning(UserWarning):
-    pass
\ No newline at end of file
+class FixedNComponentsPCAWarning(DatascienceWarning):
+    rule = 'DS009'
+
+
+class ReproducibilityWarning(DatascienceWarning):
+    rule = 'DS010'
+
+
+class PCAOnCategoricalWarning(DatascienceWarning):
+    rule = 'DS011'
+
+
+class PCAVisualizationWarning(DatascienceWarning):
+    rule = 'DS012'
+
+
+class DuplicatesNotDroppedWarning(DatascienceWarning):
+    rule = 'DS013'
+
+
+class NotShuffledWarning(DatascienceWarning):
+    rule = 'DS014'
+
+
+class DataLeakageWarning(DatascienceWarning):
+    rule = 'DS015'
+
+
+class MissingDataWarning(DatascienceWarning):
+    rule = 'DS016'
@@ -0,0 +1,347 @@
+"""
+Diagnostics
+===========
+
+Structured reporting of the warnings raised by an analysis.
+
+Each warning is reported as a diagnostic record to the active diagnostics sinks,
+which stream it (e.g., as JSON Lines or SARIF) as soon as it is produced.
+
+:Author: Caterina Urban
+"""
+import json
+import warnings
+from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, List, Type
+
+from lyra.core.datascience_warnings import DatascienceWarning
+from lyra.core.statements import ProgramPoint
+
+
+class PrecisionDegradedWarning(UserWarning):
+    """Warning raised when the analysis trades precision for termination (cf. ``Budget``)."""
+    rule = 'PY001'
+
+
+class Diagnostic:
+    """Warning raised by an analysis."""
+
+    def __init__(self, category: Type[Warning], message: str, level: str = None,
+                 path: str = None, line: int = None, column: int = None, variable: str = None):
+        """Warning raised by an analysis.
+
+        :param category: category of the warning
+        :param message: message of the warning
+        :param level: warning level (values: potential, plausible)
+        :param path: path of the analyzed program
+        :param line: line of the program the warning refers to, if any
+        :param column: column (0-based) of the program the warning refers to, if any
+        :param variable: variable the warning refers to, if any
+        """
+        self._category = category
+        self._message = message
+        self._level = level
+        self._path = path
+        self._line = line
+        self._column = column
+        self._variable = variable
+
+    @property
+    def category(self):
+        return self._category
+
+    @property
+    def rule(self):
+        """Stable identifier of the rule that raised the warning."""
+        return getattr(self.category, 'rule', None) or self.category.__name__
+
+    @property
+    def message(self):
+        return self._message
+
+    @property
+    def level(self):
+        return self._level
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def line(self):
+        return self._line
+
+    @property
+    def column(self):
+        return self._column
+
+    @property
+    def variable(self):
+        return self._variable
+
+    def record(self) -> Dict:
+        """Diagnostic record (serializable as JSON).
+
+        :return: dictionary with the fields of the diagnostic
+        """
+        return {
+            'rule': self.rule,
+            'category': self.category.__name__,
+            'level': self.level,
+            'file': self.path,
+            'line': self.line,
+            'column': self.column,
+            'variable': self.variable,
+            'message': self.message
+        }
+
+    def __repr__(self):
+        location = f" @ line {self.line}" if self.line is not None else ""
+        return f"{self.rule} {self.category.__name__}{location}: {self.message}"
+
+
+class Sink(metaclass=ABCMeta):
+    """Diagnostics sink."""
+
+    def start(self, path: str):
+        """Start of the analysis of a program.
+
+        :param path: path of the analyzed program
+        """
+
+    @abstractmethod
+    def report(self, diagnostic: Diagnostic):
+        """Report a diagnostic.
+
+        :param diagnostic: diagnostic to be reported
+        """
+
+    def finish(self, path: str, **statistics):
+        """End of the analysis of a program.
+
+        :param path: path of the analyzed program
+        :param statistics: statistics about the analysis (e.g., its duration)
+        """
+
+    def close(self):
+        """End of the reporting."""
+
+
+class CollectingSink(Sink):
+    """Diagnostics sink collecting the reported diagnostics."""
+
+    def __init__(self):
+        self._diagnostics: List[Diagnostic] = list()
+
+    @property
+    def diagnostics(self):
+        return self._diagnostics
+
+    def report(self, diagnostic: Diagnostic):
+        self.diagnostics.append(diagnostic)
+
+
+class JSONLinesSink(Sink):
+    """Diagnostics sink streaming one JSON record per line.
+
+    Each diagnostic is written as a record of kind ``diagnostic``,
+    and the end of the analysis of each program as a record of kind ``summary``.
+    """
+
+    def __init__(self, stream):
+        """Diagnostics sink streaming one JSON record per line.
+
+        :param stream: (text) stream the records are written to
+        """
+        self._stream = stream
+
+    @property
+    def stream(self):
+        return self._stream
+
+    def _write(self, record: Dict):
+        self.stream.write(json.dumps(record) + '\n')
+        self.stream.flush()
+
+    def report(self, diagnostic: Diagnostic):
+        self._write({'kind': 'diagnostic', **diagnostic.record()})
+
+    def finish(self, path: str, **statistics):
+        self._write({'kind': 'summary', 'file': path, **statistics})
+
+
+class SARIFSink(Sink):
+    """Diagnostics sink streaming a SARIF (version 2.1.0) log.
+
+    The results are written as soon as they are reported,
+    and the log is completed when the sink is closed.
+    """
+
+    SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+    LEVELS = {'plausible': 'warning', 'potential': 'note'}
+
+    def __init__(self, stream):
+        """Diagnostics sink streaming a SARIF (version 2.1.0) log.
+
+        :param stream: (text) stream the log is written to
+        """
+        self._stream = stream
+        self._empty = True
+        categories = DatascienceWarning.__subclasses__() + [PrecisionDegradedWarning]
+        rules = sorted(categories, key=lambda category: category.rule)
+        driver = {
+            'name': 'Pyra',
+            'informationUri': 'https://github.com/spangea/Pyra',
+            'rules': [{'id': r.rule, 'name': r.__name__} for r in rules]
+        }
+        header = json.dumps({'version': '2.1.0', '$schema': self.SCHEMA, 'runs': [
+            {'tool': {'driver': driver}, 'results': []}
+        ]})
+        self._footer = ']}]}'     # closes the results, the run, the runs, and the log
+        self.stream.write(header[:-len(self._footer)])
+        self.stream.flush()
+
+    @property
+    def stream(self):
+        return self._stream
+
+    def report(self, diagnostic: Diagnostic):
+        result = {
+            'ruleId': diagnostic.rule,
+            'level': self.LEVELS.get(diagnostic.level, 'warning'),
+            'message': {'text': diagnostic.message},
+            'properties': {
+                'category': diagnostic.category.__name__,
+                'level': diagnostic.level,
+                'variable': diagnostic.variable
+            }
+        }
+        if diagnostic.path is not None:
+            location = {'artifactLocation': {'uri': diagnostic.path}}
+            if diagnostic.line is not None:
+                location['region'] = {'startLine': diagnostic.line}
+                if diagnostic.column is not None:
+                    location['region']['startColumn'] = diagnostic.column + 1
+            result['locations'] = [{'physicalLocation': location}]
+        self.stream.write(('' if self._empty else ',') + json.dumps(result))
+        self.stream.flush()
+        self._empty = False
+
+    def close(self):
+        self.stream.write(self._footer + '\n')
+        self.stream.flush()
+
+
+SINKS = {'jsonl': JSONLinesSink, 'sarif': SARIFSink}
+"""Supported diagnostics formats."""
+
+_sinks: List[Sink] = list()
+_path: str = None
+_reported = set()
+_recordings: List[Dict] = list()
+
+
+@contextmanager
+def reporting(sink: Sink):
+    """Report diagnostics to a sink for the duration of a block (and close it at the end).
+
+    :param sink: diagnostics sink
+    :return: context manager returning the sink
+    """
+    _sinks.append(sink)
+    try:
+        yield sink
+    finally:
+        _sinks.remove(sink)
+        sink.close()
+
+
+def reset():
+    """Forget the active sinks, recordings, and reported warnings.
+
+    .. note::
+        To be called at the start of a forked worker process, which otherwise inherits
+        (and reports its diagnostics to) the sinks active in its parent process.
+    """
+    global _path
+    _sinks.clear()
+    _recordings.clear()
+    _reported.clear()
+    _path = None
+
+
+@contextmanager
+def recording():
+    """Record the warnings issued during a block (even those already reported),
+    so that they can be issued again when its result is reused (cf. ``reissue``).
+
+    :return: context manager returning the list of recorded diagnostics
+    """
+    recorded = dict()
+    _recordings.append(recorded)
+    diagnostics = list()
+    try:
+        yield diagnostics
+    finally:
+        _recordings.pop()     # recordings are nested
+        diagnostics.extend(recorded.values())
+
+
+def start(path: str):
+    """Notify the active sinks of the start of the analysis of a program.
+
+    :param path: path of the analyzed program
+    """
+    global _path
+    _path = path
+    _reported.clear()
+    for sink in _sinks:
+        sink.start(path)
+
+
+def finish(**statistics):
+    """Notify the active sinks of the end of the analysis of the current program.
+
+    :param statistics: statistics about the analysis (e.g., its duration)
+    """
+    for sink in _sinks:
+        sink.finish(_path, **statistics)
+
+
+def warn(message: str, category: Type[Warning], level: str = None, pp: ProgramPoint = None,
+         variable=None, stacklevel: int = 1):
+    """Issue a warning (cf. ``warnings.warn``) and report it to the active sinks.
+
+    As for ``warnings.warn``, a warning issued again (e.g., while computing a fixpoint)
+    is only reported once per analyzed program.
+
+    :param message: message of the warning
+    :param category: category of the warning
+    :param level: warning level (values: potential, plausible)
+    :param pp: program point the warning refers to, if any
+    :param variable: variable the warning refers to, if any
+    :param stacklevel: stack level of the warning (cf. ``warnings.warn``)
+    """
+    line, column = (pp.line, pp.column) if pp is not None else (None, None)
+    variable = str(variable) if variable is not None else None
+    diagnostic = Diagnostic(category, message, level, _path, line, column, variable)
+    key = (category, message, level, line, column, variable)
+    for recorded in _recordings:
+        recorded.setdefault(key, diagnostic)
+    if key not in _reported:
+        _reported.add(key)
+        for sink in _sinks:
+            sink.report(diagnostic)
+    warnings.warn(message, category=category, stacklevel=stacklevel + 1)
+
+
+def reissue(diagnostic: Diagnostic):
+    """Issue again a previously recorded warning (cf. ``recording``).
+
+    :param diagnostic: recorded diagnostic
+    """
+    line, column = diagnostic.line, diagnostic.column
+    pp = ProgramPoint(line, column) if line is not None else None
+    warn(diagnostic.message, diagnostic.category, diagnostic.level, pp, diagnostic.variable,
+         stacklevel=2)
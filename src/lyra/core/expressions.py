@@ -8,8 +8,12 @@ Lyra's internal representation of Python expressions.
 """
 
 from abc import ABCMeta, abstractmethod
+from collections import deque
+from copy import deepcopy
 from enum import IntEnum, Enum
+from functools import wraps
 from typing import Set, List
+from weakref import WeakValueDictionary
 
 from apronpy.coeff import PyMPQScalarCoeff, PyMPQIntervalCoeff
 from apronpy.interval import PyMPQInterval
@@ -21,18 +25,36 @@ from apronpy.var import PyVar
 
 from lyra.core.types import LyraType, StringLyraType, IntegerLyraType, BooleanLyraType, \
     DictLyraType, SetLyraType, ListLyraType, TupleLyraType, SequenceLyraType, ContainerLyraType, TopLyraType
-from lyra.core.utils import copy_docstring
+from lyra.core.utils import copy_docstring, fields, slots
+
 
 class Status(Enum):
     YES = "YES"
     MAYBE = "MAYBE"
     NO = "NO"
 
-class Expression(metaclass=ABCMeta):
+
+class HashConsing(ABCMeta):
+    """Metaclass of expressions, which constructs each expression through ``intern``.
+
+    Thus, structurally identical expressions are the same object (hash-consing).
+    """
+
+    def __call__(cls, *args, **kwargs):
+        return intern(super().__call__(*args, **kwargs))
+
+
+class Expression(metaclass=HashConsing):
     """Expression representation.
 
     https://docs.python.org/3.4/reference/expressions.html
+
+    .. note::
+        Expressions are immutable. Their hash is computed once (when they are interned)
+        and their equality first checks their identity (and their hash).
     """
+    __slots__ = ('_typ', '_hash', '_interned', '__weakref__')
+    _caches = ('_hash', '_interned')
 
     def __init__(self, typ: LyraType):
         """Expression construction.
@@ -41,6 +63,13 @@ class Expression(metaclass=ABCMeta):
         """
         self._typ = typ
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get('__hash__') is not None:
+            cls.__hash__ = _cached(cls.__dict__['__hash__'])
+        if '__eq__' in cls.__dict__:
+            cls.__eq__ = _identical(cls.__dict__['__eq__'])
+
     @property
     def typ(self):
         return self._typ
@@ -63,6 +92,14 @@ class Expression(metaclass=ABCMeta):
     def __ne__(self, other: 'Expression'):
         return not (self == other)
 
+    def __reduce__(self):
+        return _restore, (type(self), fields(self))
+
+    def __deepcopy__(self, memo):
+        if getattr(self, '_interned', False):
+            return self     # interned expressions are immutable
+        return _restore(type(self), deepcopy(fields(self), memo))
+
     @abstractmethod
     def __str__(self):
         """Expression string representation.
@@ -82,13 +119,109 @@ class Expression(metaclass=ABCMeta):
         return ids
 
 
+def _cached(method):
+    """Cache the hash of an expression."""
+    @wraps(method)
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = method(self)
+            return self._hash
+    return __hash__
+
+
+def _identical(method):
+    """Check the identity and the hash of two expressions before comparing their structure."""
+    @wraps(method)
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, Expression) and hash(self) != hash(other):
+            return False
+        return method(self, other)
+    return __eq__
+
+
+_interned = WeakValueDictionary()
+"""Interned expressions, by their key (cf. ``_key``)."""
+
+
+_atomic = {str, int, float, bool, type(None)}
+
+
+def _component(value):
+    cls = type(value)
+    if cls in _atomic:
+        return value
+    if isinstance(cls, HashConsing):    # an expression
+        # the children of an interned expression are kept alive by the expression
+        return id(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_component, value))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(map(_component, value))
+    return value
+
+
+def _key(expr: Expression):
+    """Key of an expression: its class and its fields, with its children compared by identity.
+
+    Two expressions with the same key are structurally identical
+    (which is stricter than their equality, e.g., identifiers with the same name
+    but different types are equal but have different keys).
+    """
+    cls = type(expr)
+    key = [_component(getattr(expr, name, None)) for name in slots(cls)]
+    extra = getattr(expr, '__dict__', None)     # fields of expressions defined without slots
+    if extra:
+        key.extend(map(_component, extra.values()))
+    return cls, *key
+
+
+def intern(expr: Expression) -> Expression:
+    """Canonical representative of an expression (hash-consing).
+
+    :param expr: expression to intern
+    :return: the interned expression structurally identical to the given expression, if any,
+        or the expression itself
+    """
+    try:
+        canonical = _interned.setdefault(_key(expr), expr)
+        if canonical is expr:
+            expr._interned = True
+            hash(expr)      # precompute the hash of the expression
+    except TypeError:       # unhashable fields
+        return expr
+    return canonical
+
+
+def _restore(cls, state) -> Expression:
+    """Interned expression of the given class with the given fields
+    (e.g., once unpickled or copied)."""
+    expr = cls.__new__(cls)
+    for name, field in state.items():
+        setattr(expr, name, field)
+    return intern(expr)
+
+
+def rebuild(expr: Expression, **changes) -> Expression:
+    """Expression like a given expression, but with some of its fields replaced.
+
+    :param expr: expression to rebuild
+    :param changes: fields to replace (by name)
+    :return: interned expression with the replaced fields
+    """
+    return _restore(type(expr), {**fields(expr), **changes})
+
+
 def _iter_child_exprs(expr: Expression):
     """
     Yield all direct child expressions of ``expr``,
     that is, all fields that are expressions
     and all items of fields that are lists of expressions.
     """
-    for _, field in expr.__dict__.items():
+    for field in fields(expr).values():
         if isinstance(field, Expression):
             yield field
         elif isinstance(field, list):
@@ -103,7 +236,6 @@ def walk(expr: Expression):
     starting at ``expr`` (including ``expr`` itself),
     in no specified order.
     """
-    from collections import deque
     todo = deque([expr])
     while todo:
         expr = todo.popleft()
@@ -642,6 +774,7 @@ class Literal(Expression):
 
     https://docs.python.org/3.4/reference/expressions.html#literals
     """
+    __slots__ = ('_val',)
 
     def __init__(self, typ: LyraType, val: str):
         """Literal construction.
@@ -673,6 +806,7 @@ class Identifier(Expression, metaclass=ABCMeta):
 
     https://docs.python.org/3.4/reference/expressions.html#atom-identifiers
     """
+    __slots__ = ('_name', '_special')
 
     def __init__(self, typ: LyraType, name: str, special: bool = False):
         """Identifier construction.
@@ -705,6 +839,7 @@ class Identifier(Expression, metaclass=ABCMeta):
 
 class VariableIdentifier(Identifier):
     """Variable identifier representation."""
+    __slots__ = ()
 
     def __init__(self, typ: LyraType, name: str):
         """Variable identifier construction.
@@ -713,11 +848,6 @@ class VariableIdentifier(Identifier):
         :param name: name of the identifier
         """
         super().__init__(typ, name, special=False)
-        self._is_high_dimensionality = Status.MAYBE
-        self._has_duplicates = Status.MAYBE
-        self._is_small = Status.MAYBE
-        self._is_shuffled = Status.MAYBE
-        self._has_na_values = Status.MAYBE
 
     @property
     def has_length(self):
@@ -753,58 +883,10 @@ class VariableIdentifier(Identifier):
             return ValuesIdentifier(self)
         return None
 
-    @property
-    def is_high_dimensionality(self):
-        return self._is_high_dimensionality
-
-    @is_high_dimensionality.setter
-    def is_high_dimensionality(self, value: Status):
-        if not isinstance(value, Status):
-            raise ValueError("Value must be an instance of Status Enum")
-        self._is_high_dimensionality = value
-
-    @property
-    def has_duplicates(self):
-        return self._has_duplicates
-
-    @has_duplicates.setter
-    def has_duplicates(self, value: Status):
-        if not isinstance(value, Status):
-            raise ValueError("Value must be an instance of Status Enum")
-        self._has_duplicates = value
-
-    @property
-    def is_small(self):
-        return self._is_small
-
-    @is_small.setter
-    def is_small(self, value: Status):
-        if not isinstance(value, Status):
-            raise ValueError("Value must be an instance of Status Enum")
-        self._is_small = value
-
-    @property
-    def is_shuffled(self):
-        return self._is_shuffled
-
-    @is_shuffled.setter
-    def is_shuffled(self, value: Status):
-        if not isinstance(value, Status):
-            raise ValueError("Value must be an instance of Status Enum")
-        self._is_shuffled = value
-
-    @property
-    def has_na_values(self):
-        return self._has_na_values
-
-    @has_na_values.setter
-    def has_na_values(self, value: Status):
-        if not isinstance(value, Status):
-            raise ValueError("Value must be an instance of Status Enum")
-        self._has_na_values = value
 
 class LengthIdentifier(Identifier):
     """Sequence or collection length representation."""
+    __slots__ = ('_expression',)
 
     def __init__(self, expression: Expression):
         """Sequence or collection length construction.
@@ -822,6 +904,7 @@ class LengthIdentifier(Identifier):
 
 class KeysIdentifier(Identifier):
     """Dictionary keys identifier representation."""
+    __slots__ = ('_expression',)
 
     def __init__(self, expression: Expression):
         """Dictionary keys identifier construction.
@@ -841,6 +924,7 @@ class KeysIdentifier(Identifier):
 
 class ValuesIdentifier(Identifier):
     """Dictionary values identifier representation."""
+    __slots__ = ('_expression',)
 
     def __init__(self, expression: Expression):
         """Dictionary values identifier construction.
@@ -859,6 +943,7 @@ class ValuesIdentifier(Identifier):
 
 class AttributeIdentifier(Identifier):
     """Attribute name identifier representation."""
+    __slots__ = ()
 
     def __init__(self, typ: LyraType, name: str):
         """Attribute name identifier construction.
@@ -873,6 +958,7 @@ class ListDisplay(Expression):
 
     https://docs.python.org/3/reference/expressions.html#list-displays
     """
+    __slots__ = ('_items',)
 
     def __init__(self, typ: ListLyraType, items: List[Expression] = None):
         """List display construction.
@@ -891,7 +977,7 @@ class ListDisplay(Expression):
         return (self.typ, self.items) == (other.typ, other.items)
 
     def __hash__(self):
-        return hash((self.typ, str(self.items)))
+        return hash((self.typ, tuple(self.items)))
 
     def __str__(self):
         items = map(str, self.items)
@@ -903,6 +989,7 @@ class TupleDisplay(Expression):
 
     https://docs.python.org/3/reference/expressions.html#expression-lists
     """
+    __slots__ = ('_items',)
 
     def __init__(self, typ: TupleLyraType, items: List[Expression] = None):
         """Tuple construction.
@@ -921,7 +1008,7 @@ class TupleDisplay(Expression):
         return (self.typ, self.items) == (other.typ, other.items)
 
     def __hash__(self):
-        return hash((self.typ, str(self.items)))
+        return hash((self.typ, tuple(self.items)))
 
     def __str__(self):
         items = map(str, self.items)
@@ -935,6 +1022,7 @@ class SetDisplay(Expression):
 
     https://docs.python.org/3/reference/expressions.html#set-displays
     """
+    __slots__ = ('_items',)
 
     def __init__(self, typ: SetLyraType, items: List[Expression] = None):
         """Set display construction.
@@ -953,7 +1041,7 @@ class SetDisplay(Expression):
         return (self.typ, self.items) == (other.typ, other.items)
 
     def __hash__(self):
-        return hash((self.typ, str(self.items)))
+        return hash((self.typ, tuple(self.items)))
 
     def __str__(self):
         items = map(str, self.items)
@@ -965,6 +1053,7 @@ class DictDisplay(Expression):
 
     https://docs.python.org/3/reference/expressions.html#dictionary-displays
     """
+    __slots__ = ('_keys', '_values')
 
     def __init__(self, typ: DictLyraType, keys: List[Expression] = None,
                  values: List[Expression] = None):
@@ -989,7 +1078,7 @@ class DictDisplay(Expression):
         return (self.typ, self.keys, self.values) == (other.typ, other.keys, other.values)
 
     def __hash__(self):
-        return hash((self.typ, str(self.keys), str(self.values)))
+        return hash((self.typ, tuple(self.keys), tuple(self.values)))
 
     def __str__(self):
         keys = map(str, self.keys)
@@ -1008,6 +1097,7 @@ class AttributeReference(Expression):
 
     https://docs.python.org/3.4/reference/expressions.html#attribute-references
     """
+    __slots__ = ('_target', '_attribute')
 
     def __init__(self, typ: LyraType, target: Expression, attribute: Identifier):
         """Attribute reference construction.
@@ -1046,6 +1136,7 @@ class Subscription(Expression):
 
     https://docs.python.org/3.4/reference/expressions.html#subscriptions
     """
+    __slots__ = ('_target', '_key', '_is_increasing', '_is_decreasing')
 
     def __init__(self, typ: LyraType, target: Expression, key: Expression, is_increasing: Status = Status.MAYBE, is_decreasing: Status = Status.MAYBE):
         """Subscription construction.
@@ -1072,22 +1163,10 @@ class Subscription(Expression):
     def is_increasing(self):
         return self._is_increasing
 
-    @is_increasing.setter
-    def is_increasing(self, value: Status):
-        if not isinstance(value, Status):
-            raise ValueError("Value must be an instance of Status Enum")
-        self._is_increasing = value
-
     @property
     def is_decreasing(self):
         return self._is_decreasing
 
-    @is_decreasing.setter
-    def is_decreasing(self, value: Status):
-        if not isinstance(value, Status):
-            raise ValueError("Value must be an instance of Status Enum")
-        self._is_decreasing = value
-
     def __eq__(self, other: 'Subscription'):
         typ = self.typ == other.typ
         target = self.target == other.target
@@ -1118,6 +1197,7 @@ class Slicing(Expression):
 
     https://docs.python.org/3.4/reference/expressions.html#slicings
     """
+    __slots__ = ('_target', '_lower', '_upper', '_stride')
 
     def __init__(self, typ: LyraType, target: Expression,
                  lower: Expression, upper: Expression = None, stride: Expression = None):
@@ -1175,10 +1255,12 @@ class Call(Expression, metaclass=ABCMeta):
 
     https://docs.python.org/3.4/reference/expressions.html#calls
     """
+    __slots__ = ()
 
 
 class Input(Call):
     """Input call representation."""
+    __slots__ = ()
 
     def __init__(self, typ: LyraType):
         """Input call construction.
@@ -1199,6 +1281,7 @@ class Input(Call):
 
 class Range(Call):
     """Range call representation."""
+    __slots__ = ('_start', '_stop', '_step')
 
     def __init__(self, typ: LyraType, start: Expression, stop: Expression, step: Expression):
         """Range call construction.
@@ -1241,6 +1324,7 @@ class Range(Call):
 
 class Items(Call):
     """Items call representation"""
+    __slots__ = ('_target_dict',)
 
     def __init__(self, typ: LyraType, target_dict: Expression):
         """Items() call expression construction.
@@ -1260,7 +1344,7 @@ class Items(Call):
         return (self.typ == other.typ) and (self.target_dict == other.target_dict)
 
     def __hash__(self):
-        return hash((self.typ, str(self.target_dict)))
+        return hash((self.typ, self.target_dict))
 
     def __str__(self):
         return f"{self.target_dict}.items()"
@@ -1268,6 +1352,7 @@ class Items(Call):
 
 class Keys(Call):
     """Keys call representation"""
+    __slots__ = ('_target_dict',)
 
     def __init__(self, typ: LyraType, target_dict: Expression):
         """Keys() call expression construction.
@@ -1287,7 +1372,7 @@ class Keys(Call):
         return (self.typ == other.typ) and (self.target_dict == other.target_dict)
 
     def __hash__(self):
-        return hash((self.typ, str(self.target_dict)))
+        return hash((self.typ, self.target_dict))
 
     def __str__(self):
         return f"{self.target_dict}.keys()"
@@ -1295,6 +1380,7 @@ class Keys(Call):
 
 class Values(Call):
     """Values call representation"""
+    __slots__ = ('_target_dict',)
 
     def __init__(self, typ: LyraType, target_dict: Expression):
         """Values() call expression construction.
@@ -1314,7 +1400,7 @@ class Values(Call):
         return (self.typ == other.typ) and (self.target_dict == other.target_dict)
 
     def __hash__(self):
-        return hash((self.typ, str(self.target_dict)))
+        return hash((self.typ, self.target_dict))
 
     def __str__(self):
         return f"{self.target_dict}.values()"
@@ -1327,6 +1413,7 @@ Operation Expressions
 
 class Operation(Expression, metaclass=ABCMeta):
     """Operation representation."""
+    __slots__ = ()
 
 
 """
@@ -1335,6 +1422,7 @@ Cast Operation Expressions
 
 class CastOperation(Operation):
     """Cast operation representation."""
+    __slots__ = ('_expression',)
 
     def __init__(self, typ: LyraType, expression: Expression):
         """Cast operation construction.
@@ -1371,6 +1459,8 @@ Unary Operation Expressions
 
 class UnaryOperation(Operation):
     """Unary operation representation."""
+    __slots__ = ('_operator', '_expression')
+
     class Operator(IntEnum):
         """Unary operator representation."""
 
@@ -1421,6 +1511,7 @@ class UnaryArithmeticOperation(UnaryOperation):
 
     https://docs.python.org/3.4/reference/expressions.html#unary-arithmetic-and-bitwise-operations
     """
+    __slots__ = ()
 
     class Operator(UnaryOperation.Operator):
         """Unary arithmetic operator representation."""
@@ -1448,6 +1539,7 @@ class UnaryBooleanOperation(UnaryOperation):
 
     https://docs.python.org/3.4/reference/expressions.html#boolean-operations
     """
+    __slots__ = ()
 
     class Operator(UnaryOperation.Operator):
         """Unary boolean operator representation."""
@@ -1474,6 +1566,8 @@ Binary Operation Expressions
 
 class BinaryOperation(Operation):
     """Binary operation representation."""
+    __slots__ = ('_left', '_operator', '_right', '_forloop')
+
     class Operator(IntEnum):
         """Binary operator representation."""
 
@@ -1541,6 +1635,7 @@ class BinaryArithmeticOperation(BinaryOperation):
 
     https://docs.python.org/3.4/reference/expressions.html#binary-arithmetic-operations
     """
+    __slots__ = ()
 
     class Operator(BinaryOperation.Operator):
         """Binary arithmetic operator representation."""
@@ -1575,6 +1670,7 @@ class BinaryArithmeticOperation(BinaryOperation):
 
 class BinarySequenceOperation(BinaryOperation):
     """Binary sequence operation expression representation."""
+    __slots__ = ()
 
     class Operator(BinaryOperation.Operator):
         """Binary sequence operator representation."""
@@ -1600,6 +1696,7 @@ class BinaryBooleanOperation(BinaryOperation):
 
     https://docs.python.org/3.6/reference/expressions.html#boolean-operations
     """
+    __slots__ = ()
 
     class Operator(BinaryOperation.Operator):
         """Binary arithmetic operator representation."""
@@ -1632,6 +1729,7 @@ class BinaryComparisonOperation(BinaryOperation):
 
     https://docs.python.org/3.4/reference/expressions.html#comparisons
     """
+    __slots__ = ()
 
     class Operator(BinaryOperation.Operator):
         """Binary comparison operator representation"""
@@ -1705,6 +1803,8 @@ class BinaryComparisonOperation(BinaryOperation):
 
 
 class LambdaExpression(Expression):
+    __slots__ = ('_pp',)
+
     def __init__(self, pp):
         """Lambda expression representation.
 
@@ -1722,6 +1822,8 @@ class LambdaExpression(Expression):
         return "LYRA: LAMBDA EXPRESSION NOT REPRESENTED"
 
 class LibraryAccessExpression(Expression):
+    __slots__ = ('_library', '_name')
+
     def __init__(self, library: str, name: str):
         """Library access expression representation.
 
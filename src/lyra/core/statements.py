@@ -15,6 +15,8 @@ from lyra.core.types import LyraType
 
 
 class ProgramPoint:
+    __slots__ = ('_line', '_column')
+
     def __init__(self, line: int, column: int):
         """Program point representation.
 
@@ -54,6 +56,7 @@ class Statement(metaclass=ABCMeta):
 
     https://docs.python.org/3.4/reference/simple_stmts.html
     """
+    __slots__ = ('_pp',)
 
     def __init__(self, pp: ProgramPoint):
         """Statement construction.
@@ -76,6 +79,7 @@ class Statement(metaclass=ABCMeta):
 
 class LibraryAccess(Statement):
     """Library access representation."""
+    __slots__ = ('_library', '_name')
 
     def __init__(self, pp, library: str, name: str):
         super().__init__(pp)
@@ -102,6 +106,7 @@ https://docs.python.org/3.4/reference/simple_stmts.html#expression-statements
 
 class LiteralEvaluation(Statement):
     """Literal evaluation representation."""
+    __slots__ = ('_literal',)
 
     def __init__(self, pp, literal: Expression):
         """Literal evaluation construction.
@@ -122,6 +127,7 @@ class LiteralEvaluation(Statement):
 
 class ExpressionAccess(Statement, metaclass=ABCMeta):
     """Expression access representation."""
+    __slots__ = ('_typ',)
 
     def __init__(self, pp, typ: LyraType):
         """Expression access construction.
@@ -139,6 +145,7 @@ class ExpressionAccess(Statement, metaclass=ABCMeta):
 
 class VariableAccess(ExpressionAccess):
     """Variable access representation."""
+    __slots__ = ('_variable',)
 
     def __init__(self, pp, typ, variable: VariableIdentifier):
         """Variable access construction.
@@ -160,6 +167,7 @@ class VariableAccess(ExpressionAccess):
 
 class ListDisplayAccess(ExpressionAccess):
     """List display access representation."""
+    __slots__ = ('_items',)
 
     def __init__(self, pp, typ, items: List[Statement]):
         """List display access construction.
@@ -181,6 +189,7 @@ class ListDisplayAccess(ExpressionAccess):
 
 class TupleDisplayAccess(ExpressionAccess):
     """Tuple display (= expression list with comma, or ()) access representation."""
+    __slots__ = ('_items',)
 
     def __init__(self, pp, typ, items: List[Statement]):
         """tuple access construction.
@@ -203,6 +212,8 @@ class TupleDisplayAccess(ExpressionAccess):
 
 class SetDisplayAccess(ExpressionAccess):
     """Set display access representation."""
+    __slots__ = ('_items',)
+
     def __init__(self, pp, typ, items: List[Statement]):
         """Set display access construction.
 
@@ -224,6 +235,8 @@ class SetDisplayAccess(ExpressionAccess):
 
 class DictDisplayAccess(ExpressionAccess):
     """Dictionary display access representation."""
+    __slots__ = ('_keys', '_values')
+
     def __init__(self, pp, typ, keys: List[Statement], values: List[Statement]):
         """Dictionary display access construction.
 
@@ -252,6 +265,7 @@ class DictDisplayAccess(ExpressionAccess):
 
 class SubscriptionAccess(ExpressionAccess):
     """Subscription access representation."""
+    __slots__ = ('_target', '_key')
 
     def __init__(self, pp, typ, target: Statement, key: Statement):
         """Subscription access construction.
@@ -279,6 +293,7 @@ class SubscriptionAccess(ExpressionAccess):
 
 class SlicingAccess(ExpressionAccess):
     """Slicing access representation."""
+    __slots__ = ('_target', '_lower', '_upper', '_stride')
 
     def __init__(self, pp, typ, target: Statement, lower: Statement, upper=None, stride=None):
         """Slicing access construction.
@@ -321,6 +336,7 @@ class SlicingAccess(ExpressionAccess):
 
 class AttributeAccess(ExpressionAccess):
     """Attribute access representation."""
+    __slots__ = ('_target', '_attr', 'name')
 
     def __init__(self, pp, typ, target: Statement, attr: AttributeIdentifier):
         """Attribute access construction.
@@ -358,6 +374,7 @@ class Assignment(Statement):
 
     https://docs.python.org/3.4/reference/simple_stmts.html#assignment-statements
     """
+    __slots__ = ('_left', '_right')
 
     def __init__(self, pp, left: ExpressionAccess, right: Statement):
         """Assignment statement representation.
@@ -389,6 +406,8 @@ https://docs.python.org/3.4/reference/simple_stmts.html#the-return-statement
 
 
 class Return(Statement):
+    __slots__ = ('_values',)
+
     def __init__(self, pp, values: List[Statement]):
         """Return statement representation.
 
@@ -415,6 +434,8 @@ https://docs.python.org/3.4/reference/simple_stmts.html#the-raise-statement
 
 
 class Raise(Statement):
+    __slots__ = ()
+
     def __init__(self, pp):
         """Raise statement representation.
 
@@ -433,6 +454,7 @@ https://docs.python.org/3.4/reference/simple_stmts.html#the-import-statement
 
 
 class Import(Statement):
+    __slots__ = ('_library', '_name')
 
     def __init__(self, pp, library: str, name: str):
         super().__init__(pp)
@@ -457,6 +479,8 @@ Call Statements.
 
 
 class Call(Statement):
+    __slots__ = ('_name', '_arguments', '_typ', '_forloop')
+
     def __init__(self, pp, name: str, arguments: List[Statement], typ: LyraType, forloop=False):
         """Call statement representation.
 
@@ -494,6 +518,8 @@ class Call(Statement):
 
 
 class Keyword(Statement):
+    __slots__ = ('_name', '_value')
+
     def __init__(self, pp, name: str, value: Statement):
         """Keyword argument representation.
 
@@ -518,6 +544,8 @@ class Keyword(Statement):
 
 
 class Assert(Statement):
+    __slots__ = ()
+
     def __init__(self, pp):
         """Assert statement representation.
 
@@ -531,6 +559,8 @@ class Assert(Statement):
 
 
 class Delete(Statement):
+    __slots__ = ('_targets',)
+
     def __init__(self, pp, targets):
         """Delete statement representation.
 
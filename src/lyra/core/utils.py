@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
 
 def copy_docstring(fromfunc):
     """Decorator to copy the docstring of ``fromfunc``.
@@ -12,3 +15,28 @@ def copy_docstring(fromfunc):
             func.__doc__ = sourcedoc
         return func
     return _decorator
+
+
+@lru_cache(maxsize=None)
+def slots(cls) -> Tuple[str, ...]:
+    """Names of the slots of a class (and of its bases) that store fields.
+
+    The slots listed in the ``_caches`` of the class (e.g., a cached hash) do not store fields.
+
+    :param cls: class the slots of which are collected
+    :return: names of the slots of the class
+    """
+    excluded = set(getattr(cls, '_caches', ())) | {'__dict__', '__weakref__'}
+    slotted = (klass.__dict__.get('__slots__', ()) for klass in reversed(cls.__mro__))
+    return tuple(name for names in slotted for name in names if name not in excluded)
+
+
+def fields(obj) -> Dict[str, Any]:
+    """Fields of an object, stored in its slots (cf. ``slots``) or in its dictionary.
+
+    :param obj: object the fields of which are collected
+    :return: fields of the object (by name)
+    """
+    result = {name: getattr(obj, name) for name in slots(type(obj)) if hasattr(obj, name)}
+    result.update(getattr(obj, '__dict__', dict()))
+    return result
@@ -1,13 +1,13 @@
 import copy
-import warnings
 from collections import defaultdict
 from copy import deepcopy
 from enum import IntEnum
 from functools import reduce
-from typing import Set, Union
+from typing import Optional, Set, Union
 
 from lyra.abstract_domains.assumption.assumption_domain import InputMixin, JSONMixin
-from lyra.abstract_domains.lattice import BottomMixin, ArithmeticMixin, SequenceMixin
+from lyra.abstract_domains.lattice import Lattice, BottomMixin, ArithmeticMixin, SequenceMixin, \
+    KindMixin
 from lyra.abstract_domains.state import State, StateWithSummarization
 from lyra.abstract_domains.store import Store
 from lyra.core.expressions import VariableIdentifier, Expression, ExpressionVisitor, Literal, \
@@ -24,6 +24,7 @@ from lyra.core.statements import VariableAccess, AttributeAccess
 from lyra.abstract_domains.basis import BasisWithSummarization
 
 from lyra.core.datascience_warnings import InconsistentTypeWarning, NoneRetAssignmentWarning, HighDimensionalityWarning
+from lyra.core.diagnostics import warn
 
 # TODO: Check correctness and update documentation and operators
 
@@ -142,6 +143,10 @@ class DatascienceTypeLattice(BottomMixin, ArithmeticMixin, SequenceMixin, JSONMi
             return "⊥"
         return self.element.name
 
+    @copy_docstring(Lattice._hash_key)
+    def _hash_key(self):
+        return self.element
+
     def _neg(self) -> 'DatascienceTypeLattice':
         if self.is_bottom() :
             return self._replace(self.bottom())
@@ -334,37 +339,17 @@ class DatascienceTypeLattice(BottomMixin, ArithmeticMixin, SequenceMixin, JSONMi
         return DatascienceTypeLattice()
 
     def top(self):
-        return self._replace(DatascienceTypeLattice())
+        return self._set(DatascienceTypeLattice.Status.Top)
 
     def is_top(self) -> bool:
         return self.element == DatascienceTypeLattice.Status.Top
 
     def _less_equal(self, other: 'DatascienceTypeLattice') -> bool:
-        if other.is_top():
-            return True
-        elif self.element == other.element:
-            return True
-        elif self.is_bottom():
-            return True
-        elif (self.element in self._numeric_series_types()
-              and other.element in {DatascienceTypeLattice.Status.NumericSeries, DatascienceTypeLattice.Status.Series}):
-            return True
-        elif (self.element in self._string_series_types()
-              and other.element in {DatascienceTypeLattice.Status.StringSeries, DatascienceTypeLattice.Status.Series}):
-            return True
-        elif self.element in self._array_types() and other.element == DatascienceTypeLattice.Status.Array:
-            return True
-        elif self.element in self._list_types() and other.element == DatascienceTypeLattice.Status.List:
-            return True
-        elif self.element in self._scalar_types() and other.element == DatascienceTypeLattice.Status.Scalar:
-            return True
-        elif self.element == DatascienceTypeLattice.Status.DataFrameFromPCA and other.element == DatascienceTypeLattice.Status.DataFrame:
-            return True
-        elif (self.element in {DatascienceTypeLattice.Status.NumericSeries, DatascienceTypeLattice.Status.StringSeries,
-                               DatascienceTypeLattice.Status.BoolSeries}
-              and other.element == DatascienceTypeLattice.Status.Series):
+        if self.is_bottom():
             return True
-        return False
+        elif other.is_bottom():
+            return False
+        return _order[self.element][other.element]
 
     @classmethod
     def get_all_types(cls):
@@ -372,166 +357,188 @@ class DatascienceTypeLattice(BottomMixin, ArithmeticMixin, SequenceMixin, JSONMi
 
     @classmethod
     def _dataframes_types(cls):
-        s = (DatascienceTypeLattice.Status.DataFrame,
-             DatascienceTypeLattice.Status.DataFrameFromPCA)
-        return s
+        return _dataframes_types
 
     @classmethod
     def _list_types(cls):
-        s = (DatascienceTypeLattice.Status.List,
-             DatascienceTypeLattice.Status.BoolList,
-             DatascienceTypeLattice.Status.NumericList,
-             DatascienceTypeLattice.Status.StringList)
-        return s
+        return _list_types
 
     @classmethod
     def _scalar_types(cls):
-        s = (DatascienceTypeLattice.Status.Boolean,
-             DatascienceTypeLattice.Status.Numeric,
-             DatascienceTypeLattice.Status.Scalar,
-             DatascienceTypeLattice.Status.String)
-        return s
+        return _scalar_types
 
     @classmethod
     def _array_types(cls):
-        s = (DatascienceTypeLattice.Status.Array,
-             DatascienceTypeLattice.Status.BoolArray,
-             DatascienceTypeLattice.Status.NumericArray,
-             DatascienceTypeLattice.Status.StringArray)
-        return s
+        return _array_types
 
     @classmethod
     def _series_types(cls):
-        s = (DatascienceTypeLattice.Status.Series,
-             DatascienceTypeLattice.Status.NumericSeries,
-             DatascienceTypeLattice.Status.RatioSeries,
-             DatascienceTypeLattice.Status.ExpSeries,
-             DatascienceTypeLattice.Status.StdSeries,
-             DatascienceTypeLattice.Status.NormSeries,
-             DatascienceTypeLattice.Status.StringSeries,
-             DatascienceTypeLattice.Status.CatSeries
-             )
-        return s
+        return _series_types
+
     @classmethod
     def _numeric_series_types(cls):
-        s = (DatascienceTypeLattice.Status.NumericSeries,
-             DatascienceTypeLattice.Status.RatioSeries,
-             DatascienceTypeLattice.Status.ExpSeries,
-             DatascienceTypeLattice.Status.StdSeries,
-             DatascienceTypeLattice.Status.NormSeries)
-        return s
+        return _numeric_series_types
 
     @classmethod
     def _string_series_types(cls):
-        s = (DatascienceTypeLattice.Status.StringSeries,
-             DatascienceTypeLattice.Status.CatSeries)
-        return s
+        return _string_series_types
 
     @classmethod
     def _is_series_type(cls, status):
-        return (
-                status in cls._string_series_types() or
-                status in cls._numeric_series_types() or
-                status == DatascienceTypeLattice.Status.BoolSeries
-        )
+        series = _string_series_types + _numeric_series_types
+        return status in series or status == DatascienceTypeLattice.Status.BoolSeries
 
     @classmethod
     def _is_dataframe_type(cls, status):
-        return status in cls._dataframes_types()
+        return status in _dataframes_types
 
     @classmethod
     def _atom_types(cls):
-        s = (DatascienceTypeLattice.Status.NoneType,
-             DatascienceTypeLattice.Status.NoneRet,
-             DatascienceTypeLattice.Status.Plot,
-             DatascienceTypeLattice.Status.Binarizer,
-             DatascienceTypeLattice.Status.LabelBinarizer,
-             DatascienceTypeLattice.Status.OrdinalEncoder,
-             DatascienceTypeLattice.Status.OneHotEncoder,
-             DatascienceTypeLattice.Status.LabelEncoder,
-             DatascienceTypeLattice.Status.KBinsDiscretizer,
-             DatascienceTypeLattice.Status.MultiLabelBinarizer,
-             DatascienceTypeLattice.Status.TargetEncoder,
-             DatascienceTypeLattice.Status.MaxAbsScaler,
-             DatascienceTypeLattice.Status.MinMaxScaler,
-             DatascienceTypeLattice.Status.StandardScaler,
-             DatascienceTypeLattice.Status.FunctionTransformer,
-             DatascienceTypeLattice.Status.KernelCenterer,
-             DatascienceTypeLattice.Status.Normalizer,
-             DatascienceTypeLattice.Status.PolynomialFeatures,
-             DatascienceTypeLattice.Status.PowerTransformer,
-             DatascienceTypeLattice.Status.QuantileTransformer,
-             DatascienceTypeLattice.Status.RobustScaler,
-             DatascienceTypeLattice.Status.SplineTransformer,
-             DatascienceTypeLattice.Status.Scaled,
-             DatascienceTypeLattice.Status.Tuple,
-             DatascienceTypeLattice.Status.Set,
-             DatascienceTypeLattice.Status.Dict,
-             DatascienceTypeLattice.Status.Tensor,
-             DatascienceTypeLattice.Status.SplittedTrainData,
-             DatascienceTypeLattice.Status.SplittedTestData,
-             DatascienceTypeLattice.Status.FeatureSelector,
-             DatascienceTypeLattice.Status.FeatureSelected
-             )
-        return s
+        return _atom_types
+
+    def _set(self, status: Status) -> 'DatascienceTypeLattice':
+        """Update the current lattice element to be the (default) element of the given type."""
+        self._kind = KindMixin.Kind.DEFAULT
+        self._element = status
+        return self
 
     def _join(self, other: 'DatascienceTypeLattice') -> 'DatascienceTypeLattice':
-        if self.is_top() or other.is_top():
-            return self._replace(self.top())
-        elif self.is_bottom() and other.is_bottom():
+        if other.is_bottom():
             return self
         elif self.is_bottom():
-            return self._replace(DatascienceTypeLattice(other.element))
-        elif other.is_bottom():
-            return self
-        elif self.element == other.element:
-            return self
-        elif self._less_equal(other):
-            return self._replace(DatascienceTypeLattice(other.element))
-        elif other._less_equal(self):
-            return self
-        # Computes the join between types of the same group
-        # Numeric series
-        elif self.element in self._numeric_series_types() and other.element in self._numeric_series_types():
-            return self._replace(DatascienceTypeLattice(DatascienceTypeLattice.Status.NumericSeries))
-        # String series
-        elif self.element in self._string_series_types() and other.element in self._string_series_types():
-            return self._replace(DatascienceTypeLattice(DatascienceTypeLattice.Status.StringSeries))
-        # Array
-        elif self.element in self._array_types() and other.element in self._array_types():
-            return self._replace(DatascienceTypeLattice(DatascienceTypeLattice.Status.Array))
-        # List
-        elif self.element in self._list_types() and other.element in self._list_types():
-            return self._replace(DatascienceTypeLattice(DatascienceTypeLattice.Status.List))
-        # Scalar values
-        elif self.element in self._scalar_types() and other.element in self._scalar_types():
-            return self._replace(DatascienceTypeLattice(DatascienceTypeLattice.Status.Scalar))
-        # DataFrame
-        elif self.element in self._dataframes_types() and other.element in self._dataframes_types():
-            return self._replace(DatascienceTypeLattice(DatascienceTypeLattice.Status.DataFrame))
-        # Computes the join between types of different series groups
-        elif self._is_series_type(self.element) and self._is_series_type(other.element):
-            return self._replace(DatascienceTypeLattice(DatascienceTypeLattice.Status.Series))
-        return self._replace(self.top())
+            return self._set(other.element)
+        # The join is the closest common ancestor of the types in the lattice (which is a tree)
+        return self._set(_joins[self.element][other.element])
 
     def _meet(self, other: 'DatascienceTypeLattice'):
         if self.is_bottom() or other.is_bottom():
-            return self._replace(self.bottom())
-        elif self.is_top():
-            return self._replace(DatascienceTypeLattice(other.element))
-        elif other.is_top():
-            return self
-        elif self.element == other.element:
-            return self
-        elif self._less_equal(other):
-            return self
-        elif other._less_equal(self):
-            return self._replace(DatascienceTypeLattice(other.element))
-        return self._replace(self.bottom())
+            return self.bottom()
+        # The meet is the smaller type, if the types are comparable
+        met = _meets[self.element][other.element]
+        return self.bottom() if met is None else self._set(met)
 
     def _widening(self, other: 'DatascienceTypeLattice'):
         return self._join(other)
 
+    def __deepcopy__(self, memo):
+        result = type(self).__new__(type(self))
+        result.__dict__.update(self.__dict__)
+        return result
+
+
+_dataframes_types = (DatascienceTypeLattice.Status.DataFrame,
+                     DatascienceTypeLattice.Status.DataFrameFromPCA)
+
+_list_types = (DatascienceTypeLattice.Status.List,
+               DatascienceTypeLattice.Status.BoolList,
+               DatascienceTypeLattice.Status.NumericList,
+               DatascienceTypeLattice.Status.StringList)
+
+_scalar_types = (DatascienceTypeLattice.Status.Boolean,
+                 DatascienceTypeLattice.Status.Numeric,
+                 DatascienceTypeLattice.Status.Scalar,
+                 DatascienceTypeLattice.Status.String)
+
+_array_types = (DatascienceTypeLattice.Status.Array,
+                DatascienceTypeLattice.Status.BoolArray,
+                DatascienceTypeLattice.Status.NumericArray,
+                DatascienceTypeLattice.Status.StringArray)
+
+_series_types = (DatascienceTypeLattice.Status.Series,
+                 DatascienceTypeLattice.Status.NumericSeries,
+                 DatascienceTypeLattice.Status.RatioSeries,
+                 DatascienceTypeLattice.Status.ExpSeries,
+                 DatascienceTypeLattice.Status.StdSeries,
+                 DatascienceTypeLattice.Status.NormSeries,
+                 DatascienceTypeLattice.Status.StringSeries,
+                 DatascienceTypeLattice.Status.CatSeries)
+
+_numeric_series_types = (DatascienceTypeLattice.Status.NumericSeries,
+                         DatascienceTypeLattice.Status.RatioSeries,
+                         DatascienceTypeLattice.Status.ExpSeries,
+                         DatascienceTypeLattice.Status.StdSeries,
+                         DatascienceTypeLattice.Status.NormSeries)
+
+_string_series_types = (DatascienceTypeLattice.Status.StringSeries,
+                        DatascienceTypeLattice.Status.CatSeries)
+
+_atom_types = (DatascienceTypeLattice.Status.NoneType,
+               DatascienceTypeLattice.Status.NoneRet,
+               DatascienceTypeLattice.Status.Plot,
+               DatascienceTypeLattice.Status.Binarizer,
+               DatascienceTypeLattice.Status.LabelBinarizer,
+               DatascienceTypeLattice.Status.OrdinalEncoder,
+               DatascienceTypeLattice.Status.OneHotEncoder,
+               DatascienceTypeLattice.Status.LabelEncoder,
+               DatascienceTypeLattice.Status.KBinsDiscretizer,
+               DatascienceTypeLattice.Status.MultiLabelBinarizer,
+               DatascienceTypeLattice.Status.TargetEncoder,
+               DatascienceTypeLattice.Status.MaxAbsScaler,
+               DatascienceTypeLattice.Status.MinMaxScaler,
+               DatascienceTypeLattice.Status.StandardScaler,
+               DatascienceTypeLattice.Status.FunctionTransformer,
+               DatascienceTypeLattice.Status.KernelCenterer,
+               DatascienceTypeLattice.Status.Normalizer,
+               DatascienceTypeLattice.Status.PolynomialFeatures,
+               DatascienceTypeLattice.Status.PowerTransformer,
+               DatascienceTypeLattice.Status.QuantileTransformer,
+               DatascienceTypeLattice.Status.RobustScaler,
+               DatascienceTypeLattice.Status.SplineTransformer,
+               DatascienceTypeLattice.Status.Scaled,
+               DatascienceTypeLattice.Status.Tuple,
+               DatascienceTypeLattice.Status.Set,
+               DatascienceTypeLattice.Status.Dict,
+               DatascienceTypeLattice.Status.Tensor,
+               DatascienceTypeLattice.Status.SplittedTrainData,
+               DatascienceTypeLattice.Status.SplittedTestData,
+               DatascienceTypeLattice.Status.FeatureSelector,
+               DatascienceTypeLattice.Status.FeatureSelected)
+
+
+def _parents():
+    """Parent of each type in the lattice of types (a tree rooted in Top, bottom aside)."""
+    status = DatascienceTypeLattice.Status
+    parents = {typ: status.Top for typ in status}
+    parents[status.Top] = None
+    groups = ((_numeric_series_types, status.NumericSeries),
+              (_string_series_types, status.StringSeries),
+              ((status.BoolSeries, status.NumericSeries, status.StringSeries), status.Series),
+              (_array_types, status.Array), (_list_types, status.List),
+              (_scalar_types, status.Scalar), (_dataframes_types, status.DataFrame))
+    for group, parent in groups:
+        for typ in group:
+            if typ != parent:
+                parents[typ] = parent
+    return parents
+
+
+def _tables():
+    """Order, join, and meet between types, indexed by (the values of) the types."""
+    parents = _parents()
+    ancestors = dict()      # ancestors of each type, from the type itself up to Top
+    for typ in DatascienceTypeLattice.Status:
+        ancestors[typ] = [typ]
+        while parents[ancestors[typ][-1]] is not None:
+            ancestors[typ].append(parents[ancestors[typ][-1]])
+    size = max(DatascienceTypeLattice.Status) + 1
+    order = [[False] * size for _ in range(size)]
+    joins = [[None] * size for _ in range(size)]
+    meets = [[None] * size for _ in range(size)]
+    for typ in DatascienceTypeLattice.Status:
+        above = set(ancestors[typ])
+        for other in DatascienceTypeLattice.Status:
+            order[typ][other] = other in above
+            joins[typ][other] = next(ancestor for ancestor in ancestors[other]
+                                     if ancestor in above)
+            if other in above:
+                meets[typ][other] = typ
+            elif typ in ancestors[other]:
+                meets[typ][other] = other
+    return order, joins, meets
+
+
+_order, _joins, _meets = _tables()
+
 
 def resolve(typ: LyraType) -> DatascienceTypeLattice.Status:
     _typ = typ
@@ -570,7 +577,121 @@ def resolve(typ: LyraType) -> DatascienceTypeLattice.Status:
     return DatascienceTypeLattice.Status.Top
 
 
+def _status(fact: Optional[bool]) -> Status:
+    """Status of a fact about the data (e.g., from its profile), ``None`` if unknown."""
+    if fact is None:
+        return Status.MAYBE
+    return Status.YES if fact else Status.NO
+
+
+class DataProperties:
+    """Properties of the data a variable refers to (e.g., whether a DataFrame has duplicates).
+
+    Each property is ``Status.YES`` or ``Status.NO`` when known, ``Status.MAYBE`` otherwise.
+    Data properties are immutable, thus they can be shared between states.
+    """
+    __slots__ = ('_is_high_dimensionality', '_has_duplicates', '_is_small', '_is_shuffled',
+                 '_has_na_values')
+    names = tuple(name[1:] for name in __slots__)
+
+    def __init__(self, is_high_dimensionality: Status = Status.MAYBE,
+                 has_duplicates: Status = Status.MAYBE, is_small: Status = Status.MAYBE,
+                 is_shuffled: Status = Status.MAYBE, has_na_values: Status = Status.MAYBE):
+        for name, value in zip(self.__slots__, (is_high_dimensionality, has_duplicates, is_small,
+                                                is_shuffled, has_na_values)):
+            if not isinstance(value, Status):
+                raise ValueError("Value must be an instance of Status Enum")
+            setattr(self, name, value)
+
+    @property
+    def is_high_dimensionality(self):
+        return self._is_high_dimensionality
+
+    @property
+    def has_duplicates(self):
+        return self._has_duplicates
+
+    @property
+    def is_small(self):
+        return self._is_small
+
+    @property
+    def is_shuffled(self):
+        return self._is_shuffled
+
+    @property
+    def has_na_values(self):
+        return self._has_na_values
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: 'DataProperties'):
+        return isinstance(other, DataProperties) and self._values() == other._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __repr__(self):
+        values = zip(self.names, self._values())
+        return ", ".join(f"{name}: {value.value}" for name, value in values)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def is_top(self) -> bool:
+        """Whether no property is known."""
+        return all(value == Status.MAYBE for value in self._values())
+
+    def replace(self, **properties: Status) -> 'DataProperties':
+        """Data properties with some properties replaced.
+
+        :param properties: replaced properties and their new values
+        :return: new data properties
+        """
+        current = dict(zip(self.names, self._values()))
+        current.update(properties)
+        return DataProperties(**current)
+
+    def less_equal(self, other: 'DataProperties') -> bool:
+        """Whether every property known by the other data properties is also known
+        (to be the same).
+
+        :param other: other data properties
+        :return: whether the current data properties are less than or equal to the other
+        """
+        return all(y == Status.MAYBE or x == y for x, y in zip(self._values(), other._values()))
+
+    def join(self, other: 'DataProperties') -> 'DataProperties':
+        """Keep the properties on which the data properties agree, forget the others.
+
+        :param other: other data properties
+        :return: new data properties, least upper bound of the current and the other
+        """
+        values = zip(self._values(), other._values())
+        return DataProperties(*(x if x == y else Status.MAYBE for x, y in values))
+
+    def meet(self, other: 'DataProperties') -> 'DataProperties':
+        """Keep the properties known by either data properties
+        (the current ones in case of disagreement).
+
+        :param other: other data properties
+        :return: new data properties,
+            (an upper bound of the) greatest lower bound of the current and the other
+        """
+        values = zip(self._values(), other._values())
+        return DataProperties(*(y if x == Status.MAYBE else x for x, y in values))
+
+
+_unknown = DataProperties()
+
+
 class DatascienceTypeState(Store, StateWithSummarization, InputMixin):
+    copy_on_write = True
+
     class Status(defaultdict):
 
         def __missing__(self, key):
@@ -586,13 +707,105 @@ class DatascienceTypeState(Store, StateWithSummarization, InputMixin):
         super().__init__(variables, lattices, arguments)
         InputMixin.__init__(self, precursory)
         self._subscriptions = dict() # Initialize _subscriptions as a dictionary
+        self._properties = dict()   # data properties of the variables, unknown if missing
 
     @property
     def subscriptions(self):
         return self._subscriptions
 
+    @property
+    def properties(self):
+        """Current mapping from variables to the (known) properties of the data they refer to."""
+        return self._properties
+
+    def get_properties(self, variable: VariableIdentifier) -> DataProperties:
+        """Properties of the data a variable refers to.
+
+        :param variable: variable whose data properties are retrieved
+        :return: data properties of the variable (all unknown if none is recorded)
+        """
+        return self._properties.get(variable, _unknown)
+
+    def set_properties(self, variable: VariableIdentifier, properties: DataProperties):
+        """Record the properties of the data a variable refers to.
+
+        :param variable: variable whose data properties are recorded
+        :param properties: data properties of the variable
+        """
+        if properties.is_top():
+            self._properties.pop(variable, None)
+        else:
+            self._properties[variable] = properties
+
+    def update_properties(self, variable: VariableIdentifier, **properties: Status):
+        """Change some of the properties of the data a variable refers to.
+
+        :param variable: variable whose data properties are changed
+        :param properties: changed properties and their new values
+        """
+        self.set_properties(variable, self.get_properties(variable).replace(**properties))
+
+    def _mappings(self):
+        return super()._mappings() + [self._subscriptions, self._properties]
+
+    @copy_docstring(Store.collect)
+    def collect(self, variables: Set[VariableIdentifier]) -> 'DatascienceTypeState':
+        # the checks at the end of the program need the type and the data properties
+        # of the variables
+        checked = {variable for variable in variables if variable in self.properties}
+        for key in [key for key in self.store if isinstance(key, Subscription)]:
+            target = key.target.variable if isinstance(key.target, VariableAccess) else key.target
+            if target in checked:
+                del self.store[key]
+        for variable in checked:
+            self._subscriptions.pop(variable, None)
+        return super().collect(variables - checked)
+
+    def _combine_properties(self, other: 'DatascienceTypeState', operation):
+        variables = set(self.properties).union(other.properties)
+        properties = dict()
+        for variable in variables:
+            combined = operation(self.get_properties(variable), other.get_properties(variable))
+            if not combined.is_top():
+                properties[variable] = combined
+        self._properties = properties
+
+    @copy_docstring(Store.is_top)
+    def is_top(self) -> bool:
+        return super().is_top() and not self.properties
+
+    @copy_docstring(Store._hash_key)
+    def _hash_key(self):
+        key = super()._hash_key()
+        if self.properties:
+            properties = self.properties.items()
+            return key, frozenset((variable.name, value) for variable, value in properties)
+        return key
+
+    @copy_docstring(Store._less_equal)
+    def _less_equal(self, other: 'DatascienceTypeState') -> bool:
+        properties = all(self.get_properties(variable).less_equal(properties)
+                         for variable, properties in other.properties.items())
+        return properties and super()._less_equal(other)
+
+    @copy_docstring(Store._join)
+    def _join(self, other: 'DatascienceTypeState') -> 'DatascienceTypeState':
+        self._combine_properties(other, DataProperties.join)
+        return super()._join(other)
+
+    @copy_docstring(Store._meet)
+    def _meet(self, other: 'DatascienceTypeState'):
+        self._combine_properties(other, DataProperties.meet)
+        return super()._meet(other)
+
+    @copy_docstring(Store._widening)
+    def _widening(self, other: 'DatascienceTypeState'):
+        self._combine_properties(other, DataProperties.join)    # the properties have finite height
+        return super()._widening(other)
+
     def _weak_update(self, variables: Set[VariableIdentifier], previous: 'StateWithSummarization'):
         for var in variables:
+            self.set_properties(var, self.get_properties(var).join(previous.get_properties(var)))
             self.store[var].join(previous.store[var])
             if var.has_length:
                 self.lengths[var.length].join(previous.lengths[var.length])
@@ -648,14 +861,18 @@ class DatascienceTypeState(Store, StateWithSummarization, InputMixin):
             left_copy = copy.deepcopy(self.store[left])
             right_copy = copy.deepcopy(evaluation[right])
             if right_copy.meet(typ).is_bottom() and not typ.is_top():
-                warnings.warn(f"Warning [potential]: inferred type is different wrt annotated type for variable {left.name}. {typ} -> {evaluation[right]} @ line {self.pp}",
-                              category=InconsistentTypeWarning, stacklevel=2)
+                warn(f"Warning [potential]: inferred type is different wrt annotated type "
+                     f"for variable {left.name}. {typ} -> {evaluation[right]} @ line {self.pp}",
+                     category=InconsistentTypeWarning, stacklevel=2,
+                     level='potential', pp=self.pp, variable=left)
         # Assignment is destructive
         self.store[left] = evaluation[right]
         if evaluation[right].element == DatascienceTypeLattice.Status.NoneRet:
-            warnings.warn(f"Warning [plausible]: Assignment to None type for variable {left.name} @ line {self.pp}",
-                          category=NoneRetAssignmentWarning,
-                          stacklevel=2)
+            warn(f"Warning [plausible]: Assignment to None type for variable {left.name} "
+                 f"@ line {self.pp}",
+                 category=NoneRetAssignmentWarning,
+                 stacklevel=2,
+                 level='plausible', pp=self.pp, variable=left)
         if left.is_dictionary:
             _typ = DatascienceTypeLattice.from_lyra_type(left.typ.key_typ)
             typ_ = DatascienceTypeLattice.from_lyra_type(left.typ.val_typ)
@@ -669,19 +886,7 @@ class DatascienceTypeState(Store, StateWithSummarization, InputMixin):
                 self.values[left.values] = deepcopy(evaluation[right]).meet(deepcopy(typ))
         if isinstance(right, VariableIdentifier):
             if right in self.variables and left in self.variables:
-                right_tmp = None
-                for v in self._variables:
-                    if v == right:
-                        right_tmp = v
-                if right_tmp:
-                    left.is_shuffled = right_tmp.is_shuffled
-                    left.is_high_dimensionality = right_tmp.is_high_dimensionality
-                    left.has_duplicates = right_tmp.has_duplicates
-                    left.is_small = right_tmp.is_small
-                    left.has_na_values = right_tmp.has_na_values
-                    if left in self.variables:
-                        self.variables.remove(left)
-                    self.variables.add(left)
+                self.set_properties(left, self.get_properties(right))
         if right_copy_:
             if len(right_copy_) == 7:
                 right = right_copy_
@@ -690,43 +895,31 @@ class DatascienceTypeState(Store, StateWithSummarization, InputMixin):
                 self._add_series_with_dtypes(left, right[1], right[6])  # No return, just side effect
                 # If there is at least one ordered Series, the DataFrame is not shuffled
                 if any([v == "increasing" or v == "decreasing" for v in dict(right[6]).values()]):
-                    left.is_shuffled = Status.NO
+                    is_shuffled = Status.NO
+                elif len(right[6]) < len(right[1]):     # the sorting of some Series is unknown
+                    is_shuffled = Status.MAYBE
                 else:
-                    left.is_shuffled = Status.YES
+                    is_shuffled = Status.YES
                 if right[2] == True:
-                    left.is_high_dimensionality = Status.YES
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: {left.name} is high dimensional. Feature selection/engineering or dimensionality reduction may be necessary.",
-                        category=HighDimensionalityWarning, stacklevel=2)
-                else:
-                    left.is_high_dimensionality = Status.NO
-                if right[3] == True:
-                    left.has_duplicates = Status.YES
-                else:
-                    left.has_duplicates = Status.NO
-                if right[4] == True:
-                    left.has_na_values = Status.YES
-                else:
-                    left.has_na_values = Status.NO
-                if right[5] == True:
-                    left.is_small = Status.YES
-                else:
-                    left.is_small = Status.NO
-                if left in self.variables:
-                    self.variables.remove(left)
+                        category=HighDimensionalityWarning, stacklevel=2,
+                        level='plausible', pp=self.pp, variable=left)
+                properties = DataProperties(
+                    is_high_dimensionality=_status(right[2]),
+                    has_duplicates=_status(right[3]),
+                    is_small=_status(right[5]),
+                    is_shuffled=is_shuffled,
+                    has_na_values=_status(right[4]))
                 self.variables.add(left)
+                self.set_properties(left, properties)
             elif len(right_copy_) == 2:
                 right_tmp = right_copy_[1]
                 if right_tmp in self.variables:
-                    left.is_shuffled = right_tmp.is_shuffled
-                    left.is_high_dimensionality = right_tmp.is_high_dimensionality
-                    left.has_duplicates = right_tmp.has_duplicates
-                    left.is_small = right_tmp.is_small
-                    left.has_na_values = right_tmp.has_na_values
-                    if left in self.variables:
-                        self.variables.remove(left)
                     self.variables.add(left)
+                    self.set_properties(left, self.get_properties(right_tmp))
                 self.variables.remove(right_tmp)
+                self.properties.pop(right_tmp, None)
         return self
 
     def _assign_subscription(self, left: Subscription, right: Expression) -> 'DatascienceTypeState':
@@ -734,9 +927,11 @@ class DatascienceTypeState(Store, StateWithSummarization, InputMixin):
         typ = DatascienceTypeLattice.from_lyra_type(left.typ)
         self.store[left] = evaluation[right].meet(typ)
         if evaluation[right].element == DatascienceTypeLattice.Status.NoneRet:
-                        warnings.warn(f"Warning [plausible]: Assignment to None type for variable {left.name} @ line {self.pp}",
-                        NoneRetAssignmentWarning,
-                        stacklevel=2)
+            warn(f"Warning [plausible]: Assignment to None type for variable {left.name} "
+                 f"@ line {self.pp}",
+                 NoneRetAssignmentWarning,
+                 stacklevel=2,
+                 level='plausible', pp=self.pp, variable=left)
         target = left.target
         if isinstance(target, VariableAccess):
             target = target.variable
@@ -763,9 +958,11 @@ class DatascienceTypeState(Store, StateWithSummarization, InputMixin):
         else:
             self.store[left] = evaluation[right].meet(typ)
         if evaluation[right].element == DatascienceTypeLattice.Status.NoneRet:
-            warnings.warn(f"Warning [plausible]: Assignment to None type for variable {left.name} @ line {self.pp}",
-                          NoneRetAssignmentWarning,
-                          stacklevel=2)
+            warn(f"Warning [plausible]: Assignment to None type for variable {left.name} "
+                 f"@ line {self.pp}",
+                 NoneRetAssignmentWarning,
+                 stacklevel=2,
+                 level='plausible', pp=self.pp, variable=left)
         return self
 
     def _assign_slicing(self, left: Slicing, right: Expression) -> 'DatascienceTypeState':
@@ -846,12 +1043,14 @@ class DatascienceTypeState(Store, StateWithSummarization, InputMixin):
     def forget_variable(self, variable: VariableIdentifier) -> 'DatascienceTypeState':
         # Puts the variable type to top
         self.store[variable].top()
+        self.properties.pop(variable, None)
         return self
 
     def delete_var(self, variable: VariableIdentifier) -> 'DatascienceTypeState':
         # Deletes the variable from the store if they are present
         if variable in self.store:
             del self.store[variable]
+        self.properties.pop(variable, None)
         return self
 
     def _output(self, output: Expression) -> 'DatascienceTypeState':
@@ -869,6 +1068,7 @@ class DatascienceTypeState(Store, StateWithSummarization, InputMixin):
     def remove_variable(self, variable: VariableIdentifier):
         try:
             self.variables.remove(variable)
+            self.properties.pop(variable, None)
             del self.store[variable]
             if variable.has_length:
                 del self.lengths[variable.length]
@@ -0,0 +1,289 @@
+"""
+Data Profiling
+==============
+
+Metadata of the CSV files read by the analyzed programs (with ``pandas.read_csv``):
+the shape of the data, the data type of each column, whether the data has duplicated rows
+or missing values, and whether each column is sorted.
+
+The data is read in chunks, so memory usage does not grow with the size of the data
+(except for one 64-bit hash per row, needed to find duplicated rows across chunks),
+and optionally only up to a given number of rows.
+CSV files within zip archives are read from the archive without extracting them.
+Profiles are cached on disk, keyed by the path, size, and modification time of the data,
+so later analyses do not read the data again.
+
+:Author: Caterina Urban
+"""
+import hashlib
+import os
+import zipfile
+from typing import Dict, Iterable, Optional, Tuple
+
+from lyra.frontend.cache import DiskCache, cache_directory, version
+
+ARCHIVES = ["/Users/greta/PhD/kaggle/input"]    # TODO: Do not use hardcoded paths
+"""Directories searched for the zip archives of data that is not found."""
+
+
+class DataProfile:
+    """Metadata of a CSV file.
+
+    When only a sample of the rows was read (cf. ``exact``), the facts that the rows read
+    cannot establish for the whole data are unknown (i.e., ``None``, or missing for sorting).
+    """
+
+    def __init__(self, rows: int, dtypes: Dict[str, str], has_duplicates: bool,
+                 has_na_values: bool, sorting: Dict[str, str], exact: bool = True):
+        """Metadata of a CSV file.
+
+        :param rows: number of rows (read)
+        :param dtypes: data type of each column
+        :param has_duplicates: whether there are duplicated rows
+        :param has_na_values: whether there are missing values
+        :param sorting: sorting of each column
+            (values: constant, increasing, decreasing, not_sorted)
+        :param exact: whether all rows were read (or only a sample of them)
+        """
+        self._rows = rows
+        self._dtypes = dtypes
+        self._has_duplicates = has_duplicates
+        self._has_na_values = has_na_values
+        self._sorting = sorting
+        self._exact = exact
+
+    @property
+    def rows(self):
+        """Number of rows (read)."""
+        return self._rows
+
+    @property
+    def columns(self):
+        """Number of columns."""
+        return len(self.dtypes)
+
+    @property
+    def dtypes(self):
+        """Data type of each column."""
+        return self._dtypes
+
+    @property
+    def has_duplicates(self) -> Optional[bool]:
+        """Whether there are duplicated rows (``None`` if unknown)."""
+        if self._has_duplicates or self.exact:
+            return self._has_duplicates
+        return None     # the rows that were not read might duplicate other rows
+
+    @property
+    def has_na_values(self) -> Optional[bool]:
+        """Whether there are missing values (``None`` if unknown)."""
+        if self._has_na_values or self.exact:
+            return self._has_na_values
+        return None     # the rows that were not read might have missing values
+
+    @property
+    def sorting(self) -> Dict[str, str]:
+        """Sorting of each column (only of the columns that are not sorted, if not exact)."""
+        if self.exact:
+            return self._sorting
+        # the rows that were not read might break the sorting of the rows read
+        return {c: sorting for c, sorting in self._sorting.items() if sorting == 'not_sorted'}
+
+    @property
+    def exact(self):
+        """Whether all rows were read (or only a sample of them)."""
+        return self._exact
+
+    @property
+    def is_small(self) -> Optional[bool]:
+        """Whether there are at most 100 rows (``None`` if unknown)."""
+        if self.exact or self.rows > 100:
+            return self.rows <= 100
+        return None     # the number of rows read is only a lower bound
+
+    @property
+    def is_high_dimensional(self) -> Optional[bool]:
+        """Whether the number of rows is less than twice the number of columns
+        (``None`` if unknown)."""
+        if self.exact or self.rows >= 2 * self.columns:
+            return self.rows < 2 * self.columns
+        return None     # the number of rows read is only a lower bound
+
+    def __repr__(self):
+        shape = f"{self.rows}{'' if self.exact else '+'} x {self.columns}"
+        return f"DataProfile({shape}, duplicates={self.has_duplicates}, na={self.has_na_values})"
+
+
+def locate(path: str, archives: Iterable[str] = ()) -> Tuple[str, Optional[str]]:
+    """Locate a CSV file, possibly within a zip archive.
+
+    A file ``<directory>/<name>`` that does not exist is looked for as member ``<name>``
+    of a zip archive ``<directory>.zip``, next to the directory
+    or within one of the given directories.
+
+    :param path: path of the CSV file
+    :param archives: directories containing zip archives
+    :return: path of the file (or of the archive),
+        and name of the archive member (``None`` if not in an archive)
+    """
+    if os.path.exists(path):
+        return path, None
+    directory, name = os.path.split(path)
+    archive = os.path.basename(directory) + '.zip'
+    for candidate in (os.path.dirname(directory), *archives):
+        candidate = os.path.join(candidate, archive)
+        if os.path.isfile(candidate):
+            with zipfile.ZipFile(candidate) as zipped:
+                members = [m for m in zipped.namelist() if m == name or m.endswith('/' + name)]
+            if members:
+                return candidate, min(members, key=len)
+    raise FileNotFoundError(path)
+
+
+def _dtype(previous: Optional[str], dtype: str) -> str:
+    """Data type of a column, unifying the data types inferred for different chunks."""
+    if dtype == 'str':      # text columns (pandas 3)
+        dtype = 'object'
+    if previous is None or previous == dtype:
+        return dtype
+    numeric = ('int64', 'float64')
+    if previous in numeric and dtype in numeric:
+        return 'float64'
+    return 'object'
+
+
+def profile(data, options: Dict = None, rows: int = None, chunk: int = 100000) -> DataProfile:
+    """Profile CSV data, reading it a chunk at a time.
+
+    :param data: path or (binary) file object of the CSV data
+    :param options: keyword arguments of ``pandas.read_csv``
+    :param rows: maximum number of rows to read, ``None`` to read all rows
+    :param chunk: number of rows read at a time
+    :return: profile of the CSV data (up to the given number of rows)
+    """
+    import numpy as np      # imported lazily, only needed to read the data
+    import pandas as pd
+    options = dict(options or dict())
+    limit = options.pop('nrows', None)
+    sampled = rows is not None and (limit is None or rows < int(limit))
+    if sampled:
+        limit = rows + 1    # one more row to know whether there are more rows
+    total, dtypes, has_na_values, hashes, more = 0, dict(), False, list(), False
+    sorting: Dict[str, Tuple[bool, bool, object]] = dict()   # increasing, decreasing, last value
+    with pd.read_csv(data, chunksize=chunk, nrows=limit, **options) as reader:
+        for frame in reader:
+            if sampled and total + len(frame) > rows:
+                frame, more = frame.iloc[:rows - total], True
+            total += len(frame)
+            for column, dtype in frame.dtypes.items():
+                dtypes[column] = _dtype(dtypes.get(column), str(dtype))
+            has_na_values = has_na_values or bool(frame.isna().values.any())
+            hashes.append(pd.util.hash_pandas_object(frame, index=False).to_numpy())
+            for column in frame.columns:
+                increasing, decreasing, last = sorting.get(column, (True, True, None))
+                if (increasing or decreasing) and not frame.empty:
+                    series = frame[column]
+                    increasing = increasing and series.is_monotonic_increasing
+                    decreasing = decreasing and series.is_monotonic_decreasing
+                    if last is not None:
+                        try:
+                            increasing = increasing and bool(last <= series.iloc[0])
+                            decreasing = decreasing and bool(last >= series.iloc[0])
+                        except TypeError:   # incomparable values
+                            increasing = decreasing = False
+                    last = series.iloc[-1]
+                sorting[column] = increasing, decreasing, last
+    hashed = np.concatenate(hashes) if hashes else np.empty(0, dtype=np.uint64)
+    hashed.sort()
+    has_duplicates = bool((hashed[1:] == hashed[:-1]).any())
+    names = {(True, True): 'constant', (True, False): 'increasing', (False, True): 'decreasing'}
+    sorted_ = {c: names.get((i, d), 'not_sorted') for c, (i, d, _) in sorting.items()}
+    return DataProfile(total, dtypes, has_duplicates, has_na_values, sorted_, not more)
+
+
+class ProfileCache(DiskCache):
+    """On-disk cache of the profiles of CSV files."""
+
+    def __init__(self, directory: str = None, size: int = 256 * 1024 * 1024):
+        """On-disk cache of the profiles of CSV files.
+
+        :param directory: cache directory (defaults to ``$XDG_CACHE_HOME/pyra/profiles``)
+        :param size: maximum size of the cache (in bytes)
+        """
+        super().__init__(directory or cache_directory('profiles'), size)
+        self._version = version()
+
+    def key(self, path: str, member: Optional[str], options: Dict, rows: Optional[int]) -> str:
+        """Key of the cache entry of a CSV file.
+
+        :param path: path of the CSV file (or of the zip archive containing it)
+        :param member: name of the archive member, ``None`` if not in an archive
+        :param options: keyword arguments of ``pandas.read_csv``
+        :param rows: maximum number of rows read, ``None`` if all rows are read
+        :return: SHA-256 hash of the path, size, and modification time of the file,
+            of the options it is read with, and of the Pyra version
+        """
+        stat = os.stat(path)
+        components = (os.path.abspath(path), member or '', str(stat.st_size),
+                      str(stat.st_mtime_ns), repr(sorted(options.items())), str(rows))
+        digest = hashlib.sha256(self._version.encode('utf-8'))
+        for component in components:
+            digest.update(b'\0')
+            digest.update(component.encode('utf-8'))
+        return digest.hexdigest()
+
+
+class Profiler:
+    """Profiler of the CSV files read by the analyzed programs."""
+
+    def __init__(self, cache: ProfileCache = None, rows: int = None, chunk: int = 100000,
+                 archives: Iterable[str] = tuple(ARCHIVES)):
+        """Profiler of the CSV files read by the analyzed programs.
+
+        :param cache: cache of the profiles, ``None`` for no caching
+        :param rows: maximum number of rows of each file to read, ``None`` to read all rows
+        :param chunk: number of rows read at a time
+        :param archives: directories containing the zip archives of data that is not found
+        """
+        self._cache = cache
+        self._rows = rows
+        self._chunk = chunk
+        self._archives = tuple(archives)
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @property
+    def rows(self):
+        return self._rows
+
+    @property
+    def chunk(self):
+        return self._chunk
+
+    @property
+    def archives(self):
+        return self._archives
+
+    def profile(self, path: str, options: Dict = None) -> DataProfile:
+        """Profile of a CSV file, read from the cache if possible.
+
+        :param path: path of the CSV file
+        :param options: keyword arguments of ``pandas.read_csv``
+        :return: profile of the CSV file
+        """
+        options = options or dict()
+        container, member = locate(path, self.archives)
+        key = self.cache.key(container, member, options, self.rows) if self.cache else None
+        cached = self.cache.load(key) if self.cache else None
+        if cached is not None:
+            return cached
+        if member is None:
+            result = profile(container, options, self.rows, self.chunk)
+        else:
+            with zipfile.ZipFile(container) as zipped, zipped.open(member) as data:
+                result = profile(data, options, self.rows, self.chunk)
+        if self.cache:
+            self.cache.store(key, result)
+        return result
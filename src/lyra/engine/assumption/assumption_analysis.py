@@ -17,6 +17,7 @@ from lyra.abstract_domains.assumption.type_domain import TypeState
 from lyra.engine.backward import BackwardInterpreter
 from lyra.engine.forward import ForwardInterpreter
 from lyra.engine.runner import Runner
+from lyra.engine.worklist import WTOWorklist
 from lyra.semantics.backward import DefaultBackwardSemantics
 from lyra.semantics.forward import DefaultForwardSemantics
 from lyra.datascience.datascience_type_domain import DatascienceTypeState
@@ -31,11 +32,16 @@ class ForwardDatascienceTypeAnalysis(Runner):
         self.warning_level = warning_level
 
     def interpreter(self):
-        return ForwardInterpreter(self.cfgs, self.fargs, DatascienceTypeSemantics(), 3, warning_level=self.warning_level)
+        return ForwardInterpreter(self.cfgs, self.fargs, DatascienceTypeSemantics(), 3,
+                                  warning_level=self.warning_level, worklist=WTOWorklist)
 
     def state(self):
         return DatascienceTypeState(self.variables)
 
+    @property
+    def criterion(self):
+        return DatascienceTypeSemantics.warning_calls
+
 
 class BackwardDatascienceTypeAnalysis(Runner):
 
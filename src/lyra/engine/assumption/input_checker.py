@@ -0,0 +1,509 @@
+"""
+Input Data Checker
+==================
+
+Validation of the input data of a program against the assumption inferred
+by an assumption analysis.
+
+The inferred assumption (cf. ``AssumptionState.InputStack.InputLattice``) is compiled into
+a tree of checks, which is then run over the input data as it is read, in fixed-size chunks:
+only the chunk being checked and the values the repetitions depend on are kept in memory.
+
+* a basic constraint reads one line and checks it against each of its (non-top) lattices
+* a star constraint accepts the rest of the input data, which is therefore not read at all
+* a repetition evaluates its multiplier on the values previously read and checks its constraints
+  as many times; a multiplier that cannot be evaluated is treated as a star constraint
+
+Repetitions of basic constraints are checked a whole chunk at a time, with a regular expression
+that only matches lines satisfying the checks; the lines of a chunk that does not match
+are then checked one by one to report the violations.
+
+:Author: Caterina Urban
+"""
+import re
+from itertools import islice
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from lyra.abstract_domains.assumption.alphabet_domain import AlphabetLattice
+from lyra.abstract_domains.assumption.assumption_domain import AssumptionState, JSONMixin
+from lyra.abstract_domains.assumption.quantity_domain import QuantityLattice
+from lyra.abstract_domains.assumption.range_domain import RangeLattice
+from lyra.abstract_domains.assumption.type_domain import TypeLattice
+from lyra.abstract_domains.assumption.wordset_domain import WordSetLattice
+from lyra.core.expressions import Expression, Literal, VariableIdentifier, CastOperation, \
+    UnaryArithmeticOperation, BinaryArithmeticOperation
+from lyra.core.types import FloatLyraType
+
+InputLattice = AssumptionState.InputStack.InputLattice
+Check = Tuple[Callable[[bytes], bool], Optional[bytes], Optional[Callable[[bytes, int], bool]]]
+
+
+class InputViolation:
+    """Line of the input data that does not satisfy the inferred assumption."""
+
+    def __init__(self, line: int, text: Optional[str], message: str):
+        """Line of the input data that does not satisfy the inferred assumption.
+
+        :param line: line of the input data (one past the last line for missing input data)
+        :param text: content of the line, ``None`` for missing input data
+        :param message: description of the violated constraint
+        """
+        self._line = line
+        self._text = text
+        self._message = message
+
+    @property
+    def line(self):
+        """Line of the input data."""
+        return self._line
+
+    @property
+    def text(self):
+        """Content of the line, ``None`` for missing input data."""
+        return self._text
+
+    @property
+    def message(self):
+        """Description of the violated constraint."""
+        return self._message
+
+    def __repr__(self):
+        return f"{self.line}: {self.message}"
+
+
+class _Unknown(Exception):
+    """Raised when a multiplier cannot be evaluated on the values read so far."""
+
+
+class _Skip(Exception):
+    """Raised when the rest of the input data is accepted without being read."""
+
+
+class _Missing(Exception):
+    """Raised when the input data ends before the inferred assumption does."""
+
+
+# checks on a line (without its line terminator), each paired with
+# a regular expression that only matches lines satisfying the check and
+# a check on a chunk of lines that only succeeds if all lines satisfy the check
+# (``None`` if there is no such regular expression or check on a chunk of lines)
+
+def _number(value: bytes):
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _integers(lines: bytes, count: int) -> Optional[List[int]]:
+    """Integer values of a chunk of lines, ``None`` if some line is not an integer."""
+    values = lines.splitlines()
+    if len(values) != count:
+        return None
+    try:
+        return list(map(int, values))
+    except ValueError:
+        return None
+
+
+def _boolean(value: bytes) -> bool:
+    try:
+        return int(value) in (0, 1)
+    except ValueError:
+        return False
+
+
+def _integer(value: bytes) -> bool:
+    try:
+        int(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _float(value: bytes) -> bool:
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _never(value: bytes) -> bool:
+    return False
+
+
+def _type(lattice: TypeLattice) -> Check:
+    checks = {
+        TypeLattice.Status.Boolean: (_boolean, rb'[01]', None),
+        TypeLattice.Status.Integer: (_integer, rb'[+-]?[0-9]+', None),
+        TypeLattice.Status.Float:
+            (_float, rb'[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?', None)
+    }
+    return checks[lattice.element]
+
+
+def _range(lattice: RangeLattice) -> Check:
+    lower, upper = lattice.lower, lattice.upper
+
+    def check(value: bytes) -> bool:
+        try:
+            return lower <= _number(value) <= upper
+        except ValueError:
+            return False
+
+    def chunk(lines: bytes, count: int) -> bool:
+        values = _integers(lines, count)
+        return values is not None and (not values or lower <= min(values) and max(values) <= upper)
+    return check, None, chunk
+
+
+def _quantity(lattice: QuantityLattice) -> Check:
+    negative, zero, positive = lattice.negative, lattice.zero, lattice.positive
+
+    def check(value: bytes) -> bool:
+        try:
+            number = _number(value)
+        except ValueError:
+            return False
+        return (negative and number < 0) or (zero and number == 0) or (positive and number > 0)
+
+    def chunk(lines: bytes, count: int) -> bool:
+        values = _integers(lines, count)
+        if values is None:
+            return False
+        if not values:
+            return True
+        return (negative or min(values) >= 0) and (positive or max(values) <= 0) \
+            and (zero or 0 not in values)
+    return check, None, chunk
+
+
+def _alphabet(lattice: AlphabetLattice) -> Check:
+    certainly = [character.encode() for character in lattice.certainly]
+    maybe = b''.join(character.encode() for character in lattice.maybe)
+    if len(maybe) == len(lattice.maybe):    # single-byte characters, checked without decoding
+        def check(value: bytes) -> bool:
+            return not value.translate(None, maybe) and all(c in value for c in certainly)
+        allowed = maybe.replace(b'\n', b'')
+        if certainly or not allowed:
+            return check, None, None
+        terminated = allowed + b'\r\n'
+        pattern = b'[' + re.escape(allowed) + b']*'
+        return check, pattern, lambda lines, count: not lines.translate(None, terminated)
+    characters, allowed = set(lattice.certainly), set(lattice.maybe)
+
+    def check(value: bytes) -> bool:
+        decoded = set(value.decode(errors='replace'))
+        return characters.issubset(decoded) and decoded.issubset(allowed)
+    return check, None, None
+
+
+def _wordset(lattice: WordSetLattice) -> Check:
+    words = frozenset(word.encode() for word in lattice.strings)
+
+    def chunk(lines: bytes, count: int) -> bool:
+        values = lines.splitlines()
+        return len(values) == count and words.issuperset(values)
+    if not words or len(words) > 256:
+        return words.__contains__, None, chunk
+    pattern = b'(?:' + b'|'.join(re.escape(word) for word in sorted(words)) + b')'
+    return words.__contains__, pattern, chunk
+
+
+_compilers: Dict[type, Callable[[JSONMixin], Check]] = {
+    TypeLattice: _type,
+    RangeLattice: _range,
+    QuantityLattice: _quantity,
+    AlphabetLattice: _alphabet,
+    WordSetLattice: _wordset
+}
+"""Compilation of the (non-top, non-bottom) lattices of a basic constraint
+into checks on a line."""
+
+
+def _variables(expression: Expression) -> Set[str]:
+    """Names of the input values (cf. ``AssumptionState.InputStack.InputReplacement``)
+    a multiplier depends on."""
+    if isinstance(expression, VariableIdentifier):
+        return {expression.name}
+    if isinstance(expression, (CastOperation, UnaryArithmeticOperation)):
+        return _variables(expression.expression)
+    if isinstance(expression, BinaryArithmeticOperation):
+        return _variables(expression.left) | _variables(expression.right)
+    return set()
+
+
+def _evaluate(expression: Expression, values: Dict[str, bytes]):
+    """Evaluate a multiplier on the input values read so far.
+
+    :param expression: multiplier to evaluate
+    :param values: input values read so far (that multipliers depend on)
+    :return: value of the multiplier
+    :raise _Unknown: if the multiplier cannot be evaluated
+    """
+    try:
+        if isinstance(expression, Literal):
+            return _number(expression.val.encode())
+        if isinstance(expression, VariableIdentifier):
+            return _number(values[expression.name])
+        if isinstance(expression, CastOperation):
+            value = _evaluate(expression.expression, values)
+            return float(value) if isinstance(expression.typ, FloatLyraType) else int(value)
+        if isinstance(expression, UnaryArithmeticOperation):
+            value = _evaluate(expression.expression, values)
+            negated = expression.operator == UnaryArithmeticOperation.Operator.Sub
+            return -value if negated else value
+        if isinstance(expression, BinaryArithmeticOperation):
+            left = _evaluate(expression.left, values)
+            right = _evaluate(expression.right, values)
+            if expression.operator == BinaryArithmeticOperation.Operator.Add:
+                return left + right
+            if expression.operator == BinaryArithmeticOperation.Operator.Sub:
+                return left - right
+            if expression.operator == BinaryArithmeticOperation.Operator.Mult:
+                return left * right
+            if expression.operator == BinaryArithmeticOperation.Operator.Div:
+                return left / right
+    except (KeyError, ValueError, OverflowError, ZeroDivisionError):
+        pass
+    raise _Unknown
+
+
+def _matcher(patterns: List[List[bytes]]) -> Callable[[bytes, int], bool]:
+    """Check on a chunk of lines built from the regular expressions
+    each line of a repetition of basic constraints should match."""
+    lines = list()
+    for expressions in patterns:
+        expressions = expressions or [b'[^\n]*']
+        ends = (b'(?=' + expression + b'\r?(?:\n|\\Z))' for expression in expressions[:-1])
+        lookaheads = b''.join(ends)
+        lines.append(lookaheads + expressions[-1] + b'\r?(?:\n|\\Z)')
+    match = re.compile(b'(?:' + b''.join(lines) + b')*').fullmatch
+    return lambda chunk, count: match(chunk) is not None
+
+
+class _Reader:
+    """Reader of input data in fixed-size chunks."""
+
+    def __init__(self, data: BinaryIO, size: int):
+        self._data = data
+        self._size = size
+        self._buffer = b''
+        self._position = 0
+
+    def _more(self) -> bool:
+        chunk = self._data.read(self._size)
+        if not chunk:
+            return False
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+        return True
+
+    def readline(self) -> Optional[bytes]:
+        """Read one line.
+
+        :return: the line (including its line terminator), ``None`` at the end of the input data
+        """
+        while True:
+            end = self._buffer.find(b'\n', self._position)
+            if end >= 0:
+                line = self._buffer[self._position:end + 1]
+                self._position = end + 1
+                return line
+            if not self._more():
+                if self._position < len(self._buffer):
+                    line = self._buffer[self._position:]
+                    self._position = len(self._buffer)
+                    return line
+                return None
+
+    def readlines(self, count: int, multiple: int = 1) -> Tuple[bytes, int]:
+        """Read up to a given number of lines, as many as are available in the current chunk.
+
+        :param count: maximum number of lines to read
+        :param multiple: number the number of lines read should be a multiple of (if possible)
+        :return: the lines (including their line terminators) and their number,
+            which is zero only at the end of the input data
+        """
+        available = self._buffer.count(b'\n', self._position)
+        if not available:
+            line = self.readline()
+            return (line, 1) if line is not None else (b'', 0)
+        start = self._position
+        if available > count:
+            available, end = count, start
+            for _ in range(count):
+                end = self._buffer.find(b'\n', end) + 1
+        else:
+            end = self._buffer.rfind(b'\n') + 1
+        for _ in range(available % multiple if available >= multiple else 0):
+            end = self._buffer.rfind(b'\n', start, end - 1) + 1
+            available -= 1
+        self._position = end
+        return self._buffer[start:end], available
+
+
+class InputChecker:
+    """Streaming checker of the input data of a program against an inferred assumption."""
+
+    def __init__(self, assumption: InputLattice, chunk: int = 1 << 20):
+        """Compile an inferred assumption into a streaming checker.
+
+        :param assumption: assumption on the input data inferred at the beginning of the program
+        :param chunk: size of the chunks the input data is read in, in bytes
+        """
+        self._assumption = assumption
+        self._chunk = chunk
+        self._depended: Set[str] = set()
+        self._compiled = self._compile(assumption)
+        self._lines = 0
+        self._unchecked: Optional[int] = None
+
+    @property
+    def assumption(self):
+        """Assumption on the input data."""
+        return self._assumption
+
+    @property
+    def lines(self):
+        """Number of lines read by the last check."""
+        return self._lines
+
+    @property
+    def unchecked(self):
+        """First line not checked by the last check (because of a star constraint
+        or a multiplier that cannot be evaluated), ``None`` if the whole input data was checked."""
+        return self._unchecked
+
+    def _compile(self, constraint):
+        if isinstance(constraint, tuple):
+            if not constraint:      # the constraint is a StarConstraint
+                return None
+            pp, lattices = constraint   # the constraint is a BasicConstraint
+            checks = list()
+            for lattice in lattices:
+                if lattice.is_bottom():
+                    checks.append((_never, None, None, repr(lattice)))
+                elif not lattice.is_top() and type(lattice) in _compilers:
+                    checks.append(_compilers[type(lattice)](lattice) + (repr(lattice),))
+            return pp.line, tuple(checks)
+        # the constraint is an InputLattice
+        self._depended.update(_variables(constraint.multiplier))
+        constraints = [self._compile(c) for c in constraint.constraints]
+        return constraint.multiplier, constraints, self._block(constraints)
+
+    def _block(self, constraints) -> Optional[Callable[[bytes, int], bool]]:
+        """Check on a chunk of lines read by a repetition of basic constraints,
+        which only succeeds if all lines satisfy the constraints,
+        ``None`` if the repetition cannot be checked a chunk at a time."""
+        if not all(compiled is not None and len(compiled) == 2 for compiled in constraints):
+            return None     # not a repetition of BasicConstraints
+        read = {str(pp) for pp, _ in constraints}
+        if any(name.partition('.')[0] in read for name in self._depended):
+            return None     # a multiplier depends on a value read by the repetition
+        checks = [check for _, line in constraints for check in line]
+        if not checks:
+            return lambda lines, count: True
+        if len(constraints) == 1:   # the same checks on each line
+            chunks = list()
+            for _, pattern, chunk, _ in checks:
+                if chunk is None and pattern is None:
+                    return None
+                chunks.append(chunk or _matcher([[pattern]]))
+            return lambda lines, count: all(chunk(lines, count) for chunk in chunks)
+        if any(pattern is None for _, pattern, _, _ in checks):
+            return None
+        return _matcher([[pattern for _, pattern, _, _ in line] for _, line in constraints])
+
+    def check(self, path: str, exhaustive: bool = False) -> List[InputViolation]:
+        """Check an input data file.
+
+        :param path: path to the input data file
+        :param exhaustive: whether to report all violations (instead of stopping at the first one)
+        :return: violations of the inferred assumption
+        """
+        with open(path, 'rb') as data:
+            violations = self.violations(data)
+            return list(violations if exhaustive else islice(violations, 1))
+
+    def violations(self, data: BinaryIO) -> Iterator[InputViolation]:
+        """Check input data as it is read.
+
+        :param data: input data (opened in binary mode)
+        :return: violations of the inferred assumption, as soon as they are found
+        """
+        self._lines, self._unchecked = 0, None
+        reader = _Reader(data, self._chunk)
+        values: Dict[str, bytes] = dict()
+        previous = [None, 0]    # line of the program and index of the last value read there
+
+        def basic(pp: int, checks, line: bytes) -> Iterator[InputViolation]:
+            self._lines += 1
+            value = line.rstrip(b'\r\n')
+            for check, _, _, description in checks:
+                if not check(value):
+                    text = value.decode(errors='replace')
+                    message = f"{text!r} does not satisfy {description} (input read at line {pp})"
+                    yield InputViolation(self._lines, text, message)
+                    break
+            index = previous[1] + 1 if previous[0] == pp else 1
+            previous[0], previous[1] = pp, index
+            name = f"{pp}.{index}"
+            if name in self._depended:
+                values[name] = value
+
+        def block(constraints, match, repetitions: int) -> Iterator[InputViolation]:
+            size = len(constraints)
+            done, expected = 0, repetitions * size
+            while done < expected:
+                if done % size:     # complete the current repetition first
+                    lines, count = reader.readlines(size - done % size)
+                else:
+                    lines, count = reader.readlines(expected - done, size)
+                if not count:
+                    raise _Missing
+                if done % size == 0 and count % size == 0 and match(lines, count):
+                    self._lines += count
+                else:   # check the lines one by one
+                    start = 0
+                    for i in range(done, done + count):
+                        end = lines.find(b'\n', start) + 1 or len(lines)
+                        yield from basic(*constraints[i % size], lines[start:end])
+                        start = end
+                done += count
+            previous[0], previous[1] = None, 0
+
+        def do(constraints) -> Iterator[InputViolation]:
+            for compiled in constraints:
+                if compiled is None:    # StarConstraint
+                    raise _Skip
+                if len(compiled) == 2:  # BasicConstraint
+                    line = reader.readline()
+                    if line is None:
+                        raise _Missing
+                    yield from basic(*compiled, line)
+                    continue
+                multiplier, nested, match = compiled    # InputLattice
+                repetitions = _evaluate(multiplier, values)
+                if repetitions != int(repetitions):
+                    raise _Unknown
+                if match is not None:
+                    yield from block(nested, match, int(repetitions))
+                else:
+                    for _ in range(int(repetitions)):
+                        yield from do(nested)
+
+        if self.assumption.is_bottom():
+            yield InputViolation(1, None, "no input data satisfies the assumption")
+            return
+        try:
+            yield from do([self._compiled])
+        except (_Skip, _Unknown):
+            self._unchecked = self._lines + 1
+            return
+        except _Missing:
+            yield InputViolation(self._lines + 1, None, "missing input data")
+            return
+        if reader.readline() is not None:
+            yield InputViolation(self._lines + 1, None, "unexpected input data")
@@ -5,13 +5,13 @@ Backward Analysis Engine
 :Author: Caterina Urban
 """
 
-from collections import deque
+import time
 from copy import deepcopy
-from queue import Queue
 from typing import List, Optional
 
 from lyra.engine.interpreter import Interpreter
-from lyra.engine.result import AnalysisResult
+from lyra.engine.result import AnalysisResult, StateSequence
+from lyra.engine.worklist import FIFOWorklist
 from lyra.semantics.backward import BackwardSemantics
 
 from lyra.abstract_domains.state import State
@@ -21,7 +21,8 @@ from lyra.core.cfg import Basic, Loop, Conditional, Edge, Node, ControlFlowGraph
 class BackwardInterpreter(Interpreter):
     """Backward control flow graph interpreter."""
 
-    def __init__(self, cfgs, fargs, semantics: BackwardSemantics, widening, precursory=None):
+    def __init__(self, cfgs, fargs, semantics: BackwardSemantics, widening, precursory=None,
+                 worklist=FIFOWorklist):
         """Backward control flow graph interpreter construction.
 
         :param cfgs: control flow graphs to analyze
@@ -29,14 +30,15 @@ class BackwardInterpreter(Interpreter):
         :param semantics: semantics of statements in the control flow graph
         :param widening: number of iterations before widening
         :param precursory: precursory control flow graph interpreter
+        :param worklist: worklist determining the order in which nodes are analyzed
         """
-        super().__init__(cfgs, fargs, semantics, widening, precursory)
+        super().__init__(cfgs, fargs, semantics, widening, precursory, worklist)
 
     @property
     def semantics(self):
         return self._semantics
 
-    def analyze(self, cfg: ControlFlowGraph, initial: State) -> AnalysisResult:
+    def fixpoint(self, cfg: ControlFlowGraph, initial: State) -> AnalysisResult:
         from lyra.engine.forward import ForwardInterpreter
 
         context: State = deepcopy(initial)
@@ -48,12 +50,14 @@ class BackwardInterpreter(Interpreter):
             pre_result: Optional[AnalysisResult] = None
 
         # prepare the worklist and iteration counts
-        worklist = Queue()
+        worklist = self.worklist(cfg, backward=True)
         worklist.put(cfg.out_node)
         iterations = {node: 0 for node in cfg.nodes}
+        started, first = time.time(), self._visits
 
         while not worklist.empty():
             current: Node = worklist.get()  # retrieve the current node
+            self._visits += 1
 
             iteration = iterations[current.identifier]
 
@@ -144,10 +148,15 @@ class BackwardInterpreter(Interpreter):
                 # widening
                 if isinstance(current, Loop) and self.widening < iteration:
                     entry = deepcopy(previous).widening(entry)
+                # degradation (if the budget of the analysis is exhausted)
+                if isinstance(current, Loop) and self.budget is not None:
+                    visits = self._visits - first
+                    budget = self.budget
+                    entry = budget.degrade(self, cfg, current, previous, entry, started, visits)
 
             # check for termination and execute block
             if previous is None or not entry.less_equal(previous):
-                states = deque([entry])
+                states = StateSequence([entry], reverse=True)
                 if isinstance(current, Basic):
                     successor = entry
 
@@ -169,7 +178,7 @@ class BackwardInterpreter(Interpreter):
                 elif isinstance(current, Loop):
                     # nothing to be done
                     pass
-                self.result.set_node_result(current, context, list(states))
+                self.result.set_node_result(current, context, states)
                 # update worklist and iteration count
                 for node in cfg.predecessors(current):
                     worklist.put(node)
@@ -0,0 +1,242 @@
+"""
+Batch Analysis
+==============
+
+Analysis of many programs in one run, fanned out over a pool of worker processes.
+
+Each worker analyzes one program at a time. A worker that exceeds the per-program timeout
+is killed, and a worker that crashes is replaced, without affecting the rest of the run.
+
+:Author: Caterina Urban
+"""
+import glob
+import io
+import multiprocessing
+import os
+import time
+import traceback
+import warnings
+from contextlib import redirect_stdout
+from enum import Enum
+from multiprocessing.connection import wait
+from typing import Callable, Iterable, Iterator, List
+
+import lyra.core.diagnostics as diagnostics
+from lyra.core.diagnostics import CollectingSink, Diagnostic
+from lyra.engine.runner import Runner
+
+
+class BatchResult:
+    """Outcome of the analysis of one program of a batch."""
+
+    class Status(Enum):
+        """Status of the analysis of a program."""
+        OK = 'ok'
+        ERROR = 'error'
+        TIMEOUT = 'timeout'
+        CRASH = 'crash'
+
+    def __init__(self, path: str, status: 'BatchResult.Status', duration: float,
+                 diagnostics: List[Diagnostic] = None, error: str = None):
+        """Outcome of the analysis of one program of a batch.
+
+        :param path: path of the analyzed program
+        :param status: status of the analysis
+        :param duration: duration of the analysis (in seconds)
+        :param diagnostics: warnings raised by the analysis
+        :param error: description of the error that stopped the analysis, if any
+        """
+        self._path = path
+        self._status = status
+        self._duration = duration
+        self._diagnostics = diagnostics or list()
+        self._error = error
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def status(self):
+        return self._status
+
+    @property
+    def duration(self):
+        return self._duration
+
+    @property
+    def diagnostics(self):
+        return self._diagnostics
+
+    @property
+    def error(self):
+        return self._error
+
+    def __str__(self):
+        lines = [f"[{self.status.value}] {self.path} ({self.duration:.2f}s)"]
+        if self.error:
+            lines.append(f"    {self.error}")
+        lines.extend(f"    {diagnostic}" for diagnostic in self.diagnostics)
+        return "\n".join(lines)
+
+
+def collect(targets: Iterable[str]) -> List[str]:
+    """Collect the Python files to analyze.
+
+    :param targets: directories (searched recursively), glob patterns, Python files,
+        or text files listing Python files (one per line)
+    :return: paths of the Python files to analyze, in order and without duplicates
+    """
+    paths = list()
+    for target in targets:
+        if os.path.isdir(target):
+            for root, dirs, files in os.walk(target):
+                dirs.sort()
+                paths.extend(os.path.join(root, f) for f in sorted(files) if f.endswith('.py'))
+        elif os.path.isfile(target) and target.endswith('.py'):
+            paths.append(target)
+        elif os.path.isfile(target):
+            with open(target, 'r') as listing:
+                lines = (line.strip() for line in listing)
+                paths.extend(line for line in lines if line and not line.startswith('#'))
+        else:
+            paths.extend(sorted(glob.glob(target, recursive=True)))
+    return list(dict.fromkeys(paths))
+
+
+def analyze(factory: Callable[[str], Runner], path: str) -> BatchResult:
+    """Analyze a program, collecting the warnings raised by the analysis.
+
+    :param factory: function creating the analysis runner for a program
+    :param path: path of the program to analyze
+    :return: outcome of the analysis
+    """
+    start = time.time()
+    with warnings.catch_warnings(), redirect_stdout(io.StringIO()), \
+            diagnostics.reporting(CollectingSink()) as sink:
+        warnings.simplefilter('ignore')
+        try:
+            runner = factory(path)
+            runner.viewing = False
+            runner.main(path)
+            status, error = BatchResult.Status.OK, None
+        except Exception as e:
+            status = BatchResult.Status.ERROR
+            frame = traceback.extract_tb(e.__traceback__)[-1]
+            error = f"{type(e).__name__}: {e} ({frame.filename}:{frame.lineno})"
+    return BatchResult(path, status, time.time() - start, sink.diagnostics, error)
+
+
+def _work(factory: Callable[[str], Runner], connection):
+    diagnostics.reset()     # the diagnostics are reported by the parent process
+    while True:
+        path = connection.recv()
+        if path is None:
+            break
+        connection.send(analyze(factory, path))
+
+
+class Batch:
+    """Batch analysis of many programs over a pool of worker processes."""
+
+    def __init__(self, factory: Callable[[str], Runner], workers: int = None,
+                 timeout: float = None):
+        """Batch analysis of many programs over a pool of worker processes.
+
+        .. note::
+            Where available, the workers are forked from the current process
+            and thus share the modules (e.g., the semantics) it has already loaded.
+
+        :param factory: (picklable) function creating the analysis runner for a program
+        :param workers: number of worker processes (defaults to the number of CPUs)
+        :param timeout: maximum duration of the analysis of a program (in seconds), if any
+        """
+        self._factory = factory
+        self._workers = workers or os.cpu_count() or 1
+        self._timeout = timeout
+        if 'fork' in multiprocessing.get_all_start_methods():
+            self._context = multiprocessing.get_context('fork')
+        else:
+            self._context = multiprocessing.get_context()
+
+    @property
+    def factory(self):
+        return self._factory
+
+    @property
+    def workers(self):
+        return self._workers
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    def _spawn(self):
+        connection, child = self._context.Pipe()
+        process = self._context.Process(target=_work, args=(self.factory, child), daemon=True)
+        process.start()
+        child.close()
+        return process, connection
+
+    def run(self, paths: Iterable[str]) -> Iterator[BatchResult]:
+        """Analyze programs, yielding the outcome of each analysis as soon as it is available.
+
+        :param paths: paths of the programs to analyze
+        :return: iterator over the outcomes of the analyses, in order of completion
+        """
+        pending = iter(paths)
+        idle = [self._spawn() for _ in range(self.workers)]
+        busy = dict()       # busy worker process -> (connection, analyzed path, start time)
+        try:
+            while True:
+                while idle:
+                    path = next(pending, None)
+                    if path is None:
+                        break
+                    process, connection = idle.pop()
+                    connection.send(path)
+                    busy[process] = (connection, path, time.time())
+                if not busy:
+                    break
+                waiting = None
+                if self.timeout is not None:
+                    deadline = min(start for _, _, start in busy.values()) + self.timeout
+                    waiting = max(0.0, deadline - time.time())
+                objects = [connection for connection, _, _ in busy.values()]
+                wait(objects + [process.sentinel for process in busy], waiting)
+                for process, (connection, path, start) in list(busy.items()):
+                    duration = time.time() - start
+                    result = None
+                    if connection.poll():
+                        try:
+                            result = connection.recv()
+                            idle.append((process, connection))
+                        except EOFError:
+                            pass
+                    if result is None:
+                        if not process.is_alive():
+                            error = f"worker exited with code {process.exitcode}"
+                            status = BatchResult.Status.CRASH
+                            result = BatchResult(path, status, duration, error=error)
+                        elif self.timeout is not None and duration >= self.timeout:
+                            process.kill()
+                            process.join()
+                            error = f"analysis exceeded the timeout of {self.timeout}s"
+                            status = BatchResult.Status.TIMEOUT
+                            result = BatchResult(path, status, duration, error=error)
+                        else:
+                            continue
+                        connection.close()
+                        idle.append(self._spawn())
+                    del busy[process]
+                    yield result
+        finally:
+            for process, connection in idle:
+                connection.send(None)
+                connection.close()
+            for process in busy:
+                process.kill()
+            for process, _ in idle:
+                process.join()
+            for process in busy:
+                process.join()
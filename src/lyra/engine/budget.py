@@ -0,0 +1,151 @@
+"""
+Analysis Budget
+===============
+
+Bounds on the resources spent by an analysis run (and by the analysis of each function),
+beyond which the analysis trades precision for termination.
+
+When the wall time or the number of node visits of the analysis run,
+or of the analysis of a function, exceeds its budget, the loops of the function
+are widened immediately (i.e., without waiting for the widening threshold of the interpreter).
+When it exceeds twice its budget, the loop heads of the function go to top,
+which guarantees the termination of the analysis shortly after.
+A loop head whose state exceeds the state size budget is widened immediately, and goes to top
+if its state still exceeds the budget.
+
+Each degradation of the precision of the analysis is reported as a ``PrecisionDegradedWarning``.
+
+:Author: Caterina Urban
+"""
+import time
+from copy import deepcopy
+from math import inf
+from typing import List, Optional, Tuple
+
+from lyra.abstract_domains.state import State
+from lyra.core.cfg import ControlFlowGraph, Conditional, Edge, Loop
+from lyra.core.diagnostics import PrecisionDegradedWarning, warn
+
+
+def size(state: State) -> int:
+    """Size of a state, measured as the length of its string representation
+    (which grows with the number of variables and with the size of their values,
+    e.g., of string sets).
+
+    :param state: state to measure
+    :return: size of the state
+    """
+    return len(str(state))
+
+
+class Budget:
+    """Budget of an analysis run (and of the analysis of each function)."""
+
+    def __init__(self, time: float = None, visits: int = None, size: int = None,
+                 function_time: float = None, function_visits: int = None):
+        """Budget of an analysis run (and of the analysis of each function).
+
+        :param time: maximum wall time of the analysis run (in seconds), ``None`` for no bound
+        :param visits: maximum number of node visits of the analysis run, ``None`` for no bound
+        :param size: maximum size of the state at a loop head (cf. ``size``), ``None`` for no bound
+        :param function_time: maximum wall time of the analysis of a function (in seconds),
+            ``None`` for no bound
+        :param function_visits: maximum number of node visits of the analysis of a function,
+            ``None`` for no bound
+        """
+        self._time = time
+        self._visits = visits
+        self._size = size
+        self._function_time = function_time
+        self._function_visits = function_visits
+        self._start: Optional[float] = None
+        self._degraded: List[Tuple[str, int, str]] = list()
+
+    @property
+    def time(self):
+        return self._time
+
+    @property
+    def visits(self):
+        return self._visits
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def function_time(self):
+        return self._function_time
+
+    @property
+    def function_visits(self):
+        return self._function_visits
+
+    @property
+    def degraded(self):
+        """Degradations of the analysis run so far (function, loop head, and widening or top)."""
+        return self._degraded
+
+    def start(self):
+        """Start of an analysis run."""
+        self._start = time.time()
+        self._degraded = list()
+
+    def _exhausted(self, visits: int, started: float, fvisits: int) -> Tuple[float, Optional[str]]:
+        """Largest ratio between the resources spent and their budget,
+        and the corresponding budget."""
+        if self._start is None:
+            self._start = started
+        now = time.time()
+        spent = [
+            (now - self._start, self.time, f"time budget of {self.time}s"),
+            (visits, self.visits, f"budget of {self.visits} visits"),
+            (now - started, self.function_time, f"function time budget of {self.function_time}s"),
+            (fvisits, self.function_visits, f"function budget of {self.function_visits} visits")
+        ]
+        bounded = [(amount, bound, reason) for amount, bound, reason in spent if bound is not None]
+        ratios = [(amount / bound if bound else inf, reason) for amount, bound, reason in bounded]
+        return max(ratios, key=lambda ratio: ratio[0], default=(0, None))
+
+    def degrade(self, interpreter, cfg: ControlFlowGraph, loop: Loop, previous: Optional[State],
+                entry: State, started: float, visits: int) -> State:
+        """Degrade the precision of the entry state of a loop head, if the budget is exhausted.
+
+        :param interpreter: control flow graph interpreter
+        :param cfg: control flow graph of the analyzed function
+        :param loop: loop head
+        :param previous: previous entry state of the loop head (``None`` at the first visit)
+        :param entry: current entry state of the loop head
+        :param started: start time of the analysis of the function
+        :param visits: number of node visits of the analysis of the function so far
+        :return: entry state of the loop head (degraded, if the budget is exhausted)
+        """
+        ratio, reason = self._exhausted(interpreter.visits, started, visits)
+        widen, top, oversized = 1 < ratio, 2 < ratio, False
+        if not widen and self.size is not None and size(entry) > self.size:
+            widen, oversized, reason = True, True, f"state size budget of {self.size}"
+        widened = False
+        if widen and not top:
+            if previous is None:    # there is nothing to widen with at the first visit
+                top = oversized
+            else:
+                entry, widened = deepcopy(previous).widening(entry), True
+                top = oversized and size(entry) > self.size
+        if top:
+            entry = entry.top()
+        if widened or top:
+            self._report(interpreter, cfg, loop, reason, 'top' if top else 'widening')
+        return entry
+
+    def _report(self, interpreter, cfg: ControlFlowGraph, loop: Loop, reason: str, action: str):
+        fname = next((name for name, graph in interpreter.cfgs.items() if graph is cfg), '')
+        degradation = (fname, loop.identifier, action)
+        if degradation in self._degraded:
+            return
+        self._degraded.append(degradation)
+        edges = (edge for edge in cfg.out_edges(loop) if edge.kind == Edge.Kind.LOOP_IN)
+        pp = next((edge.condition.pp for edge in edges if isinstance(edge, Conditional)), None)
+        where = f"function {fname}" if fname else "program"
+        message = f"Precision degraded: the analysis of the {where} " \
+                  f"exceeded the {reason} ({action} at loop)"
+        warn(message, PrecisionDegradedWarning, pp=pp, stacklevel=2)
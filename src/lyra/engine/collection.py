@@ -0,0 +1,84 @@
+"""
+Garbage Collection
+==================
+
+Garbage collection of the analysis states, which forget the information about
+the variables that are dead at the entry of each node of a control flow graph.
+
+A variable is considered dead at the entry of a node if it does not occur in any statement
+or condition reachable from the node. Assignments are not considered to kill the variables they
+assign since analysis states may keep information about a variable across its assignments
+(e.g., the subscriptions of a dataframe, cf. ``DatascienceTypeState``). A dead variable is thus
+never accessed again by the analysis, and its information can be safely forgotten.
+
+:Author: Caterina Urban
+"""
+from typing import Dict, FrozenSet, Set
+
+from lyra.abstract_domains.state import State
+from lyra.core.cfg import ControlFlowGraph, Conditional, Node
+from lyra.core.expressions import VariableIdentifier
+from lyra.engine.slicing import accessed
+
+
+class Collector:
+    """Garbage collection of the analysis states of a control flow graph."""
+
+    def __init__(self, cfg: ControlFlowGraph):
+        """Garbage collection of the analysis states of a control flow graph.
+
+        :param cfg: control flow graph whose analysis states are collected
+        """
+        self._cfg = cfg
+        self._dead: Dict[int, FrozenSet[VariableIdentifier]] = dict()
+        variables = cfg.variables
+        for identifier, live in self._liveness(cfg).items():
+            self._dead[identifier] = frozenset(variables - live)
+
+    @property
+    def cfg(self) -> ControlFlowGraph:
+        """Control flow graph whose analysis states are collected."""
+        return self._cfg
+
+    @staticmethod
+    def _liveness(cfg: ControlFlowGraph) -> Dict[int, Set[VariableIdentifier]]:
+        """Variables occurring in a statement or condition reachable from the entry of each node.
+
+        :param cfg: control flow graph
+        :return: live variables at the entry of each node of the control flow graph
+        """
+        occurring: Dict[int, Set[VariableIdentifier]] = dict()
+        for identifier, node in cfg.nodes.items():
+            occurring[identifier] = set().union(*(accessed(stmt) for stmt in node.stmts))
+        for edge in cfg.edges.values():
+            # the condition is evaluated at the exit of the source node
+            if isinstance(edge, Conditional):
+                occurring[edge.source.identifier].update(accessed(edge.condition))
+        live = {identifier: set(variables) for identifier, variables in occurring.items()}
+        pending = list(cfg.nodes.values())
+        while pending:
+            current = pending.pop()
+            for predecessor in cfg.predecessors(current):
+                added = live[current.identifier] - live[predecessor.identifier]
+                if added:
+                    live[predecessor.identifier].update(added)
+                    pending.append(predecessor)
+        return live
+
+    def dead(self, node: Node) -> FrozenSet[VariableIdentifier]:
+        """Variables that are dead at the entry of a node.
+
+        :param node: node of the control flow graph
+        :return: variables that are dead at the entry of the node
+        """
+        return self._dead[node.identifier]
+
+    def collect(self, node: Node, state: State) -> State:
+        """Forget the information about the variables that are dead at the entry of a node.
+
+        :param node: node of the control flow graph
+        :param state: state at the entry of the node
+        :return: state modified to forget the information about the dead variables
+        """
+        dead = self._dead[node.identifier]
+        return state.collect(dead) if dead else state
@@ -5,13 +5,13 @@ Forward Analysis Engine
 :Author: Caterina Urban
 """
 
-from collections import deque
+import time
 from copy import deepcopy
-from queue import Queue
 from typing import Optional, List
 
 from lyra.engine.interpreter import Interpreter
-from lyra.engine.result import AnalysisResult
+from lyra.engine.result import AnalysisResult, StateSequence
+from lyra.engine.worklist import FIFOWorklist
 from lyra.semantics.forward import ForwardSemantics
 
 from lyra.abstract_domains.state import State
@@ -21,7 +21,8 @@ from lyra.core.cfg import Basic, Loop, Conditional, Edge, Node, ControlFlowGraph
 class ForwardInterpreter(Interpreter):
     """Forward control flow graph interpreter."""
 
-    def __init__(self, cfgs, fargs, semantics: ForwardSemantics, widening, precursory=None, warning_level=None):
+    def __init__(self, cfgs, fargs, semantics: ForwardSemantics, widening, precursory=None,
+                 warning_level=None, worklist=FIFOWorklist):
         """Forward control flow graph interpreter construction.
 
         :param cfgs: control flow graphs to analyze
@@ -29,14 +30,19 @@ class ForwardInterpreter(Interpreter):
         :param semantics: semantics of statements in the control flow graph
         :param widening: number of iterations before widening
         :param precursory: precursory control flow graph interpreter
+        :param worklist: worklist determining the order in which nodes are analyzed
         """
-        super().__init__(cfgs, fargs, semantics, widening, precursory)
+        super().__init__(cfgs, fargs, semantics, widening, precursory, worklist)
         self.warning_level = warning_level
 
-    def analyze(self, cfg: ControlFlowGraph, initial: State) -> AnalysisResult:
+    def fixpoint(self, cfg: ControlFlowGraph, initial: State) -> AnalysisResult:
         from lyra.engine.backward import BackwardInterpreter
 
         context: State = deepcopy(initial)
+        # collect the states of the analyzed control flow graph only, not of the called functions
+        collector = self.collector
+        if collector is not None and collector.cfg is not cfg:
+            collector = None
 
         # run the precursory analysis (if any)
         if self.precursory:  # there is a precursory analysis to be run
@@ -45,12 +51,14 @@ class ForwardInterpreter(Interpreter):
             pre_result: Optional[AnalysisResult] = None
 
         # prepare the worklist and iteration counts
-        worklist = Queue()
+        worklist = self.worklist(cfg)
         worklist.put(cfg.in_node)
         iterations = {node: 0 for node in cfg.nodes}
+        started, first = time.time(), self._visits
 
         while not worklist.empty():
             current: Node = worklist.get()  # retrieve the current node
+            self._visits += 1
 
             iteration = iterations[current.identifier]
 
@@ -149,10 +157,18 @@ class ForwardInterpreter(Interpreter):
                 # widening
                 if isinstance(current, Loop) and self.widening < iteration:
                     entry = deepcopy(previous).widening(entry)
+                # degradation (if the budget of the analysis is exhausted)
+                if isinstance(current, Loop) and self.budget is not None:
+                    visits = self._visits - first
+                    budget = self.budget
+                    entry = budget.degrade(self, cfg, current, previous, entry, started, visits)
+            # garbage collection (if any)
+            if collector is not None:
+                entry = collector.collect(current, entry)
 
             # check for termination and execute block
             if previous is None or not entry.less_equal(previous):
-                states = deque([entry])
+                states = StateSequence([entry])
                 if isinstance(current, Basic):
                     successor = entry
 
@@ -174,7 +190,7 @@ class ForwardInterpreter(Interpreter):
                 elif isinstance(current, Loop):
                     # nothing to be done
                     pass
-                self.result.set_node_result(current, context, list(states))
+                self.result.set_node_result(current, context, states)
                 # update worklist and iteration count
                 for node in cfg.successors(current):
                     worklist.put(node)
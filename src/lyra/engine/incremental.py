@@ -0,0 +1,303 @@
+"""
+Incremental Analysis
+====================
+
+Incremental re-analysis of a program at function granularity.
+
+The analysis results of each function (for each context it has been analyzed in)
+are persisted together with a fingerprint of its control flow graph.
+When the program is analyzed again, the fixpoint is only computed for the functions
+whose fingerprint changed, for the functions calling them, and for the contexts
+that were not analyzed before. The stored results are reused everywhere else.
+
+:Author: Caterina Urban
+"""
+import hashlib
+import os
+from copy import deepcopy
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+import lyra.core.diagnostics as diagnostics
+from lyra.abstract_domains.state import State
+from lyra.core.cfg import ControlFlowGraph, Conditional
+from lyra.core.diagnostics import Diagnostic
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.statements import Call
+from lyra.core.utils import fields
+from lyra.engine.result import AnalysisResult
+from lyra.frontend.cache import DiskCache, cache_directory
+
+
+@lru_cache(maxsize=None)
+def version() -> str:
+    """Digest of the Pyra sources the stored analysis results are valid for.
+
+    :return: SHA-256 hash of the sources of the analyzer
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    digest = hashlib.sha256()
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories[:] = sorted(d for d in subdirectories if d not in ('tests', 'unittests'))
+        for name in sorted(files):
+            if name.endswith('.py'):
+                with open(os.path.join(directory, name), 'rb') as source:
+                    digest.update(source.read())
+    return digest.hexdigest()[:16]
+
+
+def _canonical(value, defined: Set[str]) -> str:
+    """Canonical string representation of (a component of) a control flow graph.
+
+    Unlike the string representation of statements,
+    it includes their types and program points (which determine the reported warnings).
+    Calls are annotated with whether they target a function of the program.
+
+    :param value: value to represent
+    :param defined: names of the functions of the program
+    :return: canonical string representation of the value
+    """
+    if value is None or isinstance(value, (str, int, float, bool, Enum)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return '[{}]'.format(', '.join(_canonical(item, defined) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return '{{{}}}'.format(', '.join(sorted(_canonical(item, defined) for item in value)))
+    if isinstance(value, dict):
+        items = (f'{_canonical(k, defined)}: {_canonical(v, defined)}' for k, v in value.items())
+        return '{{{}}}'.format(', '.join(sorted(items)))
+    if hasattr(value, '__dict__') or hasattr(value, '__slots__'):
+        pairs = sorted(fields(value).items())
+        items = (f'{name}={_canonical(field, defined)}' for name, field in pairs)
+        call = f'<{value.name in defined}>' if isinstance(value, Call) else ''
+        return '{}{}({})'.format(type(value).__qualname__, call, ', '.join(items))
+    return repr(value)
+
+
+def fingerprint(cfg: ControlFlowGraph, fargs: List[VariableIdentifier], defined: Set[str]) -> str:
+    """Fingerprint of the control flow graph of a function.
+
+    It does not depend on the node identifiers, which change when other functions are edited.
+    The nodes are numbered by their position in the (sorted) node identifiers instead.
+
+    :param cfg: control flow graph of the function
+    :param fargs: formal arguments of the function
+    :param defined: names of the functions of the program
+    :return: fingerprint of the control flow graph
+    """
+    index = {identifier: i for i, identifier in enumerate(sorted(cfg.nodes))}
+    digest = hashlib.sha256(_canonical(fargs, defined).encode('utf-8'))
+    in_node, out_node = index[cfg.in_node.identifier], index[cfg.out_node.identifier]
+    digest.update(f'{in_node}, {out_node}'.encode('utf-8'))
+    for identifier in sorted(cfg.nodes):
+        node = cfg.nodes[identifier]
+        digest.update(f'\n{type(node).__name__} {_canonical(node.stmts, defined)}'.encode('utf-8'))
+    edges = list()
+    for edge in cfg.edges.values():
+        source, target = index[edge.source.identifier], index[edge.target.identifier]
+        condition = _canonical(edge.condition, defined) if isinstance(edge, Conditional) else ''
+        edges.append(f'\n{source} -> {target} {edge.kind.name} {condition}')
+    for edge in sorted(edges):
+        digest.update(edge.encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
+class Entry:
+    """Stored analysis result of a function for a context."""
+
+    def __init__(self, states: Dict[int, List[State]], calls: List[Tuple[Tuple[str, str], State]],
+                 warnings: List[Diagnostic]):
+        """Stored analysis result of a function for a context.
+
+        :param states: analysis result of each node,
+            indexed by its position in the (sorted) node identifiers
+        :param calls: functions (name and fingerprint) analyzed during the analysis,
+            with their context
+        :param warnings: warnings issued during the analysis
+        """
+        self._states = states
+        self._calls = calls
+        self._warnings = warnings
+
+    @property
+    def states(self):
+        return self._states
+
+    @property
+    def calls(self):
+        return self._calls
+
+    @property
+    def warnings(self):
+        return self._warnings
+
+
+class Incremental:
+    """Incremental re-analysis of a program against the results of a previous analysis run."""
+
+    def __init__(self, cfgs: Dict[str, ControlFlowGraph],
+                 fargs: Dict[str, List[VariableIdentifier]],
+                 previous: Dict[Tuple[str, str], Dict[State, Entry]] = None):
+        """Incremental re-analysis of a program against the results of a previous analysis run.
+
+        :param cfgs: control flow graphs of the program
+        :param fargs: formal arguments of the functions of the program
+        :param previous: stored analysis results of the previous analysis run, if any
+        """
+        defined = set(cfgs)
+        self._names = {id(cfg): fname for fname, cfg in cfgs.items()}
+        self._fingerprints = {fname: fingerprint(cfg, fargs.get(fname, []), defined)
+                              for fname, cfg in cfgs.items()}
+        self._previous = previous or dict()
+        self._entries: Dict[Tuple[str, str], Dict[State, Entry]] = dict()
+        self._calls: List[List[Tuple[Tuple[str, str], State]]] = list()
+        self._valid: Dict[int, bool] = dict()
+        self._reused = 0
+
+    @property
+    def fingerprints(self):
+        """Fingerprint of each function of the program."""
+        return self._fingerprints
+
+    @property
+    def entries(self):
+        """Analysis results of the current analysis run, to be stored for the next one."""
+        return self._entries
+
+    @property
+    def reused(self):
+        """Number of function analyses whose stored result was reused."""
+        return self._reused
+
+    def _reusable(self, key: Tuple[str, str], context: State) -> Optional[Entry]:
+        """Stored analysis result of a function for a context, if it is still valid.
+
+        A stored result is valid if the functions analyzed during its analysis did not change.
+
+        :param key: name and fingerprint of the function
+        :param context: context of the analysis
+        :return: stored analysis result, ``None`` if not stored or no longer valid
+        """
+        entry = self._previous.get(key, dict()).get(context)
+        if entry is None:
+            return None
+        if id(entry) not in self._valid:
+            self._valid[id(entry)] = all(
+                self.fingerprints.get(fname) == fp and self._reusable((fname, fp), ctx)
+                for (fname, fp), ctx in entry.calls)
+        return entry if self._valid[id(entry)] else None
+
+    def _record(self, key: Tuple[str, str], context: State, entry: Entry):
+        self._entries.setdefault(key, dict())[context] = entry
+
+    def _restore(self, result: AnalysisResult, key: Tuple[str, str], context: State, entry: Entry):
+        """Restore a stored analysis result of a function (and of the functions it calls).
+
+        :param result: analysis result to restore into
+        :param key: name and fingerprint of the function
+        :param context: context of the analysis
+        :param entry: stored analysis result
+        """
+        cfg = result.cfgs[key[0]]
+        identifiers = sorted(cfg.nodes)
+        for i, states in entry.states.items():
+            result.set_node_result(cfg.nodes[identifiers[i]], context, states)
+        self._record(key, context, entry)
+        for callee, ctx in entry.calls:
+            self._restore(result, callee, ctx, self._previous[callee][ctx])
+
+    def called(self, fname: str, context: State):
+        """Record that a function has been analyzed (or its analysis reused) for a context
+        during the analysis of the function calling it (if any).
+
+        :param fname: name of the function
+        :param context: context of the analysis
+        """
+        if self._calls:     # the function is called by the function being analyzed
+            self._calls[-1].append(((fname, self.fingerprints[fname]), context))
+
+    def analyze(self, interpreter, cfg: ControlFlowGraph, initial: State) -> AnalysisResult:
+        """Run the analysis of a function, reusing its stored analysis result if it is still valid.
+
+        :param interpreter: control flow graph interpreter
+        :param cfg: control flow graph to analyze
+        :param initial: initial analysis state
+        :return: result of the analysis
+        """
+        fname = self._names.get(id(cfg))
+        if fname is None:
+            return interpreter.fixpoint(cfg, initial)
+        key, context = (fname, self.fingerprints[fname]), deepcopy(initial)
+        self.called(fname, context)
+        entry = self._reusable(key, context)
+        if entry is not None:
+            self._restore(interpreter.result, key, context, entry)
+            for warning in entry.warnings:
+                diagnostics.reissue(warning)
+            self._reused += 1
+            return interpreter.result
+        self._calls.append(list())
+        try:
+            with diagnostics.recording() as warnings:
+                result = interpreter.fixpoint(cfg, initial)
+        finally:
+            calls = self._calls.pop()
+        states = dict()
+        for i, identifier in enumerate(sorted(cfg.nodes)):
+            node_result = result.get_node_result(cfg.nodes[identifier])
+            if context in node_result:
+                states[i] = node_result[context]
+        self._record(key, context, Entry(states, calls, warnings))
+        return result
+
+
+class ResultCache(DiskCache):
+    """On-disk store of the analysis results of the previous analysis run of each program."""
+
+    def __init__(self, directory: str = None, size: int = 256 * 1024 * 1024):
+        """On-disk store of the analysis results of the previous analysis run of each program.
+
+        :param directory: cache directory (defaults to ``$XDG_CACHE_HOME/pyra/results``)
+        :param size: maximum size of the cache (in bytes)
+        """
+        super().__init__(directory or cache_directory('results'), size)
+        self._version = version()
+
+    def key(self, path: str, analysis: str) -> str:
+        """Key of the cache entry of a program.
+
+        :param path: path of the program
+        :param analysis: description of the analysis
+        :return: SHA-256 hash of the path of the program, of the analysis, and of the Pyra sources
+        """
+        digest = hashlib.sha256(self._version.encode('utf-8'))
+        for component in (analysis, os.path.abspath(path)):
+            digest.update(b'\0')
+            digest.update(component.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, path: str, analysis: str, cfgs: Dict[str, ControlFlowGraph],
+            fargs: Dict[str, List[VariableIdentifier]]) -> Incremental:
+        """Prepare the incremental re-analysis of a program against its previous analysis run.
+
+        :param path: path of the program
+        :param analysis: description of the analysis
+        :param cfgs: control flow graphs of the program
+        :param fargs: formal arguments of the functions of the program
+        :return: incremental re-analysis of the program
+        """
+        stored = self.load(self.key(path, analysis)) or dict()
+        previous = {key: dict(entries) for key, entries in stored.items()}
+        return Incremental(cfgs, fargs, previous)
+
+    def put(self, path: str, analysis: str, incremental: Incremental):
+        """Store the analysis results of an analysis run of a program.
+
+        :param path: path of the program
+        :param analysis: description of the analysis
+        :param incremental: incremental re-analysis of the program
+        """
+        # the contexts are only hashed once the stored states are completely loaded
+        entries = {key: list(entries.items()) for key, entries in incremental.entries.items()}
+        self.store(self.key(path, analysis), entries)
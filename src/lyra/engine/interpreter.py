@@ -6,16 +6,19 @@ Analysis Engine
 """
 
 from abc import ABCMeta, abstractmethod
-from typing import Dict
+from typing import Dict, FrozenSet, Type
 
 from lyra.core.cfg import ControlFlowGraph
+from lyra.core.expressions import VariableIdentifier
 from lyra.engine.result import AnalysisResult
+from lyra.engine.worklist import Worklist, FIFOWorklist
 
 from lyra.abstract_domains.state import State
 
 
 class Interpreter(metaclass=ABCMeta):
-    def __init__(self, cfgs, fargs, semantics, widening, precursory=None):
+    def __init__(self, cfgs, fargs, semantics, widening, precursory=None,
+                 worklist: Type[Worklist] = FIFOWorklist):
         """Control flow graph interpreter.
 
         :param cfgs: control flow graphs to analyze
@@ -23,12 +26,20 @@ class Interpreter(metaclass=ABCMeta):
         :param semantics: semantics of statements in the control flow graph
         :param widening: number of iterations before widening
         :param precursory: precursory control flow graph interpreter
+        :param worklist: worklist determining the order in which nodes are analyzed
         """
         self._result = AnalysisResult(cfgs)
         self._fargs = fargs
         self._semantics = semantics
         self._widening: int = widening
         self._precursory: 'Interpreter' = precursory
+        self._worklist: Type[Worklist] = worklist
+        self._visits: int = 0
+        self._incremental = None
+        self._summaries = None
+        self._budget = None
+        self._collector = None
+        self._locals: Dict[str, FrozenSet[VariableIdentifier]] = dict()
 
     @property
     def cfgs(self):
@@ -54,9 +65,78 @@ class Interpreter(metaclass=ABCMeta):
     def precursory(self):
         return self._precursory
 
-    @abstractmethod
+    @property
+    def worklist(self):
+        return self._worklist
+
+    @property
+    def visits(self):
+        """Number of node visits performed by the interpreter so far."""
+        return self._visits
+
+    def local_variables(self, fname: str) -> FrozenSet[VariableIdentifier]:
+        """Local variables of a function, i.e., its variables that are not formal arguments.
+
+        :param fname: name of the function
+        :return: set of local variables of the function
+        """
+        if fname not in self._locals:
+            variables = self.cfgs[fname].variables
+            self._locals[fname] = frozenset(variables.difference(self.fargs[fname]))
+        return self._locals[fname]
+
+    @property
+    def incremental(self) -> 'Incremental':
+        """Stored analysis results of a previous analysis run to reuse, ``None`` for no reuse."""
+        return self._incremental
+
+    @incremental.setter
+    def incremental(self, incremental: 'Incremental'):
+        self._incremental = incremental
+
+    @property
+    def summaries(self) -> 'Summaries':
+        """Summaries of the user-defined functions to reuse across calls, ``None`` for no reuse."""
+        return self._summaries
+
+    @summaries.setter
+    def summaries(self, summaries: 'Summaries'):
+        self._summaries = summaries
+
+    @property
+    def budget(self) -> 'Budget':
+        """Budget of the analysis, beyond which it trades precision for termination,
+        ``None`` for no bound."""
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget: 'Budget'):
+        self._budget = budget
+
+    @property
+    def collector(self) -> 'Collector':
+        """Garbage collection of the states of the analyzed control flow graph,
+        ``None`` for no collection."""
+        return self._collector
+
+    @collector.setter
+    def collector(self, collector: 'Collector'):
+        self._collector = collector
+
     def analyze(self, cfg: ControlFlowGraph, initial: State) -> AnalysisResult:
-        """Run the analysis.
+        """Run the analysis, reusing the stored results of a previous analysis run (if any).
+
+        :param cfg: control flow graph to analyze
+        :param initial: initial analysis state
+        :return: result of the analysis
+        """
+        if self.incremental is None:
+            return self.fixpoint(cfg, initial)
+        return self.incremental.analyze(self, cfg, initial)
+
+    @abstractmethod
+    def fixpoint(self, cfg: ControlFlowGraph, initial: State) -> AnalysisResult:
+        """Compute the analysis fixpoint.
 
         :param cfg: control flow graph to analyze
         :param initial: initial analysis state
@@ -7,6 +7,7 @@
 
 from lyra.engine.backward import BackwardInterpreter
 from lyra.engine.runner import Runner
+from lyra.engine.worklist import WTOWorklist
 from lyra.semantics.backward import DefaultBackwardSemantics
 
 from lyra.abstract_domains.liveness.liveness_domain import LivenessState, StrongLivenessState
@@ -15,7 +16,8 @@ from lyra.abstract_domains.liveness.liveness_domain import LivenessState, Strong
 class LivenessAnalysis(Runner):
 
     def interpreter(self):
-        return BackwardInterpreter(self.cfgs, self.fargs, DefaultBackwardSemantics(), 3)
+        return BackwardInterpreter(self.cfgs, self.fargs, DefaultBackwardSemantics(), 3,
+                                   worklist=WTOWorklist)
 
     def state(self):
         return LivenessState(self.variables)
@@ -0,0 +1,198 @@
+"""
+Parallel Function Analysis
+==========================
+
+Analysis of each user-defined function of a program on its own (besides the program itself),
+fanned out over a pool of worker processes.
+
+Each function is analyzed from the initial state of the analysis over its variables
+(i.e., the top state or the state given by the type annotations of its variables),
+independently of its calls. The results of the analyses (and the warnings they raise)
+are merged at the end, in the order of the functions of the program.
+
+:Author: Caterina Urban
+"""
+import io
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Dict, Iterable, List, Optional
+
+import lyra.core.diagnostics as diagnostics
+from lyra.core.diagnostics import CollectingSink, Diagnostic
+from lyra.engine.result import AnalysisResult
+
+
+class FunctionResult:
+    """Outcome of the analysis of one function of a program."""
+
+    def __init__(self, fname: str, result: Optional[Dict], duration: float, visits: int = 0,
+                 hits: int = 0, diagnostics: List[Diagnostic] = None, error: str = None):
+        """Outcome of the analysis of one function of a program.
+
+        :param fname: name of the analyzed function (``''`` for the program itself)
+        :param result: analysis result of each analyzed node (in each context),
+            ``None`` if the analysis failed
+        :param duration: duration of the analysis (in seconds)
+        :param visits: number of node visits performed by the analysis
+        :param hits: number of calls that reused the summary of a function
+        :param diagnostics: warnings raised by the analysis
+        :param error: description of the error that stopped the analysis, if any
+        """
+        self._fname = fname
+        self._result = result
+        self._duration = duration
+        self._visits = visits
+        self._hits = hits
+        self._diagnostics = diagnostics or list()
+        self._error = error
+
+    @property
+    def fname(self):
+        return self._fname
+
+    @property
+    def result(self):
+        return self._result
+
+    @property
+    def duration(self):
+        return self._duration
+
+    @property
+    def visits(self):
+        return self._visits
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def diagnostics(self):
+        return self._diagnostics
+
+    @property
+    def error(self):
+        return self._error
+
+
+_runner = None
+"""Analysis runner of the worker processes."""
+
+
+def _initialize(runner):
+    global _runner
+    _runner = runner
+    diagnostics.reset()     # the warnings are issued again by the parent process
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))    # to pickle deep analysis states
+
+
+def analyze(runner, fname: str) -> FunctionResult:
+    """Analyze a function on its own, collecting the warnings raised by the analysis.
+
+    :param runner: analysis runner
+    :param fname: name of the function to analyze (``''`` for the program itself)
+    :return: outcome of the analysis
+    """
+    start = time.time()
+    with warnings.catch_warnings(), redirect_stdout(io.StringIO()), \
+            diagnostics.reporting(CollectingSink()) as sink:
+        warnings.simplefilter('ignore')
+        try:
+            interpreter, result = runner.analyze(fname)
+            hits = interpreter.summaries.hits if interpreter.summaries else 0
+            duration = time.time() - start
+            return FunctionResult(fname, result.result, duration, interpreter.visits, hits,
+                                  sink.diagnostics)
+        except Exception as e:
+            frame = traceback.extract_tb(e.__traceback__)[-1]
+            error = f"{type(e).__name__}: {e} ({frame.filename}:{frame.lineno})"
+            duration = time.time() - start
+            return FunctionResult(fname, None, duration, diagnostics=sink.diagnostics, error=error)
+
+
+def _work(fname: str) -> FunctionResult:
+    return analyze(_runner, fname)
+
+
+class Functions:
+    """Analysis of the functions of a program over a pool of worker processes."""
+
+    def __init__(self, runner, workers: int = None):
+        """Analysis of the functions of a program over a pool of worker processes.
+
+        .. note::
+            Where available, the workers are forked from the current process
+            and thus share the control flow graphs of the program without copying them.
+
+        :param runner: analysis runner (with the control flow graphs of the program)
+        :param workers: number of worker processes (defaults to the number of CPUs),
+            1 to analyze in this process
+        """
+        self._runner = runner
+        self._workers = workers or os.cpu_count() or 1
+        if 'fork' in multiprocessing.get_all_start_methods():
+            self._context = multiprocessing.get_context('fork')
+        else:
+            self._context = multiprocessing.get_context()
+        self._outcomes: List[FunctionResult] = list()
+
+    @property
+    def runner(self):
+        return self._runner
+
+    @property
+    def workers(self):
+        return self._workers
+
+    @property
+    def outcomes(self):
+        """Outcomes of the analysis of each function,
+        in the order of the functions of the program."""
+        return self._outcomes
+
+    @property
+    def visits(self):
+        """Number of node visits performed by all analyses."""
+        return sum(outcome.visits for outcome in self.outcomes)
+
+    @property
+    def hits(self):
+        """Number of calls that reused the summary of a function in all analyses."""
+        return sum(outcome.hits for outcome in self.outcomes)
+
+    def _analyze(self, fnames: List[str]) -> Dict[str, FunctionResult]:
+        if self.workers == 1 or len(fnames) == 1:
+            return {fname: analyze(self.runner, fname) for fname in fnames}
+        # the largest functions are analyzed first, to balance the load of the workers
+        cfgs = self.runner.cfgs
+        ordered = sorted(fnames, key=lambda fname: len(cfgs[fname].nodes), reverse=True)
+        workers = min(self.workers, len(fnames))
+        with ProcessPoolExecutor(workers, self._context, _initialize, (self.runner,)) as pool:
+            return dict(zip(ordered, pool.map(_work, ordered)))
+
+    def run(self, fnames: Iterable[str]) -> AnalysisResult:
+        """Analyze functions of the program, each on its own, and merge the results.
+
+        The warnings raised by the analyses are issued again in the current process.
+
+        :param fnames: names of the functions to analyze (``''`` for the program itself)
+        :return: merged result of the analyses (in the order of the given functions)
+        """
+        fnames = list(dict.fromkeys(fnames))
+        outcomes = self._analyze(fnames)
+        self._outcomes = [outcomes[fname] for fname in fnames]
+        merged = AnalysisResult(self.runner.cfgs)
+        for outcome in self.outcomes:
+            for diagnostic in outcome.diagnostics:
+                diagnostics.reissue(diagnostic)
+            for node, contexts in (outcome.result or dict()).items():
+                for context, states in contexts.items():
+                    if context not in merged.get_node_result(node):
+                        merged.set_node_result(node, context, states)
+        return merged
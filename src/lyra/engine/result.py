@@ -1,10 +1,129 @@
+from collections.abc import Sequence
+from copy import deepcopy
 from itertools import zip_longest
-from typing import List, Dict
+from typing import List, Dict, Any, Union, Iterator, Iterable
 
 from lyra.abstract_domains.state import State
 from lyra.core.cfg import Node, ControlFlowGraph, Edge
 
 
+class _Delta:
+    """Changes of a state with respect to the state before it (cf. ``State.delta``)."""
+    __slots__ = ('changes',)
+
+    def __init__(self, changes: Any):
+        self.changes = changes
+
+    def __getstate__(self):
+        return self.changes
+
+    def __setstate__(self, changes):
+        self.changes = changes
+
+
+class StateSequence(Sequence):
+    """States of a node (before and after each statement), stored compactly.
+
+    The first and the last state are kept as a whole. The other states are kept
+    as their changes with respect to the state added before them, when the states support it
+    (cf. ``State.delta``), and are reconstructed on demand.
+
+    The states can be added one at a time as they are computed, either after the last state
+    (cf. ``append``) or, for a reverse sequence, before the first state (cf. ``appendleft``).
+
+    .. note::
+        Once some states are kept as their changes, the states are returned as fresh copies
+        (also the ones kept as a whole, which the other states are reconstructed from):
+        modifying them does not affect the sequence. Otherwise, as for a list,
+        the states are returned as they were added.
+    """
+
+    def __init__(self, states: Iterable[State] = (), reverse: bool = False):
+        """States of a node, stored compactly.
+
+        :param states: states of the node
+        :param reverse: whether the states are added before the first state
+            rather than after the last state
+        """
+        # in the order in which they are added
+        self._states: List[Union[State, _Delta]] = list()
+        self._reverse = reverse
+        # changes of the last state (kept as a whole until another state is added)
+        self._pending = None
+        self._compact = False   # whether some states are kept as their changes
+        for state in (reversed(list(states)) if reverse else states):
+            self._add(state)
+
+    def _add(self, state: State):
+        changes = state.delta(self._states[-1]) if self._states else None
+        if self._pending is not None:
+            self._states[-1] = _Delta(self._pending)
+        self._states.append(state)
+        self._pending = changes
+        self._compact = self._compact or changes is not None
+
+    def append(self, state: State):
+        """Add a state after the last state.
+
+        :param state: state to add
+        """
+        if self._reverse:
+            message = "States of a reverse sequence can only be added before the first state!"
+            raise ValueError(message)
+        self._add(state)
+
+    def appendleft(self, state: State):
+        """Add a state before the first state (of a reverse sequence).
+
+        :param state: state to add
+        """
+        if not self._reverse:
+            raise ValueError("States of a sequence can only be added after the last state!")
+        self._add(state)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self._states)
+        if not 0 <= index < len(self._states):
+            raise IndexError("state index out of range")
+        index = len(self._states) - 1 - index if self._reverse else index
+        first = index
+        while isinstance(self._states[first], _Delta):   # closest state kept as a whole
+            first -= 1
+        state = self._states[first]
+        if first == index:
+            return deepcopy(state) if self._compact else state
+        for entry in self._states[first + 1:index + 1]:
+            state = state.patch(entry.changes)
+        return state
+
+    def _iter(self) -> Iterator[State]:
+        state = None
+        for entry in self._states:
+            if isinstance(entry, _Delta):
+                state = state.patch(entry.changes)
+                yield state
+            else:
+                state = entry
+                yield deepcopy(entry) if self._compact else entry
+
+    def __iter__(self) -> Iterator[State]:
+        return reversed(list(self._iter())) if self._reverse else self._iter()
+
+    def __len__(self):
+        return len(self._states)
+
+    def __eq__(self, other):
+        if isinstance(other, (StateSequence, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class AnalysisResult:
     def __init__(self, cfgs: Dict[str, ControlFlowGraph]):
         """Analysis result representation.
@@ -12,7 +131,7 @@ class AnalysisResult:
         :param cfg: analyzed control flow graph
         """
         self._cfgs: Dict[str, ControlFlowGraph] = cfgs
-        self._result: Dict[Node, Dict[State, List[State]]] = dict()
+        self._result: Dict[Node, Dict[State, StateSequence]] = dict()
 
     @property
     def cfgs(self):
@@ -22,22 +141,28 @@ class AnalysisResult:
     def result(self):
         return self._result
 
-    def get_node_result(self, node: Node) -> Dict[State, List[State]]:
+    def get_node_result(self, node: Node) -> Dict[State, StateSequence]:
         """Get the analysis result for a node.
 
         :param node: analyzed node
-        :return: list of states representing the result of the analysis for the block
+        :return: sequence of states representing the result of the analysis for the block
         """
         return self.result.get(node, dict())
 
-    def set_node_result(self, node: Node, context: State, states: List[State]) -> None:
+    def set_node_result(self, node: Node, context: State,
+                        states: Union[List[State], StateSequence]) -> None:
         """Set the analysis result for a node.
 
+        The states are stored compactly (cf. ``StateSequence``).
+
         :param node: analyzed node
-        :param states: list of states representing the result of the analysis for the block
+        :param context: context of the analysis
+        :param states: states representing the result of the analysis for the block
         """
         if node not in self.result:
             self.result[node] = dict()
+        if not isinstance(states, StateSequence):
+            states = StateSequence(states)
         self.result[node][context] = states
 
     def __str__(self):
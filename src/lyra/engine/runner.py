@@ -14,29 +14,54 @@ import tokenize
 from abc import abstractmethod
 from math import inf
 from queue import Queue
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple, Optional
 
 from lyra.core.cfg import Loop, ControlFlowGraph, Conditional, Edge, Node
 from lyra.core.expressions import VariableIdentifier, LengthIdentifier, Status
 from lyra.core.statements import Assignment, VariableAccess, Call, TupleDisplayAccess
 from lyra.core.types import SequenceLyraType, ContainerLyraType
+from lyra.engine.budget import Budget
+from lyra.engine.collection import Collector
+from lyra.engine.incremental import ResultCache
+from lyra.engine.interpreter import Interpreter
+from lyra.engine.parallel import Functions
 from lyra.engine.result import AnalysisResult
+from lyra.engine.slicing import Slicer
+from lyra.engine.summaries import Summaries
+from lyra.frontend.cache import CFGCache
 from lyra.frontend.cfg_generator import ast_to_cfgs
 from lyra.frontend.cfg_generator import ast_to_fargs
 from lyra.visualization.graph_renderer import AnalysisResultRenderer
 from lyra.datascience.datascience_type_domain import DatascienceTypeState, DatascienceTypeLattice
 from lyra.core.datascience_warnings import DuplicatesNotDroppedWarning, NotShuffledWarning, MissingDataWarning
-import warnings
+import lyra.core.diagnostics as diagnostics
+from lyra.core.diagnostics import warn
 
 class Runner:
     """Analysis runner."""
 
+    _function = ''      # function analyzed on its own (cf. ``analyze``), '' for the whole program
+
     def __init__(self):
         self._path = None
         self._source = None
         self._tree = None
         self._cfgs = None
         self._fargs = {}
+        self._rendering = 'pdf'
+        self._viewing = True
+        self._checking = True
+        self._verbose = False
+        self._cache = None
+        self._incremental = None
+        self._summarizing = True
+        self._contexts = None
+        self._functions = False
+        self._workers = None
+        self._budget = None
+        self._slicing = False
+        self._slicer = None
+        self._collecting = False
 
     @property
     def path(self):
@@ -56,6 +81,8 @@ class Runner:
 
     @property
     def tree(self):
+        if self._tree is None and self.source is not None:
+            self._tree = ast.parse(self.source)     # not parsed when the CFGs are cached
         return self._tree
 
     @tree.setter
@@ -78,6 +105,143 @@ class Runner:
     def fargs(self, fargs):
         self._fargs = fargs
 
+    @property
+    def rendering(self):
+        """Format (dot, svg, or pdf) the analysis result is rendered to (``None`` for none)."""
+        return self._rendering
+
+    @rendering.setter
+    def rendering(self, rendering):
+        self._rendering = rendering
+
+    @property
+    def viewing(self):
+        """Whether the rendered analysis result is opened with the default viewer."""
+        return self._viewing
+
+    @viewing.setter
+    def viewing(self, viewing):
+        self._viewing = viewing
+
+    @property
+    def checking(self):
+        """Whether the analysis result is checked against the result comments in the program."""
+        return self._checking
+
+    @checking.setter
+    def checking(self, checking):
+        self._checking = checking
+
+    @property
+    def verbose(self):
+        """Whether the statistics of the analysis (e.g., its node visits) are printed
+        along with its duration (they are always reported to the diagnostics sinks)."""
+        return self._verbose
+
+    @verbose.setter
+    def verbose(self, verbose):
+        self._verbose = verbose
+
+    @property
+    def cache(self) -> CFGCache:
+        """Cache of the control flow graphs (and function arguments), ``None`` for no caching."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: CFGCache):
+        self._cache = cache
+
+    @property
+    def incremental(self) -> ResultCache:
+        """Store of the results of the previous analysis runs
+        (``None`` for no incremental analysis)."""
+        return self._incremental
+
+    @incremental.setter
+    def incremental(self, incremental: ResultCache):
+        self._incremental = incremental
+
+    @property
+    def summarizing(self):
+        """Whether the analysis of the user-defined functions is reused across calls
+        (cf. ``Summaries``)."""
+        return self._summarizing
+
+    @summarizing.setter
+    def summarizing(self, summarizing):
+        self._summarizing = summarizing
+
+    @property
+    def contexts(self):
+        """Maximum number of analyzed contexts of each user-defined function
+        (``None`` for no bound)."""
+        return self._contexts
+
+    @contexts.setter
+    def contexts(self, contexts):
+        self._contexts = contexts
+
+    @property
+    def functions(self):
+        """Whether each user-defined function is also analyzed on its own (cf. ``Functions``)."""
+        return self._functions
+
+    @functions.setter
+    def functions(self, functions):
+        self._functions = functions
+
+    @property
+    def workers(self):
+        """Number of worker processes the functions are analyzed by,
+        ``None`` for the number of CPUs."""
+        return self._workers
+
+    @workers.setter
+    def workers(self, workers):
+        self._workers = workers
+
+    @property
+    def budget(self) -> Budget:
+        """Budget of the analysis, beyond which it trades precision for termination,
+        ``None`` for no bound."""
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget: Budget):
+        self._budget = budget
+
+    @property
+    def slicing(self):
+        """Whether only the statements that can influence the calls of interest are analyzed
+        (cf. ``criterion``)."""
+        return self._slicing
+
+    @slicing.setter
+    def slicing(self, slicing):
+        self._slicing = slicing
+
+    @property
+    def slicer(self) -> Slicer:
+        """Slicing of the analyzed program,
+        ``None`` if the whole program is analyzed (cf. ``slicing``)."""
+        return self._slicer
+
+    @property
+    def collecting(self):
+        """Whether the information about the dead variables is forgotten during the analysis
+        (cf. ``Collector``)."""
+        return self._collecting
+
+    @collecting.setter
+    def collecting(self, collecting):
+        self._collecting = collecting
+
+    @property
+    def criterion(self) -> Optional[Set[str]]:
+        """Names of the calls of interest of a demand-driven analysis (cf. ``slicing``),
+        ``None`` if the analysis does not support it."""
+        return None
+
     @abstractmethod
     def interpreter(self):
         """Control flow graph interpreter."""
@@ -87,58 +251,170 @@ class Runner:
         """Initial analysis state."""
 
     @property
-    def variables(self, fname: str = '') -> Set[VariableIdentifier]:
-        return self.cfgs[fname].variables
+    def variables(self) -> Set[VariableIdentifier]:
+        """Variables of the analyzed function (of the whole program, by default),
+        including the formal arguments of the function."""
+        if self._function:
+            return self.cfgs[self._function].variables.union(self.fargs[self._function])
+        return self.cfgs[self._function].variables
 
     def main(self, path):
         self.path = path
+        diagnostics.start(path)
         with open(self.path, 'r') as source:
             self.source = source.read()
-            self.tree = ast.parse(self.source)
+        self.tree = None
+        cached = self.cache.get(self.source) if self.cache else None
+        if cached:
+            self.cfgs, self.fargs = cached
+        else:
             self.cfgs: Dict[str, ControlFlowGraph] = ast_to_cfgs(self.tree)
             self.fargs: Dict[str, List[VariableIdentifier]] = ast_to_fargs(self.tree)
+            if self.cache:
+                self.cache.put(self.source, self.cfgs, self.fargs)
+        if self.slicing:
+            if self.criterion is None:
+                raise ValueError(f"{type(self).__name__} does not support demand-driven analysis!")
+            self._slicer = Slicer(self.criterion)
+            self.cfgs = self.slicer.slice(self.cfgs)
         return self.run()
 
+    def analyze(self, fname: str = '') -> Tuple[Interpreter, AnalysisResult]:
+        """Analyze a function on its own, from the initial state over its variables.
+
+        :param fname: name of the function (``''`` for the whole program)
+        :return: interpreter and result of the analysis
+        """
+        interpreter = self.interpreter()
+        interpreter.budget = self.budget
+        if self.summarizing:
+            interpreter.summaries = Summaries(self.contexts)
+        if self.collecting:
+            interpreter.collector = Collector(self.cfgs[fname])
+        self._function = fname
+        try:
+            initial = self.state()
+        finally:
+            self._function = ''
+        return interpreter, interpreter.analyze(self.cfgs[fname], initial)
+
     def run(self, fname: str = '') -> AnalysisResult:
         start = time.time()
-        result = self.interpreter().analyze(self.cfgs[fname], self.state())
-        if isinstance(self.state(), DatascienceTypeState):
+        interpreter = self.interpreter()
+        if self.budget:
+            self.budget.start()
+            interpreter.budget = self.budget
+        incremental = self.incremental and self.path is not None and not self.functions
+        if incremental:
+            analysis = self._analysis(interpreter)
+            interpreter.incremental = self.incremental.get(self.path, analysis,
+                                                           self.cfgs, self.fargs)
+        if self.summarizing:
+            interpreter.summaries = Summaries(self.contexts)
+        if self.collecting:
+            interpreter.collector = Collector(self.cfgs[fname])
+        initial = self.state()
+        if self.functions:
+            functions = Functions(self, self.workers)
+            result = functions.run([fname, *(f for f in self.cfgs if f != fname)])
+            for outcome in functions.outcomes:
+                if outcome.error and outcome.fname == fname:
+                    raise RuntimeError(f"Analysis failed: {outcome.error}")
+                if outcome.error:
+                    print(f"Function {outcome.fname}: {outcome.error}")
+            visits, hits = functions.visits, functions.hits
+        else:
+            result = interpreter.analyze(self.cfgs[fname], initial)
+            visits = interpreter.visits
+            hits = interpreter.summaries.hits if self.summarizing else 0
+        if incremental:
+            self.incremental.put(self.path, analysis, interpreter.incremental)
+        if isinstance(initial, DatascienceTypeState):
             last_node_results = list(result.get_node_result(self.cfgs[fname].out_node).values())[0]
             assert len(last_node_results) == 1
             last_node_results_state = last_node_results[0]
-            if self.interpreter().warning_level == "potential":
+            if interpreter.warning_level == "potential":
                 for v in last_node_results_state.variables:
-                    if v.has_duplicates == Status.YES:
-                        if v.is_small == Status.YES:
-                            warnings.warn(
-                                f"Warning [potential]: At the and of the program {v} might be small and still have duplicates that were not dropped, using drop_duplicates() might be necessary.",
-                                category=DuplicatesNotDroppedWarning, stacklevel=2)
+                    # the variable might be modified by statements that are not analyzed
+                    if self.slicer and v not in self.slicer.relevant[fname]:
+                        continue
+                    properties = last_node_results_state.get_properties(v)
+                    if properties.has_duplicates == Status.YES:
+                        if properties.is_small == Status.YES:
+                            warn(
+                                f"Warning [potential]: At the and of the program {v} might be "
+                                "small and still have duplicates that were not dropped, using "
+                                "drop_duplicates() might be necessary.",
+                                category=DuplicatesNotDroppedWarning, stacklevel=2,
+                                level='potential', variable=v)
                         else:
-                            warnings.warn(
-                            f"Warning [potential]: At the and of the program {v} might still have duplicates that were not dropped, using drop_duplicates() might be necessary.",
-                            category=DuplicatesNotDroppedWarning, stacklevel=2)
+                            warn(
+                                f"Warning [potential]: At the and of the program {v} might still "
+                                "have duplicates that were not dropped, using drop_duplicates() "
+                                "might be necessary.",
+                                category=DuplicatesNotDroppedWarning, stacklevel=2,
+                                level='potential', variable=v)
                     if v in last_node_results_state.store and DatascienceTypeLattice._is_dataframe_type(last_node_results_state.store[v].element):
-                        if v.is_shuffled == Status.NO:
-                            warnings.warn(
-                            f"Warning [potential]: At the and of the program {v} might be not shuffled and at the read_csv statement it contained a increasing/decreasing/constant Series, using sample() might be necessary to guarantee randomness.",
-                            category=NotShuffledWarning, stacklevel=2)
-                    if v.has_na_values == Status.YES:
-                        warnings.warn(
-                        f"Warning [potential]: At the and of the program {v} might still have NA values, using dropna() might be necessary.",
-                        category=MissingDataWarning, stacklevel=2)
+                        if properties.is_shuffled == Status.NO:
+                            warn(
+                                f"Warning [potential]: At the and of the program {v} might be "
+                                "not shuffled and at the read_csv statement it contained a "
+                                "increasing/decreasing/constant Series, using sample() might be "
+                                "necessary to guarantee randomness.",
+                                category=NotShuffledWarning, stacklevel=2,
+                                level='potential', variable=v)
+                    if properties.has_na_values == Status.YES:
+                        warn(
+                            f"Warning [potential]: At the and of the program {v} might still "
+                            "have NA values, using dropna() might be necessary.",
+                            category=MissingDataWarning, stacklevel=2,
+                            level='potential', variable=v)
         end = time.time()
+        # statistics of the features active in the analysis run
+        statistics = {'visits': visits}
+        if incremental:
+            statistics['reused'] = interpreter.incremental.reused
+        if self.summarizing:
+            statistics['summarized'] = hits
+        if self.functions:
+            statistics['functions'] = len(functions.outcomes)
+        if self.slicer:
+            statistics['sliced'] = self.slicer.kept
+            statistics['statements'] = self.slicer.total
+        if self.budget and not self.functions:
+            statistics['degraded'] = len(self.budget.degraded)
         print('Time: {}s'.format(end - start))
-        self.render(result)
-        self.check(result)
+        if self.verbose:
+            for name, value in statistics.items():
+                print('{}: {}'.format(name.capitalize(), value))
+        diagnostics.finish(time=end - start, **statistics)
+        if self.rendering:
+            self.render(result)
+        if self.checking:
+            self.check(result)
         return result
 
+    def _analysis(self, interpreter) -> str:
+        """Description of the analysis, which the stored results must match to be reused."""
+        semantics, precursory = type(interpreter.semantics), type(interpreter.precursory)
+        analysis = type(self), type(interpreter), semantics, precursory
+        description = ' '.join(f'{cls.__module__}.{cls.__qualname__}' for cls in analysis)
+        warning_level = getattr(interpreter, 'warning_level', None)
+        if self.slicing:    # results of a demand-driven analysis only cover its slice
+            description = f'{description} sliced {sorted(self.criterion)}'
+        # results of an analysis with garbage collection lack the dead variables
+        if self.collecting:
+            description = f'{description} collected'
+        return f'{description} {interpreter.widening} {warning_level}'
+
     def render(self, result):
         renderer = AnalysisResultRenderer()
         data = (self.cfgs, result)
         name = os.path.splitext(os.path.basename(self.path))[0]
         label = f"CFG with Analysis Result for {name}"
         directory = os.path.dirname(self.path)
-        renderer.render(data, filename=name, label=label, directory=directory, view=True)
+        renderer.render(data, filename=name, label=label, directory=directory,
+                        view=self.viewing, format=self.rendering)
 
     def _expected_result(self):
         initial = re.compile('INITIAL:?\s*(?P<state>.*)')
@@ -0,0 +1,192 @@
+"""
+Program Slicing
+===============
+
+Slicing of control flow graphs for demand-driven analyses, which only analyze
+the statements that can influence the calls of interest (e.g., the calls that can raise warnings).
+
+The slice is computed flow-insensitively: a statement is kept if it involves a call of interest
+(or a call to a user-defined function), if it assigns the result of a call that is not an operator
+(whose assignment can itself raise warnings, e.g., when the call returns ``None``),
+if it is not an assignment or a call (e.g., an import),
+or if it may modify a relevant variable, i.e., a variable occurring in a kept statement
+or in a condition. Method calls may modify their receiver, thus calls are assumed to modify
+the variables they are passed. The relevant variables are thus modified by kept statements only,
+and their analysis is not affected by the statements that are not kept.
+
+:Author: Caterina Urban
+"""
+import ast
+from collections import defaultdict
+from typing import Dict, Set, Iterator, Iterable, Optional
+
+from lyra.core.cfg import ControlFlowGraph, Basic, Loop, Node, Conditional, Unconditional
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.statements import Statement, Assignment, Call, ExpressionAccess, \
+    LiteralEvaluation, VariableAccess, TupleDisplayAccess, ListDisplayAccess, SubscriptionAccess, \
+    SlicingAccess, AttributeAccess
+from lyra.core.utils import fields
+
+OPERATORS = frozenset(operator.__name__.lower()
+                      for base in (ast.unaryop, ast.operator, ast.boolop, ast.cmpop)
+                      for operator in base.__subclasses__())
+"""Names of the calls the operators are translated to."""
+
+
+def statements(stmt: Statement) -> Iterator[Statement]:
+    """Statements occurring in a statement (including the statement itself)."""
+    yield stmt
+    for value in fields(stmt).values():
+        for item in (value if isinstance(value, (list, tuple)) else (value,)):
+            if isinstance(item, Statement):
+                yield from statements(item)
+
+
+def accessed(stmt: Statement) -> Set[VariableIdentifier]:
+    """Variables occurring in a statement."""
+    return {s.variable for s in statements(stmt) if isinstance(s, VariableAccess)}
+
+
+def _base(stmt: Statement) -> Optional[VariableIdentifier]:
+    """Variable (partially) accessed by a statement, if any."""
+    while isinstance(stmt, (SubscriptionAccess, SlicingAccess, AttributeAccess)):
+        stmt = stmt.target
+    return stmt.variable if isinstance(stmt, VariableAccess) else None
+
+
+def _targets(left: Statement) -> Set[VariableIdentifier]:
+    """Variables (entirely) overwritten by an assignment to a left-hand side."""
+    if isinstance(left, VariableAccess):
+        return {left.variable}
+    if isinstance(left, (TupleDisplayAccess, ListDisplayAccess)):
+        return set().union(*(_targets(item) for item in left.items))
+    return set()
+
+
+def _used(stmt: Statement) -> Set[VariableIdentifier]:
+    """Variables whose value a statement depends on."""
+    if isinstance(stmt, Assignment):
+        left = stmt.left
+        if isinstance(left, (TupleDisplayAccess, ListDisplayAccess)):
+            used = set().union(*(accessed(item) - _targets(item) for item in left.items))
+        else:
+            used = accessed(left) - _targets(left)
+        return used | accessed(stmt.right)
+    return accessed(stmt)
+
+
+def _modified(stmt: Statement) -> Set[VariableIdentifier]:
+    """Variables a statement may modify."""
+    modified = set()
+    if isinstance(stmt, Assignment):
+        modified.update(_targets(stmt.left))
+        modified.add(_base(stmt.left))
+    for call in statements(stmt):
+        if isinstance(call, Call):
+            modified.update(_base(argument) for argument in call.arguments)
+    modified.discard(None)
+    return modified
+
+
+class Slicer:
+    """Slicing of control flow graphs to the statements that can influence calls of interest."""
+
+    def __init__(self, calls: Iterable[str]):
+        """Slicing of control flow graphs to the statements that can influence calls of interest.
+
+        :param calls: names of the calls of interest
+        """
+        self._calls = frozenset(calls)
+        self._relevant: Dict[str, Set[VariableIdentifier]] = dict()
+        self._kept = 0
+        self._total = 0
+
+    @property
+    def calls(self):
+        """Names of the calls of interest."""
+        return self._calls
+
+    @property
+    def relevant(self) -> Dict[str, Set[VariableIdentifier]]:
+        """Relevant variables of each sliced function (``''`` for the program itself)."""
+        return self._relevant
+
+    @property
+    def kept(self) -> int:
+        """Number of statements kept by the slicing."""
+        return self._kept
+
+    @property
+    def total(self) -> int:
+        """Number of statements before the slicing."""
+        return self._total
+
+    def _criterion(self, stmt: Statement, functions: Set[str]) -> bool:
+        """Whether a statement involves a call of interest or a call to a user-defined function,
+        or assigns the result of a call that is not an operator."""
+        if isinstance(stmt, Assignment) and isinstance(stmt.right, Call):
+            if stmt.right.name not in OPERATORS:
+                return True
+        return any(isinstance(s, Call) and (s.name in self.calls or s.name in functions)
+                   for s in statements(stmt))
+
+    def slice(self, cfgs: Dict[str, ControlFlowGraph]) -> Dict[str, ControlFlowGraph]:
+        """Slice control flow graphs.
+
+        :param cfgs: control flow graphs of the program and of its functions
+        :return: sliced control flow graphs (with the same nodes, possibly with fewer statements)
+        """
+        return {fname: self.slice_cfg(fname, cfg, set(cfgs)) for fname, cfg in cfgs.items()}
+
+    def slice_cfg(self, fname: str, cfg: ControlFlowGraph,
+                  functions: Set[str]) -> ControlFlowGraph:
+        """Slice a control flow graph.
+
+        :param fname: name of the function (``''`` for the program itself)
+        :param cfg: control flow graph of the function
+        :param functions: names of the user-defined functions
+        :return: sliced control flow graph
+        """
+        kept, relevant = set(), set()
+        candidates: Dict[VariableIdentifier, list] = defaultdict(list)
+        for node in cfg.nodes.values():
+            self._total += len(node.stmts)
+            for stmt in node.stmts:
+                if not isinstance(stmt, (Assignment, Call, ExpressionAccess, LiteralEvaluation)):
+                    kept.add(id(stmt))
+                    relevant.update(_used(stmt))
+                elif self._criterion(stmt, functions):
+                    kept.add(id(stmt))
+                    relevant.update(accessed(stmt))
+                else:
+                    for variable in _modified(stmt):
+                        candidates[variable].append(stmt)
+        for edge in cfg.edges.values():
+            if isinstance(edge, Conditional):
+                relevant.update(accessed(edge.condition))
+        pending = list(relevant)
+        while pending:
+            for stmt in candidates.pop(pending.pop(), ()):
+                if id(stmt) not in kept:
+                    kept.add(id(stmt))
+                    used = _used(stmt) - relevant
+                    relevant.update(used)
+                    pending.extend(used)
+        self._relevant[fname] = relevant
+        self._kept += len(kept)
+
+        nodes: Dict[int, Node] = dict()
+        for identifier, node in cfg.nodes.items():
+            assert isinstance(node, (Basic, Loop))
+            stmts = [stmt for stmt in node.stmts if id(stmt) in kept]
+            nodes[identifier] = type(node)(identifier, stmts)
+        edges = set()
+        for edge in cfg.edges.values():
+            source, target = nodes[edge.source.identifier], nodes[edge.target.identifier]
+            if isinstance(edge, Conditional):
+                edges.add(Conditional(source, edge.condition, target, edge.kind))
+            else:
+                assert isinstance(edge, Unconditional)
+                edges.add(Unconditional(source, target, edge.kind))
+        in_node, out_node = nodes[cfg.in_node.identifier], nodes[cfg.out_node.identifier]
+        return ControlFlowGraph(set(nodes.values()), in_node, out_node, edges)
@@ -0,0 +1,114 @@
+"""
+Function Summaries
+==================
+
+Summaries of the user-defined functions of a program, memoizing their analysis.
+
+The summary of a function maps each context the function has been analyzed in to its exit state.
+The context of a call is the state at the entry of the function restricted to the variables
+of the function (i.e., its formal arguments and the other variables it refers to),
+since the function cannot access (nor modify) the other variables of the caller.
+A call reuses the exit state of an analyzed context that includes (``less_equal``) its context,
+and the restriction of the state of the caller is replaced by this exit state.
+
+The number of analyzed contexts of each function can be bounded:
+beyond the bound, the context of a call is widened with an already analyzed context.
+
+:Author: Caterina Urban
+"""
+from copy import deepcopy
+from typing import Dict, Optional, Tuple
+
+from lyra.abstract_domains.state import State
+from lyra.abstract_domains.store import Store
+
+
+class Summaries:
+    """Summaries of the user-defined functions of a program."""
+
+    def __init__(self, contexts: int = None):
+        """Summaries of the user-defined functions of a program.
+
+        :param contexts: maximum number of analyzed contexts of each function
+            (``None`` for no bound)
+        """
+        self._contexts = contexts
+        self._summaries: Dict[str, Dict[State, State]] = dict()
+        self._hits = 0
+
+    @property
+    def contexts(self):
+        """Maximum number of analyzed contexts of each function, ``None`` for no bound."""
+        return self._contexts
+
+    @property
+    def summaries(self):
+        """Exit state of each function for each analyzed context."""
+        return self._summaries
+
+    @property
+    def hits(self):
+        """Number of calls that reused the summary of a function."""
+        return self._hits
+
+    def _lookup(self, fname: str, context: Store) -> Optional[Tuple[Store, Store]]:
+        """Analyzed context (and corresponding exit state) of a function including a given context.
+
+        :param fname: name of the function
+        :param context: context of a call to the function
+        :return: analyzed context and exit state, ``None`` if there is no such analyzed context
+        """
+        summary = self._summaries.get(fname, dict())
+        if context in summary:
+            return context, summary[context]
+        for analyzed in reversed(list(summary)):
+            if context.comparable(analyzed) and context.less_equal(analyzed):
+                return analyzed, summary[analyzed]
+        return None
+
+    def _bound(self, fname: str, context: Store) -> Store:
+        """Context to analyze a function in (widened if it has too many analyzed contexts).
+
+        :param fname: name of the function
+        :param context: context of a call to the function
+        :return: context to analyze the function in
+        """
+        summary = self._summaries.get(fname, dict())
+        if self.contexts is None or len(summary) < self.contexts:
+            return context
+        for analyzed in reversed(list(summary)):
+            if context.comparable(analyzed):
+                del summary[analyzed]       # included in the widened context
+                return deepcopy(analyzed).widening(context)
+        return context
+
+    def call(self, interpreter, fname: str, state: State) -> State:
+        """Analyze a call to a user-defined function, reusing its summary if possible.
+
+        :param interpreter: control flow graph interpreter
+        :param fname: name of the function
+        :param state: state at the entry of the function
+        :return: state at the exit of the function
+        """
+        fcfg = interpreter.cfgs[fname]
+        # the state cannot be restricted to the function variables
+        if not isinstance(state, Store):
+            fresult = interpreter.analyze(fcfg, state)
+            fstate = fresult.get_node_result(fcfg.out_node)[state][-1]
+            return state.bottom().join(deepcopy(fstate))
+        variables = interpreter.local_variables(fname).union(interpreter.fargs[fname])
+        context = deepcopy(state).project(variables)
+        found = self._lookup(fname, context)
+        if found:
+            analyzed, fstate = found
+            if interpreter.incremental:     # the caller depends on the reused analysis
+                interpreter.incremental.called(fname, analyzed)
+            self._hits += 1
+        else:
+            analyzed = self._bound(fname, context)
+            fresult = interpreter.analyze(fcfg, analyzed)
+            fstate = deepcopy(fresult.get_node_result(fcfg.out_node)[analyzed][-1])
+            self._summaries.setdefault(fname, dict())[analyzed] = fstate
+        state = state.embed(context, fstate)
+        state.result = set(fstate.result)
+        return state
@@ -0,0 +1,111 @@
+"""
+Worklists
+=========
+
+Iteration strategies for the control flow graph interpreters.
+
+:Author: Caterina Urban
+"""
+
+from abc import ABCMeta, abstractmethod
+from heapq import heappush, heappop
+from queue import Queue
+from typing import Dict, List, Set, Tuple
+
+from lyra.core.cfg import ControlFlowGraph, Node
+
+
+class Worklist(metaclass=ABCMeta):
+    def __init__(self, cfg: ControlFlowGraph, backward: bool = False):
+        """Worklist of nodes of a control flow graph that are pending analysis.
+
+        :param cfg: control flow graph being analyzed
+        :param backward: whether the control flow graph is analyzed backward
+        """
+        self._cfg = cfg
+        self._backward = backward
+
+    @property
+    def cfg(self):
+        return self._cfg
+
+    @property
+    def backward(self):
+        return self._backward
+
+    @abstractmethod
+    def put(self, node: Node) -> None:
+        """Schedule a node for analysis.
+
+        :param node: node to be scheduled
+        """
+
+    @abstractmethod
+    def get(self) -> Node:
+        """Retrieve the next node to be analyzed.
+
+        :return: next node to be analyzed
+        """
+
+    @abstractmethod
+    def empty(self) -> bool:
+        """Test whether there are no more nodes to be analyzed.
+
+        :return: whether the worklist is empty
+        """
+
+
+class FIFOWorklist(Worklist):
+    """First-in first-out worklist.
+
+    A node is scheduled again every time it is put in the worklist,
+    even when it is already pending analysis.
+
+    This is the default worklist of the interpreters, and the order in which
+    the expected results of the interval, sign and usage tests were recorded:
+    the widening is applied after a number of visits of each loop head, thus
+    another order might yield different results for them.
+    """
+
+    def __init__(self, cfg: ControlFlowGraph, backward: bool = False):
+        super().__init__(cfg, backward)
+        self._queue = Queue()
+
+    def put(self, node: Node) -> None:
+        self._queue.put(node)
+
+    def get(self) -> Node:
+        return self._queue.get()
+
+    def empty(self) -> bool:
+        return self._queue.empty()
+
+
+class WTOWorklist(Worklist):
+    """Priority worklist following a weak topological ordering of the control flow graph.
+
+    The node that comes first in the weak topological ordering is analyzed first,
+    so that the nodes within a loop are stabilized before the nodes after the loop.
+    A node that is already pending analysis is not scheduled again.
+    """
+
+    def __init__(self, cfg: ControlFlowGraph, backward: bool = False):
+        super().__init__(cfg, backward)
+        ordering = cfg.weak_topological_order(backward=backward)
+        self._priority: Dict[Node, int] = {node: i for i, node in enumerate(ordering)}
+        self._heap: List[Tuple[int, int, Node]] = list()
+        self._pending: Set[Node] = set()
+
+    def put(self, node: Node) -> None:
+        if node not in self._pending:
+            self._pending.add(node)
+            priority = self._priority.get(node, len(self._priority))
+            heappush(self._heap, (priority, node.identifier, node))
+
+    def get(self) -> Node:
+        _, _, node = heappop(self._heap)
+        self._pending.remove(node)
+        return node
+
+    def empty(self) -> bool:
+        return not self._heap
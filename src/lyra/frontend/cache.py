@@ -0,0 +1,200 @@
+"""
+Control Flow Graph Cache
+========================
+
+Content-addressed on-disk cache of the control flow graphs (and function arguments)
+generated by the frontend, so that unchanged programs skip the frontend entirely.
+
+Entries are keyed by the SHA-256 hash of the source code and of the Pyra version,
+and the least recently used entries are evicted when the cache exceeds its size bound.
+The underlying size-bounded on-disk cache also stores the results of incremental analyses.
+
+:Author: Caterina Urban
+"""
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from lyra.core.cfg import ControlFlowGraph
+from lyra.core.expressions import VariableIdentifier
+
+_FRONTEND = ['core/cfg.py', 'core/expressions.py', 'core/statements.py', 'core/types.py',
+             'frontend/cfg_generator.py']
+
+
+def cache_directory(name: str) -> str:
+    """Default directory of a Pyra cache.
+
+    :param name: name of the cache
+    :return: ``$XDG_CACHE_HOME/pyra/<name>`` (or ``~/.cache/pyra/<name>``)
+    """
+    home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(home, 'pyra', name)
+
+
+@lru_cache(maxsize=None)
+def version() -> str:
+    """Pyra version the cached entries are valid for.
+
+    Besides the release version, it includes a digest of the frontend sources, so that
+    entries generated by a modified frontend (e.g., in a development install) are not reused.
+
+    :return: Pyra version
+    """
+    try:
+        from importlib.metadata import version as distribution
+        release = distribution('Pyra')
+    except Exception:
+        release = 'unknown'
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    digest = hashlib.sha256()
+    for module in _FRONTEND:
+        with open(os.path.join(root, module), 'rb') as source:
+            digest.update(source.read())
+    return f'{release}+{digest.hexdigest()[:16]}'
+
+
+class DiskCache:
+    """On-disk cache of pickled entries, bounded in size."""
+
+    def __init__(self, directory: str, size: int = 256 * 1024 * 1024):
+        """On-disk cache of pickled entries, bounded in size.
+
+        :param directory: cache directory
+        :param size: maximum size of the cache (in bytes)
+        """
+        self._directory = directory
+        self._size = size
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @property
+    def size(self):
+        return self._size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.pickle')
+
+    def load(self, key: str):
+        """Retrieve an entry of the cache.
+
+        :param key: key of the entry
+        :return: value of the entry, ``None`` if not cached
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as entry:
+                value = pickle.load(entry)
+        except FileNotFoundError:
+            return None
+        except Exception:       # corrupted (or incompatible) entry
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)      # mark the entry as recently used
+        except OSError:
+            pass
+        return value
+
+    def store(self, key: str, value):
+        """Store an entry of the cache.
+
+        The entry is written atomically, so concurrent analyses can share the cache.
+        Values that cannot be pickled are simply not cached.
+
+        :param key: key of the entry
+        :param value: value of the entry
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        limit = sys.getrecursionlimit()
+        try:
+            sys.setrecursionlimit(max(limit, 10000))
+            with os.fdopen(descriptor, 'wb') as entry:
+                pickle.dump(value, entry, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self._path(key))
+        except (pickle.PicklingError, RecursionError, TypeError, AttributeError, OSError):
+            self._remove(temporary)
+            return
+        finally:
+            sys.setrecursionlimit(limit)
+        self._evict()
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        """Evict the least recently used entries until the cache fits its size bound."""
+        entries = list()
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pickle'):
+                try:
+                    stat = entry.stat()
+                except OSError:     # concurrently evicted
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.size:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        """Remove all entries of the cache."""
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.pickle'):
+                    self._remove(entry.path)
+
+
+class CFGCache(DiskCache):
+    """Content-addressed on-disk cache of control flow graphs (and function arguments)."""
+
+    def __init__(self, directory: str = None, size: int = 256 * 1024 * 1024):
+        """Content-addressed on-disk cache of control flow graphs (and function arguments).
+
+        :param directory: cache directory (defaults to ``$XDG_CACHE_HOME/pyra/cfgs``)
+        :param size: maximum size of the cache (in bytes)
+        """
+        super().__init__(directory or cache_directory('cfgs'), size)
+        self._version = version()
+
+    def key(self, source: str) -> str:
+        """Key of the cache entry of a program.
+
+        :param source: source code of the program
+        :return: SHA-256 hash of the source code and of the Pyra version
+        """
+        digest = hashlib.sha256(self._version.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(source.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, source: str) \
+            -> Optional[Tuple[Dict[str, ControlFlowGraph], Dict[str, List[VariableIdentifier]]]]:
+        """Retrieve the control flow graphs (and function arguments) of a program.
+
+        :param source: source code of the program
+        :return: control flow graphs and function arguments of the program, ``None`` if not cached
+        """
+        return self.load(self.key(source))
+
+    def put(self, source: str, cfgs: Dict[str, ControlFlowGraph],
+            fargs: Dict[str, List[VariableIdentifier]]):
+        """Store the control flow graphs (and function arguments) of a program.
+
+        :param source: source code of the program
+        :param cfgs: control flow graphs of the program
+        :param fargs: function arguments of the program
+        """
+        self.store(self.key(source), (cfgs, fargs))
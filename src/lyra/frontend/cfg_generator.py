@@ -75,7 +75,7 @@ class LooseControlFlowGraph:
         self._cfg._out_node = node
 
     @property
-    def edges(self) -> Dict[Tuple[Node, Node], Edge]:
+    def edges(self) -> Mapping[Tuple[Node, Node], Edge]:
         return self._cfg.edges
 
     @property
@@ -119,10 +119,10 @@ class LooseControlFlowGraph:
             self.loose_out_edges.add(edge)
             self._cfg._out_node = None
         else:
-            self.edges[edge.source, edge.target] = edge
+            self._cfg.add_edge(edge)
 
     def remove_edge(self, edge):
-        del self.edges[(edge.source, edge.target)]
+        self._cfg.remove_edge(edge)
 
     def remove_node(self, node):
         """Remove a node and all its out edges from the CFG.
@@ -140,16 +140,17 @@ class LooseControlFlowGraph:
             self.remove_node(node_to_be_removed)
 
     def get_edges_with_source(self, source):
-        return [edge for edge in self.edges.values() if edge.source is source]
+        return list(self._cfg.out_edges(source))
 
     def get_edges_with_target(self, target):
-        return [edge for edge in self.edges.values() if edge.target is target]
+        return list(self._cfg.in_edges(target))
 
     def combine(self, other):
         assert not (self.in_node and other.in_node)
         assert not (self.out_node and other.out_node)
         self.nodes.update(other.nodes)
-        self.edges.update(other.edges)
+        for edge in other.edges.values():
+            self._cfg.add_edge(edge)
         self.loose_in_edges.update(other.loose_in_edges)
         self.loose_out_edges.update(other.loose_out_edges)
         self.both_loose_edges.update(other.both_loose_edges)
@@ -168,7 +169,8 @@ class LooseControlFlowGraph:
                 not other.loose_in_edges and not other.both_loose_edges)
 
         self.nodes.update(other.nodes)
-        self.edges.update(other.edges)
+        for edge in other.edges.values():
+            self._cfg.add_edge(edge)
 
         edge_added = False
         if self.loose_out_edges:
@@ -176,7 +178,7 @@ class LooseControlFlowGraph:
             for e in self.loose_out_edges:
                 e._target = other.in_node
                 # updated/created edge is not yet in edge dict -> add
-                self.edges[(e.source, e.target)] = e
+                self._cfg.add_edge(e)
             # clear loose edge sets
             self._loose_out_edges = set()
         elif other.loose_in_edges:
@@ -184,7 +186,7 @@ class LooseControlFlowGraph:
             for e in other.loose_in_edges:
                 e._source = self.out_node
                 # updated/created edge is not yet in edge dict -> add
-                self.edges[(e.source, e.target)] = e
+                self._cfg.add_edge(e)
             # clear loose edge set
             other._loose_in_edges = set()
 
@@ -206,7 +208,7 @@ class LooseControlFlowGraph:
             # neither of the CFGs has loose ends -> add unconditional edge
             e = Unconditional(self.out_node, other.in_node)
             # updated/created edge is not yet in edge dict -> add
-            self.edges[(e.source, e.target)] = e
+            self._cfg.add_edge(e)
 
         # in any case, transfer loose_out_edges of other to self
         self.loose_out_edges.update(other.loose_out_edges)
@@ -4,6 +4,12 @@ Lyra Static Program Analyzer
 """
 
 import argparse
+import os
+import sys
+import time
+from contextlib import contextmanager, redirect_stdout
+from functools import partial
+
 from lyra.engine.liveness.liveness_analysis import StrongLivenessAnalysis
 from lyra.engine.numerical.interval_analysis import ForwardIntervalAnalysisWithSummarization
 from lyra.engine.usage.usage_analysis import SimpleUsageAnalysis
@@ -12,11 +18,351 @@ from lyra.engine.usage.dataframe_usage_analysis import DataFrameColumnUsageAnaly
 from lyra.engine.numerical.sign_analysis import ForwardSignAnalysis
 from lyra.engine.assumption.assumption_analysis import ForwardTypeAnalysis
 from lyra.engine.assumption.assumption_analysis import ForwardDatascienceTypeAnalysis
+from lyra.engine.assumption.assumption_analysis import TypeRangeAssumptionAnalysis, \
+    TypeAlphabetAssumptionAnalysis, TypeWordSetAssumptionAnalysis, \
+    TypeRangeAlphabetAssumptionAnalysis, TypeRangeWordSetAssumptionAnalysis, \
+    TypeRangeAlphabetWordSetAssumptionAnalysis
+from lyra.engine.assumption.input_checker import InputChecker
+from lyra.datascience.profiling import Profiler, ProfileCache
 from lyra.datascience.annotate import annotate
+import lyra.core.diagnostics as diagnostics
+from lyra.engine.batch import Batch, BatchResult, collect
+from lyra.engine.budget import Budget
+from lyra.engine.incremental import ResultCache
+from lyra.engine.runner import Runner
+from lyra.frontend.cache import CFGCache
 import lyra.config as config
 
+ANALYSES = {
+    'intervals': ForwardIntervalAnalysisWithSummarization,
+    'liveness': StrongLivenessAnalysis,
+    'usage': SimpleUsageAnalysis,
+    'df_usage': DataFrameColumnUsageAnalysis,
+    'sign': ForwardSignAnalysis,
+    'type-datascience': ForwardDatascienceTypeAnalysis,
+    'type-vanilla': ForwardTypeAnalysis,
+}
+"""Supported analyses."""
+
+ASSUMPTIONS = {
+    'type+range': TypeRangeAssumptionAnalysis,
+    'type+alphabet': TypeAlphabetAssumptionAnalysis,
+    'type+wordset': TypeWordSetAssumptionAnalysis,
+    'type+range+alphabet': TypeRangeAlphabetAssumptionAnalysis,
+    'type+range+wordset': TypeRangeWordSetAssumptionAnalysis,
+    'type+range+alphabet+wordset': TypeRangeAlphabetWordSetAssumptionAnalysis,
+}
+"""Supported assumption analyses (to check input data against)."""
+
+
+def runner(analysis: str, warning_level: str = 'potential') -> Runner:
+    """Create the runner of an analysis.
+
+    :param analysis: name of the analysis (one of ``ANALYSES``)
+    :param warning_level: warning level to be used (values: potential, plausible)
+    :return: runner of the analysis
+    """
+    if analysis not in ANALYSES:
+        raise ValueError(f'Unknown analysis {analysis} (values: {", ".join(ANALYSES)})')
+    if analysis == 'type-datascience':
+        # The value of the warning level has to be either 'potential' or 'plausible'
+        if warning_level not in ['potential', 'plausible']:
+            raise ValueError('Warning level must be either potential or plausible')
+        return ForwardDatascienceTypeAnalysis(warning_level)
+    return ANALYSES[analysis]()
+
+
+def _headless() -> bool:
+    """Whether there is no display to view the rendered analysis results on."""
+    if sys.platform.startswith('linux') or 'bsd' in sys.platform:
+        return not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    return False
+
+
+def _output_arguments(parser, render: str):
+    parser.add_argument(
+        '--render',
+        help=f'format the analysis result is rendered to (default: {render})',
+        choices=['none', 'dot', 'svg', 'pdf'],
+        default=render)
+    parser.add_argument(
+        '--check-annotations',
+        help='check the analysis result against the result comments in the analyzed program',
+        action='store_true')
+    parser.add_argument(
+        '--verbose',
+        help='print the statistics of the analysis (e.g., its node visits) '
+             'along with its duration',
+        action='store_true')
+
+
+def _cache_arguments(parser):
+    parser.add_argument(
+        '--no-cache',
+        help='do not cache the control flow graphs of the analyzed programs',
+        action='store_true')
+    parser.add_argument(
+        '--cache-dir',
+        help='directory of the control flow graph cache (default: $XDG_CACHE_HOME/pyra/cfgs)',
+        default=None)
+    parser.add_argument(
+        '--cache-size',
+        help='maximum size of the control flow graph cache, in MB (default: 256)',
+        type=int,
+        default=256)
+    parser.add_argument(
+        '--incremental',
+        help='reuse the analysis results of the functions unchanged since the previous run',
+        action='store_true')
+    parser.add_argument(
+        '--incremental-dir',
+        help='directory of the stored analysis results (default: $XDG_CACHE_HOME/pyra/results)',
+        default=None)
+    parser.add_argument(
+        '--no-summaries',
+        help='analyze each call to a user-defined function anew instead of reusing its summary',
+        action='store_true')
+    parser.add_argument(
+        '--contexts',
+        help='maximum number of analyzed contexts of each user-defined function '
+             '(default: no bound)',
+        type=int,
+        default=None)
+
+
+def _profile_arguments(parser):
+    parser.add_argument(
+        '--profile-rows',
+        help='maximum number of rows of each CSV file read to profile it (default: all rows)',
+        type=int,
+        default=None)
+    parser.add_argument(
+        '--no-profile-cache',
+        help='profile the CSV files read by the analyzed programs anew '
+             'instead of reusing their cached profiles',
+        action='store_true')
+
+
+def _budget_arguments(parser):
+    parser.add_argument(
+        '--budget-time',
+        help='maximum wall time of the analysis of each program, in seconds (default: none)',
+        type=float,
+        default=None)
+    parser.add_argument(
+        '--budget-visits',
+        help='maximum number of node visits of the analysis of each program (default: none)',
+        type=int,
+        default=None)
+    parser.add_argument(
+        '--budget-size',
+        help='maximum size of the analysis state at a loop head, in characters (default: none)',
+        type=int,
+        default=None)
+    parser.add_argument(
+        '--function-budget-time',
+        help='maximum wall time of the analysis of each function, in seconds (default: none)',
+        type=float,
+        default=None)
+    parser.add_argument(
+        '--function-budget-visits',
+        help='maximum number of node visits of the analysis of each function (default: none)',
+        type=int,
+        default=None)
+
+
+def _slicing_arguments(parser):
+    parser.add_argument(
+        '--demand-driven',
+        help='only analyze the statements that can influence the library calls with warning rules '
+             '(type-datascience analysis only)',
+        action='store_true')
+
+
+def _collection_arguments(parser):
+    parser.add_argument(
+        '--collect-dead',
+        help='forget the information about the variables that are no longer used '
+             'during the analysis',
+        action='store_true')
+
+
+def _configure(analysis: Runner, args, view: bool = True) -> Runner:
+    """Set up the output and the caching of an analysis as given on the command line."""
+    analysis.rendering = args.render if args.render != 'none' else None
+    analysis.viewing = view
+    analysis.checking = args.check_annotations
+    analysis.verbose = args.verbose
+    if not args.no_cache:
+        analysis.cache = CFGCache(args.cache_dir, args.cache_size * 1024 * 1024)
+    if args.incremental:
+        analysis.incremental = ResultCache(args.incremental_dir, args.cache_size * 1024 * 1024)
+    analysis.summarizing = not args.no_summaries
+    analysis.contexts = args.contexts
+    cache = None if args.no_profile_cache else ProfileCache(size=args.cache_size * 1024 * 1024)
+    config.profiler = Profiler(cache, args.profile_rows)
+    bounds = (args.budget_time, args.budget_visits, args.budget_size,
+              args.function_budget_time, args.function_budget_visits)
+    if any(bound is not None for bound in bounds):
+        analysis.budget = Budget(*bounds)
+    if args.demand_driven:
+        if analysis.criterion is None:
+            raise ValueError('Demand-driven analysis is not supported '
+                             f'by the {args.analysis} analysis')
+        analysis.slicing = True
+    analysis.collecting = args.collect_dead
+    return analysis
+
+
+def _batch_runner(args, path: str) -> Runner:
+    config.args = argparse.Namespace(**{**vars(args), 'python_file': path})
+    return _configure(runner(args.analysis, args.warning_level), args, view=False)
+
+
+def _diagnostics_arguments(parser):
+    parser.add_argument(
+        '--diagnostics',
+        help='stream the warnings in a machine-readable format '
+             f'(values: {", ".join(diagnostics.SINKS)})',
+        choices=diagnostics.SINKS,
+        default=None)
+    parser.add_argument(
+        '--diagnostics-output',
+        help='file the warnings are streamed to (default: standard output)',
+        default='-')
+
+
+@contextmanager
+def _diagnostics(args):
+    """Stream the warnings in the format and to the file given on the command line, if any."""
+    if not args.diagnostics:
+        yield None
+    elif args.diagnostics_output == '-':
+        # the analysis output is moved to the standard error to keep the diagnostics parsable
+        with diagnostics.reporting(diagnostics.SINKS[args.diagnostics](sys.stdout)) as sink:
+            with redirect_stdout(sys.stderr):
+                yield sink
+    else:
+        with open(args.diagnostics_output, 'w') as output:
+            with diagnostics.reporting(diagnostics.SINKS[args.diagnostics](output)) as sink:
+                yield sink
+
+
+def batch(argv):
+    """Batch analysis entry point (``pyra batch``)."""
+    parser = argparse.ArgumentParser(prog='pyra batch')
+    parser.add_argument(
+        'targets',
+        nargs='+',
+        help='Python files to analyze (directories, glob patterns, Python files, '
+             'or text files listing Python files one per line)')
+    parser.add_argument(
+        '--analysis',
+        help=f'analysis to be used (values: {", ".join(ANALYSES)})',
+        default='usage')
+    parser.add_argument(
+        '--warning-level',
+        help='warning level to be used (values: potential, plausible)',
+        default='potential')
+    parser.add_argument(
+        '--workers',
+        help='number of worker processes (default: number of CPUs)',
+        type=int,
+        default=os.cpu_count())
+    parser.add_argument(
+        '--timeout',
+        help='maximum duration of the analysis of each file, in seconds (default: none)',
+        type=float,
+        default=None)
+    _output_arguments(parser, 'none')
+    _cache_arguments(parser)
+    _profile_arguments(parser)
+    _budget_arguments(parser)
+    _slicing_arguments(parser)
+    _collection_arguments(parser)
+    _diagnostics_arguments(parser)
+    args = parser.parse_args(argv)
+    # fail early on invalid options
+    if runner(args.analysis, args.warning_level).criterion is None and args.demand_driven:
+        raise ValueError('Demand-driven analysis is not supported '
+                         f'by the {args.analysis} analysis')
+    config.args = args
+
+    paths = collect(args.targets)
+    counts = {status: 0 for status in BatchResult.Status}
+    with _diagnostics(args) as sink:
+        for result in Batch(partial(_batch_runner, args), args.workers, args.timeout).run(paths):
+            counts[result.status] += 1
+            print(result, flush=True)
+            if sink:
+                sink.start(result.path)
+                for diagnostic in result.diagnostics:
+                    sink.report(diagnostic)
+                sink.finish(result.path, status=result.status.value, time=result.duration)
+        summary = ', '.join(f'{count} {status.value}' for status, count in counts.items())
+        print(f'Analyzed {len(paths)} files: {summary}')
+    return 0 if counts[BatchResult.Status.OK] == len(paths) else 1
+
+
+def check_input(argv):
+    """Input data checking entry point (``pyra check-input``)."""
+    parser = argparse.ArgumentParser(prog='pyra check-input')
+    parser.add_argument(
+        'python_file',
+        help='Python file whose assumptions on its input data are inferred')
+    parser.add_argument(
+        'input_files',
+        nargs='+',
+        help='input data files to check against the inferred assumptions')
+    parser.add_argument(
+        '--analysis',
+        help=f'assumption analysis to be used (values: {", ".join(ASSUMPTIONS)})',
+        choices=ASSUMPTIONS,
+        default='type+range+alphabet+wordset')
+    parser.add_argument(
+        '--all',
+        help='report all violations of the inferred assumptions '
+             'instead of stopping at the first one',
+        action='store_true')
+    parser.add_argument(
+        '--chunk-size',
+        help='size of the chunks the input data is read in, in KB (default: 1024)',
+        type=int,
+        default=1024)
+    _cache_arguments(parser)
+    args = parser.parse_args(argv)
+    config.args = args
+
+    analysis = ASSUMPTIONS[args.analysis]()
+    analysis.rendering, analysis.viewing, analysis.checking = None, False, False
+    if not args.no_cache:
+        analysis.cache = CFGCache(args.cache_dir, args.cache_size * 1024 * 1024)
+    with redirect_stdout(sys.stderr):   # keep the standard output to the violations
+        result = analysis.main(args.python_file)
+    states = result.get_node_result(analysis.cfgs[''].in_node)
+    assumption = next(iter(states.values()))[0].stack.lattice
+    checker = InputChecker(assumption, args.chunk_size * 1024)
+    valid = True
+    for path in args.input_files:
+        start = time.time()
+        violations = checker.check(path, args.all)
+        end = time.time()
+        for violation in violations:
+            print(f'{path}:{violation}')
+        if checker.unchecked is not None:
+            unchecked = f'{path}:{checker.unchecked}: input data not checked from here on'
+            print(unchecked, file=sys.stderr)
+        print(f'{path}: {checker.lines} lines checked in {end - start:.3f}s', file=sys.stderr)
+        valid = valid and not violations
+    return 0 if valid else 1
+
+
 def main():
     """Static analyzer entry point."""
+    if sys.argv[1:2] == ['batch']:
+        return batch(sys.argv[2:])
+    if sys.argv[1:2] == ['check-input']:
+        return check_input(sys.argv[2:])
     parser = argparse.ArgumentParser()
     parser.add_argument(
         'python_file',
@@ -29,32 +375,36 @@ def main():
         '--warning-level',
         help='warning level to be used (values: potential, plausible)',
         default='potential')
+    parser.add_argument(
+        '--functions',
+        help='also analyze each user-defined function on its own, in parallel',
+        action='store_true')
+    parser.add_argument(
+        '--workers',
+        help='number of worker processes the functions are analyzed by (default: number of CPUs)',
+        type=int,
+        default=None)
     parser.add_argument(
         '--annotate',
         help='use the results of the ForwardDatascienceTypeAnalysis to annotate the code',
         action='store_true')
+    _output_arguments(parser, 'none' if _headless() else 'pdf')
+    _cache_arguments(parser)
+    _profile_arguments(parser)
+    _budget_arguments(parser)
+    _slicing_arguments(parser)
+    _collection_arguments(parser)
+    _diagnostics_arguments(parser)
     args = parser.parse_args()
     config.args = args
 
-    if args.analysis == 'intervals':
-        ForwardIntervalAnalysisWithSummarization().main(args.python_file)
-    if args.analysis == 'liveness':
-        StrongLivenessAnalysis().main(args.python_file)
-    if args.analysis == 'usage':
-        SimpleUsageAnalysis().main(args.python_file)
-    if args.analysis == 'df_usage':
-        DataFrameColumnUsageAnalysis().main(args.python_file)
-    if args.analysis == "sign":
-        ForwardSignAnalysis().main(args.python_file)
-    if args.analysis == 'type-datascience':
-        # The value of the warning level has to be either 'potential' or 'plausible'
-        if args.warning_level not in ['potential', 'plausible']:
-            raise ValueError('Warning level must be either potential or plausible')
-        result = ForwardDatascienceTypeAnalysis(args.warning_level).main(args.python_file)
-        if(args.annotate):
-            annotated_code = annotate(result, args.python_file)
-    if args.analysis == 'type-vanilla':
-        ForwardTypeAnalysis().main(args.python_file)
+    if args.analysis in ANALYSES:
+        with _diagnostics(args):
+            analysis = _configure(runner(args.analysis, args.warning_level), args, not _headless())
+            analysis.functions, analysis.workers = args.functions, args.workers
+            result = analysis.main(args.python_file)
+            if args.analysis == 'type-datascience' and args.annotate:
+                annotated_code = annotate(result, args.python_file)
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -32,8 +32,7 @@ from lyra.datascience.datascience_type_domain import (
     DatascienceTypeState,
     DatascienceTypeLattice,
 )
-import warnings
-import pandas as pd
+from lyra.core.diagnostics import warn
 
 from lyra.core.datascience_warnings import (
     GmeanWarning,
@@ -52,7 +51,7 @@ from lyra.semantics.torch_datascience_type_semantics import TorchDatascienceType
 from lyra.semantics.seaborn_datascience_type_semantics import SeabornDatascienceTypeSemantics
 import lyra.semantics.utilities as utilities
 from lyra.semantics.utilities import SelfUtilitiesSemantics
-from lyra.semantics.semantics import camel_to_snake
+from lyra.semantics.symbols import has_symbol
 from lyra.semantics.numpy_datascience_type_semantics import NumPyDatascienceTypeSemantics
 
 from lyra.core.types import TopLyraType
@@ -70,17 +69,20 @@ class DatascienceTypeSemantics(
 ):
     """Forward semantics of statements with support for Pandas library calls for dataframe column usage analysis."""
 
+    warning_calls = frozenset({
+        'read_csv',                                             # data properties (e.g., NA values)
+        'mean', 'median', 'fillna', 'sample',                   # statistics and data cleaning
+        'plot', 'scatter', 'scatter_3d',                        # plotting
+        'fit', 'transform', 'fit_transform', 'PCA', 'train_test_split',    # machine learning
+    })
+    """Names of the calls whose semantics can raise warnings."""
+
     def semantics(self, stmt, state, interpreter, get_caller=False):
         """Override the semantics method to add the get_caller parameter"""
-        name = '{}_semantics'.format(camel_to_snake(stmt.__class__.__name__))
-        if hasattr(self, name):
-            method = getattr(self, name)
-            if 'get_caller' in method.__code__.co_varnames:
-                return method(stmt, state, interpreter, get_caller=get_caller)
-            else:
-                return method(stmt, state, interpreter)
-        error = f"Semantics for statement {stmt} of type {type(stmt)} not yet implemented! "
-        raise NotImplementedError(error + f"You must provide method {name}(...)")
+        method, caller = self._handler(stmt)
+        if caller:
+            return method(self, stmt, state, interpreter, get_caller=get_caller)
+        return method(self, stmt, state, interpreter)
 
     def relaxed_open_call_policy(
             self, stmt: Call, state: DatascienceTypeState, interpreter: ForwardInterpreter
@@ -122,7 +124,7 @@ class DatascienceTypeSemantics(
             id = access.target.variable
             # FIXME: Access on fields of df or series can return specific types
             if state.get_type(id) == DatascienceTypeLattice.Status.DataFrame:
-                if hasattr(pd.DataFrame, access.attr.name):
+                if has_symbol("pandas.DataFrame", access.attr.name):
                     if access.attr.name == "dtypes":
                         state.result = {DatascienceTypeLattice.Status.Series}
                     elif access.attr.name == "values":
@@ -376,17 +378,19 @@ class DatascienceTypeSemantics(
             state.result = {DatascienceTypeLattice.Status.Series}
         elif utilities.is_Series(state, caller):
             if caller in state.store and state.get_type(caller) == DatascienceTypeLattice.Status.CatSeries:
-                warnings.warn(
+                warn(
                     f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {caller_to_print} is a CatSeries, median my be not meaningful.",
                     category=CategoricalConversionMeanWarning,
                     stacklevel=2,
+                    level='plausible', pp=stmt.pp, variable=caller_to_print,
                 )
             else:
                 if interpreter.warning_level == "potential":
-                    warnings.warn(
+                    warn(
                         f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> if in {caller_to_print} there is a CatSeries, median my be not meaningful.",
                         category=CategoricalConversionMeanWarning,
                         stacklevel=2,
+                        level='potential', pp=stmt.pp, variable=caller_to_print,
                     )
             state.result = {DatascienceTypeLattice.Status.Numeric}
         else:
@@ -432,39 +436,45 @@ class DatascienceTypeSemantics(
         caller_to_print = caller if not isinstance(caller, DatascienceTypeLattice.Status) else stmt
         if utilities.is_Series(state, caller):
             if utilities.is_RatioSeries(state, caller):
-                warnings.warn(
+                warn(
                     f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {caller_to_print} is a RatioSeries, gmean should be used.",
                     category=GmeanWarning,
                     stacklevel=2,
+                    level='plausible', pp=stmt.pp, variable=caller_to_print,
                 )
             elif utilities.is_CatSeries(state, caller):
-                warnings.warn(
+                warn(
                     f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {caller_to_print} is a CatSeries, mean my be not meaningful.",
                     category=CategoricalConversionMeanWarning,
                     stacklevel=2,
+                    level='plausible', pp=stmt.pp, variable=caller_to_print,
                 )
             elif utilities.is_ScaledSeries(state, caller):
-                warnings.warn(
+                warn(
                     f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {caller_to_print} is a ScaledSeries [StdSeries or NormSeries], mean my be not meaningful.",
                     category=ScaledMeanWarning,
                     stacklevel=2,
+                    level='plausible', pp=stmt.pp, variable=caller_to_print,
                 )
             else:
                 if interpreter.warning_level == "potential":
-                    warnings.warn(
+                    warn(
                         f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> if in {caller_to_print} there is a RatioSeries, gmean should be used.",
                         category=GmeanWarning,
                         stacklevel=2,
+                        level='potential', pp=stmt.pp, variable=caller_to_print,
                     )
-                    warnings.warn(
+                    warn(
                         f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> if in {caller_to_print} there is a CatSeries, mean my be not meaningful.",
                         category=CategoricalConversionMeanWarning,
                         stacklevel=2,
+                        level='potential', pp=stmt.pp, variable=caller_to_print,
                     )
-                    warnings.warn(
+                    warn(
                         f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> if in {caller_to_print} there is a ScaledSeries [StdSeries or NormSeries], mean my be not meaningful.",
                         category=ScaledMeanWarning,
                         stacklevel=2,
+                        level='potential', pp=stmt.pp, variable=caller_to_print,
                     )
             state.result = {DatascienceTypeLattice.Status.Numeric}
         elif utilities.is_DataFrame(state, caller):
@@ -650,10 +660,11 @@ class DatascienceTypeSemantics(
                     if utilities.is_DataFrame(state, v):
                         data = v
                         if interpreter.warning_level == "potential":
-                            warnings.warn(
+                            warn(
                                 f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} could contain categorical data, a bar plot should be used.",
                                 category=CategoricalPlotWarning,
                                 stacklevel=2,
+                                level='potential', pp=stmt.pp, variable=arg_to_print,
                             )
                             break
         if data is None: # Only used in case of positional argument with x, y, z keywords
@@ -673,121 +684,138 @@ class DatascienceTypeSemantics(
                     for sub in state.subscriptions[data]:
                         if sub.key.val == possible_sub_name:
                             if utilities.is_CatSeries(state, sub):
-                                warnings.warn(
+                                warn(
                                     f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} is a categorical Series, a bar plot should be used.",
                                     category=CategoricalPlotWarning,
                                     stacklevel=2,
+                                    level='plausible', pp=stmt.pp, variable=arg_to_print,
                                 )
                             elif utilities.is_StringSeries(state, sub):
-                                warnings.warn(
+                                warn(
                                     f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} is a string Series, a bar plot should be used.",
                                     category=CategoricalPlotWarning,
                                     stacklevel=2,
+                                    level='plausible', pp=stmt.pp, variable=arg_to_print,
                                 )
                             elif utilities.is_Series(state, sub) and not utilities.is_NumericSeries(state, sub):
                                 if interpreter.warning_level == "potential":
-                                    warnings.warn(
+                                    warn(
                                         f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} could contain categorical data, a bar plot should be used. ",
                                         category=CategoricalPlotWarning,
                                         stacklevel=2,
+                                        level='potential', pp=stmt.pp, variable=arg_to_print,
                                     )
                             break
                 elif interpreter.warning_level == "potential":
-                    warnings.warn(
+                    warn(
                                 f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} could contain categorical data, a bar plot should be used. ",
                                 category=CategoricalPlotWarning,
                                 stacklevel=2,
+                                level='potential', pp=stmt.pp, variable=arg_to_print,
                             )
             if utilities.is_StringArray(state, arg):
-                warnings.warn(
+                warn(
                     f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} is a string array, a bar plot should be used.",
                     category=CategoricalPlotWarning,
                     stacklevel=2,
+                    level='plausible', pp=stmt.pp, variable=arg_to_print,
                 )
             elif utilities.is_StringList(state, arg):
-                warnings.warn(
+                warn(
                     f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} is a string list, a bar plot should be used.",
                     category=CategoricalPlotWarning,
                     stacklevel=2,
+                    level='plausible', pp=stmt.pp, variable=arg_to_print,
                 )
             elif utilities.is_CatSeries(state, arg):
-                warnings.warn(
+                warn(
                     f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} is a categorical Series, a bar plot should be used.",
                     category=CategoricalPlotWarning,
                     stacklevel=2,
+                    level='plausible', pp=stmt.pp, variable=arg_to_print,
                 )
             elif utilities.is_StringSeries(state, arg):
-                warnings.warn(
+                warn(
                     f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} is a string Series, a bar plot should be used.",
                     category=CategoricalPlotWarning,
                     stacklevel=2,
+                    level='plausible', pp=stmt.pp, variable=arg_to_print,
                 )
             elif (utilities.is_Array(state, arg) or utilities.is_Top(state, arg)) and not utilities.is_NumericArray(state, arg):
                 if interpreter.warning_level == "potential":
-                    warnings.warn(
+                    warn(
                         f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} could contain categorical data, a bar plot should be used. ",
                         category=CategoricalPlotWarning,
                         stacklevel=2,
+                        level='potential', pp=stmt.pp, variable=arg_to_print,
                     )
             elif utilities.is_DataFrame(state, arg):
                 if isinstance(arg, VariableAccess):
                     arg = arg.variable
                 if state.get_type(arg) == DatascienceTypeLattice.Status.DataFrameFromPCA:
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} is a DataFrame resulted from PCA, t-SNE or UMAP might be a better choice for visualization.",
                         stacklevel=2,
-                        category=PCAVisualizationWarning
+                        category=PCAVisualizationWarning,
+                        level='plausible', pp=stmt.pp, variable=arg_to_print
                     )
             # Also a subscription to a DataFrameFromPCA a PCAVisualizationWarning must be raised
             elif isinstance(arg, SubscriptionAccess):
                 if utilities.is_CatSeries(state, arg):
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} is a categorical Series, a bar plot should be used.",
                         category=CategoricalPlotWarning,
                         stacklevel=2,
+                        level='plausible', pp=stmt.pp, variable=arg_to_print,
                     )
                 elif utilities.is_StringSeries(state, arg):
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} is a string Series, a bar plot should be used.",
                         category=CategoricalPlotWarning,
                         stacklevel=2,
+                        level='plausible', pp=stmt.pp, variable=arg_to_print,
                     )
                 elif utilities.is_Series(state, arg) and not utilities.is_NumericSeries(state, arg):
                     if interpreter.warning_level == "potential":
-                        warnings.warn(
+                        warn(
                             f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} could contain categorical data, a bar plot should be used. ",
                             category=CategoricalPlotWarning,
                             stacklevel=2,
+                            level='potential', pp=stmt.pp, variable=arg_to_print,
                         )
                 if isinstance(arg.target, VariableAccess):
                     arg = arg.target.variable
                 else:
                     arg = arg.target
                 if state.get_type(arg) == DatascienceTypeLattice.Status.DataFrameFromPCA:
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} is a DataFrame resulted from PCA, t-SNE or UMAP might be a better choice for visualization.",
                         stacklevel=2,
-                        category=PCAVisualizationWarning
+                        category=PCAVisualizationWarning,
+                        level='plausible', pp=stmt.pp, variable=arg_to_print
                     )
             elif utilities.is_Series(state, arg):
                 if utilities.is_CatSeries(state, arg):
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} is a categorical Series, a bar plot should be used.",
                         category=CategoricalPlotWarning,
                         stacklevel=2,
+                        level='plausible', pp=stmt.pp, variable=arg_to_print,
                     )
                 elif utilities.is_StringSeries(state, arg):
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} is a string Series, a bar plot should be used.",
                         category=CategoricalPlotWarning,
                         stacklevel=2,
+                        level='plausible', pp=stmt.pp, variable=arg_to_print,
                     )
                 elif utilities.is_Series(state, arg) and not utilities.is_NumericSeries(state, arg):
                     if interpreter.warning_level == "potential":
-                        warnings.warn(
+                        warn(
                             f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> {arg_to_print} could contain categorical data, a bar plot should be used. ",
                             category=CategoricalPlotWarning,
                             stacklevel=2,
+                            level='potential', pp=stmt.pp, variable=arg_to_print,
                         )
 
         state.result = {DatascienceTypeLattice.Status.Plot}
@@ -1322,43 +1350,49 @@ class DatascienceTypeSemantics(
                 is_reproducible = True
                 break
         if not is_reproducible:
-            warnings.warn(
+            warn(
                 f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} the random state is not set, the experiment might not be reproducible.",
                 category=ReproducibilityWarning,
                 stacklevel=2,
+                level='plausible', pp=stmt.pp,
             )
         types: tuple = ()
         for arg in stmt.arguments:
             if not isinstance(arg, Keyword):
                 if utilities.is_NormSeries(state, arg):
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} @ column {stmt.pp.column} -> Data should be normalized after the split method",
                         category=DataLeakageWarning,
                         stacklevel=2,
+                        level='plausible', pp=stmt.pp,
                     )
                 elif utilities.is_StdSeries(state, arg):
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} @ column {stmt.pp.column} -> Data should be standardized after the split method",
                         category=DataLeakageWarning,
                         stacklevel=2,
+                        level='plausible', pp=stmt.pp,
                     )
                 elif utilities.is_CatSeries(state, arg):
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} @ column {stmt.pp.column} -> Data should be encoded after the split method",
                         category=DataLeakageWarning,
                         stacklevel=2,
+                        level='plausible', pp=stmt.pp,
                     )
                 elif utilities.is_FeatureSelected(state, arg):
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} @ column {stmt.pp.column} -> Data should be Feature Selected after the split method",
                         category=DataLeakageWarning,
                         stacklevel=2,
+                        level='plausible', pp=stmt.pp,
                     )
                 elif utilities.is_Scaled(state, arg):
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} @ column {stmt.pp.column} -> Data should be scaled after the split method",
                         category=DataLeakageWarning,
                         stacklevel=2,
+                        level='plausible', pp=stmt.pp,
                     )
                 types += tuple({DatascienceTypeLattice.Status.SplittedTrainData})
                 types += tuple({DatascienceTypeLattice.Status.SplittedTestData})
@@ -81,21 +81,16 @@ class UserDefinedCallSemantics(ForwardSemantics):
                 _ret = VariableIdentifier(formal.typ, '{}#return'.format(actual.name))
                 state = state.remove_variable(_ret)
         # add local function variables to the state
-        _formal_args = set()
-        for formal in formal_args:
-            _formal_args.add(formal)
-            # if isinstance(formal.typ, (SequenceLyraType, ContainerLyraType)):
-            #     _formal_args.add(LengthIdentifier(formal))
-            #     if isinstance(formal.typ, DictLyraType):
-            #         _formal_args.add(KeysIdentifier(formal))
-            #         _formal_args.add(ValuesIdentifier(formal))
-        local_vars = set(fcfg.variables).difference(_formal_args)
+        local_vars = interpreter.local_variables(fname)
         for local in local_vars:
             state = state.add_variable(local).forget_variable(local)
 
-        fresult = interpreter.analyze(fcfg, state)      # analyze the function
-        fstate = fresult.get_node_result(fcfg.out_node)[state][-1]
-        state = state.bottom().join(deepcopy(fstate))
+        if interpreter.summaries is not None:
+            state = interpreter.summaries.call(interpreter, fname, state)
+        else:
+            fresult = interpreter.analyze(fcfg, state)      # analyze the function
+            fstate = fresult.get_node_result(fcfg.out_node)[state][-1]
+            state = state.bottom().join(deepcopy(fstate))
 
         # assign return variable
         if state.result:
@@ -0,0 +1,574 @@
+"""
+Library Symbols Index
+=====================
+
+Attributes of the libraries supported by the semantics of calls.
+
+.. warning::
+    Generated by ``python -m lyra.semantics.symbols``. Do not edit.
+"""
+
+VERSIONS = {
+    'matplotlib.pyplot': '3.9.2',
+    'numpy': '1.26.4',
+    'pandas': '2.1.3',
+    'pandas.DataFrame': '2.1.3',
+    'plotly.express': '6.0.1',
+    'seaborn': '0.13.2',
+    'torch': '2.14.1+cu130',
+}
+
+SYMBOLS = {
+    'matplotlib.pyplot': frozenset({
+        'AbstractContextManager', 'Annotation', 'Arrow', 'Artist', 'AutoLocator', 'AxLine', 'Axes',
+        'BackendFilter', 'Button', 'Circle', 'Colormap', 'Enum', 'ExitStack', 'Figure',
+        'FigureBase', 'FigureCanvasBase', 'FigureManagerBase', 'FixedFormatter', 'FixedLocator',
+        'FormatStrFormatter', 'Formatter', 'FuncFormatter', 'GridSpec', 'IndexLocator', 'Line2D',
+        'LinearLocator', 'Locator', 'LogFormatter', 'LogFormatterExponent', 'LogFormatterMathtext',
+        'LogLocator', 'MaxNLocator', 'MouseButton', 'MultipleLocator', 'Normalize',
+        'NullFormatter', 'NullLocator', 'PolarAxes', 'Polygon', 'Rectangle', 'ScalarFormatter',
+        'Slider', 'Subplot', 'SubplotSpec', 'TYPE_CHECKING', 'Text', 'TickHelper', 'Widget',
+        '_NO_PYPLOT_NOTE', '_REPL_DISPLAYHOOK', '_ReplDisplayHook', '_add_pyplot_note', '_api',
+        '_auto_draw_if_interactive', '_backend_mod', '_color_sequences', '_colormaps',
+        '_copy_docstring_and_deprecators', '_docstring', '_draw_all_if_interactive',
+        '_get_backend_mod', '_get_pyplot_commands', '_log', '_pylab_helpers',
+        '_warn_if_gui_out_of_main_thread', 'acorr', 'angle_spectrum', 'annotate', 'annotations',
+        'arrow', 'autoscale', 'autumn', 'axes', 'axhline', 'axhspan', 'axis', 'axline', 'axvline',
+        'axvspan', 'backend_registry', 'bar', 'bar_label', 'barbs', 'barh', 'bone', 'box',
+        'boxplot', 'broken_barh', 'cast', 'cbook', 'cla', 'clabel', 'clf', 'clim', 'close', 'cm',
+        'cohere', 'color_sequences', 'colorbar', 'colormaps', 'connect', 'contour', 'contourf',
+        'cool', 'copper', 'csd', 'cycler', 'delaxes', 'disconnect', 'draw', 'draw_all',
+        'draw_if_interactive', 'ecdf', 'errorbar', 'eventplot', 'figaspect', 'figimage',
+        'figlegend', 'fignum_exists', 'figtext', 'figure', 'fill', 'fill_between', 'fill_betweenx',
+        'findobj', 'flag', 'functools', 'gca', 'gcf', 'gci', 'get', 'get_backend', 'get_cmap',
+        'get_current_fig_manager', 'get_figlabels', 'get_fignums', 'get_plot_commands',
+        'get_scale_names', 'getp', 'ginput', 'gray', 'grid', 'hexbin', 'hist', 'hist2d', 'hlines',
+        'hot', 'hsv', 'importlib', 'imread', 'imsave', 'imshow', 'inferno', 'inspect',
+        'install_repl_displayhook', 'interactive', 'ioff', 'ion', 'isinteractive', 'jet', 'legend',
+        'locator_params', 'logging', 'loglog', 'magma', 'magnitude_spectrum', 'margins',
+        'matplotlib', 'matshow', 'minorticks_off', 'minorticks_on', 'mlab', 'new_figure_manager',
+        'nipy_spectral', 'np', 'overload', 'pause', 'pcolor', 'pcolormesh', 'phase_spectrum',
+        'pie', 'pink', 'plasma', 'plot', 'plot_date', 'polar', 'prism', 'psd', 'quiver',
+        'quiverkey', 'rc', 'rcParams', 'rcParamsDefault', 'rcParamsOrig', 'rc_context',
+        'rcdefaults', 'rcsetup', 'rgrids', 'savefig', 'sca', 'scatter', 'sci', 'semilogx',
+        'semilogy', 'set_cmap', 'set_loglevel', 'setp', 'show', 'specgram', 'spring', 'spy',
+        'stackplot', 'stairs', 'stem', 'step', 'streamplot', 'style', 'subplot', 'subplot2grid',
+        'subplot_mosaic', 'subplot_tool', 'subplots', 'subplots_adjust', 'summer', 'suptitle',
+        'switch_backend', 'sys', 'table', 'text', 'thetagrids', 'threading', 'tick_params',
+        'ticklabel_format', 'tight_layout', 'time', 'title', 'tricontour', 'tricontourf',
+        'tripcolor', 'triplot', 'twinx', 'twiny', 'uninstall_repl_displayhook', 'violinplot',
+        'viridis', 'vlines', 'waitforbuttonpress', 'winter', 'xcorr', 'xkcd', 'xlabel', 'xlim',
+        'xscale', 'xticks', 'ylabel', 'ylim', 'yscale', 'yticks',
+    }),
+    'numpy': frozenset({
+        'ALLOW_THREADS', 'BUFSIZE', 'CLIP', 'DataSource', 'ERR_CALL', 'ERR_DEFAULT', 'ERR_IGNORE',
+        'ERR_LOG', 'ERR_PRINT', 'ERR_RAISE', 'ERR_WARN', 'FLOATING_POINT_SUPPORT',
+        'FPE_DIVIDEBYZERO', 'FPE_INVALID', 'FPE_OVERFLOW', 'FPE_UNDERFLOW', 'False_', 'Inf',
+        'Infinity', 'MAXDIMS', 'MAY_SHARE_BOUNDS', 'MAY_SHARE_EXACT', 'NAN', 'NINF', 'NZERO',
+        'NaN', 'PINF', 'PZERO', 'RAISE', 'RankWarning', 'SHIFT_DIVIDEBYZERO', 'SHIFT_INVALID',
+        'SHIFT_OVERFLOW', 'SHIFT_UNDERFLOW', 'ScalarType', 'True_', 'UFUNC_BUFSIZE_DEFAULT',
+        'UFUNC_PYVALS_NAME', 'WRAP', '_CopyMode', '_NoValue', '_UFUNC_API', '_add_newdoc_ufunc',
+        '_builtins', '_distributor_init', '_financial_names', '_get_promotion_state', '_globals',
+        '_int_extended_msg', '_mat', '_no_nep50_warning', '_pyinstaller_hooks_dir',
+        '_pytesttester', '_set_promotion_state', '_specific_msg', '_typing',
+        '_using_numpy2_behavior', '_utils', 'abs', 'absolute', 'add', 'add_docstring',
+        'add_newdoc', 'add_newdoc_ufunc', 'all', 'allclose', 'alltrue', 'amax', 'amin', 'angle',
+        'any', 'append', 'apply_along_axis', 'apply_over_axes', 'arange', 'arccos', 'arccosh',
+        'arcsin', 'arcsinh', 'arctan', 'arctan2', 'arctanh', 'argmax', 'argmin', 'argpartition',
+        'argsort', 'argwhere', 'around', 'array', 'array2string', 'array_equal', 'array_equiv',
+        'array_repr', 'array_split', 'array_str', 'asanyarray', 'asarray', 'asarray_chkfinite',
+        'ascontiguousarray', 'asfarray', 'asfortranarray', 'asmatrix', 'atleast_1d', 'atleast_2d',
+        'atleast_3d', 'average', 'bartlett', 'base_repr', 'binary_repr', 'bincount', 'bitwise_and',
+        'bitwise_not', 'bitwise_or', 'bitwise_xor', 'blackman', 'block', 'bmat', 'bool_',
+        'broadcast', 'broadcast_arrays', 'broadcast_shapes', 'broadcast_to', 'busday_count',
+        'busday_offset', 'busdaycalendar', 'byte', 'byte_bounds', 'bytes_', 'c_', 'can_cast',
+        'cast', 'cbrt', 'cdouble', 'ceil', 'cfloat', 'char', 'character', 'chararray', 'choose',
+        'clip', 'clongdouble', 'clongfloat', 'column_stack', 'common_type', 'compare_chararrays',
+        'compat', 'complex128', 'complex256', 'complex64', 'complex_', 'complexfloating',
+        'compress', 'concatenate', 'conj', 'conjugate', 'convolve', 'copy', 'copysign', 'copyto',
+        'corrcoef', 'correlate', 'cos', 'cosh', 'count_nonzero', 'cov', 'cross', 'csingle',
+        'ctypeslib', 'cumprod', 'cumproduct', 'cumsum', 'datetime64', 'datetime_as_string',
+        'datetime_data', 'deg2rad', 'degrees', 'delete', 'deprecate', 'deprecate_with_doc', 'diag',
+        'diag_indices', 'diag_indices_from', 'diagflat', 'diagonal', 'diff', 'digitize', 'disp',
+        'divide', 'divmod', 'dot', 'double', 'dsplit', 'dstack', 'dtype', 'dtypes', 'e', 'ediff1d',
+        'einsum', 'einsum_path', 'emath', 'empty', 'empty_like', 'equal', 'errstate',
+        'euler_gamma', 'exceptions', 'exp', 'exp2', 'expand_dims', 'expm1', 'extract', 'eye',
+        'fabs', 'fastCopyAndTranspose', 'fft', 'fill_diagonal', 'find_common_type', 'finfo', 'fix',
+        'flatiter', 'flatnonzero', 'flexible', 'flip', 'fliplr', 'flipud', 'float128', 'float16',
+        'float32', 'float64', 'float_', 'float_power', 'floating', 'floor', 'floor_divide', 'fmax',
+        'fmin', 'fmod', 'format_float_positional', 'format_float_scientific', 'format_parser',
+        'frexp', 'from_dlpack', 'frombuffer', 'fromfile', 'fromfunction', 'fromiter', 'frompyfunc',
+        'fromregex', 'fromstring', 'full', 'full_like', 'gcd', 'generic', 'genfromtxt',
+        'geomspace', 'get_array_wrap', 'get_include', 'get_printoptions', 'getbufsize', 'geterr',
+        'geterrcall', 'geterrobj', 'gradient', 'greater', 'greater_equal', 'half', 'hamming',
+        'hanning', 'heaviside', 'histogram', 'histogram2d', 'histogram_bin_edges', 'histogramdd',
+        'hsplit', 'hstack', 'hypot', 'i0', 'identity', 'iinfo', 'imag', 'in1d', 'index_exp',
+        'indices', 'inexact', 'inf', 'info', 'infty', 'inner', 'insert', 'int16', 'int32', 'int64',
+        'int8', 'int_', 'intc', 'integer', 'interp', 'intersect1d', 'intp', 'invert', 'is_busday',
+        'isclose', 'iscomplex', 'iscomplexobj', 'isfinite', 'isfortran', 'isin', 'isinf', 'isnan',
+        'isnat', 'isneginf', 'isposinf', 'isreal', 'isrealobj', 'isscalar', 'issctype',
+        'issubclass_', 'issubdtype', 'issubsctype', 'iterable', 'ix_', 'kaiser', 'kernel_version',
+        'kron', 'lcm', 'ldexp', 'left_shift', 'less', 'less_equal', 'lexsort', 'lib', 'linalg',
+        'linspace', 'little_endian', 'load', 'loadtxt', 'log', 'log10', 'log1p', 'log2',
+        'logaddexp', 'logaddexp2', 'logical_and', 'logical_not', 'logical_or', 'logical_xor',
+        'logspace', 'longcomplex', 'longdouble', 'longfloat', 'longlong', 'lookfor', 'ma',
+        'mask_indices', 'mat', 'matmul', 'matrix', 'max', 'maximum', 'maximum_sctype',
+        'may_share_memory', 'mean', 'median', 'memmap', 'meshgrid', 'mgrid', 'min',
+        'min_scalar_type', 'minimum', 'mintypecode', 'mod', 'modf', 'moveaxis', 'msort',
+        'multiply', 'nan', 'nan_to_num', 'nanargmax', 'nanargmin', 'nancumprod', 'nancumsum',
+        'nanmax', 'nanmean', 'nanmedian', 'nanmin', 'nanpercentile', 'nanprod', 'nanquantile',
+        'nanstd', 'nansum', 'nanvar', 'nbytes', 'ndarray', 'ndenumerate', 'ndim', 'ndindex',
+        'nditer', 'negative', 'nested_iters', 'newaxis', 'nextafter', 'nonzero', 'not_equal',
+        'numarray', 'number', 'obj2sctype', 'object_', 'ogrid', 'oldnumeric', 'ones', 'ones_like',
+        'outer', 'packbits', 'pad', 'partition', 'percentile', 'pi', 'piecewise', 'place', 'poly',
+        'poly1d', 'polyadd', 'polyder', 'polydiv', 'polyfit', 'polyint', 'polymul', 'polynomial',
+        'polysub', 'polyval', 'positive', 'power', 'printoptions', 'prod', 'product',
+        'promote_types', 'ptp', 'put', 'put_along_axis', 'putmask', 'quantile', 'r_', 'rad2deg',
+        'radians', 'random', 'ravel', 'ravel_multi_index', 'real', 'real_if_close', 'rec',
+        'recarray', 'recfromcsv', 'recfromtxt', 'reciprocal', 'record', 'remainder', 'repeat',
+        'require', 'reshape', 'resize', 'result_type', 'right_shift', 'rint', 'roll', 'rollaxis',
+        'roots', 'rot90', 'round', 'round_', 'row_stack', 's_', 'safe_eval', 'save', 'savetxt',
+        'savez', 'savez_compressed', 'sctype2char', 'sctypeDict', 'sctypes', 'searchsorted',
+        'select', 'set_numeric_ops', 'set_printoptions', 'set_string_function', 'setbufsize',
+        'setdiff1d', 'seterr', 'seterrcall', 'seterrobj', 'setxor1d', 'shape', 'shares_memory',
+        'short', 'show_config', 'show_runtime', 'sign', 'signbit', 'signedinteger', 'sin', 'sinc',
+        'single', 'singlecomplex', 'sinh', 'size', 'sometrue', 'sort', 'sort_complex', 'source',
+        'spacing', 'split', 'sqrt', 'square', 'squeeze', 'stack', 'std', 'str_', 'string_',
+        'subtract', 'sum', 'swapaxes', 'take', 'take_along_axis', 'tan', 'tanh', 'tensordot',
+        'test', 'testing', 'tile', 'timedelta64', 'trace', 'tracemalloc_domain', 'transpose',
+        'trapz', 'tri', 'tril', 'tril_indices', 'tril_indices_from', 'trim_zeros', 'triu',
+        'triu_indices', 'triu_indices_from', 'true_divide', 'trunc', 'typecodes', 'typename',
+        'ubyte', 'ufunc', 'uint', 'uint16', 'uint32', 'uint64', 'uint8', 'uintc', 'uintp',
+        'ulonglong', 'unicode_', 'union1d', 'unique', 'unpackbits', 'unravel_index',
+        'unsignedinteger', 'unwrap', 'ushort', 'vander', 'var', 'vdot', 'vectorize', 'version',
+        'void', 'vsplit', 'vstack', 'where', 'who', 'zeros', 'zeros_like',
+    }),
+    'pandas': frozenset({
+        'ArrowDtype', 'BooleanDtype', 'Categorical', 'CategoricalDtype', 'CategoricalIndex',
+        'DataFrame', 'DateOffset', 'DatetimeIndex', 'DatetimeTZDtype', 'ExcelFile', 'ExcelWriter',
+        'Flags', 'Float32Dtype', 'Float64Dtype', 'Grouper', 'HDFStore', 'Index', 'IndexSlice',
+        'Int16Dtype', 'Int32Dtype', 'Int64Dtype', 'Int8Dtype', 'Interval', 'IntervalDtype',
+        'IntervalIndex', 'MultiIndex', 'NA', 'NaT', 'NamedAgg', 'Period', 'PeriodDtype',
+        'PeriodIndex', 'RangeIndex', 'Series', 'SparseDtype', 'StringDtype', 'Timedelta',
+        'TimedeltaIndex', 'Timestamp', 'UInt16Dtype', 'UInt32Dtype', 'UInt64Dtype', 'UInt8Dtype',
+        '_built_with_meson', '_config', '_is_numpy_dev', '_libs', '_pandas_datetime_CAPI',
+        '_pandas_parser_CAPI', '_testing', '_typing', '_version_meson', 'annotations', 'api',
+        'array', 'arrays', 'bdate_range', 'compat', 'concat', 'core', 'crosstab', 'cut',
+        'date_range', 'describe_option', 'errors', 'eval', 'factorize', 'from_dummies',
+        'get_dummies', 'get_option', 'infer_freq', 'interval_range', 'io', 'isna', 'isnull',
+        'json_normalize', 'lreshape', 'melt', 'merge', 'merge_asof', 'merge_ordered', 'notna',
+        'notnull', 'offsets', 'option_context', 'options', 'pandas', 'period_range', 'pivot',
+        'pivot_table', 'plotting', 'qcut', 'read_clipboard', 'read_csv', 'read_excel',
+        'read_feather', 'read_fwf', 'read_gbq', 'read_hdf', 'read_html', 'read_json', 'read_orc',
+        'read_parquet', 'read_pickle', 'read_sas', 'read_spss', 'read_sql', 'read_sql_query',
+        'read_sql_table', 'read_stata', 'read_table', 'read_xml', 'reset_option',
+        'set_eng_float_format', 'set_option', 'show_versions', 'test', 'testing',
+        'timedelta_range', 'to_datetime', 'to_numeric', 'to_pickle', 'to_timedelta', 'tseries',
+        'unique', 'util', 'value_counts', 'wide_to_long',
+    }),
+    'pandas.DataFrame': frozenset({
+        'T', '_AXIS_LEN', '_AXIS_ORDERS', '_AXIS_TO_AXIS_NUMBER', '_HANDLED_TYPES', '_accessors',
+        '_accum_func', '_agg_examples_doc', '_agg_see_also_doc', '_align_for_op', '_align_frame',
+        '_align_series', '_append', '_arith_method', '_arith_method_with_reindex', '_as_manager',
+        '_box_col_values', '_can_fast_transpose', '_check_inplace_and_allows_duplicate_labels',
+        '_check_is_chained_assignment_possible', '_check_label_or_level_ambiguity',
+        '_check_setitem_copy', '_clear_item_cache', '_clip_with_one_bound', '_clip_with_scalar',
+        '_cmp_method', '_combine_frame', '_consolidate', '_consolidate_inplace',
+        '_construct_axes_dict', '_construct_result', '_constructor', '_constructor_from_mgr',
+        '_constructor_sliced', '_constructor_sliced_from_mgr',
+        '_create_data_for_split_and_tight_to_dict', '_data', '_deprecate_downcast',
+        '_dir_additions', '_dir_deletions', '_dispatch_frame_op', '_drop_axis',
+        '_drop_labels_or_levels', '_ensure_valid_index', '_find_valid_index', '_flex_arith_method',
+        '_flex_cmp_method', '_from_arrays', '_from_mgr', '_get_agg_axis', '_get_axis',
+        '_get_axis_name', '_get_axis_number', '_get_axis_resolvers', '_get_block_manager_axis',
+        '_get_bool_data', '_get_cleaned_column_resolvers', '_get_column_array',
+        '_get_index_resolvers', '_get_item_cache', '_get_label_or_level_values',
+        '_get_numeric_data', '_get_value', '_getitem_bool_array', '_getitem_multilevel',
+        '_getitem_nocopy', '_getitem_slice', '_gotitem', '_hidden_attrs', '_indexed_same',
+        '_info_axis', '_info_axis_name', '_info_axis_number', '_info_repr', '_init_mgr',
+        '_inplace_method', '_internal_names', '_internal_names_set', '_is_copy',
+        '_is_homogeneous_type', '_is_label_or_level_reference', '_is_label_reference',
+        '_is_level_reference', '_is_mixed_type', '_is_view', '_iset_item', '_iset_item_mgr',
+        '_iset_not_inplace', '_iter_column_arrays', '_ixs', '_logical_func', '_logical_method',
+        '_maybe_align_series_as_frame', '_maybe_cache_changed', '_maybe_update_cacher',
+        '_metadata', '_min_count_stat_function', '_needs_reindex_multi', '_pad_or_backfill',
+        '_protect_consolidate', '_reduce', '_reduce_axis1', '_reindex_axes', '_reindex_multi',
+        '_reindex_with_indexers', '_rename', '_replace_columnwise', '_repr_data_resource_',
+        '_repr_fits_horizontal_', '_repr_fits_vertical_', '_repr_html_', '_repr_latex_',
+        '_reset_cache', '_reset_cacher', '_sanitize_column', '_series', '_set_axis',
+        '_set_axis_name', '_set_axis_nocheck', '_set_is_copy', '_set_item',
+        '_set_item_frame_value', '_set_item_mgr', '_set_value', '_setitem_array', '_setitem_frame',
+        '_setitem_slice', '_shift_with_freq', '_should_reindex_frame_op', '_slice',
+        '_sliced_from_mgr', '_stat_function', '_stat_function_ddof', '_take_with_is_copy',
+        '_to_dict_of_blocks', '_to_latex_via_styler', '_typ', '_update_inplace', '_validate_dtype',
+        '_values', '_where', 'abs', 'add', 'add_prefix', 'add_suffix', 'agg', 'aggregate', 'align',
+        'all', 'any', 'apply', 'applymap', 'asfreq', 'asof', 'assign', 'astype', 'at', 'at_time',
+        'attrs', 'axes', 'backfill', 'between_time', 'bfill', 'bool', 'boxplot', 'clip', 'columns',
+        'combine', 'combine_first', 'compare', 'convert_dtypes', 'copy', 'corr', 'corrwith',
+        'count', 'cov', 'cummax', 'cummin', 'cumprod', 'cumsum', 'describe', 'diff', 'div',
+        'divide', 'dot', 'drop', 'drop_duplicates', 'droplevel', 'dropna', 'dtypes', 'duplicated',
+        'empty', 'eq', 'equals', 'eval', 'ewm', 'expanding', 'explode', 'ffill', 'fillna',
+        'filter', 'first', 'first_valid_index', 'flags', 'floordiv', 'from_dict', 'from_records',
+        'ge', 'get', 'groupby', 'gt', 'head', 'hist', 'iat', 'idxmax', 'idxmin', 'iloc', 'index',
+        'infer_objects', 'info', 'insert', 'interpolate', 'isetitem', 'isin', 'isna', 'isnull',
+        'items', 'iterrows', 'itertuples', 'join', 'keys', 'kurt', 'kurtosis', 'last',
+        'last_valid_index', 'le', 'loc', 'lt', 'map', 'mask', 'max', 'mean', 'median', 'melt',
+        'memory_usage', 'merge', 'min', 'mod', 'mode', 'mul', 'multiply', 'ndim', 'ne', 'nlargest',
+        'notna', 'notnull', 'nsmallest', 'nunique', 'pad', 'pct_change', 'pipe', 'pivot',
+        'pivot_table', 'plot', 'pop', 'pow', 'prod', 'product', 'quantile', 'query', 'radd',
+        'rank', 'rdiv', 'reindex', 'reindex_like', 'rename', 'rename_axis', 'reorder_levels',
+        'replace', 'resample', 'reset_index', 'rfloordiv', 'rmod', 'rmul', 'rolling', 'round',
+        'rpow', 'rsub', 'rtruediv', 'sample', 'select_dtypes', 'sem', 'set_axis', 'set_flags',
+        'set_index', 'shape', 'shift', 'size', 'skew', 'sort_index', 'sort_values', 'sparse',
+        'squeeze', 'stack', 'std', 'style', 'sub', 'subtract', 'sum', 'swapaxes', 'swaplevel',
+        'tail', 'take', 'to_clipboard', 'to_csv', 'to_dict', 'to_excel', 'to_feather', 'to_gbq',
+        'to_hdf', 'to_html', 'to_json', 'to_latex', 'to_markdown', 'to_numpy', 'to_orc',
+        'to_parquet', 'to_period', 'to_pickle', 'to_records', 'to_sql', 'to_stata', 'to_string',
+        'to_timestamp', 'to_xarray', 'to_xml', 'transform', 'transpose', 'truediv', 'truncate',
+        'tz_convert', 'tz_localize', 'unstack', 'update', 'value_counts', 'values', 'var', 'where',
+        'xs',
+    }),
+    'plotly.express': frozenset({
+        'Constant', 'IdentityMap', 'NO_COLOR', 'Range', '_chart_types', '_core', '_doc', '_imshow',
+        '_special_inputs', 'area', 'bar', 'bar_polar', 'box', 'choropleth', 'choropleth_map',
+        'choropleth_mapbox', 'colors', 'data', 'defaults', 'density_contour', 'density_heatmap',
+        'density_map', 'density_mapbox', 'ecdf', 'funnel', 'funnel_area', 'get_trendline_results',
+        'histogram', 'icicle', 'imshow', 'imshow_utils', 'line', 'line_3d', 'line_geo', 'line_map',
+        'line_mapbox', 'line_polar', 'line_ternary', 'np', 'optional_imports',
+        'parallel_categories', 'parallel_coordinates', 'pie', 'scatter', 'scatter_3d',
+        'scatter_geo', 'scatter_map', 'scatter_mapbox', 'scatter_matrix', 'scatter_polar',
+        'scatter_ternary', 'set_mapbox_access_token', 'strip', 'sunburst', 'timeline', 'treemap',
+        'trendline_functions', 'violin',
+    }),
+    'seaborn': frozenset({
+        'FacetGrid', 'JointGrid', 'PairGrid', '_base', '_compat', '_core', '_docstrings',
+        '_orig_rc_params', '_statistics', '_stats', 'algorithms', 'axes_style', 'axisgrid',
+        'barplot', 'blend_palette', 'boxenplot', 'boxplot', 'categorical', 'catplot',
+        'choose_colorbrewer_palette', 'choose_cubehelix_palette', 'choose_dark_palette',
+        'choose_diverging_palette', 'choose_light_palette', 'clustermap', 'cm', 'color_palette',
+        'colors', 'countplot', 'crayon_palette', 'crayons', 'cubehelix_palette', 'dark_palette',
+        'desaturate', 'despine', 'displot', 'distplot', 'distributions', 'diverging_palette',
+        'dogplot', 'ecdfplot', 'external', 'get_data_home', 'get_dataset_names', 'heatmap',
+        'histplot', 'hls_palette', 'husl_palette', 'jointplot', 'kdeplot', 'light_palette',
+        'lineplot', 'lmplot', 'load_dataset', 'matrix', 'miscplot', 'move_legend', 'mpl',
+        'mpl_palette', 'pairplot', 'palettes', 'palplot', 'plotting_context', 'pointplot', 'rcmod',
+        'regplot', 'regression', 'relational', 'relplot', 'reset_defaults', 'reset_orig',
+        'residplot', 'rugplot', 'saturate', 'scatterplot', 'set', 'set_color_codes', 'set_context',
+        'set_hls_values', 'set_palette', 'set_style', 'set_theme', 'stripplot', 'swarmplot',
+        'utils', 'violinplot', 'widgets', 'xkcd_palette', 'xkcd_rgb',
+    }),
+    'torch': frozenset({
+        'AVG', 'AcceleratorError', 'AggregationType', 'AliasDb', 'AnyType', 'Argument',
+        'ArgumentSpec', 'AwaitType', 'BFloat16Storage', 'BFloat16Tensor', 'BenchmarkConfig',
+        'BenchmarkExecutionStats', 'Block', 'BoolStorage', 'BoolTensor', 'BoolType', 'BufferDict',
+        'ByteStorage', 'ByteTensor', 'CallStack', 'Capsule', 'CharStorage', 'CharTensor',
+        'ClassType', 'Code', 'CompilationUnit', 'CompleteArgumentSpec', 'ComplexDoubleStorage',
+        'ComplexFloatStorage', 'ComplexType', 'ConcreteModuleType', 'ConcreteModuleTypeBuilder',
+        'DeepCopyMemoTable', 'DeserializationStorageContext', 'DeviceObjType', 'DictType',
+        'DisableTorchFunction', 'DisableTorchFunctionSubclass', 'DispatchKey', 'DispatchKeySet',
+        'DoubleStorage', 'DoubleTensor', 'EnumType', 'ErrorReport', 'Event',
+        'ExcludeDispatchKeyGuard', 'ExecutionPlan', 'FatalError', 'FileCheck', 'FloatStorage',
+        'FloatTensor', 'FloatType', 'FunctionSchema', 'Future', 'FutureType', 'Generator',
+        'GradScaler', 'Gradient', 'Graph', 'GraphExecutorState', 'HalfStorage', 'HalfTensor',
+        'IODescriptor', 'InferredType', 'IntStorage', 'IntTensor', 'IntType', 'InterfaceType',
+        'JITException', 'ListType', 'LiteScriptModule', 'LockingLogger', 'LoggerBase',
+        'LongStorage', 'LongTensor', 'ModuleDict', 'Node', 'NoneType', 'NoopLogger', 'NumberType',
+        'OperatorInfo', 'OptionalType', 'OutOfMemoryError', 'PRIVATE_OPS', 'ParameterDict',
+        'PyObjectType', 'PyTorchFileReader', 'PyTorchFileWriter', 'QInt32Storage', 'QInt8Storage',
+        'QUInt2x4Storage', 'QUInt4x2Storage', 'QUInt8Storage', 'RRefType', 'SUM', 'ScriptClass',
+        'ScriptClassFunction', 'ScriptDict', 'ScriptDictIterator', 'ScriptDictKeyIterator',
+        'ScriptFunction', 'ScriptList', 'ScriptListIterator', 'ScriptMethod', 'ScriptModule',
+        'ScriptModuleSerializer', 'ScriptObject', 'ScriptObjectProperty',
+        'SerializationStorageContext', 'ShortStorage', 'ShortTensor', 'Size', 'StaticModule',
+        'Storage', 'StorageBase', 'Stream', 'StreamObjType', 'StringType', 'SymBool',
+        'SymBoolType', 'SymFloat', 'SymInt', 'SymIntType', 'TYPE_CHECKING', 'Tag', 'Tensor',
+        'TensorType', 'ThroughputBenchmark', 'TracingState', 'TupleType', 'Type', 'TypedStorage',
+        'USE_GLOBAL_DEPS', 'USE_RTLD_GLOBAL_WITH_LIBTORCH', 'UnionType', 'UntypedStorage', 'Use',
+        'Value', '_Any', '_BecomesIntPrimType', '_BecomesIntSymType', '_BitwiseLikeType', '_C',
+        '_Callable', '_FloatPromotionType', '_GLOBAL_DEVICE_CONTEXT', '_InputT', '_LikeNumber',
+        '_LiteralString', '_ModuleType', '_Never', '_ParamSpec', '_PrimType', '_RetT', '_Self',
+        '_Sequence', '_SymIteT', '_SymType', '_SymTypingMagic', '_SymTypingMagicAlsoBool',
+        '_SymTypingMagicBitwise', '_TorchCompileAOTInductorWrapper',
+        '_TorchCompileInductorWrapper', '_TorchCompileWrapper', '_TritonLibrary', '_TypeAlias',
+        '_TypeGuard', '_TypeIs', '_TypeVar', '_VF', '__all_and_float_types',
+        '_adaptive_avg_pool2d', '_adaptive_avg_pool3d', '_add_batch_dim', '_add_relu',
+        '_add_relu_', '_addmm_activation', '_aminmax',
+        '_amp_foreach_non_finite_check_and_unscale_', '_amp_update_scale_', '_as_tensor_fullprec',
+        '_assert', '_assert_async', '_assert_scalar', '_assert_tensor_metadata', '_awaits',
+        '_batch_norm_impl_index', '_cast_Byte', '_cast_Char', '_cast_Double', '_cast_Float',
+        '_cast_Half', '_cast_Int', '_cast_Long', '_cast_Short', '_check', '_check_index',
+        '_check_is_size', '_check_not_implemented', '_check_tensor_all', '_check_tensor_all_with',
+        '_check_type', '_check_value', '_check_with', '_choose_qparams_per_tensor', '_chunk_cat',
+        '_classes', '_coalesce', '_compile', '_compute_linear_combination', '_conj', '_conj_copy',
+        '_conj_physical', '_constrain_as_size', '_convert_indices_from_coo_to_csr',
+        '_convert_indices_from_csr_to_coo', '_convert_weight_to_int4pack',
+        '_convert_weight_to_int4pack_for_cpu', '_convolution', '_convolution_mode', '_copy_from',
+        '_copy_from_and_resize', '_cslt_compress', '_cslt_sparse_mm', '_cslt_sparse_mm_search',
+        '_ctc_loss', '_cudnn_ctc_loss', '_cudnn_init_dropout_state', '_cudnn_rnn',
+        '_cudnn_rnn_flatten_weight', '_cufft_clear_plan_cache', '_cufft_get_plan_cache_max_size',
+        '_cufft_get_plan_cache_size', '_cufft_set_plan_cache_max_size', '_cummax_helper',
+        '_cummin_helper', '_custom_class_base', '_custom_op', '_custom_ops',
+        '_debug_has_internal_overlap', '_decomp', '_deprecated', '_deprecated_attrs',
+        '_dim_arange', '_dirichlet_grad', '_disable_dynamo', '_disable_functionalization',
+        '_dispatch', '_dyn_quant_matmul_4bit', '_dyn_quant_pack_4bit_weight',
+        '_efficientzerotensor', '_embedding_bag', '_embedding_bag_forward_only',
+        '_empty_affine_quantized', '_empty_per_channel_affine_quantized',
+        '_enable_functionalization', '_environment', '_euclidean_dist', '_export',
+        '_fake_quantize_learnable_per_channel_affine',
+        '_fake_quantize_learnable_per_tensor_affine',
+        '_fake_quantize_per_tensor_affine_cachemask_tensor_qparams', '_fft_c2c', '_fft_c2r',
+        '_fft_r2c', '_fill_mem_eff_dropout_mask_', '_flash_attention_forward_no_dropout_inplace',
+        '_foobar', '_foreach_abs', '_foreach_abs_', '_foreach_acos', '_foreach_acos_',
+        '_foreach_add', '_foreach_add_', '_foreach_addcdiv', '_foreach_addcdiv_',
+        '_foreach_addcmul', '_foreach_addcmul_', '_foreach_asin', '_foreach_asin_',
+        '_foreach_atan', '_foreach_atan_', '_foreach_ceil', '_foreach_ceil_', '_foreach_clamp_max',
+        '_foreach_clamp_max_', '_foreach_clamp_min', '_foreach_clamp_min_', '_foreach_clone',
+        '_foreach_copy_', '_foreach_cos', '_foreach_cos_', '_foreach_cosh', '_foreach_cosh_',
+        '_foreach_div', '_foreach_div_', '_foreach_erf', '_foreach_erf_', '_foreach_erfc',
+        '_foreach_erfc_', '_foreach_exp', '_foreach_exp_', '_foreach_expm1', '_foreach_expm1_',
+        '_foreach_floor', '_foreach_floor_', '_foreach_frac', '_foreach_frac_', '_foreach_lerp',
+        '_foreach_lerp_', '_foreach_lgamma', '_foreach_lgamma_', '_foreach_log', '_foreach_log10',
+        '_foreach_log10_', '_foreach_log1p', '_foreach_log1p_', '_foreach_log2', '_foreach_log2_',
+        '_foreach_log_', '_foreach_max', '_foreach_maximum', '_foreach_maximum_',
+        '_foreach_minimum', '_foreach_minimum_', '_foreach_mm', '_foreach_mul', '_foreach_mul_',
+        '_foreach_neg', '_foreach_neg_', '_foreach_norm', '_foreach_pow', '_foreach_pow_',
+        '_foreach_powsum', '_foreach_reciprocal', '_foreach_reciprocal_', '_foreach_round',
+        '_foreach_round_', '_foreach_rsqrt', '_foreach_rsqrt_', '_foreach_sigmoid',
+        '_foreach_sigmoid_', '_foreach_sign', '_foreach_sign_', '_foreach_sin', '_foreach_sin_',
+        '_foreach_sinh', '_foreach_sinh_', '_foreach_sqrt', '_foreach_sqrt_', '_foreach_sub',
+        '_foreach_sub_', '_foreach_tan', '_foreach_tan_', '_foreach_tanh', '_foreach_tanh_',
+        '_foreach_trunc', '_foreach_trunc_', '_foreach_zero_', '_freeze_functional_tensor',
+        '_from_blob', '_from_functional_tensor', '_functional_assert_async',
+        '_functional_assert_scalar', '_functional_sym_constrain_range',
+        '_functional_sym_constrain_range_for_size',
+        '_functionalize_are_all_mutations_hidden_from_autograd',
+        '_functionalize_are_all_mutations_under_no_grad_or_inference_mode',
+        '_functionalize_commit_update', '_functionalize_enable_reapply_views',
+        '_functionalize_get_storage_size', '_functionalize_has_data_mutation',
+        '_functionalize_has_metadata_mutation', '_functionalize_inductor_storage_resized_counter',
+        '_functionalize_is_multi_output_view', '_functionalize_is_symbolic',
+        '_functionalize_mark_mutation_hidden_from_autograd', '_functionalize_mark_storage_changed',
+        '_functionalize_mutation_counter', '_functionalize_replace',
+        '_functionalize_storage_changed_counter', '_functionalize_sync',
+        '_functionalize_unsafe_set', '_functionalize_was_inductor_storage_resized',
+        '_functionalize_was_shallow_copy_data', '_functionalize_was_storage_changed', '_functorch',
+        '_fused_adagrad_', '_fused_adam_', '_fused_adamw_', '_fused_dropout',
+        '_fused_moving_avg_obs_fq_helper', '_fused_rms_norm', '_fused_sdp_choice', '_fused_sgd_',
+        '_fw_primal_copy', '_get_cuda_dep_paths', '_get_origin', '_grid_sampler_2d_cpu_fallback',
+        '_grouped_mm', '_guards', '_has_compatible_shallow_copy_type', '_higher_order_ops',
+        '_histogramdd_bin_edges', '_histogramdd_from_bin_cts', '_histogramdd_from_bin_tensors',
+        '_import_device_backends', '_import_dotted_name', '_index_put_impl_', '_indices_copy',
+        '_initExtension', '_int_mm', '_is_all_true', '_is_any_true',
+        '_is_device_backend_autoload_enabled', '_is_functional_tensor',
+        '_is_functional_tensor_base', '_is_zerotensor', '_jit_internal', '_lazy_clone',
+        '_lazy_modules', '_library', '_linalg_check_errors', '_linalg_det', '_linalg_eigh',
+        '_linalg_slogdet', '_linalg_solve_ex', '_linalg_svd', '_linalg_utils', '_load_global_deps',
+        '_lobpcg', '_log_softmax', '_log_softmax_backward_data', '_logcumsumexp', '_logging',
+        '_lowrank', '_lstm_mps', '_lu_with_info', '_make_dep_token', '_make_dual',
+        '_make_dual_copy', '_make_per_channel_quantized_tensor',
+        '_make_per_tensor_quantized_tensor', '_masked_scale', '_masked_softmax',
+        '_meta_registrations', '_mirror_autograd_meta_to', '_mixed_dtypes_linear', '_mkldnn',
+        '_mkldnn_reshape', '_mkldnn_transpose', '_mkldnn_transpose_', '_mps_convolution',
+        '_mps_convolution_transpose', '_native', '_native_batch_norm_legit',
+        '_native_batch_norm_legit_no_training', '_native_multi_head_attention', '_neg_view',
+        '_neg_view_copy', '_nested_compute_contiguous_strides_offsets', '_nested_from_padded',
+        '_nested_from_padded_and_nested_example', '_nested_from_padded_tensor',
+        '_nested_get_jagged_dummy', '_nested_get_lengths', '_nested_get_max_seqlen',
+        '_nested_get_min_seqlen', '_nested_get_offsets', '_nested_get_ragged_idx',
+        '_nested_get_values', '_nested_get_values_copy', '_nested_tensor_from_mask',
+        '_nested_tensor_from_mask_left_aligned', '_nested_tensor_from_tensor_list',
+        '_nested_tensor_softmax_with_shape', '_nested_view_from_buffer',
+        '_nested_view_from_buffer_copy', '_nested_view_from_jagged',
+        '_nested_view_from_jagged_copy', '_nnpack_available', '_nnpack_spatial_convolution',
+        '_ops', '_overload', '_pack_padded_sequence', '_pad_packed_sequence',
+        '_philox_key_fold_in', '_philox_key_split', '_philox_normal_', '_philox_uniform_',
+        '_pin_memory', '_precompile', '_preload_cuda_deps', '_preload_cuda_lib', '_prelu_kernel',
+        '_prims', '_prims_common', '_print', '_propagate_xla_data', '_refs',
+        '_register_device_module', '_remove_batch_dim', '_reshape_alias_copy',
+        '_reshape_from_tensor', '_resize_output_', '_rowwise_prune', '_running_with_deploy',
+        '_safe_softmax', '_sample_dirichlet', '_saturate_weight_to_fp16',
+        '_scaled_dot_product_attention_math', '_scaled_dot_product_attention_math_for_mps',
+        '_scaled_dot_product_cudnn_attention', '_scaled_dot_product_efficient_attention',
+        '_scaled_dot_product_flash_attention', '_scaled_dot_product_flash_attention_for_cpu',
+        '_scaled_grouped_mm', '_scaled_grouped_mm_v2', '_scaled_mm', '_scaled_mm_v2',
+        '_segment_reduce', '_shape_as_tensor', '_sobol_engine_draw', '_sobol_engine_ff_',
+        '_sobol_engine_initialize_state_', '_sobol_engine_scramble_', '_softmax',
+        '_softmax_backward_data', '_sources', '_sparse_broadcast_to', '_sparse_broadcast_to_copy',
+        '_sparse_csr_prod', '_sparse_csr_sum', '_sparse_log_softmax_backward_data',
+        '_sparse_semi_structured_addmm', '_sparse_semi_structured_apply',
+        '_sparse_semi_structured_apply_dense', '_sparse_semi_structured_linear',
+        '_sparse_semi_structured_mm', '_sparse_semi_structured_tile',
+        '_sparse_softmax_backward_data', '_sparse_sparse_matmul', '_sparse_sum', '_stack',
+        '_standard_gamma', '_standard_gamma_grad', '_storage_classes', '_strobelight',
+        '_subclasses', '_sym_acos', '_sym_asin', '_sym_atan', '_sym_cos', '_sym_cosh', '_sym_log2',
+        '_sym_sin', '_sym_sinh', '_sym_sqrt', '_sym_tan', '_sym_tanh', '_sync', '_tensor',
+        '_tensor_classes', '_tensor_iterator', '_tensor_str', '_test_autograd_multiple_dispatch',
+        '_test_autograd_multiple_dispatch_view', '_test_autograd_multiple_dispatch_view_copy',
+        '_test_check_tensor', '_test_functorch_fallback', '_test_parallel_materialize',
+        '_test_serialization_subcmul', '_to_cpu', '_to_functional_tensor',
+        '_to_sparse_semi_structured', '_transform_bias_rescale_qkv',
+        '_transformer_encoder_layer_fwd', '_trilinear', '_triton_multi_head_attention',
+        '_triton_scaled_dot_attention', '_unique', '_unique2', '_unpack_dual', '_unsafe_index',
+        '_unsafe_index_put', '_unsafe_masked_index', '_unsafe_masked_index_put_accumulate',
+        '_use_cudnn_ctc_loss', '_use_cudnn_rnn_flatten_weight', '_use_miopen_ctc_loss', '_utils',
+        '_utils_internal', '_validate_compressed_sparse_indices',
+        '_validate_sparse_bsc_tensor_args', '_validate_sparse_bsr_tensor_args',
+        '_validate_sparse_compressed_tensor_args', '_validate_sparse_coo_tensor_args',
+        '_validate_sparse_csc_tensor_args', '_validate_sparse_csr_tensor_args', '_values_copy',
+        '_vendor', '_vmap_internals', '_warn_typed_storage_removal', '_weight_int4pack_mm',
+        '_weight_int4pack_mm_for_cpu', '_weight_int4pack_mm_with_scales_and_zeros',
+        '_weight_int8pack_mm', '_weight_norm', '_weight_norm_interface', '_weights_only_unpickler',
+        '_wrapped_linear_prepack', '_wrapped_quantized_linear_prepacked', 'abs', 'abs_',
+        'absolute', 'accelerator', 'acos', 'acos_', 'acosh', 'acosh_', 'adaptive_avg_pool1d',
+        'adaptive_max_pool1d', 'add', 'addbmm', 'addcdiv', 'addcmul', 'addmm', 'addmv', 'addmv_',
+        'addr', 'adjoint', 'affine_grid_generator', 'alias_copy', 'all', 'allclose',
+        'alpha_dropout', 'alpha_dropout_', 'amax', 'amin', 'aminmax', 'amp', 'angle', 'any', 'ao',
+        'arange', 'arccos', 'arccos_', 'arccosh', 'arccosh_', 'arcsin', 'arcsin_', 'arcsinh',
+        'arcsinh_', 'arctan', 'arctan2', 'arctan_', 'arctanh', 'arctanh_',
+        'are_deterministic_algorithms_enabled', 'argmax', 'argmin', 'argsort', 'argwhere',
+        'as_strided', 'as_strided_', 'as_strided_copy', 'as_strided_scatter', 'as_tensor',
+        'asarray', 'asin', 'asin_', 'asinh', 'asinh_', 'atan', 'atan2', 'atan_', 'atanh', 'atanh_',
+        'atleast_1d', 'atleast_2d', 'atleast_3d', 'autocast', 'autocast_decrement_nesting',
+        'autocast_increment_nesting', 'autograd', 'avg_pool1d', 'backends', 'baddbmm',
+        'bartlett_window', 'batch_norm', 'batch_norm_backward_elemt', 'batch_norm_backward_reduce',
+        'batch_norm_elemt', 'batch_norm_gather_stats', 'batch_norm_gather_stats_with_counts',
+        'batch_norm_stats', 'batch_norm_update_stats', 'bcomplex32', 'bernoulli', 'bfloat16',
+        'bilinear', 'binary_cross_entropy_with_logits', 'bincount', 'binomial', 'bit', 'bits16',
+        'bits1x8', 'bits2x4', 'bits4x2', 'bits8', 'bitwise_and', 'bitwise_left_shift',
+        'bitwise_not', 'bitwise_or', 'bitwise_right_shift', 'bitwise_xor', 'blackman_window',
+        'block_diag', 'bmm', 'bool', 'broadcast_shapes', 'broadcast_tensors', 'broadcast_to',
+        'bucketize', 'builtins', 'can_cast', 'cartesian_prod', 'cat', 'ccol_indices_copy', 'cdist',
+        'cdouble', 'ceil', 'ceil_', 'celu', 'celu_', 'cfloat', 'chain_matmul', 'chalf',
+        'channel_shuffle', 'channels_last', 'channels_last_3d', 'cholesky', 'cholesky_inverse',
+        'cholesky_solve', 'choose_qparams_optimized', 'chunk', 'clamp', 'clamp_', 'clamp_max',
+        'clamp_max_', 'clamp_min', 'clamp_min_', 'classes', 'classproperty',
+        'clear_autocast_cache', 'clip', 'clip_', 'clone', 'col_indices_copy', 'column_stack',
+        'combinations', 'compile', 'compiled_with_cxx11_abi', 'compiler', 'complex', 'complex128',
+        'complex32', 'complex64', 'concat', 'concatenate', 'cond', 'conj', 'conj_physical',
+        'conj_physical_', 'constant_pad_nd', 'contiguous_format', 'conv1d', 'conv2d', 'conv3d',
+        'conv_tbc', 'conv_transpose1d', 'conv_transpose2d', 'conv_transpose3d', 'convolution',
+        'copysign', 'corrcoef', 'cos', 'cos_', 'cosh', 'cosh_', 'cosine_embedding_loss',
+        'cosine_similarity', 'count_nonzero', 'cov', 'cpp', 'cpu', 'cross', 'crow_indices_copy',
+        'ctc_loss', 'ctypes', 'cuda', 'cudnn_affine_grid_generator', 'cudnn_batch_norm',
+        'cudnn_convolution', 'cudnn_convolution_add_relu', 'cudnn_convolution_relu',
+        'cudnn_convolution_transpose', 'cudnn_grid_sampler', 'cudnn_is_acceptable', 'cummax',
+        'cummin', 'cumprod', 'cumsum', 'cumulative_trapezoid', 'default_generator', 'deg2rad',
+        'deg2rad_', 'dequantize', 'det', 'detach', 'detach_', 'detach_copy', 'device', 'diag',
+        'diag_embed', 'diagflat', 'diagonal', 'diagonal_copy', 'diagonal_scatter', 'diff',
+        'digamma', 'dist', 'distributed', 'distributions', 'div', 'divide', 'dot', 'double',
+        'dropout', 'dropout_', 'dsmm', 'dsplit', 'dstack', 'dtype', 'e', 'eig', 'einsum',
+        'embedding', 'embedding_bag', 'embedding_renorm_', 'empty', 'empty_like', 'empty_permuted',
+        'empty_quantized', 'empty_strided', 'enable_grad', 'eq', 'equal', 'erf', 'erf_', 'erfc',
+        'erfc_', 'erfinv', 'exp', 'exp2', 'exp2_', 'exp_', 'expand_copy', 'expm1', 'expm1_',
+        'export', 'eye', 'fake_quantize_per_channel_affine', 'fake_quantize_per_tensor_affine',
+        'fbgemm_linear_fp16_weight', 'fbgemm_linear_fp16_weight_fp32_activation',
+        'fbgemm_linear_int8_weight', 'fbgemm_linear_int8_weight_fp32_activation',
+        'fbgemm_linear_quantize_weight', 'fbgemm_pack_gemm_matrix_fp16',
+        'fbgemm_pack_quantized_matrix', 'feature_alpha_dropout', 'feature_alpha_dropout_',
+        'feature_dropout', 'feature_dropout_', 'fft', 'fill', 'fill_', 'finfo', 'fix', 'fix_',
+        'flatten', 'flip', 'fliplr', 'flipud', 'float', 'float16', 'float32', 'float4_e2m1fn_x2',
+        'float64', 'float8_e4m3fn', 'float8_e4m3fnuz', 'float8_e5m2', 'float8_e5m2fnuz',
+        'float8_e8m0fnu', 'float_power', 'floor', 'floor_', 'floor_divide', 'fmax', 'fmin', 'fmod',
+        'fork', 'frac', 'frac_', 'frexp', 'frobenius_norm', 'from_dlpack', 'from_file',
+        'from_numpy', 'frombuffer', 'full', 'full_like', 'func', 'functional', 'functools',
+        'fused_moving_avg_obs_fake_quant', 'futures', 'fx', 'gather', 'gcd', 'gcd_', 'ge', 'geqrf',
+        'ger', 'get_autocast_cpu_dtype', 'get_autocast_dtype', 'get_autocast_gpu_dtype',
+        'get_autocast_ipu_dtype', 'get_autocast_xla_dtype', 'get_default_device',
+        'get_default_dtype', 'get_deterministic_debug_mode', 'get_device', 'get_device_module',
+        'get_file_path', 'get_float32_matmul_precision', 'get_num_interop_threads',
+        'get_num_threads', 'get_rng_state', 'glob', 'gradient', 'greater', 'greater_equal',
+        'grid_sampler', 'grid_sampler_2d', 'grid_sampler_3d', 'group_norm', 'gru', 'gru_cell',
+        'gt', 'half', 'hamming_window', 'hann_window', 'hardshrink', 'has_lapack', 'has_mkl',
+        'has_openmp', 'has_spectral', 'hash_tensor', 'heaviside', 'hinge_embedding_loss', 'histc',
+        'histogram', 'histogramdd', 'hsmm', 'hsplit', 'hspmm', 'hstack', 'hub', 'hypot', 'i0',
+        'i0_', 'igamma', 'igammac', 'iinfo', 'imag', 'import_ir_module',
+        'import_ir_module_from_buffer', 'importlib', 'index_add', 'index_copy', 'index_fill',
+        'index_put', 'index_put_', 'index_reduce', 'index_select', 'indices_copy', 'inf',
+        'inference_mode', 'init_num_threads', 'initial_seed', 'inner', 'inspect', 'instance_norm',
+        'int', 'int1', 'int16', 'int2', 'int3', 'int32', 'int4', 'int5', 'int6', 'int64', 'int7',
+        'int8', 'int_repr', 'inverse', 'is_anomaly_check_nan_enabled', 'is_anomaly_enabled',
+        'is_autocast_cache_enabled', 'is_autocast_cpu_enabled', 'is_autocast_enabled',
+        'is_autocast_ipu_enabled', 'is_autocast_xla_enabled', 'is_complex', 'is_conj',
+        'is_deterministic_algorithms_warn_only_enabled', 'is_distributed', 'is_floating_point',
+        'is_grad_enabled', 'is_inference', 'is_inference_mode_enabled', 'is_neg', 'is_nonzero',
+        'is_same_size', 'is_signed', 'is_storage', 'is_tensor', 'is_vulkan_available',
+        'is_warn_always_enabled', 'isclose', 'isfinite', 'isin', 'isinf', 'isnan', 'isneginf',
+        'isposinf', 'isreal', 'istft', 'jagged', 'jit', 'kaiser_window', 'kl_div', 'kron',
+        'kthvalue', 'layer_norm', 'layout', 'lcm', 'lcm_', 'ldexp', 'ldexp_', 'le',
+        'legacy_contiguous_format', 'lerp', 'less', 'less_equal', 'lgamma', 'library', 'linalg',
+        'linspace', 'load', 'lobpcg', 'log', 'log10', 'log10_', 'log1p', 'log1p_', 'log2', 'log2_',
+        'log_', 'log_softmax', 'logaddexp', 'logaddexp2', 'logcumsumexp', 'logdet', 'logical_and',
+        'logical_not', 'logical_or', 'logical_xor', 'logit', 'logit_', 'logspace', 'logsumexp',
+        'long', 'lstm', 'lstm_cell', 'lstsq', 'lt', 'lu', 'lu_solve', 'lu_unpack', 'manual_seed',
+        'margin_ranking_loss', 'masked', 'masked_fill', 'masked_scatter', 'masked_select', 'math',
+        'matmul', 'matrix_exp', 'matrix_power', 'matrix_rank', 'max', 'max_pool1d',
+        'max_pool1d_with_indices', 'max_pool2d', 'max_pool3d', 'maximum', 'mean', 'median',
+        'memory_format', 'merge_type_from_type_comment', 'meshgrid', 'min', 'minimum',
+        'miopen_batch_norm', 'miopen_convolution', 'miopen_convolution_add_relu',
+        'miopen_convolution_relu', 'miopen_convolution_transpose', 'miopen_ctc_loss',
+        'miopen_depthwise_convolution', 'miopen_rnn', 'mkldnn_adaptive_avg_pool2d',
+        'mkldnn_convolution', 'mkldnn_linear_backward_weights', 'mkldnn_max_pool2d',
+        'mkldnn_max_pool3d', 'mkldnn_rnn_layer', 'mm', 'mode', 'monitor', 'moveaxis', 'movedim',
+        'mps', 'msort', 'mtia', 'mul', 'multinomial', 'multiply', 'multiprocessing', 'mv',
+        'mvlgamma', 'nan', 'nan_to_num', 'nan_to_num_', 'nanmean', 'nanmedian', 'nanquantile',
+        'nansum', 'narrow', 'narrow_copy', 'native_batch_norm', 'native_channel_shuffle',
+        'native_dropout', 'native_group_norm', 'native_layer_norm', 'native_norm', 'ne', 'neg',
+        'neg_', 'negative', 'negative_', 'nested', 'newaxis', 'nextafter', 'nn', 'no_grad',
+        'nonzero', 'nonzero_static', 'norm', 'norm_except_dim', 'normal', 'not_equal',
+        'nuclear_norm', 'numel', 'ones', 'ones_like', 'ops', 'optim', 'orgqr', 'ormqr', 'os',
+        'outer', 'overrides', 'package', 'pairwise_distance', 'parse_ir', 'parse_schema',
+        'parse_type_comment', 'pca_lowrank', 'pdist', 'per_channel_affine',
+        'per_channel_affine_float_qparams', 'per_channel_symmetric', 'per_tensor_affine',
+        'per_tensor_symmetric', 'permute', 'permute_copy', 'pi', 'pinverse', 'pixel_shuffle',
+        'pixel_unshuffle', 'platform', 'poisson', 'poisson_nll_loss', 'polar', 'polygamma',
+        'positive', 'pow', 'prelu', 'prepare_multiprocessing_environment', 'preserve_format',
+        'prod', 'profiler', 'profiler_allow_cudagraph_cupti_lazy_reinit_cuda12', 'promote_types',
+        'put', 'q_per_channel_axis', 'q_per_channel_scales', 'q_per_channel_zero_points',
+        'q_scale', 'q_zero_point', 'qint32', 'qint8', 'qr', 'qscheme', 'quantile', 'quantization',
+        'quantize_per_channel', 'quantize_per_tensor', 'quantize_per_tensor_dynamic',
+        'quantized_batch_norm', 'quantized_gru', 'quantized_gru_cell', 'quantized_lstm',
+        'quantized_lstm_cell', 'quantized_max_pool1d', 'quantized_max_pool2d',
+        'quantized_max_pool3d', 'quantized_rnn_relu_cell', 'quantized_rnn_tanh_cell',
+        'quasirandom', 'quint2x4', 'quint4x2', 'quint8', 'rad2deg', 'rad2deg_', 'rand',
+        'rand_like', 'randint', 'randint_like', 'randn', 'randn_like', 'random', 'randperm',
+        'range', 'ravel', 'real', 'reciprocal', 'reciprocal_', 'relu', 'relu_', 'remainder',
+        'renorm', 'repeat_interleave', 'reshape', 'resize_as_', 'resize_as_sparse_',
+        'resolve_conj', 'resolve_neg', 'result_type', 'return_types', 'rms_norm', 'rnn_relu',
+        'rnn_relu_cell', 'rnn_tanh', 'rnn_tanh_cell', 'roll', 'rot90', 'round', 'round_',
+        'row_indices_copy', 'row_stack', 'rrelu', 'rrelu_', 'rsqrt', 'rsqrt_', 'rsub', 'saddmm',
+        'save', 'scalar_tensor', 'scatter', 'scatter_add', 'scatter_reduce', 'searchsorted',
+        'seed', 'segment_reduce', 'select', 'select_copy', 'select_scatter', 'selu', 'selu_',
+        'serialization', 'set_anomaly_enabled', 'set_autocast_cache_enabled',
+        'set_autocast_cpu_dtype', 'set_autocast_cpu_enabled', 'set_autocast_dtype',
+        'set_autocast_enabled', 'set_autocast_gpu_dtype', 'set_autocast_ipu_dtype',
+        'set_autocast_ipu_enabled', 'set_autocast_xla_dtype', 'set_autocast_xla_enabled',
+        'set_default_device', 'set_default_dtype', 'set_default_tensor_type',
+        'set_deterministic_debug_mode', 'set_float32_matmul_precision', 'set_flush_denormal',
+        'set_grad_enabled', 'set_num_interop_threads', 'set_num_threads', 'set_printoptions',
+        'set_rng_state', 'set_warn_always', 'sgn', 'short', 'sigmoid', 'sigmoid_', 'sign',
+        'signal', 'signbit', 'sin', 'sin_', 'sinc', 'sinc_', 'sinh', 'sinh_', 'slice_copy',
+        'slice_inverse', 'slice_scatter', 'slogdet', 'smm', 'softmax', 'solve', 'sort', 'sparse',
+        'sparse_bsc', 'sparse_bsc_tensor', 'sparse_bsr', 'sparse_bsr_tensor',
+        'sparse_compressed_tensor', 'sparse_coo', 'sparse_coo_tensor', 'sparse_csc',
+        'sparse_csc_tensor', 'sparse_csr', 'sparse_csr_tensor', 'special', 'split', 'split_copy',
+        'split_with_sizes', 'split_with_sizes_copy', 'spmm', 'sqrt', 'sqrt_', 'square', 'square_',
+        'squeeze', 'squeeze_copy', 'sspaddmm', 'stack', 'std', 'std_mean', 'stft', 'storage',
+        'strided', 'sub', 'subtract', 'sum', 'svd', 'svd_lowrank', 'swapaxes', 'swapdims',
+        'sym_constrain_range', 'sym_constrain_range_for_size', 'sym_float', 'sym_fresh_size',
+        'sym_int', 'sym_ite', 'sym_max', 'sym_min', 'sym_not', 'sym_sqrt', 'sym_sum', 'symeig',
+        'sys', 't', 't_copy', 'take', 'take_along_dim', 'tan', 'tan_', 'tanh', 'tanh_', 'tensor',
+        'tensor_split', 'tensordot', 'testing', 'textwrap', 'thread_safe_generator', 'threading',
+        'threshold', 'threshold_', 'tile', 'to_dlpack', 'topk', 'torch', 'torch_version', 'trace',
+        'transpose', 'transpose_copy', 'trapezoid', 'trapz', 'triangular_solve', 'tril',
+        'tril_indices', 'triplet_margin_loss', 'triu', 'triu_indices', 'true_divide', 'trunc',
+        'trunc_', 'typename', 'types', 'typing', 'typing_extensions', 'uint1', 'uint16', 'uint2',
+        'uint3', 'uint32', 'uint4', 'uint5', 'uint6', 'uint64', 'uint7', 'uint8', 'unbind',
+        'unbind_copy', 'unflatten', 'unfold_copy', 'unify_type_list', 'unique',
+        'unique_consecutive', 'unravel_index', 'unsafe_chunk', 'unsafe_split',
+        'unsafe_split_with_sizes', 'unsqueeze', 'unsqueeze_copy', 'use_deterministic_algorithms',
+        'utils', 'values_copy', 'vander', 'var', 'var_mean', 'vdot', 'version', 'view_as_complex',
+        'view_as_complex_copy', 'view_as_real', 'view_as_real_copy', 'view_copy', 'vmap', 'vsplit',
+        'vstack', 'wait', 'warnings', 'where', 'while_loop', 'windows', 'xlogy', 'xlogy_', 'xpu',
+        'zero_', 'zeros', 'zeros_like',
+    }),
+}
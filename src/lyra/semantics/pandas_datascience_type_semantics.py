@@ -1,10 +1,7 @@
 import os
-import shutil
-import zipfile
-import pandas as pd
 from pathlib import Path
 import lyra.config as config
-import warnings
+from lyra.core.diagnostics import warn
 
 from lyra.core.datascience_warnings import (
     InappropriateMissingValuesWarning,
@@ -33,6 +30,7 @@ from lyra.datascience.datascience_type_domain import (
     DatascienceTypeState,
     DatascienceTypeLattice,
 )
+from lyra.datascience.profiling import Profiler
 
 import lyra.semantics.utilities as utilities
 
@@ -207,13 +205,7 @@ class PandasDatascienceTypeSemantics:
                 if isinstance(caller, VariableAccess):
                     caller = caller.variable
                 if caller in state.variables:
-                    for e in state.variables:
-                        if e == caller:
-                            tmp = e
-                            state.variables.remove(e)
-                            tmp.has_duplicates = Status.NO
-                            state.variables.add(tmp)
-                            break
+                    state.update_properties(caller, has_duplicates=Status.NO)
             return state
         subset = None
         for arg in stmt.arguments:
@@ -229,11 +221,7 @@ class PandasDatascienceTypeSemantics:
                     # Create a copy of the caller to represent the new DataFrame
                     new_var = VariableIdentifier(caller.typ, f"{caller}_lyracopy")
                     state.variables.add(new_var)
-                    for e in state.variables:
-                        if e == new_var:
-                            tmp = e
-                            tmp.has_duplicates = Status.NO
-                            break
+                    state.update_properties(new_var, has_duplicates=Status.NO)
                     tmp_state = self.return_same_type_as_caller(stmt, state, interpreter)
                     tmp_result = tmp_state.result.pop()
                     state.result = {(tmp_result, new_var)}
@@ -287,23 +275,18 @@ class PandasDatascienceTypeSemantics:
                     is_reproducible = False
                     break   # After the first keyword argument, all the following must be keyword arguments
         if not is_reproducible:
-            warnings.warn(
+            warn(
                 f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} the random state is not set, the experiment might not be reproducible.",
                 category=ReproducibilityWarning,
                 stacklevel=2,
+                level='plausible', pp=stmt.pp,
             )
         caller = self.get_caller(stmt, state, interpreter)
         if utilities.is_DataFrame(state, caller):
             if isinstance(caller, VariableAccess):
                 caller = caller.variable
             if caller in state.variables:
-                for e in state.variables:
-                    if e == caller:
-                        tmp = e
-                        state.variables.remove(e)
-                        tmp.is_shuffled = Status.YES
-                        state.variables.add(tmp)
-                        break
+                state.update_properties(caller, is_shuffled=Status.YES)
         return self.return_same_type_as_caller(stmt, state, interpreter)
 
     def where_call_semantics(
@@ -486,13 +469,7 @@ class PandasDatascienceTypeSemantics:
                     if isinstance(caller, VariableAccess):
                         caller = caller.variable
                     if caller in state.variables:
-                        for e in state.variables:
-                            if e == caller:
-                                tmp = e
-                                state.variables.remove(e)
-                                tmp.has_na_values = Status.NO
-                                state.variables.add(tmp)
-                                break
+                        state.update_properties(caller, has_na_values=Status.NO)
                 return state
         subset = None
         for arg in stmt.arguments:
@@ -508,11 +485,7 @@ class PandasDatascienceTypeSemantics:
                     # Create a copy of the caller to represent the new DataFrame
                     new_var = VariableIdentifier(caller.typ, f"{caller}_lyracopy")
                     state.variables.add(new_var)
-                    for e in state.variables:
-                        if e == new_var:
-                            tmp = e
-                            tmp.has_na_values = Status.NO
-                            break
+                    state.update_properties(new_var, has_na_values=Status.NO)
                     tmp_state = self.return_same_type_as_caller(stmt, state, interpreter)
                     tmp_result = tmp_state.result.pop()
                     state.result = {(tmp_result, new_var)}
@@ -792,7 +765,6 @@ class PandasDatascienceTypeSemantics:
     def read_csv_call_semantics(
         self, stmt: Call, state: DatascienceTypeState, interpreter: ForwardInterpreter
     ) -> DatascienceTypeState:
-        last_folder_in_name = None
         try:
             dir = Path(config.args.python_file).parent
             fun_args = []
@@ -806,52 +778,16 @@ class PandasDatascienceTypeSemantics:
                 else:
                     raise Exception("Unexpected argument type")
             fun_args[0] = os.path.join(dir, fun_args[0])
-            benchmark_dir = "/Users/greta/PhD/kaggle/input" # TODO: Do not use hardcoded paths
-            last_folder_in_name = fun_args[0].split("/")[-2] + ".zip"
-            # Check if there is a zip file in the benchmark directory with the same name as the directory from which the file is read
-            if last_folder_in_name in os.listdir(benchmark_dir):
-                # Unzip the file in a temporary directory
-                with zipfile.ZipFile(os.path.join(benchmark_dir, last_folder_in_name), 'r') as zip_ref:
-                    last_folder_in_name = last_folder_in_name.replace(".zip", "")
-                    zip_ref.extractall(os.path.join("/tmp", last_folder_in_name))
-                    tmp_name = os.path.join("/tmp", last_folder_in_name, fun_args[0].split("/")[-1])
-                    concrete_df = pd.read_csv(tmp_name, **fun_kwargs)
-                    shutil.rmtree(os.path.join("/tmp", last_folder_in_name))
-            else:
-                concrete_df = pd.read_csv(fun_args[0], **fun_kwargs)
-            shape = concrete_df.shape
-            # The concrete dataframe is high dimensional if the number of columns is similar to the number of rows
-            # e.g. they are not the dobule of each other
-            if shape[0] < 2 * shape[1]:
-                is_high_dim = True
-            else:
-                is_high_dim = False
-            if len(concrete_df) <= 100:
-                is_small = True
-            else:
-                is_small = False
-            has_duplicates = concrete_df.duplicated().any()
-            has_na_values = concrete_df.isna().values.any()
-            dtype_info = {}
-            for col in concrete_df.columns:
-                dtype_info[col] = concrete_df[col].dtype
-            # For each Series check if it is increasing or decreasing
-            sorting_info = {}
-            for col in concrete_df.columns:
-                if concrete_df[col].is_monotonic_increasing and concrete_df[col].is_monotonic_decreasing:
-                    sorting_info[col] = "constant"
-                elif concrete_df[col].is_monotonic_increasing:
-                    sorting_info[col] = "increasing"
-                elif concrete_df[col].is_monotonic_decreasing:
-                    sorting_info[col] = "decreasing"
-                else:
-                    sorting_info[col] = "not_sorted"
-            state.result = {(DatascienceTypeLattice.Status.DataFrame, frozenset(dtype_info.items()), is_high_dim, has_duplicates, has_na_values, is_small, frozenset(sorting_info.items()))}
+            # The data is profiled a chunk at a time (or retrieved from the profile cache),
+            # never loaded as a whole
+            profile = (config.profiler or Profiler()).profile(fun_args[0], fun_kwargs)
+            dtypes, sorting = frozenset(profile.dtypes.items()), frozenset(profile.sorting.items())
+            state.result = {(DatascienceTypeLattice.Status.DataFrame, dtypes,
+                             profile.is_high_dimensional, profile.has_duplicates,
+                             profile.has_na_values, profile.is_small, sorting)}
         except Exception as e:
             print("It was not possible to read the concrete DataFrame due to error: ", e)
             state.result = {DatascienceTypeLattice.Status.DataFrame}
-            if last_folder_in_name is not None and last_folder_in_name in os.listdir("/tmp"):
-                shutil.rmtree(os.path.join("/tmp", last_folder_in_name))
         return state
 
     def DataFrame_call_semantics(
@@ -915,34 +851,25 @@ class PandasDatascienceTypeSemantics:
                     if isinstance(caller, VariableAccess):
                         caller = caller.variable
                     if caller in state.variables:
-                        for e in state.variables:
-                            if e == caller:
-                                tmp = e
-                                state.variables.remove(e)
-                                tmp.has_na_values = Status.NO
-                                state.variables.add(tmp)
-                                break
+                        state.update_properties(caller, has_na_values=Status.NO)
             return state
         caller = self.get_caller(stmt, state, interpreter)
         if utilities.is_DataFrame(state, caller) and isinstance(caller, VariableIdentifier):
             caller_to_print = caller if not isinstance(caller, DatascienceTypeLattice.Status) else stmt
-            if caller in state.variables:
-                for item in state.variables:
-                    if item == caller:
-                        caller = item
-                        break
             if interpreter.warning_level == "potential":
-                if caller.is_small == Status.NO:
-                    warnings.warn(
+                if state.get_properties(caller).is_small == Status.NO:
+                    warn(
                         f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> {caller_to_print} has many instances, but handling missing values with fillna might change the distribution.",
                         category=InappropriateMissingValuesWarning,
                         stacklevel=2,
+                        level='potential', pp=stmt.pp, variable=caller_to_print,
                     )
                 else:
-                    warnings.warn(
+                    warn(
                         f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> {caller_to_print} may have few instances, handling missing values with fillna might change the distribution.",
                         category=InappropriateMissingValuesWarning,
                         stacklevel=2,
+                        level='potential', pp=stmt.pp, variable=caller_to_print,
                     )
         subset = None
         for arg in stmt.arguments:
@@ -958,11 +885,7 @@ class PandasDatascienceTypeSemantics:
                     # Create a copy of the caller to represent the new DataFrame
                     new_var = VariableIdentifier(caller.typ, f"{caller}_lyracopy")
                     state.variables.add(new_var)
-                    for e in state.variables:
-                        if e == new_var:
-                            tmp = e
-                            tmp.has_na_values = Status.NO
-                            break
+                    state.update_properties(new_var, has_na_values=Status.NO)
                     tmp_state = self.return_same_type_as_caller(stmt, state, interpreter)
                     tmp_result = tmp_state.result.pop()
                     state.result = {(tmp_result, new_var)}
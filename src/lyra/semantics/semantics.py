@@ -10,13 +10,9 @@ Lyra's internal semantics of statements.
 
 import itertools
 import re
-import torch
+from abc import ABCMeta
 from copy import deepcopy
-import pandas
-import numpy
-import seaborn
-import matplotlib.pyplot
-import plotly.express
+from typing import Any, Callable, Dict, Tuple, Type
 
 
 from lyra.abstract_domains.state import State
@@ -34,6 +30,7 @@ from lyra.core.statements import Statement, VariableAccess, LiteralEvaluation, C
 from lyra.core.types import LyraType, BooleanLyraType, IntegerLyraType, FloatLyraType, \
     StringLyraType, TupleLyraType, ListLyraType, SetLyraType, DictLyraType, TopLyraType
 from lyra.engine.interpreter import Interpreter
+from lyra.semantics.symbols import has_symbol
 
 _first1 = re.compile(r'(.)([A-Z][a-z]+)')
 _all2 = re.compile('([a-z0-9])([A-Z])')
@@ -49,12 +46,60 @@ def camel_to_snake(name: str) -> str:
     return _all2.sub(r'\1_\2', subbed).lower()
 
 
-class Semantics:
+_tables: Dict[type, Dict[Any, Any]] = dict()
+"""Dispatch table of each semantics class."""
+
+
+class SemanticsMeta(ABCMeta):
+    """Metaclass of the semantics classes.
+
+    The dispatch tables are invalidated whenever a method is (dynamically) added or removed.
+    """
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        _tables.clear()
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        _tables.clear()
+
+
+class Semantics(metaclass=SemanticsMeta):
     """Semantics of statements.
 
     The semantics is independent of the direction (forward/backward) of the analysis.
+
+    .. note::
+        The semantics of a statement (and of a call) is resolved to a method only once,
+        and recorded in a dispatch table of the semantics class.
     """
 
+    @property
+    def _table(self) -> Dict[Any, Any]:
+        """Dispatch table of the current semantics."""
+        table = _tables.get(type(self))
+        if table is None:
+            table = _tables[type(self)] = dict()
+        return table
+
+    def _handler(self, stmt: Statement) -> Tuple[Callable, bool]:
+        """Method implementing the semantics of a statement.
+
+        :param stmt: statement to be executed
+        :return: (unbound) method and whether it accepts a ``get_caller`` argument
+        """
+        typ = type(stmt)
+        handler = self._table.get(typ)
+        if handler is None:
+            name = '{}_semantics'.format(camel_to_snake(typ.__name__))
+            method = getattr(type(self), name, None)
+            if method is None:
+                error = f"Semantics for statement {stmt} of type {typ} not yet implemented! "
+                raise NotImplementedError(error + f"You must provide method {name}(...)")
+            handler = self._table[typ] = (method, 'get_caller' in method.__code__.co_varnames)
+        return handler
+
     def semantics(self, stmt: Statement, state: State, interpreter: Interpreter) -> State:
         """Semantics of a statement.
 
@@ -62,11 +107,8 @@ class Semantics:
         :param state: state before executing the statement
         :return: state modified by the statement execution
         """
-        name = '{}_semantics'.format(camel_to_snake(stmt.__class__.__name__))
-        if hasattr(self, name):
-            return getattr(self, name)(stmt, state, interpreter)
-        error = f"Semantics for statement {stmt} of type {type(stmt)} not yet implemented! "
-        raise NotImplementedError(error + f"You must provide method {name}(...)")
+        method, _ = self._handler(stmt)
+        return method(self, stmt, state, interpreter)
 
     def import_semantics(self, stmt: Statement, state: State, interpreter: Interpreter) -> State:
         """Semantics of an import statement."""
@@ -232,6 +274,40 @@ class ExpressionSemantics(Semantics):
 class CallSemantics(Semantics):
     """Semantics of function/method calls."""
 
+    _libraries = {
+        "pandas": '{}_library_call_semantics',
+        "numpy": '{}_numpy_library_call_semantics',
+        "seaborn": '{}_seaborn_library_call_semantics',
+        "torch": '{}_torch_library_call_semantics',
+        "matplotlib.pyplot": '{}_library_call_semantics',
+        "plotly.express": '{}_library_call_semantics'
+    }
+    """Supported libraries and naming convention of the semantics of their library calls."""
+
+    def _call_handler(self, name: str, library: str = None, access: str = None) -> Callable:
+        """Method implementing the semantics of a function/method call.
+
+        :param name: name of the called function/method
+        :param library: supported library accessed by the call, if any
+        :param access: name of the library access, if any
+        :return: (unbound) method
+        """
+        key = (name, library, access)
+        handler = self._table.get(key)
+        if handler is None:
+            names = list()
+            if library is not None:
+                if has_symbol(library, access):             # Class call
+                    names.append('{}_class_call_semantics'.format(name))
+                elif has_symbol(library, name):             # Library call
+                    names.append(self._libraries[library].format(name))
+            names.append('{}_call_semantics'.format(name))
+            cls = type(self)
+            found = (getattr(cls, n) for n in names if hasattr(cls, n))
+            handler = next(found, None) or getattr(cls, 'user_defined_call_semantics')
+            self._table[key] = handler
+        return handler
+
     def call_semantics(self, stmt: Call, state: State, interpreter: Interpreter) -> State:
         """Semantics of a function/method call.
 
@@ -249,53 +325,12 @@ class CallSemantics(Semantics):
         It is *PROGRAMMER'S DUTY* to implement different kind of semantics if
         the behavior of the call changes as the type of the call changes.
         """
-        name = '{}_call_semantics'.format(stmt.name)
+        library, access = None, None
         if len(stmt.arguments) >= 1 and isinstance(stmt.arguments[0], LibraryAccess):
-            if stmt.arguments[0].library == "pandas":
-                if hasattr(pandas, stmt.arguments[0].name):     # Class call
-                    name = '{}_class_call_semantics'.format(stmt.name)
-                elif hasattr(pandas, stmt.name):                # Library call
-                    name = '{}_library_call_semantics'.format(stmt.name)
-                stmt.arguments.pop(0)
-            elif stmt.arguments[0].library == "numpy":
-                if hasattr(numpy, stmt.arguments[0].name):     # Class call
-                    name = '{}_class_call_semantics'.format(stmt.name)
-                elif hasattr(numpy, stmt.name):                # Library call
-                    name = '{}_numpy_library_call_semantics'.format(stmt.name)
-                stmt.arguments.pop(0)
-            elif stmt.arguments[0].library == "seaborn":
-                if hasattr(seaborn, stmt.arguments[0].name):     # Class call
-                    name = '{}_class_call_semantics'.format(stmt.name)
-                elif hasattr(seaborn, stmt.name):                # Library call
-                    name = '{}_seaborn_library_call_semantics'.format(stmt.name)
+            if stmt.arguments[0].library in self._libraries:
+                library, access = stmt.arguments[0].library, stmt.arguments[0].name
                 stmt.arguments.pop(0)
-            elif stmt.arguments[0].library == "torch":
-                if hasattr(torch, stmt.arguments[0].name):  # Class call
-                    name = '{}_class_call_semantics'.format(stmt.name)
-                elif hasattr(torch, stmt.name):  # Library call
-                    name = '{}_torch_library_call_semantics'.format(stmt.name)
-                stmt.arguments.pop(0)
-            elif stmt.arguments[0].library == "matplotlib.pyplot":
-                if hasattr(matplotlib.pyplot, stmt.arguments[0].name):     # Class call
-                    name = '{}_class_call_semantics'.format(stmt.name)
-                elif hasattr(matplotlib.pyplot, stmt.name):                # Library call
-                    name = '{}_library_call_semantics'.format(stmt.name)
-                stmt.arguments.pop(0)
-            elif stmt.arguments[0].library == "plotly.express":
-                if hasattr(plotly.express, stmt.arguments[0].name):
-                    name = '{}_class_call_semantics'.format(stmt.name)
-                elif hasattr(plotly.express, stmt.name):
-                    name = '{}_library_call_semantics'.format(stmt.name)
-                stmt.arguments.pop(0)
-
-
-        if hasattr(self, name):
-            return getattr(self, name)(stmt, state, interpreter)
-        else:
-            name = '{}_call_semantics'.format(stmt.name)
-            if hasattr(self, name):
-                return getattr(self, name)(stmt, state, interpreter)
-        return getattr(self, 'user_defined_call_semantics')(stmt, state, interpreter)
+        return self._call_handler(stmt.name, library, access)(self, stmt, state, interpreter)
 
 
 class BuiltInCallSemantics(CallSemantics):
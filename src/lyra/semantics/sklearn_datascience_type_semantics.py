@@ -17,7 +17,7 @@ from lyra.core.datascience_warnings import (
     DataLeakageWarning
 )
 
-import warnings
+from lyra.core.diagnostics import warn
 
 from lyra.core.expressions import (
     VariableIdentifier
@@ -51,10 +51,11 @@ class SklearnTypeSemantics:
         caller = self.get_caller(stmt, state, interpreter)
         if utilities.is_SplittedTestData(state, data):
             if interpreter.warning_level == "potential":
-                warnings.warn(
+                warn(
                     f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> The fit method should be used on train data only.",
                     category=DataLeakageWarning,
                     stacklevel=2,
+                    level='potential', pp=stmt.pp,
                 )
         elif utilities.is_PCA(state, caller):
             self.issue_pca_warnings(stmt, state, interpreter)
@@ -67,25 +68,28 @@ class SklearnTypeSemantics:
         if utilities.is_PCA(state, caller) and state.get_type(caller) == DatascienceTypeLattice.Status.PCA:
             arg = stmt.arguments[1]
             if utilities.is_DataFrame(state, arg) and isinstance(arg, VariableAccess) and arg.variable in state.variables:
-                for e in state.variables:
-                    if e == arg.variable and e in state.subscriptions:
-                        for sub in state.subscriptions[e]:
-                            if sub in state.store and state.get_type(sub) == DatascienceTypeLattice.Status.CatSeries:
-                                warnings.warn(
-                                    f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> PCA is applied to Dataframe containing a categorical Series, it is better to use MixedPCA.",
-                                    category=PCAOnCategoricalWarning,
-                                    stacklevel=3,
-                                )
-                                warning_raised = True
-                                break
-                        if not warning_raised:
-                            no_warning = True
+                if arg.variable in state.subscriptions:
+                    for sub in state.subscriptions[arg.variable]:
+                        categorical = DatascienceTypeLattice.Status.CatSeries
+                        if sub in state.store and state.get_type(sub) == categorical:
+                            warn(
+                                f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> PCA is "
+                                "applied to Dataframe containing a categorical Series, "
+                                "it is better to use MixedPCA.",
+                                category=PCAOnCategoricalWarning,
+                                stacklevel=3,
+                                level='plausible', pp=stmt.pp,
+                            )
+                            warning_raised = True
                             break
+                    if not warning_raised:
+                        no_warning = True
                 if not warning_raised and not no_warning and interpreter.warning_level == "potential":
-                    warnings.warn(
+                    warn(
                         f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> PCA might be applied to Dataframe containing a categorical Series, it is better to use MixedPCA.",
                         category=PCAOnCategoricalWarning,
                         stacklevel=3,
+                        level='potential', pp=stmt.pp,
                     )
 
     def transform_call_semantics(
@@ -117,10 +121,11 @@ class SklearnTypeSemantics:
         caller = self.get_caller(stmt, state, interpreter)
         if utilities.is_SplittedTestData(state, data):
             if interpreter.warning_level == "potential":
-                warnings.warn(
+                warn(
                     f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> The fit_transform method should be used on train data only.",
                     category=DataLeakageWarning,
                     stacklevel=2,
+                    level='potential', pp=stmt.pp,
                 )
         elif utilities.is_PCA(state, caller):
             self.issue_pca_warnings(stmt, state, interpreter)
@@ -311,16 +316,18 @@ class SklearnTypeSemantics:
         for a in args:
             if isinstance(a, Keyword) and a.name == "n_components":
                 if type(a.value) in (int, float):   # Constant number
-                    warnings.warn(
+                    warn(
                         f"Warning [plausible]: in {stmt} @ line {stmt.pp.line} -> n_components is {a.value}, this might be a wrong assumption. It may be better to run multiple experiments.",
                         category=FixedNComponentsPCAWarning,
                         stacklevel=2,
+                        level='plausible', pp=stmt.pp,
                     )
                 elif interpreter.warning_level == "potential":
-                    warnings.warn(
+                    warn(
                         f"Warning [potential]: in {stmt} @ line {stmt.pp.line} -> n_components might be a wrong assumption. It may be better to run multiple experiments.",
                         category=FixedNComponentsPCAWarning,
                         stacklevel=2,
+                        level='potential', pp=stmt.pp,
                     )
         state.result = {DatascienceTypeLattice.Status.PCA}
         return state
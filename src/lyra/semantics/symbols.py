@@ -0,0 +1,121 @@
+"""
+Library Symbols
+===============
+
+Attribute lookups on the libraries supported by the semantics of calls,
+answered from a precomputed index rather than by importing the libraries.
+
+The index (:mod:`lyra.semantics.library_symbols`) ships with Lyra and is generated offline,
+in an environment with the supported libraries installed, by running::
+
+    python -m lyra.semantics.symbols
+
+:Author: Caterina Urban
+"""
+import argparse
+import importlib
+import os
+import textwrap
+from typing import Dict, FrozenSet, Tuple
+
+from lyra.semantics.library_symbols import SYMBOLS, VERSIONS
+
+LIBRARIES = ('pandas', 'numpy', 'seaborn', 'torch', 'matplotlib.pyplot', 'plotly.express')
+"""Libraries whose attributes are indexed."""
+
+CLASSES = {'pandas.DataFrame': ('pandas', 'DataFrame')}
+"""Library classes whose attributes are indexed."""
+
+
+def has_symbol(library: str, name: str) -> bool:
+    """Check whether a library (or a library class) has an attribute with a given name,
+    without importing the library (cf. ``hasattr``).
+
+    :param library: name of the library (or of the library class)
+    :param name: name of the attribute
+    :return: whether the attribute belongs to the library (or to the library class)
+    """
+    return name in SYMBOLS.get(library, ())
+
+
+def version(library: str) -> str:
+    """Version of a library (or of the library of a class) the index was generated with.
+
+    :param library: name of the library (or of the library class)
+    :return: version of the library, ``None`` if the library is not indexed
+    """
+    return VERSIONS.get(library)
+
+
+def _attributes(obj) -> FrozenSet[str]:
+    return frozenset(n for n in dir(obj) if not (n.startswith('__') and n.endswith('__')))
+
+
+def _version(library: str) -> str:
+    root = importlib.import_module(library.split('.')[0])
+    return getattr(root, '__version__', None)
+
+
+def generate() -> Tuple[Dict[str, str], Dict[str, FrozenSet[str]]]:
+    """Index the attributes of the supported libraries (and library classes).
+
+    .. warning::
+        All supported libraries are imported, thus they need to be installed.
+
+    :return: versions of the indexed libraries, and attributes of each library (or library class)
+    """
+    versions, symbols = dict(), dict()
+    for library in LIBRARIES:
+        module = importlib.import_module(library)
+        versions[library] = _version(library)
+        symbols[library] = _attributes(module)
+    for cls, (library, name) in CLASSES.items():
+        module = importlib.import_module(library)
+        versions[cls] = _version(library)
+        symbols[cls] = _attributes(getattr(module, name))
+    return versions, symbols
+
+
+def render(versions: Dict[str, str], symbols: Dict[str, FrozenSet[str]]) -> str:
+    """Source code of the index module.
+
+    :param versions: versions of the indexed libraries
+    :param symbols: attributes of each library (or library class)
+    :return: source code of the index module
+    """
+    lines = [
+        '"""',
+        'Library Symbols Index',
+        '=====================',
+        '',
+        'Attributes of the libraries supported by the semantics of calls.',
+        '',
+        '.. warning::',
+        '    Generated by ``python -m lyra.semantics.symbols``. Do not edit.',
+        '"""',
+        '',
+        'VERSIONS = {',
+    ]
+    lines.extend(f'    {library!r}: {versions[library]!r},' for library in sorted(versions))
+    lines.extend(['}', '', 'SYMBOLS = {'])
+    for library in sorted(symbols):
+        names = ' '.join(f'{name!r},' for name in sorted(symbols[library]))
+        wrapped = textwrap.wrap(names, width=91, break_long_words=False, break_on_hyphens=False)
+        lines.append(f'    {library!r}: frozenset({{')
+        lines.extend(f'        {line}' for line in wrapped)
+        lines.append('    }),')
+    lines.extend(['}', ''])
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the index of library symbols.')
+    default = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'library_symbols.py')
+    parser.add_argument('-o', '--output', default=default, help='path of the index module')
+    args = parser.parse_args()
+    with open(args.output, 'w') as index:
+        index.write(render(*generate()))
+
+
+if __name__ == '__main__':
+    main()
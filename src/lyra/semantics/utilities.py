@@ -6,6 +6,7 @@ from lyra.core.expressions import (
     Input,
 )
 from lyra.core.statements import (
+    AttributeAccess,
     Call,
     SubscriptionAccess,
     VariableAccess,
@@ -83,9 +84,6 @@ def is_Series(state, caller):
         if isinstance(caller, SubscriptionAccess):
             if isinstance(caller.target, VariableAccess):
                 tmp_target = caller.target.variable
-                for v in state.variables:
-                    if v.name == tmp_target.name:
-                        tmp_target = v
             else:
                 tmp_target = caller.target
             if isinstance(caller.key, LiteralEvaluation):
@@ -137,9 +135,6 @@ def is_StringSeries(state, caller):
         if isinstance(caller, SubscriptionAccess):
             if isinstance(caller.target, VariableAccess):
                 tmp_target = caller.target.variable
-                for v in state.variables:
-                    if v.name == tmp_target.name:
-                        tmp_target = v
             else:
                 tmp_target = caller.target
             if isinstance(caller.key, LiteralEvaluation):
@@ -175,9 +170,6 @@ def is_RatioSeries(state, caller):
         if isinstance(caller, SubscriptionAccess):
             if isinstance(caller.target, VariableAccess):
                 tmp_target = caller.target.variable
-                for v in state.variables:
-                    if v.name == tmp_target.name:
-                        tmp_target = v
             else:
                 tmp_target = caller.target
             if isinstance(caller.key, LiteralEvaluation):
@@ -212,9 +204,6 @@ def is_BoolSeries(state, caller):
         if isinstance(caller, SubscriptionAccess):
             if isinstance(caller.target, VariableAccess):
                 tmp_target = caller.target.variable
-                for v in state.variables:
-                    if v.name == tmp_target.name:
-                        tmp_target = v
             else:
                 tmp_target = caller.target
             if isinstance(caller.key, LiteralEvaluation):
@@ -249,9 +238,6 @@ def is_CatSeries(state, caller):
         if isinstance(caller, SubscriptionAccess):
             if isinstance(caller.target, VariableAccess):
                 tmp_target = caller.target.variable
-                for v in state.variables:
-                    if v.name == tmp_target.name:
-                        tmp_target = v
             else:
                 tmp_target = caller.target
             if isinstance(caller.key, LiteralEvaluation):
@@ -350,9 +336,6 @@ def is_ExpSeries(state, caller):
         if isinstance(caller, SubscriptionAccess):
             if isinstance(caller.target, VariableAccess):
                 tmp_target = caller.target.variable
-                for v in state.variables:
-                    if v.name == tmp_target.name:
-                        tmp_target = v
             else:
                 tmp_target = caller.target
             if isinstance(caller.key, LiteralEvaluation):
@@ -387,9 +370,6 @@ def is_NumericSeries(state, caller):
         if isinstance(caller, SubscriptionAccess):
             if isinstance(caller.target, VariableAccess):
                 tmp_target = caller.target.variable
-                for v in state.variables:
-                    if v.name == tmp_target.name:
-                        tmp_target = v
             else:
                 tmp_target = caller.target
             if isinstance(caller.key, LiteralEvaluation):
@@ -427,9 +407,6 @@ def is_ScaledSeries(state, caller):
         if isinstance(caller, SubscriptionAccess):
             if isinstance(caller.target, VariableAccess):
                 tmp_target = caller.target.variable
-                for v in state.variables:
-                    if v.name == tmp_target.name:
-                        tmp_target = v
             else:
                 tmp_target = caller.target
             if isinstance(caller.key, LiteralEvaluation):
@@ -465,9 +442,6 @@ def is_NormSeries(state, caller):
         if isinstance(caller, SubscriptionAccess):
             if isinstance(caller.target, VariableAccess):
                 tmp_target = caller.target.variable
-                for v in state.variables:
-                    if v.name == tmp_target.name:
-                        tmp_target = v
             else:
                 tmp_target = caller.target
             if isinstance(caller.key, LiteralEvaluation):
@@ -498,9 +472,6 @@ def is_StdSeries(state, caller):
         if isinstance(caller, SubscriptionAccess):
             if isinstance(caller.target, VariableAccess):
                 tmp_target = caller.target.variable
-                for v in state.variables:
-                    if v.name == tmp_target.name:
-                        tmp_target = v
             else:
                 tmp_target = caller.target
             if isinstance(caller.key, LiteralEvaluation):
@@ -977,12 +948,29 @@ def is_zero_division_NaN(arguments):
     return False
 
 
+class CallerView:
+    """Read-only view of a state for the evaluation of the caller of a method.
+
+    The (``get_caller``) semantics of variable, subscription, and attribute accesses
+    determine the caller from the accessed expression alone and only set the result.
+    Any other use of the view fails instead of modifying the actual state.
+    """
+    __slots__ = ('result',)
+
+    def __init__(self):
+        self.result = set()
+
+
 class SelfUtilitiesSemantics:
     def get_caller(
         self, stmt: Call, state: DatascienceTypeState, interpreter: ForwardInterpreter
     ):
-        tmp_state = copy.deepcopy(state)
-        dfs = self.semantics(stmt.arguments[0], tmp_state, interpreter, get_caller=True).result
+        argument = stmt.arguments[0]
+        if isinstance(argument, (VariableAccess, SubscriptionAccess, AttributeAccess)):
+            dfs = self.semantics(argument, CallerView(), interpreter, get_caller=True).result
+        else:   # e.g., a chained method call, whose evaluation might modify the state
+            tmp_state = copy.deepcopy(state)
+            dfs = self.semantics(argument, tmp_state, interpreter, get_caller=True).result
         assert len(dfs) == 1, (
             f"Function {stmt.name} is supposed to be called "
             "either on a single DataFrame or Series element"
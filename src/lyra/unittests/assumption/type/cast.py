@@ -1,4 +1,4 @@
 
 x: str = input()
-# STATE: len(x) -> [0, inf]; x -> Integer; y -> Float
+# STATE: x -> Integer; y -> Float
 y: float = int(x)
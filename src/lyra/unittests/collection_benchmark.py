@@ -0,0 +1,82 @@
+"""
+Garbage Collection - Benchmark
+==============================
+
+Time of the data science type analysis of a script going through consecutive stages,
+each reading a wide dataframe (with an entry for each of its columns in the analysis states)
+that is no longer used in the next stages, with and without forgetting the dead variables
+(cf. ``Runner.collecting``), and size of the analysis states.
+
+:Author: Caterina Urban
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+import warnings
+from contextlib import redirect_stdout
+
+import lyra.config as config
+import lyra.core.diagnostics as diagnostics
+from lyra.core.diagnostics import CollectingSink
+from lyra.engine.assumption.assumption_analysis import ForwardDatascienceTypeAnalysis
+
+STAGE = """
+df{i} = pd.read_csv('data.csv')
+total{i} = df{i}['c0'] + df{i}['c1']
+if total{i}.mean() > 1:
+    df{i} = df{i}.dropna()
+else:
+    df{i} = df{i}.fillna(0)
+for c{i} in df{i}.columns:
+    print(df{i}[c{i}].mean())
+plt.plot(df{i}['c0'])
+"""
+
+
+def program(stages: int) -> str:
+    lines = ["import pandas as pd", "import matplotlib.pyplot as plt"]
+    lines += [STAGE.format(i=i) for i in range(stages)]
+    return "\n".join(lines)
+
+
+def analyze(path: str, collecting: bool):
+    runner = ForwardDatascienceTypeAnalysis('potential')
+    runner.rendering, runner.viewing, runner.checking = None, False, False
+    runner.collecting = collecting
+    config.args = argparse.Namespace(python_file=path)     # the data is read relative to the script
+    start = time.perf_counter()
+    with warnings.catch_warnings(), redirect_stdout(io.StringIO()), \
+            diagnostics.reporting(CollectingSink()) as sink:
+        warnings.simplefilter('ignore')
+        result = runner.main(path)
+    elapsed = time.perf_counter() - start
+    sizes = [len(state.store) for contexts in result.result.values()
+             for states in contexts.values() for state in states]
+    reported = {(d.category.__name__, d.line, d.message) for d in sink.diagnostics}
+    return elapsed, max(sizes), sum(sizes) / len(sizes), reported
+
+
+def benchmark(columns: int, stages: int):
+    with tempfile.TemporaryDirectory() as directory:
+        data = os.path.join(directory, 'data.csv')
+        with open(data, 'w') as csv:
+            csv.write(",".join(f"c{j}" for j in range(columns)) + "\n")
+            for row in range(20):
+                csv.write(",".join(str(row * j % 7) for j in range(columns)) + "\n")
+        path = os.path.join(directory, 'script.py')
+        with open(path, 'w') as script:
+            script.write(program(stages))
+        whole, largest, average, expected = analyze(path, False)
+        collected, _largest, _average, reported = analyze(path, True)
+    print(f"--- {stages} stages over {columns} columns ---")
+    print(f"{'all variables':>28}: {whole * 1e3:10.1f} ms (entries: {average:.0f} on average, {largest} at most)")
+    print(f"{'dead variables forgotten':>28}: {collected * 1e3:10.1f} ms "
+          f"(entries: {_average:.0f} on average, {_largest} at most)")
+    print(f"{'same warnings':>28}: {reported == expected}")
+
+
+if __name__ == '__main__':
+    for c, s in ((50, 10), (200, 30)):
+        benchmark(c, s)
@@ -0,0 +1,58 @@
+"""
+Fulara Lattice - Benchmark
+==========================
+
+Times the join, meet, widening and ordering of dictionary abstractions
+with many literal-keyed segments (e.g., configuration dictionaries or feature maps).
+
+:Author: Caterina Urban
+"""
+import timeit
+from copy import deepcopy
+
+from lyra.abstract_domains.container.fulara import fulara_domain
+from lyra.abstract_domains.container.fulara.fulara_lattice import FularaLattice
+from lyra.abstract_domains.container.fulara.interval_wrappers import IntervalKWrapper, IntervalVWrapper
+from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.types import IntegerLyraType
+
+k_var = VariableIdentifier(IntegerLyraType(), fulara_domain.k_name)
+v_var = VariableIdentifier(IntegerLyraType(), fulara_domain.v_name)
+
+
+def segment(key: int, value: int):
+    k = IntervalKWrapper(set(), k_var)
+    k.store[k_var] = IntervalLattice(key, key)
+    v = IntervalVWrapper(set(), v_var)
+    v.store[v_var] = IntervalLattice(value, value)
+    return k, v
+
+
+def dictionary(keys: range, value: int = 0) -> FularaLattice:
+    """Abstraction of a dictionary with the given (literal) keys."""
+    segments = {segment(key, value) for key in keys}
+    return FularaLattice(IntervalKWrapper, IntervalVWrapper, {'scalar_variables': set(), 'k_var': k_var},
+                         {'scalar_variables': set(), 'v_var': v_var}, segments)
+
+
+def benchmark(size: int, number: int = 3):
+    one = dictionary(range(size))
+    other = dictionary(range(size // 2, size + size // 2), 1)
+    joined = deepcopy(one).join(other)
+    timings = {
+        'join': lambda: deepcopy(one).join(other),
+        'meet': lambda: deepcopy(one).meet(other),
+        'widening': lambda: deepcopy(one).widening(joined),
+        'less equal': lambda: one.less_equal(joined),
+        'deepcopy': lambda: deepcopy(one),
+    }
+    print(f"--- {size} segments ({number} runs) ---")
+    for name, statement in timings.items():
+        seconds = timeit.timeit(statement, number=number)
+        print(f"{name:>28}: {seconds * 1e3 / number:10.2f} ms")
+
+
+if __name__ == '__main__':
+    for n in (10, 50, 200):
+        benchmark(n)
@@ -0,0 +1,107 @@
+"""
+Expressions - Benchmark
+=======================
+
+Memory and throughput of the representation of expressions (and statements)
+on the data science type analysis of the programs in ``unittests/datascience``:
+time to build the control flow graphs and to analyze them, number of live expressions,
+and memory allocated by the control flow graphs and by the analysis.
+
+Also times the hashing and equality of (deep) composite expressions
+and the lookup of variables in a store.
+
+Run from the ``unittests`` directory.
+
+:Author: Caterina Urban
+"""
+import ast
+import gc
+import glob
+import io
+import os
+import time
+import timeit
+import tracemalloc
+import warnings
+from contextlib import redirect_stdout
+
+from lyra.core.expressions import Expression, VariableIdentifier, BinaryArithmeticOperation, Subscription, \
+    Literal, ListDisplay
+from lyra.core.types import IntegerLyraType, ListLyraType
+from lyra.datascience.datascience_type_domain import DatascienceTypeState
+from lyra.engine.forward import ForwardInterpreter
+from lyra.frontend.cfg_generator import ast_to_cfgs, ast_to_fargs
+from lyra.semantics.datascience_type_semantics import DatascienceTypeSemantics
+
+
+def corpus():
+    paths = glob.glob(os.path.join(os.getcwd(), 'datascience', '**', '*.py'), recursive=True)
+    return sorted(path for path in paths if os.path.basename(path) != '__init__.py')
+
+
+def expressions() -> int:
+    """Number of live expressions."""
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, Expression))
+
+
+def analysis(paths):
+    sources = [ast.parse(open(path, encoding='utf-8').read()) for path in paths]
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    programs = [(ast_to_cfgs(tree), ast_to_fargs(tree)) for tree in sources]
+    built = time.perf_counter() - start
+    cfgs, _ = tracemalloc.get_traced_memory()
+    count = expressions()
+    start = time.perf_counter()
+    results = list()
+    with warnings.catch_warnings(), redirect_stdout(io.StringIO()):
+        warnings.simplefilter('ignore')
+        for graphs, fargs in programs:
+            interpreter = ForwardInterpreter(graphs, fargs, DatascienceTypeSemantics(), 3, warning_level='potential')
+            try:
+                results.append(interpreter.analyze(graphs[''], DatascienceTypeState(graphs[''].variables)))
+            except Exception:   # some programs of the corpus are not supported by the analysis
+                pass
+    analyzed = time.perf_counter() - start
+    total, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"--- {len(paths)} programs ({len(results)} analyzed) ---")
+    print(f"{'control flow graphs':>28}: {built * 1e3:10.1f} ms {cfgs / 1024:10.1f} KiB")
+    print(f"{'live expressions':>28}: {count:10d}")
+    print(f"{'analysis':>28}: {analyzed * 1e3:10.1f} ms {(total - cfgs) / 1024:10.1f} KiB (peak {peak / 1024:.1f} KiB)")
+    print(f"{'live expressions':>28}: {expressions():10d}")
+
+
+def composite(depth: int) -> Expression:
+    x = VariableIdentifier(ListLyraType(IntegerLyraType()), 'x')
+    expr = Literal(IntegerLyraType(), '0')
+    for i in range(depth):
+        item = Subscription(IntegerLyraType(), x, Literal(IntegerLyraType(), str(i)))
+        display = ListDisplay(ListLyraType(IntegerLyraType()), [item, Literal(IntegerLyraType(), str(i))])
+        expr = BinaryArithmeticOperation(IntegerLyraType(), Subscription(IntegerLyraType(), display, item),
+                                         BinaryArithmeticOperation.Operator.Add, expr)
+    return expr
+
+
+def operations(depth: int, number: int = 1000):
+    expr, other = composite(depth), composite(depth)
+    variables = {VariableIdentifier(IntegerLyraType(), f'v{i}') for i in range(100)}
+    store = DatascienceTypeState(variables).store
+    key = VariableIdentifier(IntegerLyraType(), 'v50')
+    timings = {
+        'hash': lambda: hash(expr),
+        'equality': lambda: expr == other,
+        'construction': lambda: composite(depth),
+        'store lookup': lambda: store[key],
+    }
+    print(f"--- expressions of depth {depth} ({number} runs) ---")
+    for name, statement in timings.items():
+        seconds = timeit.timeit(statement, number=number)
+        print(f"{name:>28}: {seconds * 1e6 / number:10.2f} us")
+
+
+if __name__ == '__main__':
+    analysis(corpus())
+    for d in (1, 10, 50):
+        operations(d)
@@ -0,0 +1,45 @@
+"""
+State Hashing - Micro-Benchmark
+===============================
+
+Compares the former string-based hashing and equality of analysis states
+(rendering the whole store as a sorted string) with the structural ones,
+on data science type states of increasing size.
+
+:Author: Caterina Urban
+"""
+import timeit
+from copy import deepcopy
+
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.types import IntegerLyraType, FloatLyraType, StringLyraType
+from lyra.datascience.datascience_type_domain import DatascienceTypeState
+
+
+def state(size: int) -> DatascienceTypeState:
+    types = [IntegerLyraType(), FloatLyraType(), StringLyraType()]
+    variables = {VariableIdentifier(types[i % 3], f'v{i}') for i in range(size)}
+    return DatascienceTypeState(variables)
+
+
+def benchmark(size: int, number: int = 1000):
+    context = state(size)
+    other = deepcopy(context)
+    result = {context: []}
+    timings = {
+        'repr hash': lambda: hash(repr(context)),
+        'repr equality': lambda: repr(context) == repr(other),
+        'structural hash': lambda: hash(context),
+        'structural equality': lambda: context == other,
+        'structural hash (uncached)': lambda: hash(context._structural_key()),
+        'context lookup': lambda: result[context],
+    }
+    print(f"--- {size} variables ({number} runs) ---")
+    for name, statement in timings.items():
+        seconds = timeit.timeit(statement, number=number)
+        print(f"{name:>28}: {seconds * 1e6 / number:10.2f} us")
+
+
+if __name__ == '__main__':
+    for n in (10, 100, 1000):
+        benchmark(n)
@@ -0,0 +1,54 @@
+"""
+Analysis Result - Benchmark
+===========================
+
+Memory retained by the analysis result of a long straight-line program over many variables,
+with the states stored compactly (as in the analysis result) and with all states kept as a whole,
+and time to retrieve the states from the analysis result.
+
+:Author: Caterina Urban
+"""
+import ast
+import gc
+import time
+import tracemalloc
+
+from lyra.abstract_domains.numerical.interval_domain import IntervalStateWithSummarization
+from lyra.engine.forward import ForwardInterpreter
+from lyra.frontend.cfg_generator import ast_to_cfgs, ast_to_fargs
+from lyra.semantics.forward import DefaultForwardSemantics
+
+
+def program(variables: int, statements: int) -> str:
+    lines = [f"x{i}: int = {i}" for i in range(variables)]
+    lines += [f"x{i % variables}: int = x{i * 7 % variables} + 1" for i in range(statements)]
+    return "\n".join(lines) + "\n"
+
+
+def benchmark(variables: int, statements: int):
+    tree = ast.parse(program(variables, statements))
+    cfgs, fargs = ast_to_cfgs(tree), ast_to_fargs(tree)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    interpreter = ForwardInterpreter(cfgs, fargs, DefaultForwardSemantics(), 3)
+    result = interpreter.analyze(cfgs[''], IntervalStateWithSummarization(cfgs[''].variables))
+    analyzed = time.perf_counter() - start
+    gc.collect()
+    compact, peak = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    whole = [list(states) for contexts in result.result.values() for states in contexts.values()]
+    retrieved = time.perf_counter() - start
+    gc.collect()
+    total, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"--- {statements} statements over {variables} variables ---")
+    print(f"{'analysis':>28}: {analyzed * 1e3:10.1f} ms (peak {peak / 1024:.1f} KiB)")
+    print(f"{'compact result':>28}: {compact / 1024:10.1f} KiB")
+    print(f"{'whole states':>28}: {(total - compact) / 1024:10.1f} KiB")
+    print(f"{'retrieval':>28}: {retrieved * 1e3:10.1f} ms ({sum(map(len, whole))} states)")
+
+
+if __name__ == '__main__':
+    for v, s in ((50, 500), (300, 2000)):
+        benchmark(v, s)
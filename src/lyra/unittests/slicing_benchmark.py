@@ -0,0 +1,80 @@
+"""
+Demand-Driven Analysis - Benchmark
+==================================
+
+Time of the data science type analysis of a long script, most of which does not involve
+library calls with warning rules, with and without slicing it to the statements
+that can influence those calls (cf. ``Runner.slicing``),
+and warnings reported by both.
+
+:Author: Caterina Urban
+"""
+import io
+import os
+import tempfile
+import time
+import warnings
+from contextlib import redirect_stdout
+
+import lyra.core.diagnostics as diagnostics
+from lyra.core.diagnostics import CollectingSink
+from lyra.engine.assumption.assumption_analysis import ForwardDatascienceTypeAnalysis
+
+PIPELINE = """
+df{i} = pd.DataFrame({{'a': range(10), 'b': range(10)}})
+scaled{i} = MinMaxScaler().fit_transform(df{i})
+X_train{i}, X_test{i} = train_test_split(scaled{i}, test_size=0.2)
+plt.plot(df{i}['a'])
+"""
+
+BOOKKEEPING = """
+width{j}: int = {j} * 2
+height{j}: int = width{j} + 3
+area{j}: int = width{j} * height{j}
+label{j}: str = 'run ' + str(area{j})
+log{j}: List[str] = [label{j}, str(width{j})]
+print(label{j})
+"""
+
+
+def program(pipelines: int, bookkeeping: int) -> str:
+    lines = ["from typing import List", "import pandas as pd", "import matplotlib.pyplot as plt",
+             "from sklearn.model_selection import train_test_split",
+             "from sklearn.preprocessing import MinMaxScaler"]
+    for j in range(bookkeeping):
+        lines.append(BOOKKEEPING.format(j=j))
+        if j % (bookkeeping // pipelines) == 0:
+            lines.append(PIPELINE.format(i=j))
+    return "\n".join(lines)
+
+
+def analyze(path: str, slicing: bool):
+    runner = ForwardDatascienceTypeAnalysis('potential')
+    runner.rendering, runner.viewing, runner.checking = None, False, False
+    runner.slicing = slicing
+    start = time.perf_counter()
+    with warnings.catch_warnings(), redirect_stdout(io.StringIO()), \
+            diagnostics.reporting(CollectingSink()) as sink:
+        warnings.simplefilter('ignore')
+        runner.main(path)
+    reported = {(d.category.__name__, d.line) for d in sink.diagnostics}
+    return time.perf_counter() - start, reported, runner.slicer
+
+
+def benchmark(pipelines: int, bookkeeping: int):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'script.py')
+        with open(path, 'w') as script:
+            script.write(program(pipelines, bookkeeping))
+        whole, expected, _ = analyze(path, False)
+        sliced, reported, slicer = analyze(path, True)
+    calls = {w for w in expected if w[0] in ('DataLeakageWarning', 'ReproducibilityWarning', 'CategoricalPlotWarning')}
+    print(f"--- {pipelines} pipelines among {bookkeeping} bookkeeping blocks ---")
+    print(f"{'whole program':>28}: {whole * 1e3:10.1f} ms")
+    print(f"{'demand-driven':>28}: {sliced * 1e3:10.1f} ms ({slicer.kept}/{slicer.total} statements)")
+    print(f"{'library call warnings':>28}: {len(calls):10d} (all reported: {calls <= reported})")
+
+
+if __name__ == '__main__':
+    for p, b in ((5, 50), (10, 200)):
+        benchmark(p, b)
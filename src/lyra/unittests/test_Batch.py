@@ -0,0 +1,103 @@
+"""
+Batch Analysis - Unit Tests
+===========================
+
+:Author: Caterina Urban
+"""
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+
+import lyra.core.diagnostics as diagnostics
+from lyra.engine.batch import Batch, BatchResult, collect
+from lyra.engine.runner import Runner
+from lyra.main import batch
+
+PROGRAMS = {
+    'seed.py': "import numpy as np\nb = np.random.seed(0)\n",
+    'split.py': "from sklearn.model_selection import train_test_split\n"
+                "X_train, X_test = train_test_split([1, 2, 3])\n"
+}
+
+
+class FakeRunner(Runner):
+
+    def interpreter(self):
+        pass
+
+    def state(self):
+        pass
+
+    def main(self, path):
+        print(f"Analyzing {path}")
+        if path == 'loop':
+            time.sleep(60)
+        elif path == 'crash':
+            os._exit(1)
+        elif path == 'error':
+            raise ValueError(path)
+        diagnostics.warn(f"Warning: {path}", UserWarning, level='potential')
+
+
+def factory(_):
+    return FakeRunner()
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_run(self):
+        paths = ['a', 'loop', 'b', 'crash', 'error', 'c']
+        results = {r.path: r for r in Batch(factory, workers=2, timeout=1).run(paths)}
+        self.assertEqual(set(results), set(paths))
+        for path in ['a', 'b', 'c']:
+            self.assertEqual(results[path].status, BatchResult.Status.OK)
+            messages = [diagnostic.message for diagnostic in results[path].diagnostics]
+            self.assertEqual(messages, [f'Warning: {path}'])
+        self.assertEqual(results['loop'].status, BatchResult.Status.TIMEOUT)
+        self.assertEqual(results['crash'].status, BatchResult.Status.CRASH)
+        self.assertEqual(results['error'].status, BatchResult.Status.ERROR)
+        self.assertTrue(results['error'].error.startswith('ValueError: error'))
+
+    def test_collect(self):
+        directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'usage')
+        paths = collect([directory, os.path.join(directory, '*.py')])
+        self.assertTrue(paths)
+        self.assertTrue(all(path.endswith('.py') for path in paths))
+        self.assertEqual(len(paths), len(set(paths)))
+
+
+class TestBatchDiagnostics(unittest.TestCase):
+
+    def run_batch(self, diagnostics_format: str):
+        with tempfile.TemporaryDirectory() as directory:
+            for name, program in PROGRAMS.items():
+                with open(os.path.join(directory, name), 'w') as script:
+                    script.write(program)
+            output = os.path.join(directory, 'diagnostics')
+            argv = [directory, '--analysis', 'type-datascience', '--workers', '2',
+                    '--diagnostics', diagnostics_format, '--diagnostics-output', output]
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(batch(argv), 0)
+            with open(output) as stream:
+                return stream.read()
+
+    def test_jsonl(self):
+        records = [json.loads(line) for line in self.run_batch('jsonl').splitlines()]
+        summaries = [os.path.basename(r['file']) for r in records if r['kind'] == 'summary']
+        self.assertEqual(sorted(summaries), sorted(PROGRAMS))     # one summary per program
+        self.assertTrue(all(r['status'] == 'ok' for r in records if r['kind'] == 'summary'))
+        rules = sorted(r['rule'] for r in records if r['kind'] == 'diagnostic')
+        self.assertEqual(rules, ['DS003', 'DS010'])
+
+    def test_sarif(self):
+        log = json.loads(self.run_batch('sarif'))
+        rules = sorted(result['ruleId'] for result in log['runs'][0]['results'])
+        self.assertEqual(rules, ['DS003', 'DS010'])
+
+
+if __name__ == '__main__':
+    unittest.main()
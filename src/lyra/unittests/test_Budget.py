@@ -0,0 +1,122 @@
+"""
+Analysis Budget - Unit Tests
+============================
+
+:Author: Caterina Urban
+"""
+import ast
+import time
+import unittest
+import warnings
+
+import lyra.core.diagnostics as diagnostics
+from lyra.abstract_domains.numerical.interval_domain import IntervalStateWithSummarization
+from lyra.core.cfg import Loop
+from lyra.core.diagnostics import CollectingSink, PrecisionDegradedWarning
+from lyra.engine.backward import BackwardInterpreter
+from lyra.engine.budget import Budget
+from lyra.engine.forward import ForwardInterpreter
+from lyra.frontend.cfg_generator import ast_to_cfgs, ast_to_fargs
+from lyra.semantics.backward import DefaultBackwardSemantics
+from lyra.semantics.forward import DefaultForwardSemantics
+
+LOOP = """
+x: int = 0
+y: int = 0
+while x < 30:
+    x = x + 1
+    y = y + 2
+"""
+
+PROGRAM = """
+def count(n: int):
+    i: int = 0
+    while i < n:
+        i = i + 1
+    return i
+""" + LOOP + """
+z: int = count(x)
+"""
+
+
+def analyze(budget: Budget = None, backward: bool = False):
+    tree = ast.parse(LOOP if backward else PROGRAM)
+    cfgs, fargs = ast_to_cfgs(tree), ast_to_fargs(tree)
+    if backward:
+        interpreter = BackwardInterpreter(cfgs, fargs, DefaultBackwardSemantics(), 1000)
+    else:   # a widening threshold high enough for the loop to be unrolled
+        interpreter = ForwardInterpreter(cfgs, fargs, DefaultForwardSemantics(), 1000)
+    interpreter.budget = budget
+    with diagnostics.reporting(CollectingSink()) as sink:
+        result = interpreter.analyze(cfgs[''], IntervalStateWithSummarization(cfgs[''].variables))
+    node = cfgs[''].in_node if backward else cfgs[''].out_node
+    state = next(iter(result.get_node_result(node).values()))[0 if backward else -1]
+    return interpreter, str(state), sink.diagnostics
+
+
+class TestBudget(unittest.TestCase):
+
+    def setUp(self):
+        warnings.simplefilter('ignore')
+
+    def tearDown(self):
+        warnings.resetwarnings()
+
+    def test_unbounded(self):
+        interpreter, state, reported = analyze()
+        self.assertGreater(interpreter.visits, 1000)
+        self.assertIn('x -> [30, 30]', state)
+        self.assertEqual(reported, [])
+
+    def test_visits(self):
+        budget = Budget(visits=50)
+        interpreter, state, reported = analyze(budget)
+        self.assertLess(interpreter.visits, 200)
+        self.assertIn('x -> [30, inf]', state)
+        self.assertIn('widening', {action for fname, _, action in budget.degraded if fname == ''})
+        self.assertTrue(all(d.category is PrecisionDegradedWarning for d in reported))
+        self.assertIn(10, {d.line for d in reported})  # the line of the loop of the program
+
+    def test_top(self):
+        budget = Budget(function_visits=2)
+        interpreter, state, _ = analyze(budget)
+        self.assertLess(interpreter.visits, 50)
+        self.assertIn(('', 'top'), {(fname, action) for fname, _, action in budget.degraded})
+
+    def test_size(self):
+        budget = Budget(size=5)
+        interpreter, state, reported = analyze(budget)
+        self.assertIn('y -> [-inf, inf]', state)
+        self.assertIn('state size budget of 5', reported[0].message)
+
+    def test_time(self):
+        budget = Budget(time=0)
+        budget.start()
+        interpreter, _, reported = analyze(budget)
+        self.assertLess(interpreter.visits, 50)
+        self.assertTrue(reported)
+
+    def test_first_visit(self):
+        budget = Budget(function_visits=10)
+        tree = ast.parse(LOOP)
+        cfgs = ast_to_cfgs(tree)
+        cfg = cfgs['']
+        interpreter = ForwardInterpreter(cfgs, ast_to_fargs(tree), DefaultForwardSemantics(), 3)
+        loop = next(node for node in cfg.nodes.values() if isinstance(node, Loop))
+        entry = IntervalStateWithSummarization(cfg.variables)
+        expected = str(entry)
+        with diagnostics.reporting(CollectingSink()) as sink:
+            entry = budget.degrade(interpreter, cfg, loop, None, entry, time.time(), 15)
+        self.assertEqual(str(entry), expected)     # nothing to widen with yet
+        self.assertEqual(budget.degraded, [])
+        self.assertEqual(sink.diagnostics, [])
+
+    def test_backward(self):
+        budget = Budget(visits=20)
+        interpreter, _, reported = analyze(budget, backward=True)
+        self.assertLess(interpreter.visits, analyze(backward=True)[0].visits)
+        self.assertTrue(budget.degraded)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Control Flow Graph Cache - Unit Tests
+=====================================
+
+:Author: Caterina Urban
+"""
+import ast
+import os
+import tempfile
+import unittest
+
+from lyra.frontend.cache import CFGCache
+from lyra.frontend.cfg_generator import ast_to_cfgs, ast_to_fargs
+
+PROGRAM = """
+def f(x: int) -> int:
+    return x + 1
+
+y: int = int(input())
+while y < 10:
+    y = f(y)
+print(y)
+"""
+
+
+def frontend(source: str):
+    tree = ast.parse(source)
+    return ast_to_cfgs(tree), ast_to_fargs(tree)
+
+
+class TestCFGCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = CFGCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_roundtrip(self):
+        self.assertIsNone(self.cache.get(PROGRAM))
+        cfgs, fargs = frontend(PROGRAM)
+        self.cache.put(PROGRAM, cfgs, fargs)
+        cached_cfgs, cached_fargs = self.cache.get(PROGRAM)
+        self.assertEqual(set(cached_cfgs), set(cfgs))
+        for fname, cfg in cfgs.items():
+            cached = cached_cfgs[fname]
+            self.assertEqual(set(cached.nodes), set(cfg.nodes))
+            self.assertEqual(set(cached.edges), set(cfg.edges))
+            for identifier, node in cfg.nodes.items():
+                self.assertEqual(str(cached.nodes[identifier]), str(node))
+        self.assertEqual(cached_fargs, fargs)
+        self.assertIsNone(self.cache.get(PROGRAM + "print(y)\n"))
+
+    def test_corrupted(self):
+        cfgs, fargs = frontend(PROGRAM)
+        self.cache.put(PROGRAM, cfgs, fargs)
+        path = os.path.join(self.directory.name, f'{self.cache.key(PROGRAM)}.pickle')
+        with open(path, 'wb') as entry:
+            entry.write(b'corrupted')
+        self.assertIsNone(self.cache.get(PROGRAM))
+        self.assertFalse(os.path.exists(path))
+
+    def test_eviction(self):
+        programs = [PROGRAM + f"z{i}: int = {i}\n" for i in range(3)]
+        cfgs, fargs = frontend(programs[0])
+        self.cache.put(programs[0], cfgs, fargs)
+        size = os.path.getsize(os.path.join(self.directory.name, f'{self.cache.key(programs[0])}.pickle'))
+        self.cache = CFGCache(self.directory.name, size=int(size * 2.5))
+        for i, program in enumerate(programs):
+            path = os.path.join(self.directory.name, f'{self.cache.key(program)}.pickle')
+            self.cache.put(program, *frontend(program))
+            os.utime(path, (i, i))      # least recently used first
+        self.assertIsNone(self.cache.get(programs[0]))
+        self.assertIsNotNone(self.cache.get(programs[1]))
+        self.assertIsNotNone(self.cache.get(programs[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Caller View - Unit Tests
+========================
+
+:Author: Caterina Urban
+"""
+import ast
+import copy
+import unittest
+from unittest import mock
+
+from lyra.core.expressions import Literal, Subscription, VariableIdentifier
+from lyra.core.statements import AttributeAccess
+from lyra.core.types import StringLyraType, TopLyraType
+from lyra.datascience.datascience_type_domain import DatascienceTypeLattice, DatascienceTypeState
+from lyra.engine.forward import ForwardInterpreter
+from lyra.frontend.cfg_generator import ast_to_cfgs, ast_to_fargs
+from lyra.semantics.datascience_type_semantics import DatascienceTypeSemantics
+from lyra.semantics.utilities import CallerView
+
+PROGRAM = """
+import pandas as pd
+df = pd.DataFrame()
+df.head()
+df["a"].head()
+df.a.head()
+df.dropna().head()
+"""
+
+
+class TestCallerView(unittest.TestCase):
+
+    def setUp(self):
+        tree = ast.parse(PROGRAM)
+        cfgs = ast_to_cfgs(tree)
+        self.semantics = DatascienceTypeSemantics()
+        self.interpreter = ForwardInterpreter(cfgs, ast_to_fargs(tree), self.semantics, 3)
+        nodes = cfgs[''].nodes
+        statements = [stmt for identifier in sorted(nodes) for stmt in nodes[identifier].stmts]
+        self.state = DatascienceTypeState(cfgs[''].variables)
+        for statement in statements[:2]:     # import pandas as pd; df = pd.DataFrame()
+            self.state = self.semantics.semantics(statement, self.state, self.interpreter)
+        self.variable, self.subscription, self.attribute, self.chained = statements[2:]
+
+    def get_caller(self, call):
+        """Retrieve the caller of a call, checking that the state is left untouched.
+
+        :param call: call whose caller is retrieved
+        :return: caller of the call, and whether the state was copied to retrieve it
+        """
+        before = copy.deepcopy(self.state)
+        with mock.patch('copy.deepcopy', wraps=copy.deepcopy) as deepcopy:
+            caller = self.semantics.get_caller(call, self.state, self.interpreter)
+        self.assertEqual(self.state, before)
+        self.assertEqual(str(self.state), str(before))
+        self.assertEqual(self.state.result, before.result)
+        return caller, deepcopy.called
+
+    def test_variable(self):
+        caller, copied = self.get_caller(self.variable)
+        self.assertEqual(caller, VariableIdentifier(None, 'df'))
+        self.assertFalse(copied)
+
+    def test_subscription(self):
+        caller, copied = self.get_caller(self.subscription)
+        key = Literal(StringLyraType(), 'a')
+        self.assertEqual(caller, Subscription(TopLyraType, VariableIdentifier(None, 'df'), key))
+        self.assertFalse(copied)
+
+    def test_attribute(self):
+        caller, copied = self.get_caller(self.attribute)
+        self.assertIsInstance(caller, AttributeAccess)
+        self.assertEqual(caller.target.variable, VariableIdentifier(None, 'df'))
+        self.assertEqual(caller.attr.name, 'a')
+        self.assertFalse(copied)
+
+    def test_chained(self):
+        caller, copied = self.get_caller(self.chained)
+        self.assertIn(DatascienceTypeLattice.Status.DataFrame, caller)
+        self.assertTrue(copied)
+
+    def test_view(self):
+        view = CallerView()
+        self.assertEqual(view.result, set())
+        with self.assertRaises(AttributeError):
+            view.store
+        with self.assertRaises(AttributeError):
+            view.store = dict()
+
+
+if __name__ == '__main__':
+    unittest.main()
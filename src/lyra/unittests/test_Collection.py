@@ -0,0 +1,126 @@
+"""
+Garbage Collection - Unit Tests
+===============================
+
+:Author: Caterina Urban
+"""
+import argparse
+import ast
+import io
+import os
+import tempfile
+import unittest
+import warnings
+from contextlib import redirect_stdout
+
+import lyra.config as config
+import lyra.core.diagnostics as diagnostics
+from lyra.core.cfg import Loop
+from lyra.core.diagnostics import CollectingSink
+from lyra.core.expressions import VariableIdentifier, Subscription, Literal, Status
+from lyra.core.types import IntegerLyraType, StringLyraType, TopLyraType
+from lyra.datascience.datascience_type_domain import DatascienceTypeState, DatascienceTypeLattice, DataProperties
+from lyra.engine.assumption.assumption_analysis import ForwardDatascienceTypeAnalysis
+from lyra.engine.collection import Collector
+from lyra.frontend.cfg_generator import ast_to_cfgs
+
+PROGRAM = """
+import pandas as pd
+df = pd.read_csv('data.csv')
+size: int = len(df)
+other = df.dropna()
+while size > 0:
+    size = size - 1
+print(other['a'].mean())
+"""
+
+
+def node(cfg, text: str):
+    """Node of a control flow graph with a statement containing the given text."""
+    return next(n for n in cfg.nodes.values() if any(text in str(stmt) for stmt in n.stmts))
+
+
+def analyze(collecting: bool):
+    runner = ForwardDatascienceTypeAnalysis('potential')
+    runner.rendering, runner.viewing, runner.checking = None, False, False
+    runner.collecting = collecting
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, 'data.csv'), 'w') as data:
+            data.write("a,b,c\n1,x,\n2,y,3\n2,y,3\n")
+        path = os.path.join(directory, 'script.py')
+        with open(path, 'w') as script:
+            script.write(PROGRAM)
+        config.args = argparse.Namespace(python_file=path)
+        with warnings.catch_warnings(), redirect_stdout(io.StringIO()), \
+                diagnostics.reporting(CollectingSink()) as sink:
+            warnings.simplefilter('ignore')
+            result = runner.main(path)
+    return {(d.category.__name__, d.line, d.message) for d in sink.diagnostics}, runner, result
+
+
+class TestCollector(unittest.TestCase):
+
+    def setUp(self):
+        self.cfg = ast_to_cfgs(ast.parse(PROGRAM))['']
+        self.collector = Collector(self.cfg)
+
+    def names(self, text: str):
+        return {variable.name for variable in self.collector.dead(node(self.cfg, text))}
+
+    def test_dead(self):
+        self.assertEqual(self.names('read_csv'), set())
+        self.assertIn('df', self.names('print'))
+        self.assertNotIn('other', self.names('print'))
+        self.assertIn('size', self.names('print'))
+
+    def test_loop(self):
+        body = node(self.cfg, 'sub(size')
+        self.assertNotIn('size', self.names('sub(size'))
+        head = next(iter(self.cfg.successors(body)))
+        self.assertIsInstance(head, Loop)
+        dead = {variable.name for variable in self.collector.dead(head)}
+        self.assertNotIn('size', dead)      # the loop condition is evaluated again
+        self.assertIn('df', dead)
+
+
+class TestCollect(unittest.TestCase):
+
+    def setUp(self):
+        self.df = VariableIdentifier(TopLyraType, 'df')
+        self.x = VariableIdentifier(IntegerLyraType(), 'x')
+        self.state = DatascienceTypeState({self.df, self.x})
+        self.state.store[self.df] = DatascienceTypeLattice(DatascienceTypeLattice.Status.DataFrame)
+        self.column = Subscription(TopLyraType, self.df, Literal(StringLyraType(), 'a'))
+        self.state._assign(self.column, DatascienceTypeLattice.Status.NumericSeries)
+
+    def test_collect(self):
+        self.assertIn(self.column, self.state.store)
+        self.state.collect({self.df, self.x})
+        self.assertEqual(len(self.state.store), 0)
+        self.assertFalse(self.state.subscriptions)
+        self.assertEqual(self.state.variables, {self.df, self.x})     # the variables are left unchanged
+
+    def test_checked(self):
+        self.state.set_properties(self.df, DataProperties(has_duplicates=Status.YES))
+        self.state.collect({self.df, self.x})
+        self.assertEqual(set(self.state.store), {self.df})     # needed at the end of the program
+        self.assertEqual(self.state.get_properties(self.df).has_duplicates, Status.YES)
+        self.assertFalse(self.state.subscriptions)
+
+
+class TestCollecting(unittest.TestCase):
+
+    def test_warnings(self):
+        expected, _, result = analyze(False)
+        reported, runner, collected = analyze(True)
+        self.assertTrue(expected)
+        self.assertEqual(reported, expected)
+        out = runner.cfgs[''].out_node
+        whole = list(result.get_node_result(out).values())[0][0]
+        state = list(collected.get_node_result(out).values())[0][0]
+        self.assertLess(len(state.store), len(whole.store))
+        self.assertEqual(state.variables, whole.variables)
+
+
+if __name__ == '__main__':
+    unittest.main()
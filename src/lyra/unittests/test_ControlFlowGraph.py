@@ -0,0 +1,73 @@
+"""
+Control Flow Graph - Unit Tests
+===============================
+
+:Author: Caterina Urban
+"""
+import ast
+import unittest
+
+from lyra.core.cfg import Basic, Unconditional, ControlFlowGraph
+from lyra.frontend.cfg_generator import ast_to_cfgs, LooseControlFlowGraph
+
+PROGRAM = """
+x: int = int(input())
+while x > 0:
+    if x % 2 == 0:
+        x = x // 2
+    else:
+        x = x - 1
+print(x)
+"""
+
+
+class TestAdjacency(unittest.TestCase):
+
+    def assertConsistent(self, cfg: ControlFlowGraph):
+        for node in cfg.nodes.values():
+            in_edges = {edge for edge in cfg.edges.values() if edge.target == node}
+            out_edges = {edge for edge in cfg.edges.values() if edge.source == node}
+            self.assertEqual(cfg.in_edges(node), in_edges)
+            self.assertEqual(cfg.out_edges(node), out_edges)
+            self.assertEqual(cfg.predecessors(node), {edge.source for edge in in_edges})
+            self.assertEqual(cfg.successors(node), {edge.target for edge in out_edges})
+
+    def test_generated(self):
+        cfg = ast_to_cfgs(ast.parse(PROGRAM))['']
+        self.assertConsistent(cfg)
+        self.assertIsInstance(cfg.successors(cfg.in_node), frozenset)
+        self.assertIs(cfg.successors(cfg.in_node), cfg.successors(cfg.in_node))
+        with self.assertRaises(TypeError):
+            cfg.edges[(cfg.in_node, cfg.out_node)] = Unconditional(cfg.in_node, cfg.out_node)
+
+    def test_mutations(self):
+        nodes = {i: Basic(i) for i in range(1, 5)}
+        edges = {Unconditional(nodes[1], nodes[2]), Unconditional(nodes[2], nodes[3])}
+        loose = LooseControlFlowGraph(set(nodes.values()), nodes[1], nodes[3], edges)
+        self.assertEqual(loose.eject().successors(nodes[2]), {nodes[3]})
+        loose.add_edge(Unconditional(nodes[2], nodes[4]))
+        self.assertEqual(loose.eject().successors(nodes[2]), {nodes[3], nodes[4]})
+        replacement = Unconditional(nodes[2], nodes[4], Unconditional.Kind.IF_OUT)
+        loose.add_edge(replacement)     # replaces the previous edge between the same nodes
+        self.assertEqual([edge.kind for edge in loose.eject().in_edges(nodes[4])], [replacement.kind])
+        loose.remove_edge(replacement)
+        self.assertEqual(loose.eject().predecessors(nodes[4]), frozenset())
+        loose.remove_node(nodes[2])     # removes its outgoing edges
+        self.assertEqual(loose.eject().predecessors(nodes[3]), frozenset())
+        self.assertConsistent(loose.eject())
+
+
+class TestVariables(unittest.TestCase):
+
+    def test_memoized(self):
+        cfg = ast_to_cfgs(ast.parse(PROGRAM))['']
+        variables = cfg.variables
+        self.assertEqual({variable.name for variable in variables}, {'x'})
+        cached = cfg._variables
+        variables.clear()       # analysis states modify the set of variables they are created with
+        self.assertEqual({variable.name for variable in cfg.variables}, {'x'})
+        self.assertIs(cfg._variables, cached)
+
+
+if __name__ == '__main__':
+    unittest.main()
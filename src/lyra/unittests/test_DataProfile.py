@@ -0,0 +1,110 @@
+"""
+Data Profiling - Unit Tests
+===========================
+
+:Author: Caterina Urban
+"""
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+import lyra.datascience.profiling as profiling
+from lyra.datascience.profiling import Profiler, ProfileCache, locate, profile
+
+CSV = "id,price,label,score\n" + "".join(
+    f"{i},{(i * 7) % 13}.5,{'ab'[i % 2]},{'' if i == 17 else i // 10}\n" for i in range(40)
+) + "3,8.5,b,0\n"
+
+
+def reference(path: str, **options):
+    """Profile of a CSV file computed on the whole data (as it was before profiling)."""
+    import pandas as pd
+    frame = pd.read_csv(path, **options)
+    sorting = dict()
+    for column in frame.columns:
+        increasing, decreasing = frame[column].is_monotonic_increasing, frame[column].is_monotonic_decreasing
+        names = {(True, True): 'constant', (True, False): 'increasing', (False, True): 'decreasing'}
+        sorting[column] = names.get((increasing, decreasing), 'not_sorted')
+    dtypes = {c: 'object' if str(t) == 'str' else str(t) for c, t in frame.dtypes.items()}
+    return len(frame), dtypes, bool(frame.duplicated().any()), bool(frame.isna().values.any()), sorting
+
+
+def summary(result):
+    return result.rows, result.dtypes, result.has_duplicates, result.has_na_values, result.sorting
+
+
+class TestDataProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'data', 'train.csv')
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as data:
+            data.write(CSV)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_chunks(self):
+        expected = reference(self.path)
+        self.assertTrue(expected[2])    # the last row duplicates the fourth one
+        for chunk in (1, 3, 8, 100000):
+            self.assertEqual(summary(profile(self.path, chunk=chunk)), expected)
+        expected = reference(self.path, usecols=['id'])
+        self.assertEqual(summary(profile(self.path, {'usecols': ['id']}, chunk=4)), expected)
+        self.assertEqual(expected[4], {'id': 'not_sorted'})
+
+    def test_sample(self):
+        sampled = profile(self.path, rows=10, chunk=3)
+        self.assertEqual(sampled.rows, 10)
+        self.assertFalse(sampled.exact)
+        # the facts that do not hold for the rows read are unknown for the whole data
+        self.assertIsNone(sampled.is_small)
+        self.assertFalse(sampled.is_high_dimensional)   # more rows read than twice the columns
+        self.assertIsNone(sampled.has_duplicates)
+        self.assertIsNone(sampled.has_na_values)
+        self.assertNotIn('id', sampled.sorting)     # increasing among the rows read
+        self.assertEqual(sampled.sorting['price'], 'not_sorted')
+        self.assertTrue(profile(self.path, rows=20).has_na_values)      # in row 17
+        self.assertTrue(profile(self.path, rows=1000).exact)
+
+    def test_wide(self):
+        path = os.path.join(self.directory.name, 'wide.csv')
+        with open(path, 'w') as data:
+            data.write(",".join(f"c{j}" for j in range(20)) + "\n")
+            data.writelines(",".join(str(i * j) for j in range(20)) + "\n" for i in range(1000))
+        self.assertIsNone(profile(path, rows=10).is_high_dimensional)
+        self.assertFalse(profile(path).is_high_dimensional)
+        self.assertTrue(profile(path, {'nrows': 10}).is_high_dimensional)
+
+    def test_archive(self):
+        archive = os.path.join(self.directory.name, 'input.zip')
+        with zipfile.ZipFile(archive, 'w') as zipped:
+            zipped.write(self.path, 'train.csv')
+        path = os.path.join(self.directory.name, 'input', 'train.csv')
+        self.assertEqual(locate(path), (archive, 'train.csv'))
+        with mock.patch.object(zipfile.ZipFile, 'extractall') as extractall:
+            result = Profiler(archives=()).profile(path)
+        extractall.assert_not_called()
+        self.assertEqual(summary(result), reference(self.path))
+        with self.assertRaises(FileNotFoundError):
+            locate(os.path.join(self.directory.name, 'missing', 'train.csv'))
+
+    def test_cache(self):
+        cache = ProfileCache(os.path.join(self.directory.name, 'profiles'))
+        profiler = Profiler(cache)
+        expected = summary(profiler.profile(self.path))
+        with mock.patch.object(profiling, 'profile', side_effect=AssertionError) as read:
+            self.assertEqual(summary(profiler.profile(self.path)), expected)
+            read.assert_not_called()
+            with open(self.path, 'a') as data:
+                data.write("99,1.5,a,9\n")
+            with self.assertRaises(AssertionError):     # the data changed
+                profiler.profile(self.path)
+        self.assertNotEqual(cache.key(self.path, None, {}, None), cache.key(self.path, None, {}, 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Data Properties - Unit Tests
+============================
+
+:Author: Caterina Urban
+"""
+import unittest
+from copy import deepcopy
+
+from lyra.core.expressions import VariableIdentifier, Status
+from lyra.core.types import DataFrameLyraType
+from lyra.datascience.datascience_type_domain import DataProperties, DatascienceTypeState
+
+
+class TestDataProperties(unittest.TestCase):
+
+    def test_join(self):
+        known = DataProperties(has_duplicates=Status.YES, is_small=Status.NO)
+        other = DataProperties(has_duplicates=Status.YES, is_small=Status.YES)
+        self.assertEqual(known.join(other), DataProperties(has_duplicates=Status.YES))
+        self.assertTrue(known.less_equal(known.join(other)))
+        self.assertFalse(known.join(other).less_equal(known))
+        self.assertTrue(known.join(DataProperties(has_na_values=Status.NO)).is_top())
+
+    def test_replace(self):
+        known = DataProperties(has_duplicates=Status.YES)
+        self.assertEqual(known.replace(is_shuffled=Status.NO).is_shuffled, Status.NO)
+        self.assertEqual(known.is_shuffled, Status.MAYBE)
+        with self.assertRaises(ValueError):
+            DataProperties(has_duplicates=True)
+
+
+class TestStateProperties(unittest.TestCase):
+
+    def setUp(self):
+        self.df = VariableIdentifier(DataFrameLyraType('pandas'), 'df')
+        self.state = DatascienceTypeState({self.df})
+
+    def test_copy(self):
+        self.state.update_properties(self.df, has_duplicates=Status.YES)
+        copy = deepcopy(self.state)
+        copy.update_properties(VariableIdentifier(DataFrameLyraType('pandas'), 'df'), has_duplicates=Status.NO)
+        self.assertEqual(self.state.get_properties(self.df).has_duplicates, Status.YES)
+        self.assertEqual(copy.get_properties(self.df).has_duplicates, Status.NO)
+        self.assertNotEqual(self.state, copy)
+
+    def test_join(self):
+        self.state.update_properties(self.df, has_duplicates=Status.YES, has_na_values=Status.NO)
+        other = deepcopy(self.state)
+        other.update_properties(self.df, has_duplicates=Status.NO)
+        self.assertFalse(self.state.less_equal(other))
+        self.state.join(other)
+        self.assertEqual(self.state.get_properties(self.df), DataProperties(has_na_values=Status.NO))
+        self.assertTrue(other.less_equal(self.state))
+
+    def test_remove(self):
+        self.state.update_properties(self.df, is_shuffled=Status.NO)
+        self.state.remove_variable(self.df)
+        self.assertEqual(self.state.properties, dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
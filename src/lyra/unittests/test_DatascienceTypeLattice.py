@@ -371,6 +371,21 @@ class TestDatascienceTypeLattice(unittest.TestCase):
                 t2_c = self.clone(t2)
                 self.assertEqual(t1.join(t2), t1_c.widening(t2_c))
 
+    def test_least_upper_bound(self):
+        """Test that the join is the least upper bound and the meet the greatest lower bound of two types."""
+        types = DatascienceTypeLattice.get_all_types()
+        for t1 in types:
+            for t2 in types:
+                join = self.clone(t1).join(t2)
+                meet = self.clone(t1).meet(t2)
+                self.assertTrue(t1.less_equal(join) and t2.less_equal(join))
+                self.assertTrue(meet.less_equal(t1) and meet.less_equal(t2))
+                for t in types:
+                    if t1.less_equal(t) and t2.less_equal(t):
+                        self.assertTrue(join.less_equal(t))
+                    if t.less_equal(t1) and t.less_equal(t2):
+                        self.assertTrue(t.less_equal(meet))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
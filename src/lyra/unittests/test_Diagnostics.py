@@ -0,0 +1,77 @@
+"""
+Diagnostics - Unit Tests
+========================
+
+:Author: Caterina Urban
+"""
+import io
+import json
+import unittest
+import warnings
+
+import lyra.core.diagnostics as diagnostics
+from lyra.core.datascience_warnings import GmeanWarning, MissingDataWarning
+from lyra.core.diagnostics import CollectingSink, JSONLinesSink, SARIFSink
+from lyra.core.statements import ProgramPoint
+
+
+def analyze(path: str):
+    diagnostics.start(path)
+    for _ in range(2):      # warnings issued again are only reported once
+        message = "Warning [plausible]: in mean(x) @ line 3 -> x is a RatioSeries"
+        diagnostics.warn(message, GmeanWarning, 'plausible', ProgramPoint(3, 4), 'x')
+    message = "Warning [potential]: At the and of the program df might still have NA values"
+    diagnostics.warn(message, MissingDataWarning, 'potential', variable='df')
+    diagnostics.finish(time=0.5)
+
+
+class TestDiagnostics(unittest.TestCase):
+
+    def setUp(self):
+        warnings.simplefilter('ignore')
+
+    def tearDown(self):
+        warnings.resetwarnings()
+
+    def test_collect(self):
+        with diagnostics.reporting(CollectingSink()) as sink:
+            analyze('a.py')
+        self.assertEqual(len(sink.diagnostics), 2)
+        gmean, missing = sink.diagnostics
+        self.assertEqual((gmean.rule, gmean.path, gmean.line, gmean.column), ('DS002', 'a.py', 3, 4))
+        self.assertEqual((gmean.level, gmean.variable), ('plausible', 'x'))
+        self.assertEqual((missing.rule, missing.line, missing.variable), ('DS016', None, 'df'))
+
+    def test_jsonl(self):
+        stream = io.StringIO()
+        with diagnostics.reporting(JSONLinesSink(stream)):
+            analyze('a.py')
+            analyze('b.py')
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([r['kind'] for r in records], ['diagnostic', 'diagnostic', 'summary'] * 2)
+        self.assertEqual(records[0]['category'], 'GmeanWarning')
+        self.assertEqual(records[3]['file'], 'b.py')
+        self.assertEqual(records[5], {'kind': 'summary', 'file': 'b.py', 'time': 0.5})
+
+    def test_sarif(self):
+        stream = io.StringIO()
+        with diagnostics.reporting(SARIFSink(stream)):
+            analyze('a.py')
+            self.assertIn('"ruleId": "DS002"', stream.getvalue())    # already streamed
+        log = json.loads(stream.getvalue())
+        results = log['runs'][0]['results']
+        self.assertEqual([result['ruleId'] for result in results], ['DS002', 'DS016'])
+        region = results[0]['locations'][0]['physicalLocation']['region']
+        self.assertEqual(region, {'startLine': 3, 'startColumn': 5})
+        rules = {rule['id'] for rule in log['runs'][0]['tool']['driver']['rules']}
+        self.assertEqual(len(rules), 17)
+
+    def test_empty(self):
+        stream = io.StringIO()
+        with diagnostics.reporting(SARIFSink(stream)):
+            pass
+        self.assertEqual(json.loads(stream.getvalue())['runs'][0]['results'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Expressions - Unit Tests
+========================
+
+:Author: Caterina Urban
+"""
+import gc
+import pickle
+import unittest
+from copy import copy, deepcopy
+
+from lyra.core.expressions import VariableIdentifier, Literal, BinaryArithmeticOperation, ListDisplay, \
+    Subscription, LengthIdentifier, Status, intern, rebuild, walk
+from lyra.core.statements import ProgramPoint, VariableAccess
+from lyra.core.types import IntegerLyraType, FloatLyraType, ListLyraType
+
+
+def addition(name: str, value: str):
+    x = VariableIdentifier(IntegerLyraType(), name)
+    one = Literal(IntegerLyraType(), value)
+    return BinaryArithmeticOperation(IntegerLyraType(), x, BinaryArithmeticOperation.Operator.Add, one)
+
+
+class TestExpressions(unittest.TestCase):
+
+    def test_interning(self):
+        self.assertIs(addition('x', '1'), addition('x', '1'))
+        self.assertIsNot(addition('x', '1'), addition('x', '2'))
+        items = [Literal(IntegerLyraType(), '1'), VariableIdentifier(IntegerLyraType(), 'y')]
+        display = ListDisplay(ListLyraType(IntegerLyraType()), items)
+        self.assertIs(ListDisplay(ListLyraType(IntegerLyraType()), list(items)), display)
+        self.assertIs(LengthIdentifier(display), LengthIdentifier(display))
+        self.assertIs(intern(display), display)
+
+    def test_types(self):
+        x, y = VariableIdentifier(IntegerLyraType(), 'x'), VariableIdentifier(FloatLyraType(), 'x')
+        self.assertIsNot(x, y)
+        self.assertEqual(x, y)      # identifiers are equal when their names are
+        self.assertEqual(hash(x), hash(y))
+        self.assertEqual({x: 1}[y], 1)
+        one = Literal(IntegerLyraType(), '1')
+        plus = BinaryArithmeticOperation.Operator.Add
+        self.assertIsNot(BinaryArithmeticOperation(IntegerLyraType(), x, plus, one),
+                         BinaryArithmeticOperation(IntegerLyraType(), y, plus, one))
+
+    def test_equality(self):
+        expr = addition('x', '1')
+        self.assertEqual(expr, addition('x', '1'))
+        self.assertNotEqual(expr, addition('x', '2'))
+        self.assertEqual(hash(expr), hash(addition('x', '1')))
+
+    def test_copy(self):
+        expr = addition('x', '1')
+        self.assertIs(deepcopy(expr), expr)
+        self.assertIs(copy(expr), expr)
+        self.assertIs(pickle.loads(pickle.dumps(expr)), expr)
+        subscription = Subscription(IntegerLyraType(), VariableIdentifier(ListLyraType(IntegerLyraType()), 'l'), expr)
+        self.assertIs(pickle.loads(pickle.dumps({subscription: 0})).popitem()[0], subscription)
+
+    def test_rebuild(self):
+        expr = addition('x', '1')
+        self.assertIs(rebuild(expr, _right=Literal(IntegerLyraType(), '2')), addition('x', '2'))
+        self.assertEqual(expr.right, Literal(IntegerLyraType(), '1'))
+        self.assertEqual({str(e) for e in walk(expr)}, {'x + 1', 'x', '1'})
+        self.assertEqual(expr.ids(), {VariableIdentifier(IntegerLyraType(), 'x')})
+
+    def test_sorting(self):
+        df = VariableIdentifier(IntegerLyraType(), 'df')
+        column = Subscription(IntegerLyraType(), df, Literal(IntegerLyraType(), '0'))
+        with self.assertRaises(AttributeError):     # interned expressions are immutable
+            column.is_increasing = Status.YES
+        increasing = rebuild(column, _is_increasing=Status.YES)
+        self.assertIsNot(increasing, column)
+        self.assertEqual((column.is_increasing, increasing.is_increasing), (Status.MAYBE, Status.YES))
+        self.assertIs(Subscription(IntegerLyraType(), df, Literal(IntegerLyraType(), '0')), column)
+
+    def test_slots(self):
+        expr = addition('x', '1')
+        with self.assertRaises(AttributeError):
+            expr.attribute = None
+        access = VariableAccess(ProgramPoint(1, 0), IntegerLyraType(), expr.left)
+        with self.assertRaises(AttributeError):
+            access.attribute = None
+
+    def test_release(self):
+        count = len(gc.get_objects())
+        for i in range(1000):
+            addition('z', str(i))
+        gc.collect()
+        self.assertLess(len(gc.get_objects()), count + 100)     # interned expressions are not kept alive
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Parallel Function Analysis - Unit Tests
+=======================================
+
+:Author: Caterina Urban
+"""
+import json
+import os
+import tempfile
+import unittest
+import warnings
+
+import lyra.core.diagnostics as diagnostics
+from lyra.core.diagnostics import CollectingSink, JSONLinesSink, SARIFSink
+from lyra.engine.assumption.assumption_analysis import ForwardDatascienceTypeAnalysis
+
+PROGRAM = """
+import pandas as pd
+
+def clean(df):
+    df = df.dropna()
+    return df
+
+def scale(x: int):
+    y = x * 2
+    return y
+
+def log(message: str):
+    z = print(message)
+    return message
+
+def unused(a: int, b: int):
+    while a < b:
+        a = a + 1
+    return a
+
+data = pd.DataFrame()
+data = clean(data)
+n: int = 3
+m: int = scale(n)
+"""
+
+
+def states(runner, result, fname: str):
+    return {node.identifier: [str(s) for states in result.get_node_result(node).values() for s in states]
+            for node in runner.cfgs[fname].nodes.values()}
+
+
+class TestFunctions(unittest.TestCase):
+
+    def setUp(self):
+        warnings.simplefilter('ignore')
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'program.py')
+        with open(self.path, 'w') as program:
+            program.write(PROGRAM)
+
+    def tearDown(self):
+        self.directory.cleanup()
+        warnings.resetwarnings()
+
+    def analyze(self, functions: bool, workers: int = None):
+        runner = ForwardDatascienceTypeAnalysis('potential')
+        runner.rendering, runner.checking = None, False
+        runner.functions, runner.workers = functions, workers
+        with diagnostics.reporting(CollectingSink()) as sink:
+            result = runner.main(self.path)
+        return runner, result, [str(diagnostic) for diagnostic in sink.diagnostics]
+
+    def test_functions(self):
+        runner, result, _ = self.analyze(True, 1)
+        self.assertEqual(set(runner.cfgs), {'', 'clean', 'scale', 'log', 'unused'})
+        for fname, cfg in runner.cfgs.items():
+            self.assertTrue(result.get_node_result(cfg.in_node), fname)
+            self.assertTrue(result.get_node_result(cfg.out_node), fname)
+        # the function never called by the program is analyzed from the annotated types of its variables
+        self.assertIn('unused#a -> Numeric', states(runner, result, 'unused')[runner.cfgs['unused'].in_node.identifier][0])
+
+    def test_program(self):
+        runner, result, _ = self.analyze(False)
+        _, merged, _ = self.analyze(True, 1)
+        self.assertEqual(states(runner, merged, ''), states(runner, result, ''))
+
+    def test_workers(self):
+        runner, serial, warned = self.analyze(True, 1)
+        _, parallel, reported = self.analyze(True, 3)
+        for fname in runner.cfgs:
+            self.assertEqual(states(runner, parallel, fname), states(runner, serial, fname))
+        self.assertEqual(sorted(reported), sorted(warned))
+        self.assertTrue(any('NoneRet' in diagnostic for diagnostic in reported))   # raised in log
+
+    def stream(self, sink, workers: int):
+        runner = ForwardDatascienceTypeAnalysis('potential')
+        runner.rendering, runner.checking = None, False
+        runner.functions, runner.workers = True, workers
+        output = os.path.join(self.directory.name, 'diagnostics')
+        with open(output, 'w') as stream:
+            with diagnostics.reporting(sink(stream)):    # also inherited by the forked workers
+                runner.main(self.path)
+        with open(output) as stream:
+            return stream.read()
+
+    def test_jsonl(self):
+        serial = [json.loads(line) for line in self.stream(JSONLinesSink, 1).splitlines()]
+        parallel = [json.loads(line) for line in self.stream(JSONLinesSink, 3).splitlines()]
+        self.assertEqual([r['kind'] for r in parallel].count('summary'), 1)
+        self.assertEqual(len(parallel), len(serial))
+        self.assertTrue(any(r.get('category') == 'NoneRetAssignmentWarning' for r in parallel))
+
+    def test_sarif(self):
+        serial = json.loads(self.stream(SARIFSink, 1))['runs'][0]['results']
+        parallel = json.loads(self.stream(SARIFSink, 3))['runs'][0]['results']
+        self.assertEqual(len(parallel), len(serial))
+
+
+if __name__ == '__main__':
+    unittest.main()
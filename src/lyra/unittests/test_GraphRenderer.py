@@ -0,0 +1,34 @@
+"""
+Graph Renderer - Unit Tests
+===========================
+
+:Author: Caterina Urban
+"""
+import io
+import unittest
+
+import graphviz as gv
+
+from lyra.visualization.graph_renderer import DotStream, GraphRenderer
+
+
+class TestDotStream(unittest.TestCase):
+
+    def test_source(self):
+        graph_attr = dict(GraphRenderer.graph_attr, label='CFG with Analysis Result for "test"')
+        node_attr, edge_attr = GraphRenderer.node_attr, GraphRenderer.edge_attr
+        graph = gv.Digraph(graph_attr=graph_attr, node_attr=node_attr, edge_attr=edge_attr)
+        stream = io.StringIO()
+        streamed = DotStream(stream, graph_attr=graph_attr, node_attr=node_attr, edge_attr=edge_attr)
+        table = '<<table border="0" cellborder="0"><tr><td>x = "y"</td></tr></table>>'
+        for g in (graph, streamed):
+            g.node('1', label=table, xlabel='1', fillcolor='#24bf26', shape='box')
+            g.node('2', label='x \\> 3', xlabel='2', shape='circle')
+            g.edge('1', '2', label='LOOP_IN: x \\> 3')
+            g.edge('2', '3', _attributes={'style': 'invis'})
+        streamed.close()
+        self.assertEqual(stream.getvalue(), graph.source)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Incremental Analysis - Unit Tests
+=================================
+
+:Author: Caterina Urban
+"""
+import ast
+import tempfile
+import unittest
+import warnings
+
+from lyra.datascience.datascience_type_domain import DatascienceTypeState
+from lyra.engine.forward import ForwardInterpreter
+from lyra.engine.incremental import Incremental, ResultCache
+from lyra.engine.worklist import WTOWorklist
+from lyra.frontend.cfg_generator import ast_to_cfgs, ast_to_fargs
+from lyra.semantics.datascience_type_semantics import DatascienceTypeSemantics
+
+PROGRAM = """
+import pandas as pd
+
+def clean(df):
+    df = df.dropna()
+    return df
+
+def scale(x: int) -> int:
+    y: int = x * 2
+    return y
+
+data = pd.read_csv("data.csv")
+data = clean(data)
+n: int = scale(3)
+"""
+
+
+def analyze(source: str, incremental: Incremental = None):
+    tree = ast.parse(source)
+    cfgs, fargs = ast_to_cfgs(tree), ast_to_fargs(tree)
+    interpreter = ForwardInterpreter(cfgs, fargs, DatascienceTypeSemantics(), 3, worklist=WTOWorklist)
+    if incremental:
+        interpreter.incremental = incremental(cfgs, fargs)
+    result = interpreter.analyze(cfgs[''], DatascienceTypeState(cfgs[''].variables))
+    states = dict()     # analysis result of each node, independently of the node identifiers
+    for fname, cfg in cfgs.items():
+        for i, identifier in enumerate(sorted(cfg.nodes)):
+            node_result = result.get_node_result(cfg.nodes[identifier])
+            states[fname, i] = sorted(str(state) for states in node_result.values() for state in states)
+    return interpreter, states
+
+
+class TestIncremental(unittest.TestCase):
+
+    def setUp(self):
+        warnings.simplefilter('ignore')
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(self.directory.name)
+
+    def tearDown(self):
+        warnings.resetwarnings()
+        self.directory.cleanup()
+
+    def rerun(self, source: str, edited: str):
+        first, _ = analyze(source, lambda cfgs, fargs: self.cache.get('p.py', 'a', cfgs, fargs))
+        self.cache.put('p.py', 'a', first.incremental)
+        return analyze(edited, lambda cfgs, fargs: self.cache.get('p.py', 'a', cfgs, fargs))
+
+    def test_unchanged(self):
+        interpreter, states = self.rerun(PROGRAM, PROGRAM)
+        self.assertEqual(interpreter.incremental.reused, 1)     # the whole program
+        self.assertEqual(interpreter.visits, 0)
+        self.assertEqual(states, analyze(PROGRAM)[1])
+
+    def test_edited(self):
+        edited = PROGRAM.replace('x * 2', 'x * 3')
+        interpreter, states = self.rerun(PROGRAM, edited)
+        self.assertEqual(interpreter.incremental.reused, 1)     # the call to clean
+        self.assertEqual(states, analyze(edited)[1])
+
+    def test_fingerprints(self):
+        fingerprints = analyze(PROGRAM, Incremental)[0].incremental.fingerprints
+        edited = analyze(PROGRAM.replace('x * 2', 'x * 3'), Incremental)[0].incremental.fingerprints
+        self.assertEqual(fingerprints['clean'], edited['clean'])
+        self.assertNotEqual(fingerprints['scale'], edited['scale'])
+        self.assertEqual(fingerprints[''], edited[''])
+
+
+if __name__ == '__main__':
+    unittest.main()
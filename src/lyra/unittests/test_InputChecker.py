@@ -0,0 +1,99 @@
+"""
+Input Data Checker - Unit Tests
+===============================
+
+:Author: Caterina Urban
+"""
+import io
+import os
+import unittest
+
+from lyra.abstract_domains.assumption.alphabet_domain import AlphabetLattice
+from lyra.abstract_domains.assumption.assumption_domain import AssumptionState
+from lyra.abstract_domains.assumption.range_domain import RangeLattice
+from lyra.abstract_domains.assumption.type_domain import TypeLattice
+from lyra.abstract_domains.assumption.wordset_domain import WordSetLattice
+from lyra.core.expressions import Literal, VariableIdentifier, CastOperation
+from lyra.core.statements import ProgramPoint
+from lyra.core.types import IntegerLyraType
+from lyra.engine.assumption.input_checker import InputChecker
+
+InputLattice = AssumptionState.InputStack.InputLattice
+
+PANCAKES = os.path.join(os.path.dirname(__file__), os.pardir, 'tests', 'code_jam', 'pancake_flipper')
+
+
+def basic(line: int, *lattices):
+    return ProgramPoint(line, 0), tuple(lattices)
+
+
+def repeat(multiplier, *constraints):
+    return InputLattice(multiplier, list(constraints))
+
+
+ONE = Literal(IntegerLyraType(), '1')
+T = CastOperation(IntegerLyraType(), VariableIdentifier(IntegerLyraType(), '1.1'))
+INTEGER = TypeLattice(TypeLattice.Status.Integer)
+PANCAKE = AlphabetLattice(set(), set('+- 0123456789'))
+
+# T: int = int(input())
+# for _ in range(T):
+#     s, k = input().split()
+ASSUMPTION = repeat(ONE, basic(1, INTEGER, RangeLattice(1, 100)), repeat(T, basic(3, PANCAKE)))
+
+
+class TestInputChecker(unittest.TestCase):
+
+    def test_practice(self):
+        checker = InputChecker(ASSUMPTION)
+        for name in ('A-small-practice.in', 'A-large-practice.in'):
+            self.assertEqual(checker.check(os.path.join(PANCAKES, name), exhaustive=True), [])
+            self.assertIsNone(checker.unchecked)
+        self.assertEqual(checker.lines, 101)
+
+    def test_chunks(self):
+        with open(os.path.join(PANCAKES, 'A-large-practice.in'), 'rb') as data:
+            lines = data.read().split(b'\n')
+        lines[5], lines[50] = b'--x- 3', b'+-+ k'
+        data = b'\n'.join(lines)
+        for chunk in (1, 7, 64, 1 << 20):
+            checker = InputChecker(ASSUMPTION, chunk)
+            violations = [(v.line, v.text) for v in checker.violations(io.BytesIO(data))]
+            self.assertEqual(violations, [(6, '--x- 3'), (51, '+-+ k')])
+            self.assertEqual(checker.lines, 101)
+
+    def test_first(self):
+        checker = InputChecker(ASSUMPTION)
+        violations = list(checker.violations(io.BytesIO(b'101\n')))
+        self.assertEqual(violations[0].line, 1)
+        self.assertEqual(len(violations), 2)    # out of range, and missing data
+        first = next(checker.violations(io.BytesIO(b'2\n+-\n-+ 1\n+\n')))
+        self.assertEqual((first.line, first.message), (4, "unexpected input data"))
+
+    def test_missing(self):
+        violations = list(InputChecker(ASSUMPTION).violations(io.BytesIO(b'3\n+-\n')))
+        self.assertEqual([(v.line, v.message) for v in violations], [(3, "missing input data")])
+
+    def test_dependent(self):
+        n = VariableIdentifier(IntegerLyraType(), '2.1')
+        assumption = repeat(ONE, basic(1, INTEGER), repeat(ONE, basic(2, INTEGER), repeat(n, basic(3, INTEGER))))
+        checker = InputChecker(assumption)
+        self.assertEqual(list(checker.violations(io.BytesIO(b'7\n2\n1\n2\n'))), [])
+        violations = list(checker.violations(io.BytesIO(b'7\n2\n1\n')))
+        self.assertEqual([v.line for v in violations], [4])
+
+    def test_wordset(self):
+        words = WordSetLattice({'yes', 'no'})
+        assumption = repeat(ONE, basic(1, INTEGER), repeat(T, basic(2, words)))
+        violations = list(InputChecker(assumption).violations(io.BytesIO(b'3\nyes\nmaybe\nno\n')))
+        self.assertEqual([(v.line, v.text) for v in violations], [(3, 'maybe')])
+
+    def test_star(self):
+        assumption = repeat(ONE, basic(1, INTEGER), ())
+        checker = InputChecker(assumption)
+        self.assertEqual(list(checker.violations(io.BytesIO(b'1\nanything\n'))), [])
+        self.assertEqual(checker.unchecked, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Analysis Result - Unit Tests
+============================
+
+:Author: Caterina Urban
+"""
+import pickle
+import unittest
+from copy import deepcopy
+
+from lyra.abstract_domains.numerical.interval_domain import IntervalStateWithSummarization
+from lyra.abstract_domains.numerical.sign_domain import SignState
+from lyra.core.expressions import VariableIdentifier, Literal
+from lyra.core.types import IntegerLyraType
+from lyra.engine.result import StateSequence, _Delta
+
+variables = [VariableIdentifier(IntegerLyraType(), f'x{i}') for i in range(10)]
+
+
+def states(state, count: int = 5):
+    """States after assigning a different variable at each step."""
+    result = [state]
+    for i in range(count):
+        state = deepcopy(state)
+        state.assign({variables[i]}, {Literal(IntegerLyraType(), str(i))})
+        result.append(state)
+    return result
+
+
+class TestStateSequence(unittest.TestCase):
+
+    def test_compact(self):
+        whole = states(IntervalStateWithSummarization(set(variables)))
+        sequence = StateSequence(whole)
+        self.assertEqual(len(sequence), len(whole))
+        self.assertNotIsInstance(sequence._states[0], _Delta)
+        self.assertTrue(all(isinstance(entry, _Delta) for entry in sequence._states[1:-1]))
+        self.assertNotIsInstance(sequence._states[-1], _Delta)
+        self.assertEqual(list(map(str, sequence)), list(map(str, whole)))
+        self.assertEqual([str(sequence[i]) for i in range(len(whole))], list(map(str, whole)))
+        self.assertEqual(str(sequence[-2]), str(whole[-2]))
+        self.assertEqual(list(map(str, sequence[1:])), list(map(str, whole[1:])))
+
+    def test_append(self):
+        whole = states(IntervalStateWithSummarization(set(variables)))
+        sequence = StateSequence(whole[:1])
+        for state in whole[1:]:
+            sequence.append(state)
+        self.assertEqual(list(map(str, sequence)), list(map(str, whole)))
+        reverse = StateSequence(whole[-1:], reverse=True)
+        for state in reversed(whole[:-1]):
+            reverse.appendleft(state)
+        self.assertEqual(list(map(str, reverse)), list(map(str, whole)))
+        self.assertEqual([str(reverse[i]) for i in range(len(whole))], list(map(str, whole)))
+        with self.assertRaises(ValueError):
+            reverse.append(whole[0])
+
+    def test_copies(self):
+        whole = states(IntervalStateWithSummarization(set(variables)))
+        sequence = StateSequence(whole)
+        state = sequence[2]
+        state.assign({variables[0]}, {Literal(IntegerLyraType(), '42')})
+        self.assertEqual(str(sequence[2]), str(whole[2]))
+        self.assertEqual(str(sequence[3]), str(whole[3]))
+
+    def test_first(self):
+        whole = states(IntervalStateWithSummarization(set(variables)))
+        sequence = StateSequence(whole)
+        for first in (sequence[0], next(iter(sequence))):   # kept as a whole
+            first.store[variables[1]].bottom()
+            first.store[variables[2]].meet(first.store[variables[1]])
+            self.assertEqual(list(map(str, sequence)), list(map(str, whole)))
+
+    def test_whole(self):
+        whole = states(SignState(set(variables)))     # not a copy-on-write store
+        sequence = StateSequence(whole)
+        self.assertFalse(any(isinstance(entry, _Delta) for entry in sequence._states))
+        self.assertEqual(list(sequence), whole)
+
+    def test_pickle(self):
+        whole = states(IntervalStateWithSummarization(set(variables)))
+        sequence = pickle.loads(pickle.dumps(StateSequence(whole)))
+        self.assertEqual(list(map(str, sequence)), list(map(str, whole)))
+
+
+if __name__ == '__main__':
+    unittest.main()
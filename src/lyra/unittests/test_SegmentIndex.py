@@ -0,0 +1,78 @@
+"""
+Segment Index - Unit Tests
+==========================
+
+:Author: Caterina Urban
+"""
+import unittest
+from copy import deepcopy
+
+from lyra.abstract_domains.container.fulara import fulara_domain
+from lyra.abstract_domains.container.fulara.fulara_lattice import FularaLattice, d_norm
+from lyra.abstract_domains.container.fulara.interval_wrappers import IntervalKWrapper, IntervalVWrapper
+from lyra.abstract_domains.container.fulara.segment_index import SegmentIndex
+from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.types import IntegerLyraType
+
+k_var = VariableIdentifier(IntegerLyraType(), fulara_domain.k_name)
+v_var = VariableIdentifier(IntegerLyraType(), fulara_domain.v_name)
+
+
+def key(lower, upper):
+    k = IntervalKWrapper(set(), k_var)
+    k.store[k_var] = IntervalLattice(lower, upper)
+    return k
+
+
+def segment(lower, upper, value=0):
+    v = IntervalVWrapper(set(), v_var)
+    v.store[v_var] = IntervalLattice(value, value)
+    return key(lower, upper), v
+
+
+def dictionary(*segments) -> FularaLattice:
+    return FularaLattice(IntervalKWrapper, IntervalVWrapper, {'scalar_variables': set(), 'k_var': k_var},
+                         {'scalar_variables': set(), 'v_var': v_var}, set(segments))
+
+
+class TestSegmentIndex(unittest.TestCase):
+
+    def test_overlapping(self):
+        index = SegmentIndex([segment(6, 9), segment(0, 2), segment(3, 4)])
+        self.assertEqual(len(index), 3)
+        self.assertEqual([s[0] for s in index.overlapping(key(2, 3))], [key(0, 2), key(3, 4)])
+        self.assertEqual([s[0] for s in index.overlapping(key(5, 5))], [])
+        self.assertEqual([s[0] for s in index.overlapping(key(9, float('inf')))], [key(6, 9)])
+        self.assertEqual(len(index.overlapping(key(-float('inf'), float('inf')))), 3)
+
+    def test_add_remove(self):
+        index = SegmentIndex()
+        first, second = segment(0, 2), segment(5, 7)
+        index.add(second)
+        index.add(first)
+        self.assertEqual(list(index), [first, second])
+        index.remove(first)
+        self.assertEqual(list(index), [second])
+        self.assertEqual(index.overlapping(key(1, 1)), [])
+
+    def test_d_norm(self):
+        segments = {segment(0, 2), segment(4, 6, 1), segment(2, 4, 2), segment(8, 9)}
+        normalized = d_norm(segments)
+        self.assertEqual({s[0] for s in normalized}, {key(0, 6), key(8, 9)})
+
+    def test_lattice(self):
+        one = dictionary(segment(0, 2), segment(5, 7))
+        other = dictionary(segment(1, 6, 1))
+        self.assertTrue(deepcopy(one).meet(other).is_empty())     # values do not overlap
+        met = deepcopy(one).meet(dictionary(segment(1, 6)))
+        self.assertEqual({s[0] for s in met.segments}, {key(1, 2), key(5, 6)})
+        self.assertTrue(one.less_equal(deepcopy(one).join(other)))
+        self.assertFalse(deepcopy(one).join(other).less_equal(one))
+        self.assertFalse(one.less_equal(other))
+        widened = deepcopy(one).widening(deepcopy(one).join(other))
+        self.assertTrue(deepcopy(one).join(other).less_equal(widened))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Program Slicing - Unit Tests
+============================
+
+:Author: Caterina Urban
+"""
+import ast
+import io
+import json
+import os
+import tempfile
+import unittest
+import warnings
+from contextlib import redirect_stdout
+
+import lyra.core.diagnostics as diagnostics
+from lyra.core.diagnostics import CollectingSink, JSONLinesSink
+from lyra.engine.assumption.assumption_analysis import ForwardDatascienceTypeAnalysis
+from lyra.engine.slicing import Slicer
+from lyra.frontend.cfg_generator import ast_to_cfgs
+from lyra.semantics.datascience_type_semantics import DatascienceTypeSemantics
+
+PROGRAM = """
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import MinMaxScaler
+count: int = 0
+df = pd.read_csv('data.csv')
+other = df
+label: str = 'rows'
+width: int = 3
+height: int = width + 1
+seed = np.random.seed(0)
+if count > 0:
+    df.dropna(inplace=True)
+print(label)
+scaled = MinMaxScaler().fit_transform(other)
+X_train, X_test = train_test_split(scaled, test_size=0.2)
+"""
+
+
+def analyze(slicing: bool):
+    runner = ForwardDatascienceTypeAnalysis('potential')
+    runner.rendering, runner.viewing, runner.checking = None, False, False
+    runner.slicing = slicing
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'script.py')
+        with open(path, 'w') as script:
+            script.write(PROGRAM)
+        with warnings.catch_warnings(), redirect_stdout(io.StringIO()), \
+                diagnostics.reporting(CollectingSink()) as sink:
+            warnings.simplefilter('ignore')
+            runner.main(path)
+    return {(d.category.__name__, d.line) for d in sink.diagnostics}, runner
+
+
+class TestSlicer(unittest.TestCase):
+
+    def setUp(self):
+        self.cfgs = ast_to_cfgs(ast.parse(PROGRAM))
+        self.slicer = Slicer(DatascienceTypeSemantics.warning_calls)
+        self.sliced = self.slicer.slice(self.cfgs)
+
+    def test_nodes(self):
+        cfg, sliced = self.cfgs[''], self.sliced['']
+        self.assertEqual(set(sliced.nodes), set(cfg.nodes))
+        self.assertEqual(len(sliced.edges), len(cfg.edges))
+        for identifier, node in sliced.nodes.items():
+            self.assertIs(type(node), type(cfg.nodes[identifier]))
+            self.assertTrue(all(stmt in cfg.nodes[identifier].stmts for stmt in node.stmts))
+
+    def test_relevant(self):
+        relevant = {variable.name for variable in self.slicer.relevant['']}
+        self.assertTrue({'df', 'other', 'scaled', 'count'} <= relevant)
+        self.assertFalse({'label', 'width', 'height'} & relevant)
+
+    def test_kept(self):
+        kept = [str(stmt) for node in self.sliced[''].nodes.values() for stmt in node.stmts]
+        self.assertTrue(any('read_csv' in stmt for stmt in kept))
+        self.assertTrue(any('dropna' in stmt for stmt in kept))     # may modify df (and thus other)
+        self.assertTrue(any('count' in stmt for stmt in kept))      # occurs in a condition
+        self.assertTrue(any('seed' in stmt for stmt in kept))       # assigns the result of a call
+        self.assertFalse(any('width' in stmt or 'label' in stmt for stmt in kept))
+        self.assertLess(self.slicer.kept, self.slicer.total)
+
+    def test_warnings(self):
+        expected, _ = analyze(False)
+        reported, runner = analyze(True)
+        self.assertIn(('NoneRetAssignmentWarning', 12), expected)
+        self.assertEqual(reported, expected)
+        self.assertLess(runner.slicer.kept, runner.slicer.total)
+
+
+class TestStatistics(unittest.TestCase):
+
+    def run_verbose(self, verbose: bool):
+        runner = ForwardDatascienceTypeAnalysis('potential')
+        runner.rendering, runner.viewing, runner.checking = None, False, False
+        runner.slicing, runner.summarizing, runner.verbose = True, False, verbose
+        stream, output = io.StringIO(), io.StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'script.py')
+            with open(path, 'w') as script:
+                script.write(PROGRAM)
+            with warnings.catch_warnings(), redirect_stdout(output), \
+                    diagnostics.reporting(JSONLinesSink(stream)):
+                warnings.simplefilter('ignore')
+                runner.main(path)
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        summary = next(r for r in records if r['kind'] == 'summary')
+        return output.getvalue().splitlines(), summary, runner
+
+    def test_quiet(self):
+        lines, summary, runner = self.run_verbose(False)
+        self.assertTrue(any(line.startswith('Time:') for line in lines))
+        self.assertFalse(any(line.startswith(('Visits:', 'Sliced:')) for line in lines))
+        self.assertEqual(summary['sliced'], runner.slicer.kept)
+        self.assertEqual(summary['statements'], runner.slicer.total)
+        self.assertNotIn('summarized', summary)     # summaries are disabled
+
+    def test_verbose(self):
+        lines, summary, _ = self.run_verbose(True)
+        self.assertIn(f"Visits: {summary['visits']}", lines)
+        self.assertIn(f"Sliced: {summary['sliced']}", lines)
+        self.assertFalse(any(line.startswith('Summarized:') for line in lines))
+
+
+if __name__ == '__main__':
+    unittest.main()
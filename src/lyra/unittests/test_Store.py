@@ -0,0 +1,106 @@
+"""
+Store - Unit Tests
+==================
+
+:Author: Caterina Urban
+"""
+import unittest
+from copy import deepcopy
+
+from lyra.abstract_domains.numerical.interval_lattice import IntervalLattice
+from lyra.abstract_domains.store import CopyOnWriteDict, Store
+from lyra.core.expressions import VariableIdentifier
+from lyra.core.types import IntegerLyraType
+
+
+class CopyOnWriteStore(Store):
+    copy_on_write = True
+
+
+class TestCopyOnWriteDict(unittest.TestCase):
+
+    def test_copy(self):
+        original = CopyOnWriteDict({'x': IntervalLattice(0, 1), 'y': IntervalLattice(2, 3)})
+        copy = deepcopy(original)
+        self.assertIs(copy.shared['x'], original.shared['x'])
+        copy['x'].join(IntervalLattice(5, 6))
+        self.assertEqual(copy['x'], IntervalLattice(0, 6))
+        self.assertEqual(original['x'], IntervalLattice(0, 1))
+        self.assertIs(copy.shared['y'], original.shared['y'])
+
+    def test_lent(self):
+        original = CopyOnWriteDict({'x': IntervalLattice(0, 5), 'y': IntervalLattice(2, 3)})
+        element = original['x']     # retrieved before copying, modified afterwards
+        copy = deepcopy(original)
+        element.meet(IntervalLattice(0, 1))
+        self.assertEqual(original['x'], IntervalLattice(0, 1))
+        self.assertEqual(copy['x'], IntervalLattice(0, 5))
+        self.assertIs(copy.shared['y'], original.shared['y'])
+
+    def test_update(self):
+        original = CopyOnWriteDict({'x': IntervalLattice(0, 1)})
+        copy = deepcopy(original)
+        copy['y'] = IntervalLattice(2, 3)
+        del copy['x']
+        self.assertEqual(set(original), {'x'})
+        self.assertEqual(set(copy), {'y'})
+
+    def test_share(self):
+        original = CopyOnWriteDict({'x': IntervalLattice(0, 1)})
+        other = CopyOnWriteDict()
+        other.share('x', original)
+        other['x'].bottom()
+        self.assertEqual(original['x'], IntervalLattice(0, 1))
+        self.assertTrue(other['x'].is_bottom())
+
+
+class TestCopyOnWriteStore(unittest.TestCase):
+
+    def setUp(self):
+        self.x = VariableIdentifier(IntegerLyraType(), 'x')
+        self.y = VariableIdentifier(IntegerLyraType(), 'y')
+        lattices = {IntegerLyraType(): IntervalLattice}
+        self.store = CopyOnWriteStore({self.x, self.y}, lattices)
+
+    def test_join(self):
+        other = deepcopy(self.store)
+        other.store[self.x].meet(IntervalLattice(0, 1))
+        self.assertTrue(other.less_equal(self.store))
+        self.store.store[self.y].meet(IntervalLattice(2, 3))
+        joined = deepcopy(self.store).join(other)
+        self.assertEqual(joined.store[self.x], IntervalLattice())
+        self.assertEqual(joined.store[self.y], IntervalLattice())
+        self.assertEqual(other.store[self.y], IntervalLattice())
+        self.assertEqual(self.store.store[self.y], IntervalLattice(2, 3))
+
+    def test_hash(self):
+        other = deepcopy(self.store)
+        self.assertEqual(self.store, other)
+        self.assertEqual(hash(self.store), hash(other))
+        other.store[self.x].meet(IntervalLattice(0, 1))
+        self.assertNotEqual(self.store, other)
+        other.store[self.x].top()
+        self.assertEqual(self.store, other)
+        self.assertEqual(hash(self.store), hash(other))
+
+    def test_retrieved(self):
+        other = deepcopy(self.store)
+        element = other.store[self.x]       # retrieved before hashing, modified afterwards
+        self.assertEqual(hash(other), hash(self.store))
+        element.meet(IntervalLattice(0, 1))
+        self.assertEqual(hash(other), hash(deepcopy(other)))
+        self.assertNotEqual(hash(other), hash(self.store))
+
+    def test_missing(self):
+        z = VariableIdentifier(IntegerLyraType(), 'z')
+        other = deepcopy(self.store)
+        other.variables.add(z)
+        other.store[z] = IntervalLattice(0, 1)
+        self.store._join(other)
+        self.assertEqual(self.store.store[z], IntervalLattice(0, 1))
+        self.store.store[z].bottom()
+        self.assertEqual(other.store[z], IntervalLattice(0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
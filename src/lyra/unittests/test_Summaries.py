@@ -0,0 +1,79 @@
+"""
+Function Summaries - Unit Tests
+===============================
+
+:Author: Caterina Urban
+"""
+import ast
+import unittest
+import warnings
+
+from lyra.datascience.datascience_type_domain import DatascienceTypeState
+from lyra.engine.forward import ForwardInterpreter
+from lyra.engine.summaries import Summaries
+from lyra.engine.worklist import WTOWorklist
+from lyra.frontend.cfg_generator import ast_to_cfgs, ast_to_fargs
+from lyra.semantics.datascience_type_semantics import DatascienceTypeSemantics
+
+PROGRAM = """
+import pandas as pd
+
+def clean(df):
+    df = df.dropna()
+    return df
+
+def scale(x):
+    y = x * 2
+    return y
+
+data = pd.read_csv("data.csv")
+other = pd.read_csv("other.csv")
+data = clean(data)
+other = clean(other)
+n: int = 3
+m: int = scale(n)
+s: str = 'a'
+t = scale(s)
+"""
+
+
+def analyze(source: str, summaries: Summaries = None):
+    tree = ast.parse(source)
+    cfgs, fargs = ast_to_cfgs(tree), ast_to_fargs(tree)
+    interpreter = ForwardInterpreter(cfgs, fargs, DatascienceTypeSemantics(), 3, worklist=WTOWorklist)
+    interpreter.summaries = summaries
+    result = interpreter.analyze(cfgs[''], DatascienceTypeState(cfgs[''].variables))
+    out = result.get_node_result(cfgs[''].out_node)
+    return interpreter, [str(state) for states in out.values() for state in states]
+
+
+class TestSummaries(unittest.TestCase):
+
+    def setUp(self):
+        warnings.simplefilter('ignore')
+
+    def tearDown(self):
+        warnings.resetwarnings()
+
+    def test_reused(self):
+        interpreter, states = analyze(PROGRAM, Summaries())
+        self.assertEqual(interpreter.summaries.hits, 1)     # the second call to clean
+        self.assertEqual(len(interpreter.summaries.summaries['clean']), 1)
+        self.assertEqual(len(interpreter.summaries.summaries['scale']), 2)
+        self.assertEqual(states, analyze(PROGRAM)[1])
+
+    def test_contexts(self):
+        interpreter, states = analyze(PROGRAM, Summaries(1))
+        self.assertEqual(len(interpreter.summaries.summaries['scale']), 1)
+        self.assertEqual(interpreter.summaries.hits, 1)
+        summarized = analyze(PROGRAM)[1]
+        self.assertEqual(len(states), len(summarized))
+
+    def test_projection(self):
+        interpreter, _ = analyze(PROGRAM, Summaries())
+        for context in interpreter.summaries.summaries['clean']:
+            self.assertEqual({v.name for v in context.variables}, {'clean#df'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""
+Library Symbols - Unit Tests
+============================
+
+:Author: Caterina Urban
+"""
+import os
+import subprocess
+import sys
+import unittest
+
+import lyra
+from lyra.semantics.symbols import has_symbol, version, LIBRARIES, CLASSES
+
+
+class TestSymbols(unittest.TestCase):
+
+    def test_index(self):
+        for library in LIBRARIES + tuple(CLASSES):
+            self.assertIsNotNone(version(library))
+        self.assertTrue(has_symbol('pandas', 'DataFrame'))
+        self.assertTrue(has_symbol('pandas', 'read_csv'))
+        self.assertTrue(has_symbol('numpy', 'array'))
+        self.assertTrue(has_symbol('torch', 'tensor'))
+        self.assertTrue(has_symbol('seaborn', 'heatmap'))
+        self.assertTrue(has_symbol('matplotlib.pyplot', 'plot'))
+        self.assertTrue(has_symbol('plotly.express', 'scatter'))
+        self.assertTrue(has_symbol('pandas.DataFrame', 'dtypes'))
+        self.assertFalse(has_symbol('pandas', 'dtypes'))
+        self.assertFalse(has_symbol('sklearn', 'train_test_split'))
+
+    def test_lazy(self):
+        # in a fresh interpreter, since other tests might have already imported the libraries
+        check = "import sys, lyra.semantics.semantics; " \
+                f"print(*(library in sys.modules for library in {LIBRARIES!r}))"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(lyra.__file__)))
+        environment = {**os.environ, 'PYTHONPATH': os.pathsep.join([root, *sys.path])}
+        output = subprocess.run([sys.executable, '-c', check], env=environment,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ['False'] * len(LIBRARIES))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,9 @@ Type Lattice - Unit Tests
 import unittest
 from typing import List
 
-from lyra.abstract_domains.assumption.type_domain import TypeLattice
+from lyra.abstract_domains.assumption.type_domain import TypeLattice, TypeState
+from lyra.core.expressions import VariableIdentifier, TupleDisplay
+from lyra.core.types import StringLyraType, TupleLyraType
 from lyra.unittests.abstract_tests import AbstractTest
 
 
@@ -153,5 +155,27 @@ class TestTypeLattice(AbstractTest.LatticeTest):
         self.assertEqual(self.string().concat(self.string()), self.string())
 
 
+class TestTypeState(unittest.TestCase):
+
+    def setUp(self):
+        self.x = VariableIdentifier(StringLyraType(), 'x')
+        self.y = VariableIdentifier(StringLyraType(), 'y')
+        self.state = TypeState({self.x, self.y})
+        self.state.store[self.x] = TypeLattice(TypeLattice.Status.Integer)
+        self.state.store[self.y] = TypeLattice(TypeLattice.Status.Float)
+        self.left = TupleDisplay(TupleLyraType([StringLyraType(), StringLyraType()]), [self.x, self.y])
+
+    def test_assign_tuple(self):
+        right = TupleDisplay(TupleLyraType([StringLyraType(), StringLyraType()]), [self.y, self.x])
+        self.state._assign_tuple(self.left, right)     # the items are assigned simultaneously
+        self.assertEqual(self.state.store[self.x], TypeLattice(TypeLattice.Status.Float))
+        self.assertEqual(self.state.store[self.y], TypeLattice(TypeLattice.Status.Integer))
+
+    def test_assign_any(self):
+        self.state._assign_tuple(self.left, VariableIdentifier(StringLyraType(), 'z'))
+        self.assertTrue(self.state.store[self.x].is_top())
+        self.assertTrue(self.state.store[self.y].is_top())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,91 @@
+"""
+Worklist - Unit Tests
+=====================
+
+:Author: Caterina Urban
+"""
+import ast
+import unittest
+
+from lyra.abstract_domains.numerical.sign_domain import SignState
+from lyra.core.cfg import Basic, Loop, Unconditional, ControlFlowGraph
+from lyra.engine.forward import ForwardInterpreter
+from lyra.engine.worklist import FIFOWorklist, WTOWorklist
+from lyra.frontend.cfg_generator import ast_to_cfgs, ast_to_fargs
+from lyra.semantics.forward import DefaultForwardSemantics
+
+PROGRAM = """
+x: int = 0
+i: int = 0
+while i < 10:
+    j: int = 0
+    while j < 5:
+        x = x + 1
+        j = j + 1
+    if x > 20:
+        x = 0
+    i = i + 1
+"""
+
+
+class TestWeakTopologicalOrder(unittest.TestCase):
+
+    def setUp(self):
+        # 1 -> 2 -> (3 -> 4 -> (5 -> 6) -> 7) -> 8, with 2 -> 8
+        self.nodes = {i: Basic(i) for i in (1, 2, 4, 7, 8)}
+        self.nodes.update({i: Loop(i) for i in (3, 5)})
+        self.nodes[6] = Basic(6)
+        edges = [(1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 5), (6, 7), (7, 3), (7, 8), (2, 8)]
+        edges = {Unconditional(self.nodes[s], self.nodes[t]) for s, t in edges}
+        self.cfg = ControlFlowGraph(set(self.nodes.values()), self.nodes[1], self.nodes[8], edges)
+
+    def test_forward(self):
+        ordering = [node.identifier for node in self.cfg.weak_topological_order()]
+        self.assertEqual(ordering, [1, 2, 3, 4, 5, 6, 7, 8])
+
+    def test_backward(self):
+        ordering = self.cfg.weak_topological_order(backward=True)
+        self.assertEqual(ordering[0], self.nodes[8])
+        self.assertEqual(ordering[-1], self.nodes[1])
+        self.assertEqual(set(ordering), set(self.nodes.values()))
+
+    def test_wto_worklist(self):
+        worklist = WTOWorklist(self.cfg)
+        for i in (8, 5, 3, 5, 8):
+            worklist.put(self.nodes[i])
+        retrieved = list()
+        while not worklist.empty():
+            retrieved.append(worklist.get().identifier)
+        self.assertEqual(retrieved, [3, 5, 8])
+
+    def test_fifo_worklist(self):
+        worklist = FIFOWorklist(self.cfg)
+        for i in (8, 5, 3, 5, 8):
+            worklist.put(self.nodes[i])
+        retrieved = list()
+        while not worklist.empty():
+            retrieved.append(worklist.get().identifier)
+        self.assertEqual(retrieved, [8, 5, 3, 5, 8])
+
+
+class TestVisits(unittest.TestCase):
+
+    @staticmethod
+    def analyze(worklist):
+        tree = ast.parse(PROGRAM)
+        cfgs, fargs = ast_to_cfgs(tree), ast_to_fargs(tree)
+        semantics = DefaultForwardSemantics()
+        interpreter = ForwardInterpreter(cfgs, fargs, semantics, 3, worklist=worklist)
+        result = interpreter.analyze(cfgs[''], SignState(cfgs[''].variables))
+        states = {i: str(result.get_node_result(node)) for i, node in cfgs[''].nodes.items()}
+        return interpreter.visits, states
+
+    def test_nested_loops(self):
+        fifo, fifo_states = self.analyze(FIFOWorklist)
+        wto, wto_states = self.analyze(WTOWorklist)
+        self.assertLess(wto, fifo)
+        self.assertEqual(wto_states, fifo_states)
+
+
+if __name__ == '__main__':
+    unittest.main()
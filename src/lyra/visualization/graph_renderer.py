@@ -1,15 +1,52 @@
 import html
 import numbers
+import os
 from itertools import zip_longest
 from uuid import uuid4 as uuid
 
 import graphviz as gv
+try:
+    from graphviz.quoting import attr_list, quote, quote_edge
+except ImportError:     # graphviz < 0.18
+    from graphviz.lang import attr_list, quote, quote_edge
 
 from lyra.abstract_domains.state import State
 from lyra.core.cfg import *
 from lyra.engine.result import AnalysisResult
 
 
+class DotStream:
+    """Graphviz graph written (in the DOT language) to a stream while it is drawn.
+
+    It offers the drawing methods of ``graphviz.Digraph``, without keeping the graph in memory.
+    """
+
+    def __init__(self, stream, graph_attr=None, node_attr=None, edge_attr=None):
+        """Graphviz graph written to a stream while it is drawn.
+
+        :param stream: (text) stream the graph is written to
+        :param graph_attr: graph attributes
+        :param node_attr: default node attributes
+        :param edge_attr: default edge attributes
+        """
+        self._stream = stream
+        self._stream.write('digraph {\n')
+        for keyword, attrs in (('graph', graph_attr), ('node', node_attr), ('edge', edge_attr)):
+            if attrs:
+                self._stream.write(f'\t{keyword}{attr_list(None, attrs)}\n')
+
+    def node(self, name, label=None, _attributes=None, **attrs):
+        attributes = attr_list(label, attrs, _attributes)
+        self._stream.write(f'\t{quote(name)}{attributes}\n')
+
+    def edge(self, tail_name, head_name, label=None, _attributes=None, **attrs):
+        attributes = attr_list(label, attrs, _attributes)
+        self._stream.write(f'\t{quote_edge(tail_name)} -> {quote_edge(head_name)}{attributes}\n')
+
+    def close(self):
+        self._stream.write('}\n')
+
+
 class GraphRenderer(metaclass=ABCMeta):
     """Graphviz rendering."""
 
@@ -73,26 +110,49 @@ class GraphRenderer(metaclass=ABCMeta):
         :param data: the data to be rendered
         """
 
-    def render(self, data, label=None, filename="Graph", directory="graphs", view=True):
-        """Graphviz rendering."""
+    def render(self, data, label=None, filename="Graph", directory="graphs", view=True,
+               format="pdf"):
+        """Graphviz rendering.
+
+        The graph is streamed to a DOT file while it is drawn,
+        which is then rendered (and removed) unless the requested format is ``dot``.
+
+        :param data: the data to be rendered
+        :param label: label of the graph
+        :param filename: name of the DOT file (without the ``.gv`` extension)
+        :param directory: directory of the DOT file (and of the rendered file)
+        :param view: whether to open the rendered file with the default viewer
+        :param format: output format (e.g., ``dot``, ``svg``, or ``pdf``)
+        :return: path of the rendered file
+        """
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        filepath = os.path.join(directory, f"{filename}.gv")
 
         # create the Graphviz graph
         graph_attr = self.graph_attr.copy()
         if label is not None:
             graph_attr['label'] = self._escape_label(label)
-        graph = gv.Digraph(graph_attr=graph_attr, node_attr=self.node_attr,
-                           edge_attr=self.edge_attr)
-
-        # draw nodes and edges of the Graphviz graph
-        self._graph = graph
-        self._rendered = set()
-        self._render(data)
-        self._graph = None
-        self._rendered = None
-
-        # display the Graphviz graph
-        graph.format = "pdf"
-        graph.render(f"{filename}.gv", directory, view, cleanup=True)
+        with open(filepath, 'w', encoding='utf-8') as stream:
+            graph = DotStream(stream, graph_attr=graph_attr, node_attr=self.node_attr,
+                              edge_attr=self.edge_attr)
+
+            # draw nodes and edges of the Graphviz graph
+            self._graph = graph
+            self._rendered = set()
+            self._render(data)
+            self._graph = None
+            self._rendered = None
+            graph.close()
+
+        # render and display the Graphviz graph
+        rendered = filepath
+        if format != "dot":
+            rendered = gv.render("dot", format, filepath)
+            os.remove(filepath)
+        if view:
+            gv.view(rendered)
+        return rendered
 
 
 class ListDictTreeRenderer(GraphRenderer):
@@ -194,7 +254,8 @@ class AnalysisResultRenderer(CFGRenderer):
     """Graphviz rendering of an analysis result on the analyzed control flow graph."""
 
     def _basic_node_label(self, node, result: AnalysisResult, fname='', ctx=False):
-        results: Dict[State, List[State]] = result.get_node_result(node)
+        node_result = result.get_node_result(node)
+        results: Dict[State, List[State]] = {c: list(states) for c, states in node_result.items()}
         state = '<font point-size="9">{} </font>'
         node_result = [fname] if fname and ctx else list()      # add function name
         stmt = '<font color="#ffffff" point-size="11">{}</font>'